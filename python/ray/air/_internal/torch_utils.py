@@ -1,5 +1,7 @@
+import threading
 import warnings
-from typing import Any, Dict, List, Optional, Union
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -206,6 +208,75 @@ def convert_ndarray_batch_to_torch_tensor_batch(
     return batch
 
 
+class PinnedMemoryBufferPool:
+    """A pool of reusable page-locked host buffers, to stage tensor batches for
+    copies to CUDA devices.
+
+    Copies from page-locked memory are faster than from pageable memory, and can
+    run asynchronously. Allocating page-locked memory is expensive, so the buffers
+    are reused once the copies from them have completed.
+
+    This class is thread-safe, so batches can be copied to buffers in multiple
+    threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # The free buffers by shape and dtype, with the events recorded after the
+        # copies from them were enqueued.
+        self._free_buffers: Dict[
+            Tuple[Tuple[int, ...], torch.dtype],
+            List[Tuple[torch.Tensor, "torch.cuda.Event"]],
+        ] = defaultdict(list)
+
+    def copy_batch_to_buffers(
+        self, batch: Union[torch.Tensor, Dict[str, torch.Tensor]]
+    ) -> Union[torch.Tensor, Dict[str, torch.Tensor]]:
+        """Copy a (dict of) tensor(s) to page-locked buffers from this pool."""
+        if isinstance(batch, dict):
+            return {k: self._copy_to_buffer(t) for k, t in batch.items()}
+        return self._copy_to_buffer(batch)
+
+    def move_batch_to_device(
+        self,
+        batch: Union[torch.Tensor, Dict[str, torch.Tensor]],
+        device: torch.device,
+    ) -> Union[torch.Tensor, Dict[str, torch.Tensor]]:
+        """Asynchronously copy a batch returned by `copy_batch_to_buffers` to the
+        given CUDA device, and return the buffers to the pool.
+
+        The copies are enqueued on the current stream of the device, so they
+        complete before later work on the stream uses the returned tensors.
+        """
+        if isinstance(batch, dict):
+            return {k: self._move_to_device(t, device) for k, t in batch.items()}
+        return self._move_to_device(batch, device)
+
+    def _copy_to_buffer(self, tensor: torch.Tensor) -> torch.Tensor:
+        key = (tuple(tensor.shape), tensor.dtype)
+        with self._lock:
+            free_buffers = self._free_buffers[key]
+            buffer, event = free_buffers.pop() if free_buffers else (None, None)
+        if buffer is None:
+            buffer = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+        else:
+            # Wait for the previous copy from the buffer to complete.
+            event.synchronize()
+        buffer.copy_(tensor)
+        return buffer
+
+    def _move_to_device(self, buffer: torch.Tensor, device: torch.device):
+        with torch.cuda.device(device):
+            tensor = buffer.to(device=device, non_blocking=True)
+            event = torch.cuda.Event()
+            event.record()
+        with self._lock:
+            self._free_buffers[(tuple(buffer.shape), buffer.dtype)].append(
+                (buffer, event)
+            )
+        return tensor
+
+
 def load_torch_model(
     saved_model: Union[torch.nn.Module, Dict],
     model_definition: Optional[torch.nn.Module] = None,
@@ -267,9 +267,15 @@ class ArrowBlockAccessor(TableBlockAccessor):
         for col_name in columns:
             col = self._table[col_name]
 
-            # Combine columnar values arrays to make these contiguous
-            # (making them compatible with numpy format)
-            combined_array = transform_pyarrow.combine_chunked_array(col)
+            if col.num_chunks == 1:
+                # A single chunk is already contiguous, and e.g. primitive and
+                # fixed-shape tensor arrays without nulls are converted to ndarrays
+                # without copies. Combining it would copy it.
+                combined_array = col.chunk(0)
+            else:
+                # Combine columnar values arrays to make these contiguous
+                # (making them compatible with numpy format)
+                combined_array = transform_pyarrow.combine_chunked_array(col)
 
             column_values_ndarrays.append(
                 transform_pyarrow.to_numpy(combined_array, zero_copy_only=False)
@@ -461,6 +467,15 @@ class ArrowBlockAccessor(TableBlockAccessor):
                 yield tuple(), self.to_block()
                 return
 
+            if DataContext.get_current().use_polars:
+                # Find the groups with a vectorized group-by instead of comparing
+                # the keys of every row.
+                start = 0
+                for end in transform_polars.get_group_end_offsets(self._table, keys):
+                    yield self._get_row(start)[keys], self.slice(start, end)
+                    start = end
+                return
+
             start = end = 0
             iter = self.iter_rows(public_row_format=False)
             next_row = None
@@ -526,8 +541,13 @@ class ArrowBlockAccessor(TableBlockAccessor):
         else:
             # Handle blocks of different types.
             blocks = TableBlockAccessor.normalize_block_types(blocks, "arrow")
-            concat_and_sort = get_concat_and_sort_transform(DataContext.get_current())
-            ret = concat_and_sort(blocks, sort_key)
+            context = DataContext.get_current()
+            if context.use_polars:
+                concat_and_sort = get_concat_and_sort_transform(context)
+                ret = concat_and_sort(blocks, sort_key)
+            else:
+                # The blocks are sorted runs, so merge them instead of sorting.
+                ret = transform_pyarrow.merge_sorted(blocks, sort_key)
         return ret, ArrowBlockAccessor(ret).get_metadata(exec_stats=stats.build())
 
     @staticmethod
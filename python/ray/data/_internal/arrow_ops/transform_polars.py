@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, List
+import itertools
+import sys
+from typing import TYPE_CHECKING, Any, List
 
 try:
     import pyarrow
@@ -7,6 +9,8 @@ except ImportError:
 
 
 if TYPE_CHECKING:
+    import polars
+
     from ray.data._internal.planner.exchange.sort_task_spec import SortKey
 
 pl = None
@@ -38,3 +42,39 @@ def concat_and_sort(
         sort_key.get_columns(), reverse=sort_key.get_descending()
     )
     return df.to_arrow()
+
+
+def is_polars_dataframe(obj: Any) -> bool:
+    """Whether ``obj`` is a ``polars.DataFrame``, without importing polars."""
+    # If polars hasn't been imported, `obj` can't be a polars DataFrame.
+    polars_module = sys.modules.get("polars")
+    return polars_module is not None and isinstance(obj, polars_module.DataFrame)
+
+
+def from_arrow(table: "pyarrow.Table") -> "polars.DataFrame":
+    """Convert an Arrow table into a polars DataFrame.
+
+    The chunks of the table aren't concatenated, so this is zero-copy for the
+    types that polars and Arrow represent the same way.
+    """
+    check_polars_installed()
+    return pl.from_arrow(table, rechunk=False)
+
+
+def get_group_end_offsets(table: "pyarrow.Table", keys: List[str]) -> List[int]:
+    """Return the end offsets of the groups of rows with the same keys.
+
+    This assumes the table is sorted by ``keys``, so the rows of each group are
+    adjacent.
+    """
+    check_polars_installed()
+    df = pl.from_arrow(table.select(keys), rechunk=False)
+    # `groupby` was renamed to `group_by`, and `pl.count()` to `pl.len()` in newer
+    # versions of polars.
+    group_by = getattr(df, "group_by", None) or df.groupby
+    group_size = pl.len() if hasattr(pl, "len") else pl.count()
+    # The groups are in the order of their first rows, which is the sorted order.
+    group_sizes = group_by(keys, maintain_order=True).agg(
+        group_size.alias("__group_size")
+    )["__group_size"]
+    return list(itertools.accumulate(group_sizes.to_list()))
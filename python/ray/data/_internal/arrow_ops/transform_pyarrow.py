@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import numpy as np
 from packaging.version import parse as parse_version
@@ -334,6 +334,57 @@ def concat_and_sort(
     return take_table(ret, indices)
 
 
+def merge_sorted(blocks: List["pyarrow.Table"], sort_key: "SortKey") -> "pyarrow.Table":
+    """Merge tables that are each sorted by ``sort_key`` into a sorted table.
+
+    If the key is a single numeric or temporal column without nulls, this uses
+    NumPy's stable sort (Timsort), which finds the sorted runs of the concatenated
+    tables and merges them in O(n * log(k)) for k tables, instead of sorting from
+    scratch. Otherwise, the concatenated tables are sorted with Arrow.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pac
+
+    ret = concat(blocks)
+    indices = None
+    columns = sort_key.get_columns()
+    if len(blocks) > 1 and len(columns) == 1:
+        indices = _merge_sorted_runs_indices(
+            ret.column(columns[0]), sort_key.get_descending()
+        )
+    if indices is None:
+        indices = pac.sort_indices(ret, sort_keys=sort_key.to_arrow_sort_args())
+    return take_table(ret, indices)
+
+
+def _merge_sorted_runs_indices(
+    column: "pyarrow.ChunkedArray", descending: bool
+) -> Optional["pyarrow.Array"]:
+    """Return the indices that merge the sorted runs of the column, or None if the
+    column isn't supported."""
+    import pyarrow as pa
+    import pyarrow.compute as pac
+
+    if column.null_count > 0 or not (
+        pa.types.is_integer(column.type)
+        or pa.types.is_floating(column.type)
+        or pa.types.is_timestamp(column.type)
+        or pa.types.is_date(column.type)
+        or pa.types.is_duration(column.type)
+    ):
+        return None
+    values = to_numpy(column, zero_copy_only=False)
+    if not descending:
+        return pa.array(np.argsort(values, kind="stable"))
+    if pa.types.is_floating(column.type) and pac.any(pac.is_nan(column)).as_py():
+        # Arrow places NaNs last in both orders, unlike reversed NumPy sorts.
+        return None
+    # Reversing the descending runs makes them ascending. Reversing the ascending
+    # order of the reversed values makes it descending, with the ties in their
+    # original order.
+    return pa.array(len(values) - 1 - np.argsort(values[::-1], kind="stable")[::-1])
+
+
 def to_numpy(
     array: Union["pyarrow.Array", "pyarrow.ChunkedArray"],
     *,
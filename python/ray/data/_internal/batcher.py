@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Dict, Optional
+
+import numpy as np
 
 from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.arrow_ops import transform_pyarrow
@@ -13,12 +15,6 @@ from ray.data.block import Block, BlockAccessor
 # https://github.com/apache/arrow/issues/35126 is resolved.
 MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS = 10
 
-# Delay compaction until the shuffle buffer has reached this ratio over the min
-# shuffle buffer size. Setting this to 1 minimizes memory usage, at the cost of
-# frequent compactions. Setting this to higher values increases memory usage but
-# reduces compaction frequency.
-SHUFFLE_BUFFER_COMPACTION_RATIO = 1.5
-
 
 class BatcherInterface:
     def add(self, block: Block):
@@ -166,20 +162,30 @@ class ShufflingBatcher(BatcherInterface):
 
     # Implementation Note:
     #
-    # This shuffling batcher lazily builds a shuffle buffer from added blocks, and once
-    # a batch is requested via .next_batch(), it concatenates the blocks into a concrete
-    # shuffle buffer and randomly shuffles the entire buffer.
+    # This shuffling batcher doesn't concatenate or shuffle the added blocks. Instead,
+    # it keeps references to them, together with an index of the (block, row)
+    # positions of the buffered rows. Each batch draws random positions from the
+    # index, and gathers the rows with one `take` per source block, so the buffered
+    # rows aren't copied while they wait in the buffer (except by the compactions
+    # below). If a batch draws rows from
+    # more than one source block, the gathered rows are concatenated and taken once
+    # more to restore the random order, so they're copied twice in that case.
     #
-    # Adding of more blocks can be intermixed with retrieving batches, but it should be
-    # noted that we can end up performing two expensive operations on each retrieval:
-    #  1. Build added blocks into a concrete shuffle buffer.
-    #  2. Shuffling the entire buffer.
-    # To amortize the overhead of this process, we only shuffle the blocks after a
-    # delay designated by SHUFFLE_BUFFER_COMPACTION_RATIO.
+    # The index is a pair of preallocated arrays that are only reallocated when the
+    # buffer outgrows them. The positions that are drawn for a batch are refilled
+    # with the positions at the end of the index, so the index stays compact.
     #
-    # Similarly, adding blocks is very cheap. Each added block will be appended to a
-    # list, with concatenation of the underlying data delayed until the next batch
-    # compaction.
+    # A source block is retained until all of its rows are yielded, so the drawn
+    # rows of partially consumed blocks would otherwise pile up (random draws leave
+    # a few live rows in most blocks). To bound the memory, once the source blocks
+    # retain more than `_MAX_RETAINED_ROWS_RATIO` times the buffered rows, the
+    # partially consumed blocks are compacted to their live rows. A compaction
+    # copies fewer rows than were yielded since the previous one, so it copies each
+    # row less than once on average.
+
+    # The maximum ratio of the rows retained in the source blocks to the buffered
+    # rows, before the source blocks are compacted.
+    _MAX_RETAINED_ROWS_RATIO = 2
 
     def __init__(
         self,
@@ -203,15 +209,23 @@ class ShufflingBatcher(BatcherInterface):
         if batch_size is None:
             raise ValueError("Must specify a batch_size if using a local shuffle.")
         self._batch_size = batch_size
-        self._shuffle_seed = shuffle_seed
         if shuffle_buffer_min_size < batch_size:
             # Round it up internally to `batch_size` since our algorithm requires it.
             # This is harmless since it only offers extra randomization.
             shuffle_buffer_min_size = batch_size
         self._buffer_min_size = shuffle_buffer_min_size
-        self._builder = DelegatingBlockBuilder()
-        self._shuffle_buffer: Block = None
-        self._batch_head = 0
+        self._rng = np.random.default_rng(shuffle_seed)
+        # The source blocks, and the number of their rows that haven't been yielded.
+        self._blocks: Dict[int, Block] = {}
+        self._num_rows_remaining: Dict[int, int] = {}
+        # The total number of rows of the source blocks, including yielded ones.
+        self._num_rows_retained = 0
+        self._next_block_id = 0
+        # The index of the buffered rows. Only the first `_buffer_size` entries
+        # are valid.
+        self._block_ids = np.empty(shuffle_buffer_min_size, dtype=np.int64)
+        self._row_ids = np.empty(shuffle_buffer_min_size, dtype=np.int64)
+        self._buffer_size = 0
         self._done_adding = False
 
     def add(self, block: Block):
@@ -222,8 +236,33 @@ class ShufflingBatcher(BatcherInterface):
         Args:
             block: Block to add to the shuffle buffer.
         """
-        if BlockAccessor.for_block(block).num_rows() > 0:
-            self._builder.add_block(block)
+        accessor = BlockAccessor.for_block(block)
+        num_rows = accessor.num_rows()
+        if num_rows == 0:
+            return
+        if (
+            isinstance(accessor, ArrowBlockAccessor)
+            and block.num_columns > 0
+            and block.column(0).num_chunks > 1
+        ):
+            # Taking rows from a chunked table concatenates the chunks first, so
+            # combine them once instead of for every batch.
+            block = transform_pyarrow.combine_chunks(block)
+
+        block_id = self._next_block_id
+        self._next_block_id += 1
+        self._blocks[block_id] = block
+        self._num_rows_remaining[block_id] = num_rows
+        self._num_rows_retained += num_rows
+
+        new_size = self._buffer_size + num_rows
+        if new_size > len(self._block_ids):
+            capacity = max(new_size, 2 * len(self._block_ids))
+            self._block_ids = np.resize(self._block_ids, capacity)
+            self._row_ids = np.resize(self._row_ids, capacity)
+        self._block_ids[self._buffer_size : new_size] = block_id
+        self._row_ids[self._buffer_size : new_size] = np.arange(num_rows)
+        self._buffer_size = new_size
 
     def done_adding(self) -> bool:
         """Indicate to the batcher that no more blocks will be added to the batcher.
@@ -234,39 +273,14 @@ class ShufflingBatcher(BatcherInterface):
 
     def has_any(self) -> bool:
         """Whether this batcher has any data."""
-        return self._buffer_size() > 0
+        return self._buffer_size > 0
 
     def has_batch(self) -> bool:
         """Whether this batcher has any batches."""
-        buffer_size = self._buffer_size()
-
         if not self._done_adding:
-            # Delay pulling of batches until the buffer is large enough in order to
-            # amortize compaction overhead.
-            return self._materialized_buffer_size() >= self._buffer_min_size or (
-                buffer_size - self._batch_size
-                >= self._buffer_min_size * SHUFFLE_BUFFER_COMPACTION_RATIO
-            )
+            return self._buffer_size >= self._buffer_min_size
         else:
-            return buffer_size >= self._batch_size
-
-    def _buffer_size(self) -> int:
-        """Return shuffle buffer size."""
-        buffer_size = self._builder.num_rows()
-        buffer_size += self._materialized_buffer_size()
-        return buffer_size
-
-    def _materialized_buffer_size(self) -> int:
-        """Return materialized (compacted portion of) shuffle buffer size."""
-        if self._shuffle_buffer is None:
-            return 0
-        # The size of the concrete (materialized) shuffle buffer, adjusting
-        # for the batch head position, which also serves as a counter of the number
-        # of already-yielded rows from the current concrete shuffle buffer.
-        return max(
-            0,
-            BlockAccessor.for_block(self._shuffle_buffer).num_rows() - self._batch_head,
-        )
+            return self._buffer_size >= self._batch_size
 
     def next_batch(self) -> Block:
         """Get the next shuffled batch from the shuffle buffer.
@@ -275,51 +289,68 @@ class ShufflingBatcher(BatcherInterface):
             A batch represented as a Block.
         """
         assert self.has_batch() or (self._done_adding and self.has_any())
-        # Add rows in the builder to the shuffle buffer. Note that we delay compaction
-        # as much as possible to amortize the concatenation overhead. Compaction is
-        # only necessary when the materialized buffer size falls below the min size.
-        if self._builder.num_rows() > 0 and (
-            self._done_adding
-            or self._materialized_buffer_size() <= self._buffer_min_size
-        ):
-            if self._shuffle_buffer is not None:
-                if self._batch_head > 0:
-                    # Compact the materialized shuffle buffer.
-                    block = BlockAccessor.for_block(self._shuffle_buffer)
-                    self._shuffle_buffer = block.slice(
-                        self._batch_head, block.num_rows()
-                    )
-                # Add the unyielded rows from the existing shuffle buffer.
-                self._builder.add_block(self._shuffle_buffer)
-            # Build the new shuffle buffer.
-            self._shuffle_buffer = self._builder.build()
-            self._shuffle_buffer = BlockAccessor.for_block(
-                self._shuffle_buffer
-            ).random_shuffle(self._shuffle_seed)
-            if self._shuffle_seed is not None:
-                self._shuffle_seed += 1
-            if (
-                isinstance(
-                    BlockAccessor.for_block(self._shuffle_buffer), ArrowBlockAccessor
-                )
-                and self._shuffle_buffer.num_columns > 0
-                and self._shuffle_buffer.column(0).num_chunks
-                >= MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS
-            ):
-                self._shuffle_buffer = transform_pyarrow.combine_chunks(
-                    self._shuffle_buffer
+        # Truncate the batch to the buffer size, if necessary.
+        batch_size = min(self._batch_size, self._buffer_size)
+        positions = self._rng.choice(self._buffer_size, batch_size, replace=False)
+        block_ids = self._block_ids[positions]
+        row_ids = self._row_ids[positions]
+        self._remove_from_index(positions)
+
+        # Gather the rows of each source block, in the order they were drawn.
+        order = np.argsort(block_ids, kind="stable")
+        unique_block_ids, starts, counts = np.unique(
+            block_ids[order], return_index=True, return_counts=True
+        )
+        builder = DelegatingBlockBuilder()
+        for block_id, start, count in zip(unique_block_ids, starts, counts):
+            block = self._blocks[block_id]
+            builder.add_block(
+                BlockAccessor.for_block(block).take(
+                    row_ids[order[start : start + count]]
                 )
-            # Reset the builder.
-            self._builder = DelegatingBlockBuilder()
-            self._batch_head = 0
+            )
+            self._num_rows_remaining[block_id] -= count
+            if self._num_rows_remaining[block_id] == 0:
+                # Release the source block.
+                self._num_rows_retained -= BlockAccessor.for_block(block).num_rows()
+                del self._blocks[block_id]
+                del self._num_rows_remaining[block_id]
+        batch = builder.build()
+        if len(unique_block_ids) > 1:
+            # The rows are grouped by source block, so restore the random order.
+            batch = BlockAccessor.for_block(batch).take(np.argsort(order))
+        if self._num_rows_retained > self._MAX_RETAINED_ROWS_RATIO * self._buffer_size:
+            self._compact()
+        return batch
 
-        assert self._shuffle_buffer is not None
-        buffer_size = BlockAccessor.for_block(self._shuffle_buffer).num_rows()
-        # Truncate the batch to the buffer size, if necessary.
-        batch_size = min(self._batch_size, buffer_size)
-        slice_start = self._batch_head
-        self._batch_head += batch_size
-        # Yield the shuffled batch.
-        return BlockAccessor.for_block(self._shuffle_buffer).slice(
-            slice_start, self._batch_head
+    def _compact(self):
+        """Replace the partially consumed source blocks with their live rows, so the
+        yielded rows are released."""
+        block_ids = self._block_ids[: self._buffer_size]
+        order = np.argsort(block_ids, kind="stable")
+        unique_block_ids, starts, counts = np.unique(
+            block_ids[order], return_index=True, return_counts=True
         )
+        for block_id, start, count in zip(unique_block_ids, starts, counts):
+            accessor = BlockAccessor.for_block(self._blocks[block_id])
+            if count == accessor.num_rows():
+                continue
+            positions = order[start : start + count]
+            self._blocks[block_id] = accessor.take(self._row_ids[positions])
+            self._row_ids[positions] = np.arange(count)
+        self._num_rows_retained = self._buffer_size
+
+    def _remove_from_index(self, positions: np.ndarray):
+        """Remove the given (unique) positions from the index of buffered rows.
+
+        The removed positions are refilled with the remaining positions at the end
+        of the index.
+        """
+        new_size = self._buffer_size - len(positions)
+        is_removed_tail = np.zeros(len(positions), dtype=bool)
+        is_removed_tail[positions[positions >= new_size] - new_size] = True
+        holes = positions[positions < new_size]
+        tail = np.arange(new_size, self._buffer_size)[~is_removed_tail]
+        self._block_ids[holes] = self._block_ids[tail]
+        self._row_ids[holes] = self._row_ids[tail]
+        self._buffer_size = new_size
@@ -0,0 +1,222 @@
+import hashlib
+import logging
+import os
+import shutil
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+import ray
+from ray.data._internal.execution.interfaces.task_context import TaskContext
+from ray.data.block import Block
+from ray.data.datasource.datasource import ReadTask
+
+if TYPE_CHECKING:
+    import pyarrow
+
+logger = logging.getLogger(__name__)
+
+# The prefix of the directories that cache entries are written to, before they are
+# committed.
+_TMP_PREFIX = ".tmp-"
+
+# Uncommitted entries older than this are left behind by failed workers, and are
+# removed on eviction.
+_STALE_TMP_ENTRY_S = 3600
+
+# Bump this when the format of the cache entries changes.
+_CACHE_FORMAT_VERSION = 1
+
+
+class BlockCache:
+    """A cache of the blocks produced by read tasks, on the local disk of a node.
+
+    Each entry is a directory named after the cache key of a read task, which
+    contains one Arrow IPC file per block. Entries are written to a temporary
+    directory and renamed when complete, so readers never see a partial entry.
+    Cached blocks are memory-mapped on reads, so a hit doesn't copy or decode data.
+
+    The cache directory is shared by all workers and jobs on the node. When the
+    total size of the entries exceeds ``max_bytes``, the least recently used entries
+    are evicted, using the mtime of the entry directories as the access time.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+
+    def get(self, key: str) -> Optional[List[Block]]:
+        """Return the cached blocks of ``key``, or None on a miss."""
+        import pyarrow as pa
+
+        path = self._entry_path(key)
+        try:
+            blocks = []
+            for name in sorted(os.listdir(path), key=int):
+                with pa.memory_map(os.path.join(path, name)) as source:
+                    blocks.append(pa.ipc.open_file(source).read_all())
+            # Mark the entry as recently used.
+            os.utime(path)
+        except (OSError, pa.ArrowInvalid):
+            # The entry doesn't exist, or was evicted while reading it.
+            return None
+        return blocks
+
+    def put(self, key: str, blocks: Iterable[Block]) -> Iterator[Block]:
+        """Yield ``blocks`` and cache them under ``key`` along the way.
+
+        The entry is only committed after all blocks are consumed, and if all of
+        them are Arrow tables. Errors writing the entry don't fail the read.
+        """
+        tmp_path = os.path.join(
+            self._cache_dir, f"{_TMP_PREFIX}{key}-{uuid.uuid4().hex}"
+        )
+        cacheable = True
+        try:
+            os.makedirs(tmp_path)
+        except OSError as e:
+            logger.debug(f"Failed to create the block cache entry {tmp_path}: {e}")
+            cacheable = False
+        try:
+            for i, block in enumerate(blocks):
+                if cacheable:
+                    cacheable = self._write_block(block, os.path.join(tmp_path, str(i)))
+                yield block
+            if cacheable:
+                self._commit(tmp_path, key)
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key)
+
+    def _write_block(self, block: Block, path: str) -> bool:
+        import pyarrow as pa
+
+        if not isinstance(block, pa.Table):
+            # Converting the block would change the block type of the cached reads.
+            return False
+        try:
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, block.schema) as writer:
+                    writer.write_table(block)
+        except (OSError, pa.ArrowException) as e:
+            logger.debug(f"Failed to write the block cache entry {path}: {e}")
+            return False
+        return True
+
+    def _commit(self, tmp_path: str, key: str):
+        try:
+            os.rename(tmp_path, self._entry_path(key))
+        except OSError:
+            # Another task has committed the same entry concurrently.
+            return
+        self._evict()
+
+    def _evict(self):
+        """Evict the least recently used entries beyond ``max_bytes``."""
+        now = time.time()
+        entries = []
+        total_bytes = 0
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                try:
+                    mtime = entry.stat().st_mtime
+                    if entry.name.startswith(_TMP_PREFIX):
+                        if now - mtime > _STALE_TMP_ENTRY_S:
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                        continue
+                    size = _dir_size_bytes(entry.path)
+                except OSError:
+                    # The entry has been evicted by another task.
+                    continue
+                entries.append((mtime, size, entry.path))
+                total_bytes += size
+        for _, size, path in sorted(entries):
+            if total_bytes <= self._max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_bytes -= size
+
+
+class CachedReadTask(ReadTask):
+    """A ``ReadTask`` whose blocks are cached in a ``BlockCache``."""
+
+    def __init__(self, read_task: ReadTask, cache: BlockCache, cache_key: str):
+        super().__init__(read_task.read_fn, read_task.metadata)
+        self._cache = cache
+        self._cache_key = cache_key
+
+    def read_with_cache(self, ctx: TaskContext) -> Iterable[Block]:
+        """Load the cached blocks on a hit, or read and cache them on a miss.
+
+        The hit or miss is counted in ``ctx``.
+        """
+        blocks = self._cache.get(self._cache_key)
+        if blocks is not None:
+            ctx.block_cache_hits += 1
+            yield from blocks
+        else:
+            ctx.block_cache_misses += 1
+            yield from self._cache.put(self._cache_key, self())
+
+
+def get_file_cache_keys(
+    read_args: Dict[str, Any],
+    filesystem: "pyarrow.fs.FileSystem",
+    read_tasks: List[ReadTask],
+) -> List[Optional[str]]:
+    """Compute the cache keys of read tasks that read their input files entirely.
+
+    The key of a read task covers ``read_args``, and the path, size and modification
+    time of each of its input files. A read task has no key (None) if any of these
+    can't be determined, or if ``read_args`` has no stable representation across
+    processes.
+
+    Args:
+        read_args: The arguments of the datasource that affect the read blocks.
+        filesystem: The filesystem of the input files.
+        read_tasks: The read tasks to compute the keys of.
+    """
+    from pyarrow.fs import FileType
+
+    # Objects without a custom `__repr__` are represented by their addresses.
+    read_args_repr = repr(sorted(read_args.items()))
+    if " at 0x" in read_args_repr:
+        return [None] * len(read_tasks)
+
+    paths = sorted(
+        {path for task in read_tasks for path in task.metadata.input_files or []}
+    )
+    try:
+        file_infos = filesystem.get_file_info(paths)
+    except OSError as e:
+        logger.debug(f"Failed to get the file infos for the block cache: {e}")
+        return [None] * len(read_tasks)
+    file_stats = {
+        path: (info.size, info.mtime_ns)
+        for path, info in zip(paths, file_infos)
+        if info.type == FileType.File and info.mtime_ns is not None
+    }
+
+    keys = []
+    for task in read_tasks:
+        input_files = task.metadata.input_files
+        if not input_files or any(path not in file_stats for path in input_files):
+            keys.append(None)
+            continue
+        key = repr(
+            (
+                _CACHE_FORMAT_VERSION,
+                ray.__version__,
+                read_args_repr,
+                [(path, *file_stats[path]) for path in input_files],
+            )
+        )
+        keys.append(hashlib.sha256(key.encode()).hexdigest())
+    return keys
+
+
+def _dir_size_bytes(path: str) -> int:
+    with os.scandir(path) as it:
+        return sum(entry.stat().st_size for entry in it)
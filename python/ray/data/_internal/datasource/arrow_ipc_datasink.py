@@ -0,0 +1,26 @@
+from typing import Optional
+
+import pyarrow
+
+from ray.data.block import BlockAccessor
+from ray.data.datasource.file_datasink import BlockBasedFileDatasink
+
+
+class ArrowIPCDatasink(BlockBasedFileDatasink):
+    def __init__(
+        self,
+        path: str,
+        *,
+        compression: Optional[str] = None,
+        file_format: str = "arrow",
+        **file_datasink_kwargs,
+    ):
+        super().__init__(path, file_format=file_format, **file_datasink_kwargs)
+
+        self.compression = compression
+
+    def write_block_to_file(self, block: BlockAccessor, file: "pyarrow.NativeFile"):
+        table = block.to_arrow()
+        options = pyarrow.ipc.IpcWriteOptions(compression=self.compression)
+        with pyarrow.ipc.new_file(file, table.schema, options=options) as writer:
+            writer.write_table(table)
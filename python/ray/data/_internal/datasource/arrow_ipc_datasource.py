@@ -0,0 +1,47 @@
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
+
+from ray.data.block import Block
+from ray.data.datasource.file_based_datasource import FileBasedDatasource
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class ArrowIPCDatasource(FileBasedDatasource):
+    """Arrow IPC datasource, for reading Arrow IPC (Feather V2) files.
+
+    Files on the local filesystem (including NFS mounts) are memory-mapped, so the
+    blocks are zero-copy slices of the files, unless the files are compressed.
+    """
+
+    _FILE_EXTENSIONS = ["arrow", "feather", "ipc"]
+
+    def __init__(
+        self,
+        paths: Union[str, List[str]],
+        columns: Optional[List[str]] = None,
+        **file_based_datasource_kwargs,
+    ):
+        super().__init__(paths, **file_based_datasource_kwargs)
+
+        self.columns = columns
+
+    def _read_stream(self, f: "pyarrow.NativeFile", path: str) -> Iterator[Block]:
+        from pyarrow import feather
+
+        # Only the selected columns are read from the file.
+        yield feather.read_table(f, columns=self.columns)
+
+    def _open_input_source(
+        self,
+        filesystem: "pyarrow.fs.FileSystem",
+        path: str,
+        **open_args,
+    ) -> "pyarrow.NativeFile":
+        import pyarrow as pa
+        from pyarrow.fs import LocalFileSystem
+
+        if isinstance(filesystem, LocalFileSystem):
+            return pa.memory_map(path)
+        # The IPC file format requires `open_input_file` due to random access reads.
+        return filesystem.open_input_file(path, **open_args)
@@ -1,3 +1,4 @@
+import copy
 import logging
 from dataclasses import dataclass
 from typing import (
@@ -240,6 +241,10 @@ class ParquetDatasource(Datasource):
         read_schema = schema
         pq_ds = get_parquet_dataset(paths, filesystem, dataset_kwargs)
 
+        # The names of the columns that are stored in the files, as opposed to the
+        # columns that Ray Data adds (e.g., partition columns).
+        file_column_names = set(pq_ds.schema.names)
+
         if schema is None:
             schema = pq_ds.schema
             schema = _add_partition_fields_to_schema(partitioning, schema, pq_ds)
@@ -295,6 +300,7 @@ class ParquetDatasource(Datasource):
         # `_SerializedFragment()` implementation for more details.
         self._pq_fragments = [SerializedFragment(p) for p in pq_ds.fragments]
         self._pq_paths = [p.path for p in pq_ds.fragments]
+        self._filesystem = filesystem
         self._meta_provider = meta_provider
         self._block_udf = _block_udf
         self._to_batches_kwargs = to_batch_kwargs
@@ -304,6 +310,7 @@ class ParquetDatasource(Datasource):
         self._file_metadata_shuffler = None
         self._include_paths = include_paths
         self._partitioning = partitioning
+        self._file_column_names = file_column_names
         if shuffle == "files":
             self._file_metadata_shuffler = np.random.default_rng()
 
@@ -421,6 +428,68 @@ class ParquetDatasource(Datasource):
     def supports_distributed_reads(self) -> bool:
         return self._supports_distributed_reads
 
+    @property
+    def supports_projection_pushdown(self) -> bool:
+        import pyarrow as pa
+
+        # A block UDF might depend on columns that aren't selected.
+        return self._block_udf is None and isinstance(self._schema, pa.Schema)
+
+    def apply_projection(self, columns: List[str]) -> "ParquetDatasource":
+        import pyarrow as pa
+
+        include_paths = self._include_paths and "path" in columns
+        # Ignore unknown columns here, so that the projection itself reports them.
+        columns = [column for column in columns if column in self._schema.names]
+
+        schema = pa.schema(
+            [self._schema.field(column) for column in columns], self._schema.metadata
+        )
+
+        datasource = copy.copy(self)
+        datasource._columns = columns
+        datasource._read_schema = schema
+        datasource._schema = schema
+        datasource._include_paths = include_paths
+        return datasource
+
+    @property
+    def supports_predicate_pushdown(self) -> bool:
+        import pyarrow as pa
+
+        if self._block_udf is not None or self._include_paths:
+            return False
+        # Partition columns are added after the files are read, so PyArrow can't
+        # evaluate predicates that reference them.
+        return isinstance(self._schema, pa.Schema) and set(self._schema.names).issubset(
+            self._file_column_names
+        )
+
+    def apply_predicate(
+        self, predicate: "pyarrow.dataset.Expression"
+    ) -> "ParquetDatasource":
+        to_batches_kwargs = dict(self._to_batches_kwargs)
+        if to_batches_kwargs.get("filter") is not None:
+            predicate = to_batches_kwargs["filter"] & predicate
+        to_batches_kwargs["filter"] = predicate
+
+        datasource = copy.copy(self)
+        datasource._to_batches_kwargs = to_batches_kwargs
+        return datasource
+
+    def get_cache_keys(self, read_tasks: List[ReadTask]) -> List[Optional[str]]:
+        from ray.data._internal.block_cache import get_file_cache_keys
+
+        read_args = {
+            "block_udf": self._block_udf,
+            "to_batches_kwargs": self._to_batches_kwargs,
+            "columns": self._columns,
+            "read_schema": self._read_schema,
+            "include_paths": self._include_paths,
+            "partitioning": self._partitioning,
+        }
+        return get_file_cache_keys(read_args, self._filesystem, read_tasks)
+
 
 def read_fragments(
     block_udf,
@@ -0,0 +1,157 @@
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from ray.data._internal.execution.interfaces.physical_operator import PhysicalOperator
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.execution.util import memory_string
+from ray.data.context import DataContext
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.resource_manager import ResourceManager
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+
+logger = logging.getLogger(__name__)
+
+
+class BlockSizeTuner:
+    """Tunes the target max block size of operators at runtime.
+
+    The tuner only applies to map operators that use the default target max block
+    size from the ``DataContext``, i.e., the ones whose block size isn't overridden by
+    the plan (e.g., the ones feeding a shuffle).
+
+    In each update, it makes the following decisions for each of these operators:
+    1. If the object store usage is above ``HIGH_OBJECT_STORE_UTILIZATION`` of the
+       limit, or if any object has been spilled since the last update, shrink the
+       output blocks by ``SCALE_FACTOR``. Smaller blocks reduce the memory held by
+       the generator buffers of the running tasks, and let downstream operators
+       consume and free data sooner.
+    2. Otherwise, if the object store usage is below ``LOW_OBJECT_STORE_UTILIZATION``
+       of the limit, and the tasks of every downstream map operator finish faster
+       than ``MIN_TASK_DURATION_S`` on average, grow the output blocks by
+       ``SCALE_FACTOR``. Each downstream task processes one bigger block, so the
+       per-task overhead is amortized over more data.
+
+    The block sizes are bounded by ``DataContext.adaptive_block_sizing_min_bytes``
+    and ``DataContext.adaptive_block_sizing_max_bytes``. A new block size only
+    applies to the tasks that are submitted after the update.
+    """
+
+    # Min interval in seconds between two updates.
+    UPDATE_INTERVAL_S = 5.0
+    # Shrink blocks when the object store usage exceeds this fraction of the limit.
+    HIGH_OBJECT_STORE_UTILIZATION = 0.8
+    # Only grow blocks when the object store usage is below this fraction of the limit.
+    LOW_OBJECT_STORE_UTILIZATION = 0.5
+    # Grow the blocks of an operator, when the tasks consuming them are shorter than
+    # this on average.
+    MIN_TASK_DURATION_S = 1.0
+    # The factor to shrink or grow the block size by in each update.
+    SCALE_FACTOR = 2
+
+    def __init__(self, topology: "Topology", resource_manager: "ResourceManager"):
+        ctx = DataContext.get_current()
+        self._topology = topology
+        self._resource_manager = resource_manager
+        self._min_block_size = ctx.adaptive_block_sizing_min_bytes
+        self._max_block_size = ctx.adaptive_block_sizing_max_bytes
+        assert 0 < self._min_block_size <= self._max_block_size, (
+            self._min_block_size,
+            self._max_block_size,
+        )
+        self._tunable_ops = [
+            op
+            for op in topology
+            if isinstance(op, MapOperator) and op.target_max_block_size is None
+        ]
+        self._last_update_time = time.time()
+        self._last_spilled_bytes = 0
+        # Per-op (block generation time, number of finished tasks) at the last update.
+        self._last_task_stats: Dict[PhysicalOperator, Tuple[float, int]] = {}
+
+    def try_update(self):
+        """Update the block sizes, if enough time has passed since the last update."""
+        now = time.time()
+        if now - self._last_update_time < self.UPDATE_INTERVAL_S:
+            return
+        self._last_update_time = now
+        self.update()
+
+    def update(self):
+        """Update the target max block sizes of the tunable operators."""
+        spilled_bytes = sum(op.metrics.obj_store_mem_spilled for op in self._topology)
+        spilled = spilled_bytes > self._last_spilled_bytes
+        self._last_spilled_bytes = spilled_bytes
+
+        usage = self._resource_manager.get_global_usage().object_store_memory or 0
+        limit = self._resource_manager.get_global_limits().object_store_memory
+        utilization = usage / limit if limit else 0.0
+
+        # Compute the average task durations of all operators first, so that the
+        # task stats are updated for every operator in every update.
+        avg_task_durations = {
+            op: self._get_avg_task_duration_since_last_update(op)
+            for op in self._topology
+            if isinstance(op, MapOperator)
+        }
+
+        for op in self._tunable_ops:
+            if op.completed():
+                continue
+            current = op.actual_target_max_block_size
+            if spilled or utilization > self.HIGH_OBJECT_STORE_UTILIZATION:
+                new = max(current // self.SCALE_FACTOR, self._min_block_size)
+                if new >= current:
+                    continue
+            elif utilization < self.LOW_OBJECT_STORE_UTILIZATION and (
+                self._is_task_overhead_dominant(op, avg_task_durations)
+            ):
+                new = min(current * self.SCALE_FACTOR, self._max_block_size)
+                if new <= current:
+                    continue
+            else:
+                continue
+            logger.debug(
+                f"Changing the target max block size of {op.name} from "
+                f"{memory_string(current)} to {memory_string(new)} "
+                f"(object store utilization={utilization:.2f}, spilled={spilled})."
+            )
+            op.set_target_max_block_size(new)
+
+    def _get_avg_task_duration_since_last_update(
+        self, op: MapOperator
+    ) -> Optional[float]:
+        """Return the average duration of the tasks of ``op`` that finished since the
+        last update, or None if none finished."""
+        metrics = op.metrics
+        last_time, last_num_tasks = self._last_task_stats.get(op, (0.0, 0))
+        self._last_task_stats[op] = (
+            metrics.block_generation_time,
+            metrics.num_tasks_finished,
+        )
+        num_tasks = metrics.num_tasks_finished - last_num_tasks
+        if num_tasks <= 0:
+            return None
+        return (metrics.block_generation_time - last_time) / num_tasks
+
+    def _is_task_overhead_dominant(
+        self,
+        op: PhysicalOperator,
+        avg_task_durations: Dict[PhysicalOperator, Optional[float]],
+    ) -> bool:
+        """Whether the downstream tasks consuming the outputs of ``op`` are so short
+        that the per-task overhead dominates."""
+        consumers = [
+            next_op
+            for next_op in op.output_dependencies
+            if isinstance(next_op, MapOperator)
+        ]
+        if not consumers:
+            return False
+        for next_op in consumers:
+            duration = avg_task_durations.get(next_op)
+            if duration is None or duration >= self.MIN_TASK_DURATION_S:
+                return False
+        return True
@@ -206,6 +206,10 @@ class ExecutionResources:
         )
 
 
+# The supported values of `ExecutionOptions.task_locality_fallback`.
+TASK_LOCALITY_FALLBACKS = ("spill", "wait")
+
+
 @DeveloperAPI
 class ExecutionOptions:
     """Common options for execution.
@@ -230,6 +234,16 @@ class ExecutionOptions:
         actor_locality_enabled: Whether to enable locality-aware task dispatch to
             actors (off by default). This parameter applies to both stateful map and
             streaming_split operations.
+        task_locality_enabled: Whether to schedule map tasks on the nodes that
+            produced their input blocks (off by default). This uses soft node
+            affinity, so tasks can still run on other nodes. It doesn't apply to
+            reads, to tasks with a user-specified scheduling strategy (including
+            one from ``ray_remote_args_fn``), or if ``locality_with_output`` is set.
+        task_locality_fallback: What a locality-aware map task does if its preferred
+            node doesn't have resources available. ``"spill"`` (the default)
+            schedules the task on another node right away. ``"wait"`` waits for the
+            preferred node, and only falls back to another node if the preferred
+            node is dead or can't run the task.
         verbose_progress: Whether to report progress individually per operator. By
             default, only AllToAll operators and global progress is reported. This
             option is useful for performance debugging. On by default.
@@ -245,6 +259,8 @@ class ExecutionOptions:
         # https://github.com/ray-project/ray/issues/43466
         actor_locality_enabled: bool = False,
         verbose_progress: Optional[bool] = None,
+        task_locality_enabled: bool = False,
+        task_locality_fallback: str = "spill",
     ):
         if resource_limits is None:
             resource_limits = ExecutionResources.for_limits()
@@ -255,6 +271,13 @@ class ExecutionOptions:
         self.locality_with_output = locality_with_output
         self.preserve_order = preserve_order
         self.actor_locality_enabled = actor_locality_enabled
+        if task_locality_fallback not in TASK_LOCALITY_FALLBACKS:
+            raise ValueError(
+                f"Invalid task_locality_fallback: {task_locality_fallback!r}. "
+                f"Supported values are {TASK_LOCALITY_FALLBACKS}."
+            )
+        self.task_locality_enabled = task_locality_enabled
+        self.task_locality_fallback = task_locality_fallback
         if verbose_progress is None:
             verbose_progress = bool(
                 int(os.environ.get("RAY_DATA_VERBOSE_PROGRESS", "1"))
@@ -268,6 +291,8 @@ class ExecutionOptions:
             f"locality_with_output={self.locality_with_output}, "
             f"preserve_order={self.preserve_order}, "
             f"actor_locality_enabled={self.actor_locality_enabled}, "
+            f"task_locality_enabled={self.task_locality_enabled}, "
+            f"task_locality_fallback={self.task_locality_fallback}, "
             f"verbose_progress={self.verbose_progress})"
         )
 
@@ -100,6 +100,8 @@ class RunningTaskInfo:
     inputs: RefBundle
     num_outputs: int
     bytes_outputs: int
+    # The node that the task was preferred to run on, if any.
+    preferred_location: Optional[str] = None
 
 
 class OpRuntimesMetricsMeta(type):
@@ -164,6 +166,14 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
         metrics_group=MetricsGroup.INPUTS,
         map_only=True,
     )
+    rows_task_inputs_processed: int = metric_field(
+        default=0,
+        description=(
+            "Number of input rows that operator's tasks have finished processing."
+        ),
+        metrics_group=MetricsGroup.INPUTS,
+        map_only=True,
+    )
     bytes_inputs_of_submitted_tasks: int = metric_field(
         default=0,
         description="Byte size of input blocks passed to submitted tasks.",
@@ -256,6 +266,23 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
         metrics_group=MetricsGroup.TASKS,
         map_only=True,
     )
+    task_locality_hits: int = metric_field(
+        default=0,
+        description=(
+            "Number of locality-aware tasks that ran on the node of their inputs."
+        ),
+        metrics_group=MetricsGroup.TASKS,
+        map_only=True,
+    )
+    task_locality_misses: int = metric_field(
+        default=0,
+        description=(
+            "Number of locality-aware tasks that didn't run on the node of their "
+            "inputs."
+        ),
+        metrics_group=MetricsGroup.TASKS,
+        map_only=True,
+    )
     task_submission_backpressure_time: float = metric_field(
         default=0,
         description="Time spent in task submission backpressure.",
@@ -273,6 +300,14 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
         description="Number of blocks in the operator's internal output queue.",
         metrics_group=MetricsGroup.OBJECT_STORE_MEMORY,
     )
+    obj_store_mem_shuffle_map_outputs: int = metric_field(
+        default=0,
+        description=(
+            "Byte size of shuffle map outputs held by the operator until reduce "
+            "tasks consume them."
+        ),
+        metrics_group=MetricsGroup.OBJECT_STORE_MEMORY,
+    )
     obj_store_mem_freed: int = metric_field(
         default=0,
         description="Byte size of freed memory in object store.",
@@ -293,6 +328,21 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
 
     # === Miscellaneous metrics ===
     # Use "metrics_group: "misc" in the metadata for new metrics in this section.
+    num_times_scheduled: int = metric_field(
+        default=0,
+        description=(
+            "Number of scheduling decisions in which the operator was selected to run."
+        ),
+        metrics_group=MetricsGroup.MISC,
+    )
+    num_times_starved: int = metric_field(
+        default=0,
+        description=(
+            "Number of scheduling decisions in which the operator was runnable, "
+            "but another operator was selected to run."
+        ),
+        metrics_group=MetricsGroup.MISC,
+    )
 
     def __init__(self, op: "PhysicalOperator"):
         from ray.data._internal.execution.operators.map_operator import MapOperator
@@ -492,6 +542,19 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
             output_size,
         )
 
+    def on_shuffle_map_outputs_held(self, size_bytes: int):
+        """Callback when the operator holds shuffle map outputs for reduce tasks."""
+        self.obj_store_mem_shuffle_map_outputs += size_bytes
+
+    def on_shuffle_map_outputs_released(self, size_bytes: int):
+        """Callback when reduce tasks have consumed shuffle map outputs."""
+        self.obj_store_mem_shuffle_map_outputs -= size_bytes
+        assert self.obj_store_mem_shuffle_map_outputs >= 0, (
+            self._op,
+            self.obj_store_mem_shuffle_map_outputs,
+            size_bytes,
+        )
+
     def on_toggle_task_submission_backpressure(self, in_backpressure):
         if in_backpressure and self._task_submission_backpressure_start_time == -1:
             # backpressure starting, start timer
@@ -503,18 +566,39 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
             )
             self._task_submission_backpressure_start_time = -1
 
+    def on_scheduling_decision(self, selected: bool):
+        """Callback when the operator is runnable in a scheduling decision."""
+        if selected:
+            self.num_times_scheduled += 1
+        else:
+            self.num_times_starved += 1
+
     def on_output_taken(self, output: RefBundle):
         """Callback when an output is taken from the operator."""
         self.num_outputs_taken += 1
         self.bytes_outputs_taken += output.size_bytes()
 
-    def on_task_submitted(self, task_index: int, inputs: RefBundle):
-        """Callback when the operator submits a task."""
+    def on_task_submitted(
+        self,
+        task_index: int,
+        inputs: RefBundle,
+        preferred_location: Optional[str] = None,
+    ):
+        """Callback when the operator submits a task.
+
+        Args:
+            task_index: The index of the task.
+            inputs: The inputs of the task.
+            preferred_location: The node that the task was preferred to run on, if
+                the task was submitted with a locality hint.
+        """
         self.num_tasks_submitted += 1
         self.num_tasks_running += 1
         self.bytes_inputs_of_submitted_tasks += inputs.size_bytes()
         self._pending_task_inputs.add(inputs)
-        self._running_tasks[task_index] = RunningTaskInfo(inputs, 0, 0)
+        self._running_tasks[task_index] = RunningTaskInfo(
+            inputs, 0, 0, preferred_location
+        )
 
     def on_task_output_generated(self, task_index: int, output: RefBundle):
         """Callback when a new task generates an output."""
@@ -527,6 +611,14 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
         task_info = self._running_tasks[task_index]
         if task_info.num_outputs == 0:
             self.num_tasks_have_outputs += 1
+            if task_info.preferred_location is not None:
+                # The node that ran the task is recorded in the exec stats of its
+                # outputs.
+                exec_stats = output.blocks[0][1].exec_stats
+                if exec_stats.node_id == task_info.preferred_location:
+                    self.task_locality_hits += 1
+                else:
+                    self.task_locality_misses += 1
         task_info.num_outputs += num_outputs
         task_info.bytes_outputs += output_bytes
 
@@ -552,6 +644,7 @@ class OpRuntimeMetrics(metaclass=OpRuntimesMetricsMeta):
         self.num_task_inputs_processed += len(inputs)
         total_input_size = inputs.size_bytes()
         self.bytes_task_inputs_processed += total_input_size
+        self.rows_task_inputs_processed += inputs.num_rows() or 0
         input_size = inputs.size_bytes()
         self._pending_task_inputs.remove(inputs)
         assert self.obj_store_mem_pending_task_inputs >= 0, (
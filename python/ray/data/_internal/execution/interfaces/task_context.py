@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ray.data._internal.progress_bar import ProgressBar
 
@@ -39,3 +39,12 @@ class TaskContext:
 
     # The target maximum number of bytes to include in the task's output block.
     target_max_block_size: Optional[int] = None
+
+    # The number of read tasks whose blocks were loaded from / missing in the block
+    # cache, since they were last reported with the exec stats of an output block.
+    block_cache_hits: int = 0
+    block_cache_misses: int = 0
+
+    # The write checkpoint keys of the read tasks run by this task. This is used to
+    # record the read tasks whose outputs have been written by a fused write.
+    read_task_keys: List[str] = field(default_factory=list)
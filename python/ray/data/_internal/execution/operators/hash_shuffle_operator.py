@@ -0,0 +1,278 @@
+from typing import Any, Dict, List, Optional
+
+import ray
+from ray.data._internal.execution.interfaces import (
+    ExecutionResources,
+    PhysicalOperator,
+    RefBundle,
+)
+from ray.data._internal.execution.interfaces.physical_operator import (
+    MetadataOpTask,
+    OpTask,
+)
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data.block import BlockMetadata
+
+
+class HashShuffleOperator(PhysicalOperator):
+    """A streaming map-reduce shuffle operator.
+
+    Unlike the ``AllToAllOperator``, which waits for all of its inputs before it
+    launches any shuffle task, this operator submits a map task for every input
+    block as soon as it arrives. So the map side of the shuffle overlaps with the
+    upstream operators. Map tasks are submitted through the streaming executor,
+    so the number of them in flight is bounded by the resource limits of the
+    ``ResourceManager``.
+
+    Every map task splits its block into ``num_partitions`` partitions. The map
+    outputs count towards the object store memory usage of this operator until the
+    reduce tasks that consume them finish, so the ``ResourceManager`` throttles the
+    upstream operators while the shuffle holds a lot of data. Once all map tasks
+    have finished, one reduce task is submitted per partition, and each reduced
+    block is output as soon as its task finishes, instead of after all reduce tasks
+    finish. The reduce tasks are submitted one at a time, whenever the resource
+    budget allows this operator to submit a task.
+
+    The map and reduce functions are specified with an ``ExchangeTaskSpec``, whose
+    ``map`` must deterministically assign rows to partitions (e.g., by the hash of
+    key columns).
+    """
+
+    def __init__(
+        self,
+        input_op: PhysicalOperator,
+        exchange_spec: ExchangeTaskSpec,
+        num_partitions: int,
+        name: str = "HashShuffle",
+        map_ray_remote_args: Optional[Dict[str, Any]] = None,
+        reduce_ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        """Create a HashShuffleOperator.
+
+        Args:
+            input_op: Operator generating input data for this op.
+            exchange_spec: The map and reduce functions of the shuffle.
+            num_partitions: The number of partitions, i.e., the number of
+                output blocks.
+            name: The name of this operator.
+            map_ray_remote_args: Customize the ray remote args of the map tasks.
+            reduce_ray_remote_args: Customize the ray remote args of the
+                reduce tasks.
+        """
+        assert num_partitions > 0, num_partitions
+        self._exchange_spec = exchange_spec
+        self._num_partitions = num_partitions
+        self._map_ray_remote_args = map_ray_remote_args or {}
+        self._reduce_ray_remote_args = reduce_ray_remote_args or {
+            "scheduling_strategy": "SPREAD"
+        }
+
+        self._next_task_index = 0
+        self._map_tasks: Dict[int, MetadataOpTask] = {}
+        self._reduce_tasks: Dict[int, MetadataOpTask] = {}
+        # The map outputs of each partition, in the order of the map tasks.
+        self._partitions: List[List[ray.ObjectRef]] = [
+            [] for _ in range(num_partitions)
+        ]
+        # The estimated size in bytes of the map outputs of each partition.
+        self._partition_bytes: List[int] = [0] * num_partitions
+        # The estimated size in bytes of the map outputs consumed by each running
+        # reduce task.
+        self._reduce_task_input_bytes: Dict[int, int] = {}
+        self._reduce_started = False
+        self._next_partition_to_reduce = 0
+        self._num_partitions_reduced = 0
+        self._output_buffer: List[RefBundle] = []
+        self._output_metadata: List[BlockMetadata] = []
+        self._map_metadata: List[BlockMetadata] = []
+        super().__init__(name, [input_op], target_max_block_size=None)
+
+    def num_outputs_total(self) -> Optional[int]:
+        return self._num_partitions
+
+    def _add_input_inner(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0, input_index
+        shuffle_map = cached_remote_fn(self._exchange_spec.map)
+        for block_ref, metadata in refs.blocks:
+            task_index = self._next_task_index
+            self._next_task_index += 1
+            task_input = RefBundle(
+                [(block_ref, metadata)], owns_blocks=refs.owns_blocks
+            )
+            map_out = shuffle_map.options(
+                **self._map_ray_remote_args,
+                num_returns=1 + self._num_partitions,
+            ).remote(
+                task_index,
+                block_ref,
+                self._num_partitions,
+                *self._exchange_spec._map_args,
+            )
+            self._metrics.on_task_submitted(task_index, task_input)
+            self._map_tasks[task_index] = MetadataOpTask(
+                task_index,
+                map_out[-1],
+                lambda i=task_index, out=map_out, size=metadata.size_bytes: (
+                    self._on_map_task_done(i, out, size)
+                ),
+            )
+
+    def _on_map_task_done(
+        self,
+        task_index: int,
+        map_out: List[ray.ObjectRef],
+        input_size_bytes: Optional[int],
+    ):
+        metadata = ray.get(map_out[-1])
+        self._map_metadata.append(metadata)
+        # The sizes of the partitions aren't reported, so assume that the map
+        # outputs are as large as the input, and evenly split between partitions.
+        size_bytes = metadata.size_bytes or input_size_bytes or 0
+        for i, block_ref in enumerate(map_out[:-1]):
+            self._partitions[i].append(block_ref)
+            self._partition_bytes[i] += size_bytes // self._num_partitions
+        self._metrics.on_shuffle_map_outputs_held(
+            size_bytes // self._num_partitions * self._num_partitions
+        )
+        # The input block has been partitioned, so it can be released now.
+        self._metrics.on_task_finished(task_index, None)
+        self._map_tasks.pop(task_index)
+        self._try_start_reduce()
+
+    def all_inputs_done(self) -> None:
+        super().all_inputs_done()
+        self._try_start_reduce()
+
+    def _try_start_reduce(self):
+        """Start the reduce phase once all map tasks have finished."""
+        if self._reduce_started or not self._inputs_complete or self._map_tasks:
+            return
+        self._reduce_started = True
+        if self._next_task_index == 0:
+            # No input blocks, so there's nothing to reduce.
+            self._next_partition_to_reduce = self._num_partitions
+            self._num_partitions_reduced = self._num_partitions
+            self._partitions = []
+            return
+        self._submit_next_reduce_task()
+
+    def notify_in_task_submission_backpressure(self, in_backpressure: bool) -> None:
+        super().notify_in_task_submission_backpressure(in_backpressure)
+        # The reduce tasks aren't submitted through `add_input`, so throttle them
+        # with the backpressure status that the executor computes on every
+        # scheduling step.
+        if self._reduce_started and not in_backpressure:
+            self._submit_next_reduce_task()
+
+    def _submit_next_reduce_task(self):
+        """Submit the reduce task of the next partition, if any."""
+        if self._next_partition_to_reduce >= self._num_partitions:
+            return
+        partition_index = self._next_partition_to_reduce
+        self._next_partition_to_reduce += 1
+
+        shuffle_reduce = cached_remote_fn(self._exchange_spec.reduce)
+        task_index = self._next_task_index
+        self._next_task_index += 1
+        block_ref, metadata_ref = shuffle_reduce.options(
+            **self._reduce_ray_remote_args, num_returns=2
+        ).remote(
+            *self._exchange_spec._reduce_args, *self._partitions[partition_index]
+        )
+        self._reduce_tasks[task_index] = MetadataOpTask(
+            task_index,
+            metadata_ref,
+            lambda i=task_index, b=block_ref, m=metadata_ref: (
+                self._on_reduce_task_done(i, b, m)
+            ),
+        )
+        # The reduce task holds references to the map outputs now. They're
+        # released from the memory accounting once it has consumed them.
+        self._partitions[partition_index] = []
+        self._reduce_task_input_bytes[task_index] = self._partition_bytes[
+            partition_index
+        ]
+        self._partition_bytes[partition_index] = 0
+
+    def _on_reduce_task_done(
+        self, task_index: int, block_ref: ray.ObjectRef, metadata_ref: ray.ObjectRef
+    ):
+        metadata = ray.get(metadata_ref)
+        output = RefBundle([(block_ref, metadata)], owns_blocks=True)
+        self._output_buffer.append(output)
+        self._metrics.on_output_queued(output)
+        self._output_metadata.append(metadata)
+        self._metrics.on_shuffle_map_outputs_released(
+            self._reduce_task_input_bytes.pop(task_index)
+        )
+        self._reduce_tasks.pop(task_index)
+        self._num_partitions_reduced += 1
+        if not self._reduce_tasks:
+            # Always keep one reduce task running, so that the shuffle makes
+            # progress even if its map outputs exceed the budget, and so that this
+            # operator isn't considered completed before all partitions are reduced.
+            self._submit_next_reduce_task()
+
+    def has_next(self) -> bool:
+        return len(self._output_buffer) > 0
+
+    def _get_next_inner(self) -> RefBundle:
+        output = self._output_buffer.pop(0)
+        self._metrics.on_output_dequeued(output)
+        return output
+
+    def get_active_tasks(self) -> List[OpTask]:
+        return list(self._map_tasks.values()) + list(self._reduce_tasks.values())
+
+    def get_stats(self) -> StatsDict:
+        return {"map": self._map_metadata, "reduce": self._output_metadata}
+
+    def progress_str(self) -> str:
+        if self._reduce_started:
+            return (
+                f"reduce: {self._num_partitions_reduced}/{self._num_partitions} "
+                "partitions"
+            )
+        return f"map: {self._metrics.num_tasks_finished} blocks"
+
+    def current_processor_usage(self) -> ExecutionResources:
+        num_cpus = self._map_ray_remote_args.get("num_cpus", 1)
+        return ExecutionResources(
+            cpu=num_cpus * len(self._map_tasks)
+            + self._reduce_ray_remote_args.get("num_cpus", 1) * len(self._reduce_tasks)
+        )
+
+    def incremental_resource_usage(self) -> ExecutionResources:
+        if self._reduce_started:
+            return ExecutionResources(
+                cpu=self._reduce_ray_remote_args.get("num_cpus", 1)
+            )
+        return ExecutionResources(cpu=self._map_ray_remote_args.get("num_cpus", 1))
+
+    def shutdown(self):
+        # Cancel all active tasks.
+        tasks = list(self._map_tasks.values()) + list(self._reduce_tasks.values())
+        for task in tasks:
+            ray.cancel(task.get_waitable())
+        # Wait until all tasks have failed or been cancelled.
+        for task in tasks:
+            try:
+                ray.get(task.get_waitable())
+            except ray.exceptions.RayError:
+                # Cancellation either succeeded, or the task had already failed with
+                # a different error, or cancellation failed. In all cases, we
+                # swallow the exception.
+                pass
+        self._metrics.on_shuffle_map_outputs_released(
+            sum(self._partition_bytes) + sum(self._reduce_task_input_bytes.values())
+        )
+        self._map_tasks.clear()
+        self._reduce_tasks.clear()
+        self._partitions = []
+        self._partition_bytes = [0] * self._num_partitions
+        self._reduce_task_input_bytes.clear()
+        self._output_buffer.clear()
+        super().shutdown()
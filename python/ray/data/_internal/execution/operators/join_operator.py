@@ -0,0 +1,263 @@
+from typing import List, Optional, Tuple
+
+import ray
+from ray.data._internal.execution.interfaces import (
+    PhysicalOperator,
+    RefBundle,
+    TaskContext,
+)
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.exchange.join_task_spec import (
+    JoinTaskSpec,
+    join_blocks,
+)
+from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
+    PullBasedShuffleTaskScheduler,
+)
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DataContext
+
+
+class JoinOperator(PhysicalOperator):
+    """An operator that joins its two inputs on a list of key columns.
+
+    If the total size of one input is below
+    ``DataContext.broadcast_join_threshold_bytes``, and the join type allows it, the
+    smaller input is broadcast to one task per block of the larger input. Otherwise,
+    both inputs are hash-partitioned by the join keys with a map-reduce shuffle, and
+    each reduce task joins one partition.
+
+    NOTE: the implementation is bulk for now, which materializes all its inputs in
+    object store, before starting execution.
+    """
+
+    def __init__(
+        self,
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+        keys: List[str],
+        join_type: str,
+        num_partitions: Optional[int] = None,
+        left_suffix: Optional[str] = None,
+        right_suffix: Optional[str] = None,
+    ):
+        """Create a JoinOperator.
+
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            keys: The names of the columns to join on.
+            join_type: One of "inner", "left", "right" and "outer".
+            num_partitions: The number of partitions for the hash join. Defaults to
+                the number of blocks of the larger input.
+            left_suffix: The suffix to add to overlapping non-key column names
+                of the left input.
+            right_suffix: The suffix to add to overlapping non-key column names
+                of the right input.
+        """
+        self._keys = keys
+        self._join_type = join_type
+        self._num_partitions = num_partitions
+        self._left_suffix = left_suffix
+        self._right_suffix = right_suffix
+        self._left_buffer: List[RefBundle] = []
+        self._right_buffer: List[RefBundle] = []
+        self._output_buffer: List[RefBundle] = []
+        self._stats: StatsDict = {}
+        super().__init__(
+            "Join", [left_input_op, right_input_op], target_max_block_size=None
+        )
+
+    def num_outputs_total(self) -> Optional[int]:
+        if self._num_partitions is not None:
+            return self._num_partitions
+        left_num_outputs = self.input_dependencies[0].num_outputs_total()
+        right_num_outputs = self.input_dependencies[1].num_outputs_total()
+        if left_num_outputs is None or right_num_outputs is None:
+            return None
+        return max(left_num_outputs, right_num_outputs)
+
+    def _add_input_inner(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+        if input_index == 0:
+            self._left_buffer.append(refs)
+        else:
+            self._right_buffer.append(refs)
+
+    def all_inputs_done(self) -> None:
+        self._output_buffer, self._stats = self._join(
+            self._left_buffer, self._right_buffer
+        )
+        self._left_buffer.clear()
+        self._right_buffer.clear()
+        super().all_inputs_done()
+
+    def has_next(self) -> bool:
+        return len(self._output_buffer) > 0
+
+    def _get_next_inner(self) -> RefBundle:
+        return self._output_buffer.pop(0)
+
+    def get_stats(self) -> StatsDict:
+        return self._stats
+
+    def _join(
+        self, left_input: List[RefBundle], right_input: List[RefBundle]
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        left_num_blocks = sum(len(bundle.blocks) for bundle in left_input)
+        right_num_blocks = sum(len(bundle.blocks) for bundle in right_input)
+
+        if left_num_blocks == 0 or right_num_blocks == 0:
+            # The schema of an input without blocks is unknown, so there's nothing
+            # to join with. Pass the other input through for outer joins.
+            if self._join_type == "outer":
+                output = left_input if left_num_blocks > 0 else right_input
+            elif self._join_type == "left":
+                output = left_input
+            elif self._join_type == "right":
+                output = right_input
+            else:
+                output = []
+            for ref in left_input + right_input:
+                if not any(ref is output_ref for output_ref in output):
+                    ref.destroy_if_owned()
+            return output, {self._name: []}
+
+        threshold = DataContext.get_current().broadcast_join_threshold_bytes
+        left_size = _size_bytes(left_input)
+        right_size = _size_bytes(right_input)
+        # A broadcast input must be the one whose unmatched rows are dropped, because
+        # each of its rows is joined once per block of the other input.
+        broadcast_right = (
+            self._join_type in ("inner", "left")
+            and right_size is not None
+            and right_size <= threshold
+        )
+        broadcast_left = (
+            self._join_type in ("inner", "right")
+            and left_size is not None
+            and left_size <= threshold
+        )
+        if broadcast_right and broadcast_left:
+            # Broadcast the smaller input.
+            broadcast_left = left_size < right_size
+            broadcast_right = not broadcast_left
+
+        if broadcast_right:
+            output, stats = self._broadcast_join(left_input, right_input, False)
+        elif broadcast_left:
+            output, stats = self._broadcast_join(right_input, left_input, True)
+        else:
+            output, stats = self._hash_join(
+                left_input,
+                right_input,
+                left_num_blocks,
+                self._num_partitions or max(left_num_blocks, right_num_blocks),
+            )
+
+        # Clean up inputs.
+        for ref in left_input:
+            ref.destroy_if_owned()
+        for ref in right_input:
+            ref.destroy_if_owned()
+
+        return output, stats
+
+    def _hash_join(
+        self,
+        left_input: List[RefBundle],
+        right_input: List[RefBundle],
+        left_num_blocks: int,
+        num_partitions: int,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        join_spec = JoinTaskSpec(
+            left_num_blocks,
+            self._keys,
+            self._join_type,
+            self._left_suffix,
+            self._right_suffix,
+        )
+        # Push-based shuffle merges map outputs before the reduce, which would mix
+        # up the blocks of both inputs, so always use the pull-based scheduler.
+        scheduler = PullBasedShuffleTaskScheduler(join_spec)
+        sub_progress_bar_dict = {
+            name: ProgressBar(name, num_partitions, unit="task", enabled=False)
+            for name in [
+                ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
+                ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
+            ]
+        }
+        ctx = TaskContext(task_idx=0, sub_progress_bar_dict=sub_progress_bar_dict)
+        return scheduler.execute(left_input + right_input, num_partitions, ctx)
+
+    def _broadcast_join(
+        self,
+        input: List[RefBundle],
+        broadcast_input: List[RefBundle],
+        broadcast_is_left: bool,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        broadcast_blocks = [
+            block for bundle in broadcast_input for block in bundle.block_refs
+        ]
+        join_one_block = cached_remote_fn(_broadcast_join_one_block, num_returns=2)
+
+        output_blocks = []
+        output_metadata = []
+        for bundle in input:
+            for block in bundle.block_refs:
+                res, meta = join_one_block.remote(
+                    block,
+                    *broadcast_blocks,
+                    broadcast_is_left=broadcast_is_left,
+                    keys=self._keys,
+                    join_type=self._join_type,
+                    left_suffix=self._left_suffix,
+                    right_suffix=self._right_suffix,
+                )
+                output_blocks.append(res)
+                output_metadata.append(meta)
+
+        output_metadata = ray.get(output_metadata)
+        input_owned = all(b.owns_blocks for b in input)
+        output_refs = [
+            RefBundle([(block, meta)], owns_blocks=input_owned)
+            for block, meta in zip(output_blocks, output_metadata)
+        ]
+        return output_refs, {self._name: output_metadata}
+
+
+def _size_bytes(bundles: List[RefBundle]) -> Optional[int]:
+    """The total size of ``bundles``, or ``None`` if any block size is unknown."""
+    total = 0
+    for bundle in bundles:
+        for _, metadata in bundle.blocks:
+            if metadata.size_bytes is None:
+                return None
+            total += metadata.size_bytes
+    return total
+
+
+def _broadcast_join_one_block(
+    block: Block,
+    *broadcast_blocks: Block,
+    broadcast_is_left: bool,
+    keys: List[str],
+    join_type: str,
+    left_suffix: Optional[str],
+    right_suffix: Optional[str],
+) -> Tuple[Block, BlockMetadata]:
+    """Join `block` with the concatenation of `broadcast_blocks`."""
+    stats = BlockExecStats.builder()
+    if broadcast_is_left:
+        left_blocks, right_blocks = list(broadcast_blocks), [block]
+    else:
+        left_blocks, right_blocks = [block], list(broadcast_blocks)
+    result = join_blocks(
+        left_blocks, right_blocks, keys, join_type, left_suffix, right_suffix
+    )
+    br = BlockAccessor.for_block(result)
+    return result, br.get_metadata(exec_stats=stats.build())
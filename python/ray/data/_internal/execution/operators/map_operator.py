@@ -2,6 +2,7 @@ import copy
 import functools
 import itertools
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
 from typing import (
@@ -28,6 +29,7 @@ from ray.data._internal.compute import (
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
+    NodeIdStr,
     PhysicalOperator,
     RefBundle,
     TaskContext,
@@ -43,6 +45,7 @@ from ray.data._internal.execution.operators.base_physical_operator import (
 from ray.data._internal.execution.operators.map_transformer import (
     ApplyAdditionalSplitToOutputBlocks,
     MapTransformer,
+    TransformProfiler,
 )
 from ray.data._internal.stats import StatsDict
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
@@ -264,6 +267,13 @@ class MapOperator(OneToOneOperator, ABC):
     def _get_runtime_ray_remote_args(
         self, input_bundle: Optional[RefBundle] = None
     ) -> Dict[str, Any]:
+        return self._add_default_ray_remote_args(
+            self._get_user_ray_remote_args(), input_bundle
+        )
+
+    def _get_user_ray_remote_args(self) -> Dict[str, Any]:
+        """Return the remote args specified by the user, including the dynamic ones
+        from ``ray_remote_args_fn``."""
         ray_remote_args = copy.deepcopy(self._ray_remote_args)
 
         # Override parameters from user provided remote args function.
@@ -271,6 +281,12 @@ class MapOperator(OneToOneOperator, ABC):
             new_remote_args = self._ray_remote_args_fn()
             for k, v in new_remote_args.items():
                 ray_remote_args[k] = v
+        return ray_remote_args
+
+    def _add_default_ray_remote_args(
+        self, ray_remote_args: Dict[str, Any], input_bundle: Optional[RefBundle]
+    ) -> Dict[str, Any]:
+        """Add the default scheduling strategy to the user's ``ray_remote_args``."""
         # For tasks with small args, we will use SPREAD by default to optimize for
         # compute load-balancing. For tasks with large args, we will use DEFAULT to
         # allow the Ray locality scheduler a chance to optimize task placement.
@@ -314,6 +330,7 @@ class MapOperator(OneToOneOperator, ABC):
         gen: ObjectRefGenerator,
         inputs: RefBundle,
         task_done_callback: Optional[Callable[[], None]] = None,
+        preferred_location: Optional[NodeIdStr] = None,
     ):
         """Submit a new data-handling task."""
         # TODO(hchen):
@@ -323,7 +340,7 @@ class MapOperator(OneToOneOperator, ABC):
         #    can also be capsulated in the base class.
         task_index = self._next_data_task_idx
         self._next_data_task_idx += 1
-        self._metrics.on_task_submitted(task_index, inputs)
+        self._metrics.on_task_submitted(task_index, inputs, preferred_location)
 
         def _output_ready_callback(task_index, output: RefBundle):
             # Since output is streamed, it should only contain one block.
@@ -479,13 +496,27 @@ def _map_task(
     DataContext._set_current(data_context)
     stats = BlockExecStats.builder()
     map_transformer.set_target_max_block_size(ctx.target_max_block_size)
-    for b_out in map_transformer.apply_transform(iter(blocks), ctx):
+    profiler = None
+    if data_context.enable_transform_profiling:
+        profiler = TransformProfiler(map_transformer, ctx.task_idx)
+    for b_out in map_transformer.apply_transform(iter(blocks), ctx, profiler):
         # TODO(Clark): Add input file propagation from input blocks.
         m_out = BlockAccessor.for_block(b_out).get_metadata()
         m_out.exec_stats = stats.build()
         m_out.exec_stats.udf_time_s = map_transformer.udf_time()
         m_out.exec_stats.task_idx = ctx.task_idx
+        m_out.exec_stats.block_cache_hits = ctx.block_cache_hits
+        m_out.exec_stats.block_cache_misses = ctx.block_cache_misses
+        ctx.block_cache_hits = ctx.block_cache_misses = 0
+        if profiler is not None:
+            # The output block is serialized into the object store when it's yielded.
+            output_start, output_start_wall = time.perf_counter(), time.time()
         yield b_out
+        if profiler is not None:
+            profiler.profile_output(output_start, output_start_wall)
+            # The metadata is serialized after the profile is set, so the profile
+            # includes the output of this block.
+            m_out.exec_stats.transform_profile = profiler.pop_profile()
         yield m_out
         stats = BlockExecStats.builder()
 
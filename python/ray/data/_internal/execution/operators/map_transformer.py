@@ -1,9 +1,13 @@
 import itertools
+import os
 import time
 from abc import abstractmethod
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 
+import psutil
+
 from ray.data._internal.block_batching.block_batching import batch_blocks
 from ray.data._internal.execution.interfaces.task_context import TaskContext
 from ray.data._internal.output_buffer import BlockOutputBuffer
@@ -141,8 +145,17 @@ class MapTransformer:
         self,
         input_blocks: Iterable[Block],
         ctx: TaskContext,
+        profiler: Optional["TransformProfiler"] = None,
     ) -> Iterable[Block]:
-        """Apply the transform functions to the input blocks."""
+        """Apply the transform functions to the input blocks.
+
+        Args:
+            input_blocks: The input blocks.
+            ctx: The context of the task.
+            profiler: If set, times each transform function and samples the memory
+                usage. It must have been created for the transform functions of
+                this transformer.
+        """
         assert (
             self._target_max_block_size is not None
         ), "target_max_block_size must be set before running"
@@ -151,10 +164,12 @@ class MapTransformer:
 
         iter = input_blocks
         # Apply the transform functions sequentially to the input iterable.
-        for transform_fn in self._transform_fns:
+        for i, transform_fn in enumerate(self._transform_fns):
             iter = transform_fn(iter, ctx)
             if transform_fn._is_udf:
                 iter = self._udf_timed_iter(iter)
+            if profiler is not None:
+                iter = profiler.profile_stage(i, iter)
         return iter
 
     def fuse(self, other: "MapTransformer") -> "MapTransformer":
@@ -184,6 +199,148 @@ class MapTransformer:
         return self._udf_time
 
 
+@dataclass
+class TransformProfile:
+    """The profile of the transform functions of a task."""
+
+    # The names of the stages, i.e., the transform functions followed by the output
+    # stage, which yields the output blocks to be stored in the object store.
+    stage_names: List[str]
+    # The time spent in each stage, excluding the time spent in upstream stages.
+    stage_time_s: List[float]
+    # The number of times each stage produced an output.
+    stage_num_outputs: List[int]
+    # The peak memory usage of the worker process sampled after each stage
+    # produced an output.
+    stage_peak_rss_bytes: List[int]
+    # The outputs of the stages as complete events of the Chrome trace event format.
+    trace_events: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class TransformProfiler:
+    """Profiles the transform functions of a MapTransformer in a task.
+
+    Transform functions are chained generators, so the time spent in producing an
+    output of a transform function includes the time spent in the upstream ones.
+    The profiler subtracts the latter, to attribute the time to the transform
+    function that actually spent it.
+    """
+
+    # The min interval between samples of the memory usage.
+    MEMORY_SAMPLE_INTERVAL_S = 0.01
+
+    # The max number of trace events kept per task, to bound the size of the stats.
+    # The count spans `pop_profile` calls, so that the events of a task are bounded
+    # regardless of how many output blocks they're attached to.
+    MAX_TRACE_EVENTS = 10000
+
+    def __init__(self, transformer: MapTransformer, task_idx: int):
+        self._stage_names = [
+            _get_stage_name(i, fn)
+            for i, fn in enumerate(transformer.get_transform_fns())
+        ] + ["Output"]
+        self._task_idx = task_idx
+        self._process = psutil.Process(os.getpid())
+        self._last_memory_sample_time = 0
+        self._rss_bytes = 0
+        # The time spent in each stage including the upstream stages. It's never
+        # reset, so that it's consistent for calls that span `pop_profile`.
+        self._inclusive_time_s = [0.0] * len(self._stage_names)
+        # The number of trace events recorded by this task. It's never reset.
+        self._num_trace_events = 0
+        self._reset()
+
+    def profile_stage(self, stage_idx: int, iter: Iterable[Any]) -> Iterable[Any]:
+        """Profile the outputs of the given stage."""
+        iter = iter.__iter__()
+        while True:
+            upstream_start = (
+                self._inclusive_time_s[stage_idx - 1] if stage_idx > 0 else 0
+            )
+            start = time.perf_counter()
+            start_wall = time.time()
+            try:
+                output = next(iter)
+            except StopIteration:
+                self._record(stage_idx, start, start_wall, upstream_start, False)
+                break
+            self._record(stage_idx, start, start_wall, upstream_start, True)
+            yield output
+
+    def profile_output(self, start: float, start_wall: float):
+        """Record that the output stage, which started at the given times, ended."""
+        self._record(len(self._stage_names) - 1, start, start_wall, None, True)
+
+    def pop_profile(self) -> TransformProfile:
+        """Return the profile since the previous call, and reset it."""
+        profile = TransformProfile(
+            stage_names=self._stage_names,
+            stage_time_s=self._stage_time_s,
+            stage_num_outputs=self._stage_num_outputs,
+            stage_peak_rss_bytes=self._stage_peak_rss_bytes,
+            trace_events=self._trace_events,
+        )
+        self._reset()
+        return profile
+
+    def _reset(self):
+        num_stages = len(self._stage_names)
+        self._stage_time_s = [0.0] * num_stages
+        self._stage_num_outputs = [0] * num_stages
+        self._stage_peak_rss_bytes = [0] * num_stages
+        self._trace_events = []
+
+    def _record(
+        self,
+        stage_idx: int,
+        start: float,
+        start_wall: float,
+        upstream_start: Optional[float],
+        has_output: bool,
+    ):
+        duration = time.perf_counter() - start
+        self._inclusive_time_s[stage_idx] += duration
+        if upstream_start is not None and stage_idx > 0:
+            upstream_duration = self._inclusive_time_s[stage_idx - 1] - upstream_start
+        else:
+            upstream_duration = 0
+        self._stage_time_s[stage_idx] += max(duration - upstream_duration, 0)
+        if has_output:
+            self._stage_num_outputs[stage_idx] += 1
+
+        now = time.perf_counter()
+        if now - self._last_memory_sample_time >= self.MEMORY_SAMPLE_INTERVAL_S:
+            self._rss_bytes = self._process.memory_info().rss
+            self._last_memory_sample_time = now
+        self._stage_peak_rss_bytes[stage_idx] = max(
+            self._stage_peak_rss_bytes[stage_idx], self._rss_bytes
+        )
+
+        if self._num_trace_events < self.MAX_TRACE_EVENTS:
+            self._num_trace_events += 1
+            self._trace_events.append(
+                {
+                    "name": self._stage_names[stage_idx],
+                    "ph": "X",
+                    "ts": start_wall * 1e6,
+                    "dur": duration * 1e6,
+                    "tid": self._task_idx,
+                }
+            )
+
+
+def _get_stage_name(stage_idx: int, transform_fn: MapTransformFn) -> str:
+    name = type(transform_fn).__name__
+    # Name the stages after the wrapped functions if possible, e.g., the read
+    # functions, since the type names alone are ambiguous.
+    fn = getattr(transform_fn, "_block_fn", None)
+    if fn is not None:
+        name += f"({getattr(fn, '__name__', type(fn).__name__)})"
+    if transform_fn._is_udf:
+        name += "[UDF]"
+    return f"{stage_idx}: {name}"
+
+
 def create_map_transformer_from_block_fn(
     block_fn: MapTransformCallable[Block, Block],
     init_fn: Optional[Callable[[], None]] = None,
@@ -1,16 +1,21 @@
+from collections import defaultdict
 from typing import Any, Callable, Dict, Optional
 
 import ray
 from ray.data._internal.execution.interfaces import (
+    ExecutionOptions,
     ExecutionResources,
+    NodeIdStr,
     PhysicalOperator,
     RefBundle,
     TaskContext,
 )
 from ray.data._internal.execution.operators.map_operator import MapOperator, _map_task
 from ray.data._internal.execution.operators.map_transformer import MapTransformer
+from ray.data._internal.execution.util import locality_string
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data.context import DataContext
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
 
 class TaskPoolMapOperator(MapOperator):
@@ -72,6 +77,27 @@ class TaskPoolMapOperator(MapOperator):
         }
 
         self._map_task = cached_remote_fn(_map_task, **ray_remote_static_args)
+        self._task_locality_enabled = False
+        self._task_locality_fallback = None
+
+    def start(self, options: ExecutionOptions):
+        from ray.data._internal.logical.operators.read_operator import Read
+
+        super().start(options)
+        # Locality hints don't override the scheduling strategies that are set by
+        # the user or by `locality_with_output`. They also don't apply to reads,
+        # whose inputs are read tasks put by the driver, so they'd all be hinted
+        # to the driver's node.
+        reads_input = bool(self._logical_operators) and isinstance(
+            self._logical_operators[0], Read
+        )
+        self._task_locality_enabled = (
+            options.task_locality_enabled
+            and not options.locality_with_output
+            and "scheduling_strategy" not in self._ray_remote_args
+            and not reads_input
+        )
+        self._task_locality_fallback = options.task_locality_fallback
 
     def _add_bundled_input(self, bundle: RefBundle):
         # Submit the task as a normal Ray task.
@@ -80,7 +106,26 @@ class TaskPoolMapOperator(MapOperator):
             target_max_block_size=self.actual_target_max_block_size,
         )
 
-        dynamic_ray_remote_args = self._get_runtime_ray_remote_args(input_bundle=bundle)
+        dynamic_ray_remote_args = self._get_user_ray_remote_args()
+        preferred_location = None
+        # `ray_remote_args_fn` can also set a scheduling strategy.
+        if (
+            self._task_locality_enabled
+            and "scheduling_strategy" not in dynamic_ray_remote_args
+        ):
+            preferred_location = self._get_location(bundle)
+        if preferred_location is not None:
+            dynamic_ray_remote_args[
+                "scheduling_strategy"
+            ] = NodeAffinitySchedulingStrategy(
+                preferred_location,
+                soft=True,
+                _spill_on_unavailable=self._task_locality_fallback == "spill",
+            )
+        else:
+            dynamic_ray_remote_args = self._add_default_ray_remote_args(
+                dynamic_ray_remote_args, bundle
+            )
         dynamic_ray_remote_args["name"] = self.name
 
         data_context = DataContext.get_current()
@@ -98,7 +143,22 @@ class TaskPoolMapOperator(MapOperator):
             ctx,
             *bundle.block_refs,
         )
-        self._submit_data_task(gen, bundle)
+        self._submit_data_task(gen, bundle, preferred_location=preferred_location)
+
+    def _get_location(self, bundle: RefBundle) -> Optional[NodeIdStr]:
+        """Return the node that produced the most bytes of the bundle, or None if
+        the producers of the blocks are unknown.
+
+        The producers are recorded in the exec stats of the blocks, so this
+        doesn't look up the object locations for each task.
+        """
+        bytes_per_node = defaultdict(int)
+        for metadata in bundle.metadata:
+            if metadata.exec_stats is not None and metadata.exec_stats.node_id:
+                bytes_per_node[metadata.exec_stats.node_id] += metadata.size_bytes or 0
+        if not bytes_per_node:
+            return None
+        return max(bytes_per_node, key=bytes_per_node.get)
 
     def shutdown(self):
         # Cancel all active tasks.
@@ -116,6 +176,11 @@ class TaskPoolMapOperator(MapOperator):
         super().shutdown()
 
     def progress_str(self) -> str:
+        if self._task_locality_enabled:
+            return locality_string(
+                self._metrics.task_locality_hits,
+                self._metrics.task_locality_misses,
+            )
         return ""
 
     def base_resource_usage(self) -> ExecutionResources:
@@ -92,6 +92,8 @@ class ResourceManager:
         mem_op_internal = op.metrics.obj_store_mem_pending_task_outputs or 0
         # Op's internal output buffers.
         mem_op_internal += op.metrics.obj_store_mem_internal_outqueue
+        # Shuffle map outputs that haven't been consumed by reduce tasks.
+        mem_op_internal += op.metrics.obj_store_mem_shuffle_map_outputs
 
         # Op's external output buffer.
         mem_op_outputs = state.outqueue_memory_usage()
@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING
+
+import ray
+from .bottleneck_scheduling_policy import BottleneckSchedulingPolicy
+from .memory_usage_scheduling_policy import MemoryUsageSchedulingPolicy
+from .scheduling_policy import SchedulingPolicy
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.resource_manager import ResourceManager
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+# Default scheduling policy and its config key.
+# Use `DataContext.set_config` to config it.
+DEFAULT_SCHEDULING_POLICY = MemoryUsageSchedulingPolicy
+SCHEDULING_POLICY_CONFIG_KEY = "scheduling_policy"
+
+
+def get_scheduling_policy(
+    topology: "Topology", resource_manager: "ResourceManager"
+) -> SchedulingPolicy:
+    data_context = ray.data.DataContext.get_current()
+    policy = data_context.get_config(
+        SCHEDULING_POLICY_CONFIG_KEY, DEFAULT_SCHEDULING_POLICY
+    )
+    return policy(topology, resource_manager)
+
+
+__all__ = [
+    "BottleneckSchedulingPolicy",
+    "MemoryUsageSchedulingPolicy",
+    "SchedulingPolicy",
+    "SCHEDULING_POLICY_CONFIG_KEY",
+    "get_scheduling_policy",
+]
@@ -0,0 +1,98 @@
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .scheduling_policy import SchedulingPolicy
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces.physical_operator import (
+        PhysicalOperator,
+    )
+    from ray.data._internal.execution.resource_manager import ResourceManager
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+
+class BottleneckSchedulingPolicy(SchedulingPolicy):
+    """A scheduling policy that balances the operators to the bottleneck.
+
+    The end-to-end throughput of a pipeline is bounded by its slowest operator. So
+    this policy prioritizes the operator with the lowest estimated throughput, to
+    keep it saturated, over the operators that are already producing faster than
+    their downstream can consume.
+
+    The throughput of an operator is estimated from its `OpRuntimeMetrics` as the
+    number of rows each of its tasks output per second, multiplied by the number of
+    running tasks. To make operators that filter or expand rows comparable, the
+    throughput is then converted to the number of rows it eventually results in at
+    the end of the pipeline, using the measured ratio of output rows to input rows
+    of the downstream operators.
+
+    Like the default policy, metadata-only operators always run first. Operators
+    without an estimate yet (e.g., no task has produced outputs) run next, so their
+    throughput gets measured. Ties are broken by the object store memory usage.
+    """
+
+    def __init__(self, topology: "Topology", resource_manager: "ResourceManager"):
+        self._topology = topology
+        self._resource_manager = resource_manager
+        # The estimated throughputs in the last `select_operator` call.
+        self._throughputs: Dict["PhysicalOperator", Optional[float]] = {}
+
+    def select_operator(self, ops: List["PhysicalOperator"]) -> "PhysicalOperator":
+        ratios_to_end = self._output_input_ratios_to_end()
+        self._throughputs = {
+            op: self._estimate_throughput(op, ratios_to_end[op]) for op in ops
+        }
+        return min(
+            ops,
+            key=lambda op: (
+                not op.throttling_disabled(),
+                self._throughputs[op] is not None,
+                self._throughputs[op] or 0,
+                self._resource_manager.get_op_usage(op).object_store_memory,
+            ),
+        )
+
+    def explain(self, op: "PhysicalOperator") -> str:
+        if op.throttling_disabled():
+            return "metadata-only operator"
+        throughput = self._throughputs.get(op)
+        if throughput is None:
+            return "no throughput estimate yet"
+        return f"estimated throughput={throughput:.1f} rows/s"
+
+    def _output_input_ratios_to_end(self) -> Dict["PhysicalOperator", float]:
+        """Return the ratio of the rows at the end of the pipeline to the output
+        rows of each operator, following the first output of each operator."""
+        ratios = {}
+        # The topology is ordered from upstream to downstream, so the ratio of each
+        # operator's downstream is computed first.
+        for op in reversed(list(self._topology)):
+            if op.output_dependencies:
+                next_op = op.output_dependencies[0]
+                ratios[op] = _output_input_ratio(next_op) * ratios[next_op]
+            else:
+                ratios[op] = 1.0
+        return ratios
+
+    def _estimate_throughput(
+        self, op: "PhysicalOperator", ratio_to_end: float
+    ) -> Optional[float]:
+        """Estimate the throughput of ``op`` in rows/s at the end of the pipeline,
+        or None if there isn't enough data to estimate it."""
+        metrics = op._metrics
+        if (
+            metrics.block_generation_time <= 0
+            or metrics.rows_task_outputs_generated == 0
+        ):
+            return None
+        rows_per_task_s = (
+            metrics.rows_task_outputs_generated / metrics.block_generation_time
+        )
+        return rows_per_task_s * metrics.num_tasks_running * ratio_to_end
+
+
+def _output_input_ratio(op: "PhysicalOperator") -> float:
+    """The measured ratio of output rows to input rows of ``op``, or 1 if unknown."""
+    metrics = op._metrics
+    if metrics.rows_task_inputs_processed == 0:
+        return 1.0
+    return metrics.rows_task_outputs_generated / metrics.rows_task_inputs_processed
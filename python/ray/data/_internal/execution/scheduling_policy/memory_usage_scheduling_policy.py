@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING, List
+
+from .scheduling_policy import SchedulingPolicy
+from ray.data._internal.execution.util import memory_string
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces.physical_operator import (
+        PhysicalOperator,
+    )
+    from ray.data._internal.execution.resource_manager import ResourceManager
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+
+class MemoryUsageSchedulingPolicy(SchedulingPolicy):
+    """A scheduling policy that runs metadata-only operators first, and then the
+    operator with the least object store memory usage.
+
+    Running the operator with the least memory usage first tends to run downstream
+    operators before upstream ones, which frees up memory sooner.
+    """
+
+    def __init__(self, topology: "Topology", resource_manager: "ResourceManager"):
+        self._resource_manager = resource_manager
+
+    def select_operator(self, ops: List["PhysicalOperator"]) -> "PhysicalOperator":
+        return min(
+            ops,
+            key=lambda op: (
+                not op.throttling_disabled(),
+                self._resource_manager.get_op_usage(op).object_store_memory,
+            ),
+        )
+
+    def explain(self, op: "PhysicalOperator") -> str:
+        if op.throttling_disabled():
+            return "metadata-only operator"
+        memory = self._resource_manager.get_op_usage(op).object_store_memory
+        return f"object store memory={memory_string(memory)}"
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from ray.data._internal.execution.interfaces.physical_operator import (
+        PhysicalOperator,
+    )
+    from ray.data._internal.execution.resource_manager import ResourceManager
+    from ray.data._internal.execution.streaming_executor_state import Topology
+
+
+class SchedulingPolicy(ABC):
+    """Interface for scheduling policies.
+
+    A scheduling policy decides which operator to dispatch the next input to, among
+    the operators that are runnable, i.e., that have queued inputs and aren't
+    throttled by the resource limits or the backpressure policies.
+    """
+
+    @abstractmethod
+    def __init__(self, topology: "Topology", resource_manager: "ResourceManager"):
+        ...
+
+    @abstractmethod
+    def select_operator(self, ops: List["PhysicalOperator"]) -> "PhysicalOperator":
+        """Select the operator to run from the given non-empty list of runnable
+        operators.
+
+        Used in `streaming_executor_state.py::select_operator_to_run()`.
+        """
+        ...
+
+    def explain(self, op: "PhysicalOperator") -> str:
+        """Return a human-readable explanation of how the operator was ranked in the
+        last `select_operator` call.
+
+        This is reported in the scheduling status of the operator, to help debug why
+        an operator was starved. It's only called when the status is read, which may
+        be after the operators have changed, so policies should explain from what
+        they recorded in the last `select_operator` call where possible.
+        """
+        return ""
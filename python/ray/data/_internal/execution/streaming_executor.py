@@ -9,6 +9,7 @@ from ray.data._internal.execution.backpressure_policy import (
     BackpressurePolicy,
     get_backpressure_policies,
 )
+from ray.data._internal.execution.block_size_tuner import BlockSizeTuner
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     ExecutionResources,
@@ -19,6 +20,10 @@ from ray.data._internal.execution.interfaces import (
 )
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.resource_manager import ResourceManager
+from ray.data._internal.execution.scheduling_policy import (
+    SchedulingPolicy,
+    get_scheduling_policy,
+)
 from ray.data._internal.execution.streaming_executor_state import (
     OpState,
     Topology,
@@ -72,6 +77,8 @@ class StreamingExecutor(Executor, threading.Thread):
         self._topology: Optional[Topology] = None
         self._output_node: Optional[OpState] = None
         self._backpressure_policies: List[BackpressurePolicy] = []
+        self._block_size_tuner: Optional[BlockSizeTuner] = None
+        self._scheduling_policy: Optional[SchedulingPolicy] = None
 
         self._dataset_tag = dataset_tag
         # Stores if an operator is completed,
@@ -128,11 +135,18 @@ class StreamingExecutor(Executor, threading.Thread):
             lambda: self._autoscaler.get_total_resources(),
         )
         self._backpressure_policies = get_backpressure_policies(self._topology)
+        self._scheduling_policy = get_scheduling_policy(
+            self._topology, self._resource_manager
+        )
         self._autoscaler = create_autoscaler(
             self._topology,
             self._resource_manager,
             self._execution_id,
         )
+        if DataContext.get_current().enable_adaptive_block_sizing:
+            self._block_size_tuner = BlockSizeTuner(
+                self._topology, self._resource_manager
+            )
 
         self._has_op_completed = {op: False for op in self._topology}
 
@@ -292,6 +306,8 @@ class StreamingExecutor(Executor, threading.Thread):
         self._num_errored_blocks += num_errored_blocks
 
         self._resource_manager.update_usages()
+        if self._block_size_tuner is not None:
+            self._block_size_tuner.try_update()
         # Dispatch as many operators as we can for completed tasks.
         self._report_current_usage()
         op = select_operator_to_run(
@@ -300,6 +316,7 @@ class StreamingExecutor(Executor, threading.Thread):
             self._backpressure_policies,
             self._autoscaler,
             ensure_at_least_one_running=self._consumer_idling(),
+            scheduling_policy=self._scheduling_policy,
         )
 
         i = 0
@@ -315,6 +332,7 @@ class StreamingExecutor(Executor, threading.Thread):
                 self._backpressure_policies,
                 self._autoscaler,
                 ensure_at_least_one_running=self._consumer_idling(),
+                scheduling_policy=self._scheduling_policy,
             )
 
         update_operator_states(topology)
@@ -477,9 +495,13 @@ def _debug_dump_topology(topology: Topology, resource_manager: ResourceManager)
     """
     logger.debug("Execution Progress:")
     for i, (op, state) in enumerate(topology.items()):
+        status = state._scheduling_status
         logger.debug(
             f"{i}: {state.summary_str(resource_manager)}, "
-            f"Blocks Outputted: {state.num_completed_tasks}/{op.num_outputs_total()}"
+            f"Blocks Outputted: {state.num_completed_tasks}/{op.num_outputs_total()}, "
+            f"Scheduling: selected={status.selected}, runnable={status.runnable}, "
+            f"under_resource_limits={status.under_resource_limits}"
+            + (f" ({status.reason})" if status.reason else "")
         )
 
 
@@ -3,13 +3,14 @@
 This is split out from streaming_executor.py to facilitate better unit testing.
 """
 
+import functools
 import logging
 import math
 import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import ray
 from ray.data._internal.execution.autoscaler import Autoscaler
@@ -32,6 +33,10 @@ from ray.data._internal.execution.operators.base_physical_operator import (
 )
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.resource_manager import ResourceManager
+from ray.data._internal.execution.scheduling_policy import (
+    MemoryUsageSchedulingPolicy,
+    SchedulingPolicy,
+)
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data.context import DataContext
 
@@ -166,6 +171,17 @@ class OpSchedulingStatus:
     # Whether the resources were sufficient for the operator to run
     # in the last scheduling decision.
     under_resource_limits: bool = False
+    # Explains how the scheduling policy ranked the operator in the
+    # last scheduling decision, if it was runnable. It's only called
+    # when the reason is read (e.g., for debug logging), to keep it off
+    # the hot path of the scheduling loop.
+    explain_fn: Optional[Callable[[], str]] = None
+
+    @property
+    def reason(self) -> str:
+        """How the scheduling policy ranked the operator in the last
+        scheduling decision, if it was runnable."""
+        return self.explain_fn() if self.explain_fn is not None else ""
 
 
 class OpState:
@@ -536,6 +552,7 @@ def select_operator_to_run(
     backpressure_policies: List[BackpressurePolicy],
     autoscaler: Autoscaler,
     ensure_at_least_one_running: bool,
+    scheduling_policy: Optional[SchedulingPolicy] = None,
 ) -> Optional[PhysicalOperator]:
     """Select an operator to run, if possible.
 
@@ -549,6 +566,9 @@ def select_operator_to_run(
     Note that memory limits also apply to the outqueue of the output operator. This
     provides backpressure if the consumer is slow. However, once a bundle is returned
     to the user, it is no longer tracked.
+
+    Among the eligible operators, `scheduling_policy` picks the one to run. Defaults
+    to the `MemoryUsageSchedulingPolicy`.
     """
     # Filter to ops that are eligible for execution.
     ops = []
@@ -597,16 +617,15 @@ def select_operator_to_run(
 
     selected_op = None
     if ops:
-        # Run metadata-only operators first. After that, choose the operator with the
-        # least memory usage.
-        selected_op = min(
-            ops,
-            key=lambda op: (
-                not op.throttling_disabled(),
-                resource_manager.get_op_usage(op).object_store_memory,
-            ),
-        )
-        topology[selected_op]._scheduling_status.selected = True
+        if scheduling_policy is None:
+            scheduling_policy = MemoryUsageSchedulingPolicy(topology, resource_manager)
+        selected_op = scheduling_policy.select_operator(ops)
+        for op in ops:
+            status = topology[op]._scheduling_status
+            status.selected = op is selected_op
+            status.explain_fn = functools.partial(scheduling_policy.explain, op)
+            # Use `_metrics` directly, since `metrics` recomputes the extra metrics.
+            op._metrics.on_scheduling_decision(selected=op is selected_op)
     autoscaler.try_trigger_scaling()
     return selected_op
 
@@ -2,8 +2,9 @@ import copy
 import logging
 import threading
 import time
+from collections import deque
 from dataclasses import replace
-from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 import ray
 from ray.data._internal.execution.interfaces import NodeIdStr, RefBundle
@@ -28,6 +29,13 @@ logger = logging.getLogger(__name__)
 
 BLOCKED_CLIENT_WARN_TIMEOUT = 30
 
+# The max number of blocks that each iterator fetches from the coordinator per call.
+MAX_BLOCKS_PER_GET = 4
+
+# In work-stealing mode, the number of blocks that the coordinator queues ahead for
+# each iterator. Queued blocks can be stolen by other iterators that run out of data.
+WORK_STEALING_PREFETCH_BLOCKS = 4
+
 
 class StreamSplitDataIterator(DataIterator):
     """Implements a collection of iterators over a shared data stream."""
@@ -38,18 +46,24 @@ class StreamSplitDataIterator(DataIterator):
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        work_stealing: bool = False,
     ) -> List["StreamSplitDataIterator"]:
         """Create a split iterator from the given base Dataset and options.
 
         See also: `Dataset.streaming_split`.
         """
+        if work_stealing and equal:
+            raise ValueError(
+                "`work_stealing` isn't supported with `equal=True`, since iterators "
+                "that steal blocks read more rows than others."
+            )
         # To avoid deadlock, the concurrency on this actor must be set to at least `n`.
         coord_actor = SplitCoordinator.options(
             max_concurrency=n,
             scheduling_strategy=NodeAffinitySchedulingStrategy(
                 ray.get_runtime_context().get_node_id(), soft=False
             ),
-        ).remote(base_dataset, n, equal, locality_hints)
+        ).remote(base_dataset, n, equal, locality_hints, work_stealing)
 
         return [
             StreamSplitDataIterator(base_dataset, coord_actor, i, n) for i in range(n)
@@ -76,19 +90,23 @@ class StreamSplitDataIterator(DataIterator):
                 self._coord_actor.start_epoch.remote(self._output_split_idx)
             )
             future: ObjectRef[
-                Optional[ObjectRef[Block]]
-            ] = self._coord_actor.get.remote(cur_epoch, self._output_split_idx)
+                List[Tuple[ObjectRef[Block], BlockMetadata]]
+            ] = self._coord_actor.get_batch.remote(
+                cur_epoch, self._output_split_idx, MAX_BLOCKS_PER_GET
+            )
             while True:
-                block_ref_and_md: Optional[
+                block_refs_and_mds: List[
                     Tuple[ObjectRef[Block], BlockMetadata]
                 ] = ray.get(future)
-                if not block_ref_and_md:
+                if not block_refs_and_mds:
                     break
                 else:
-                    future = self._coord_actor.get.remote(
-                        cur_epoch, self._output_split_idx
+                    # Fetch the next blocks while the current ones are consumed.
+                    future = self._coord_actor.get_batch.remote(
+                        cur_epoch, self._output_split_idx, MAX_BLOCKS_PER_GET
                     )
-                    yield RefBundle(blocks=(block_ref_and_md,), owns_blocks=False)
+                    for block_ref_and_md in block_refs_and_mds:
+                        yield RefBundle(blocks=(block_ref_and_md,), owns_blocks=False)
 
         return gen_blocks(), self._iter_stats, False
 
@@ -126,6 +144,13 @@ class SplitCoordinator:
 
     This actor runs a streaming executor locally on its main thread. Clients can
     retrieve results via actor calls running on other threads.
+
+    In work-stealing mode, blocks aren't assigned to output splits by the
+    ``OutputSplitter``. Instead, a background thread pulls blocks from the executor
+    and queues them for the split with the shortest queue (preferring the splits
+    whose locality hints match the location of the block). A split whose queue is
+    empty steals blocks from the longest queue, so fast consumers don't wait for
+    slow ones.
     """
 
     def __init__(
@@ -134,6 +159,7 @@ class SplitCoordinator:
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]],
+        work_stealing: bool = False,
     ):
         # Automatically set locality with output to the specified location hints.
         if locality_hints:
@@ -147,13 +173,24 @@ class SplitCoordinator:
         self._n = n
         self._equal = equal
         self._locality_hints = locality_hints
+        self._work_stealing = work_stealing
         self._lock = threading.RLock()
+        # Notified when blocks are queued or dequeued in work-stealing mode.
+        self._queue_changed = threading.Condition(self._lock)
         self._executor = None
 
         # Guarded by self._lock.
         self._next_bundle: Dict[int, RefBundle] = {}
         self._unfinished_clients_in_epoch = n
         self._cur_epoch = -1
+        # The blocks queued for each split in work-stealing mode, whether all
+        # blocks of the current epoch have been queued, and the error raised by the
+        # execution, if any.
+        self._queues: List[Deque[Tuple[ObjectRef[Block], BlockMetadata]]] = [
+            deque() for _ in range(n)
+        ]
+        self._all_blocks_queued = False
+        self._execution_error: Optional[Exception] = None
 
         def gen_epochs():
             while True:
@@ -171,7 +208,7 @@ class SplitCoordinator:
                 output_iterator = execute_to_legacy_bundle_iterator(
                     executor,
                     dataset._plan,
-                    dag_rewrite=add_split_op,
+                    dag_rewrite=None if work_stealing else add_split_op,
                 )
                 yield output_iterator
 
@@ -204,6 +241,18 @@ class SplitCoordinator:
 
         This is intended to be called concurrently from multiple clients.
         """
+        blocks = self.get_batch(epoch_id, output_split_idx, 1)
+        return blocks[0] if blocks else None
+
+    def get_batch(
+        self, epoch_id: int, output_split_idx: int, max_blocks: int
+    ) -> List[Tuple[ObjectRef[Block], BlockMetadata]]:
+        """Blocking get operation for up to ``max_blocks`` blocks.
+
+        This blocks until at least one block is available, and returns an empty
+        list once all blocks of the epoch have been returned. This is intended to be
+        called concurrently from multiple clients.
+        """
         start_time = time.perf_counter()
         if epoch_id != self._cur_epoch:
             raise ValueError(
@@ -211,6 +260,11 @@ class SplitCoordinator:
             )
 
         try:
+            if self._work_stealing:
+                return self._get_batch_from_queues(
+                    epoch_id, output_split_idx, max_blocks
+                )
+
             # Ensure there is at least one bundle.
             with self._lock:
                 if output_split_idx in self._next_bundle:
@@ -223,8 +277,10 @@ class SplitCoordinator:
                 # This is a BLOCKING call, so do it outside the lock.
                 next_bundle = self._output_iterator.get_next(output_split_idx)
 
-            block = next_bundle.blocks[-1]
-            next_bundle = replace(next_bundle, blocks=next_bundle.blocks[:-1])
+            # Return the remaining blocks of the bundle, without blocking for more.
+            num_blocks = min(max_blocks, len(next_bundle.blocks))
+            blocks = list(reversed(next_bundle.blocks[-num_blocks:]))
+            next_bundle = replace(next_bundle, blocks=next_bundle.blocks[:-num_blocks])
 
             # Accumulate any remaining blocks in next_bundle map as needed.
             with self._lock:
@@ -232,9 +288,9 @@ class SplitCoordinator:
                 if not next_bundle.blocks:
                     del self._next_bundle[output_split_idx]
 
-            return block
+            return blocks
         except StopIteration:
-            return None
+            return []
         finally:
             stats = self.stats()
             if stats and stats.streaming_split_coordinator_s:
@@ -242,6 +298,96 @@ class SplitCoordinator:
                     time.perf_counter() - start_time
                 )
 
+    def _get_batch_from_queues(
+        self, epoch_id: int, output_split_idx: int, max_blocks: int
+    ) -> List[Tuple[ObjectRef[Block], BlockMetadata]]:
+        """Get blocks from the queue of the split, or steal them from the longest
+        queue if the queue is empty."""
+        with self._queue_changed:
+            while True:
+                if epoch_id != self._cur_epoch:
+                    raise ValueError(
+                        "Invalid iterator: the dataset has moved on to another epoch."
+                    )
+                queue = self._queues[output_split_idx]
+                num_blocks = min(max_blocks, len(queue))
+                if num_blocks == 0:
+                    queue = max(self._queues, key=len)
+                    # Steal at most half of the blocks, from the end of the queue,
+                    # i.e., the blocks that the other split would consume last.
+                    num_blocks = min(max_blocks, (len(queue) + 1) // 2)
+                    if num_blocks > 0:
+                        blocks = [queue.pop() for _ in range(num_blocks)]
+                        self._queue_changed.notify_all()
+                        return blocks
+                else:
+                    blocks = [queue.popleft() for _ in range(num_blocks)]
+                    self._queue_changed.notify_all()
+                    return blocks
+
+                if self._execution_error is not None:
+                    raise self._execution_error
+                if self._all_blocks_queued:
+                    return []
+                self._queue_changed.wait()
+
+    def _queue_blocks(self, epoch_id: int, output_iterator: Iterator[RefBundle]):
+        """Pull blocks from the executor, and queue them for the output splits.
+
+        This runs on a background thread in work-stealing mode.
+        """
+        max_queued_blocks = self._n * WORK_STEALING_PREFETCH_BLOCKS
+        try:
+            while True:
+                with self._queue_changed:
+                    # Apply backpressure if the consumers have enough blocks queued.
+                    while (
+                        epoch_id == self._cur_epoch
+                        and sum(len(q) for q in self._queues) >= max_queued_blocks
+                    ):
+                        self._queue_changed.wait()
+                    if epoch_id != self._cur_epoch:
+                        return
+
+                # This is a BLOCKING call, so do it outside the lock.
+                bundle = output_iterator.get_next()
+                location = None
+                if self._locality_hints:
+                    location = bundle.get_cached_location()
+
+                with self._queue_changed:
+                    if epoch_id != self._cur_epoch:
+                        return
+                    for block in bundle.blocks:
+                        self._queues[self._select_queue(location)].append(block)
+                    self._queue_changed.notify_all()
+        except StopIteration:
+            pass
+        except Exception as e:
+            with self._queue_changed:
+                if epoch_id == self._cur_epoch:
+                    self._execution_error = e
+        finally:
+            with self._queue_changed:
+                if epoch_id == self._cur_epoch:
+                    self._all_blocks_queued = True
+                    self._queue_changed.notify_all()
+
+    def _select_queue(self, location: Optional[NodeIdStr]) -> int:
+        """Select the split with the shortest queue, preferring the splits located
+        at ``location``."""
+        candidates = range(self._n)
+        if location is not None:
+            local_candidates = [
+                i
+                for i in candidates
+                if self._locality_hints[i] == location
+                and len(self._queues[i]) < WORK_STEALING_PREFETCH_BLOCKS
+            ]
+            if local_candidates:
+                candidates = local_candidates
+        return min(candidates, key=lambda i: len(self._queues[i]))
+
     def _barrier(self, split_idx: int) -> int:
         """Arrive and block until the start of the given epoch."""
 
@@ -275,6 +421,9 @@ class SplitCoordinator:
                     self._output_iterator = next(self._next_epoch)
                 except Exception as e:
                     self._gen_epoch_error = e
+                else:
+                    if self._work_stealing:
+                        self._start_queueing_blocks(self._cur_epoch)
 
         if self._gen_epoch_error is not None:
             # If there was an error when advancing to the next epoch,
@@ -283,3 +432,18 @@ class SplitCoordinator:
 
         assert self._output_iterator is not None
         return starting_epoch + 1
+
+    def _start_queueing_blocks(self, epoch_id: int):
+        """Start queueing the blocks of a new epoch in work-stealing mode."""
+        with self._queue_changed:
+            self._queues = [deque() for _ in range(self._n)]
+            self._all_blocks_queued = False
+            self._execution_error = None
+            # Wake up the queueing thread of the previous epoch, if any, so it exits.
+            self._queue_changed.notify_all()
+        threading.Thread(
+            target=self._queue_blocks,
+            args=(epoch_id, self._output_iterator),
+            name=f"SplitCoordinator-epoch-{epoch_id}",
+            daemon=True,
+        ).start()
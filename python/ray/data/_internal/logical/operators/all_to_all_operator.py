@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
@@ -90,8 +90,13 @@ class Repartition(AbstractAllToAll):
         input_op: LogicalOperator,
         num_outputs: int,
         shuffle: bool,
+        keys: Optional[List[str]] = None,
     ):
-        if shuffle:
+        if keys:
+            # Hash repartition is planned as a streaming `HashShuffleOperator`,
+            # which doesn't have sub progress bars.
+            sub_progress_bar_names = None
+        elif shuffle:
             sub_progress_bar_names = [
                 ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
                 ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
@@ -107,6 +112,7 @@ class Repartition(AbstractAllToAll):
             sub_progress_bar_names=sub_progress_bar_names,
         )
         self._shuffle = shuffle
+        self._keys = keys
 
     def aggregate_output_metadata(self) -> BlockMetadata:
         assert len(self._input_dependencies) == 1, len(self._input_dependencies)
@@ -121,6 +127,7 @@ class Sort(AbstractAllToAll):
         input_op: LogicalOperator,
         sort_key: SortKey,
         batch_format: Optional[str] = "default",
+        boundaries_cache: Optional[Dict[Tuple[Tuple[str, ...], int], List]] = None,
     ):
         super().__init__(
             "Sort",
@@ -133,6 +140,10 @@ class Sort(AbstractAllToAll):
         )
         self._sort_key = sort_key
         self._batch_format = batch_format
+        # If set, the sampled range boundaries are cached in it by the key columns
+        # and the number of output blocks, and reused by later sorts with the same
+        # cache.
+        self._boundaries_cache = boundaries_cache
 
     def aggregate_output_metadata(self) -> BlockMetadata:
         assert len(self._input_dependencies) == 1, len(self._input_dependencies)
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional,
 from ray.data._internal.compute import ComputeStrategy, TaskPoolStrategy
 from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data._internal.logical.operators.one_to_one_operator import AbstractOneToOne
-from ray.data.block import UserDefinedFunction
+from ray.data.block import BlockMetadata, UserDefinedFunction
 from ray.data.context import DEFAULT_BATCH_SIZE
 from ray.data.preprocessor import Preprocessor
 
@@ -52,6 +52,21 @@ class AbstractMap(AbstractOneToOne):
         self._ray_remote_args = ray_remote_args or {}
         self._ray_remote_args_fn = ray_remote_args_fn
 
+    def _row_preserving_output_metadata(
+        self, schema: Optional[Union[type, "pa.lib.Schema"]] = None
+    ) -> BlockMetadata:
+        """Return the aggregate output metadata of an operator that outputs exactly
+        one row per input row, with the given output schema, if known."""
+        assert len(self._input_dependencies) == 1, len(self._input_dependencies)
+        input_metadata = self._input_dependencies[0].aggregate_output_metadata()
+        return BlockMetadata(
+            num_rows=input_metadata.num_rows,
+            size_bytes=None,
+            schema=schema,
+            input_files=input_metadata.input_files,
+            exec_stats=None,
+        )
+
 
 class AbstractUDFMap(AbstractMap):
     """Abstract class for logical operators performing a UDF that should be converted
@@ -212,6 +227,10 @@ class MapRows(AbstractUDFMap):
     def can_modify_num_rows(self) -> bool:
         return False
 
+    def aggregate_output_metadata(self) -> BlockMetadata:
+        # `map` outputs exactly one row per input row.
+        return self._row_preserving_output_metadata()
+
 
 class Filter(AbstractUDFMap):
     """Logical operator for filter."""
@@ -269,6 +288,17 @@ class Project(AbstractMap):
     def can_modify_num_rows(self) -> bool:
         return False
 
+    def aggregate_output_metadata(self) -> BlockMetadata:
+        import pyarrow as pa
+
+        input_schema = self.input_dependency.aggregate_output_metadata().schema
+        schema = None
+        if isinstance(input_schema, pa.Schema) and all(
+            col in input_schema.names for col in self._cols
+        ):
+            schema = pa.schema([input_schema.field(col) for col in self._cols])
+        return self._row_preserving_output_metadata(schema)
+
 
 class FlatMap(AbstractUDFMap):
     """Logical operator for flat_map."""
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import List, Optional
 
 from ray.data._internal.logical.interfaces import LogicalOperator
+from ray.data.block import BlockMetadata
 
 
 class NAry(LogicalOperator):
@@ -40,6 +41,24 @@ class Zip(NAry):
             return None
         return max(left_num_outputs, right_num_outputs)
 
+    def aggregate_output_metadata(self) -> BlockMetadata:
+        # Zip fails if the inputs have different numbers of rows, so only report
+        # the number of rows if it's known to succeed.
+        num_rows = None
+        left_num_rows, right_num_rows = (
+            input_op.aggregate_output_metadata().num_rows
+            for input_op in self._input_dependencies
+        )
+        if left_num_rows is not None and left_num_rows == right_num_rows:
+            num_rows = left_num_rows
+        return BlockMetadata(
+            num_rows=num_rows,
+            size_bytes=None,
+            schema=None,
+            input_files=None,
+            exec_stats=None,
+        )
+
 
 class Union(NAry):
     """Logical operator for union."""
@@ -58,3 +77,70 @@ class Union(NAry):
                 return None
             total_num_outputs += num_outputs
         return total_num_outputs
+
+    def aggregate_output_metadata(self) -> BlockMetadata:
+        input_metadata = [
+            input_op.aggregate_output_metadata()
+            for input_op in self._input_dependencies
+        ]
+        num_rows, size_bytes = None, None
+        if all(m.num_rows is not None for m in input_metadata):
+            num_rows = sum(m.num_rows for m in input_metadata)
+        if all(m.size_bytes is not None for m in input_metadata):
+            size_bytes = sum(m.size_bytes for m in input_metadata)
+        schema = None
+        schemas = [m.schema for m in input_metadata]
+        if schemas[0] is not None and all(schema == schemas[0] for schema in schemas):
+            schema = schemas[0]
+        input_files = []
+        for m in input_metadata:
+            input_files.extend(m.input_files or [])
+        return BlockMetadata(
+            num_rows=num_rows,
+            size_bytes=size_bytes,
+            schema=schema,
+            input_files=input_files,
+            exec_stats=None,
+        )
+
+
+class Join(NAry):
+    """Logical operator for join."""
+
+    def __init__(
+        self,
+        left_input_op: LogicalOperator,
+        right_input_op: LogicalOperator,
+        keys: List[str],
+        join_type: str,
+        num_partitions: Optional[int] = None,
+        left_suffix: Optional[str] = None,
+        right_suffix: Optional[str] = None,
+    ):
+        """
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            keys: The names of the columns to join on.
+            join_type: One of "inner", "left", "right" and "outer".
+            num_partitions: The number of partitions for the hash join.
+            left_suffix: The suffix to add to overlapping non-key column names
+                of the left input.
+            right_suffix: The suffix to add to overlapping non-key column names
+                of the right input.
+        """
+        super().__init__(left_input_op, right_input_op, num_outputs=num_partitions)
+        self._keys = keys
+        self._join_type = join_type
+        self._num_partitions = num_partitions
+        self._left_suffix = left_suffix
+        self._right_suffix = right_suffix
+
+    def estimated_num_outputs(self):
+        if self._num_outputs is not None:
+            return self._num_outputs
+        left_num_outputs = self._input_dependencies[0].estimated_num_outputs()
+        right_num_outputs = self._input_dependencies[1].estimated_num_outputs()
+        if left_num_outputs is None or right_num_outputs is None:
+            return None
+        return max(left_num_outputs, right_num_outputs)
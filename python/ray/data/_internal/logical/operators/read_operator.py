@@ -1,11 +1,15 @@
+import copy
 import functools
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from ray.data._internal.logical.operators.map_operator import AbstractMap
 from ray.data._internal.util import unify_block_metadata_schema
 from ray.data.block import BlockMetadata
 from ray.data.datasource.datasource import Datasource, Reader
 
+if TYPE_CHECKING:
+    from ray.data._internal.write_checkpoint import WriteCheckpoint
+
 
 class Read(AbstractMap):
     """Logical operator for read."""
@@ -32,6 +36,8 @@ class Read(AbstractMap):
         self._mem_size = mem_size
         self._concurrency = concurrency
         self._detected_parallelism = None
+        # The checkpoint of the write that consumes this read, if any.
+        self._write_checkpoint = None
 
     def set_detected_parallelism(self, parallelism: int):
         """
@@ -46,6 +52,30 @@ class Read(AbstractMap):
         """
         return self._detected_parallelism
 
+    def with_datasource(self, datasource: Datasource) -> "Read":
+        """Return a copy of this operator that reads from ``datasource`` instead.
+
+        This is used by optimizer rules that push work into the datasource.
+        """
+        assert not datasource.should_create_reader
+        read_op = copy.copy(self)
+        read_op._datasource = datasource
+        read_op._datasource_or_legacy_reader = datasource
+        read_op._input_dependencies = []
+        read_op._output_dependencies = []
+        # The cached metadata describes the outputs of the original datasource.
+        read_op.__dict__.pop("_cached_output_metadata", None)
+        return read_op
+
+    def with_write_checkpoint(self, write_checkpoint: "WriteCheckpoint") -> "Read":
+        """Return a copy of this operator that skips the read tasks whose outputs
+        have been written according to ``write_checkpoint``."""
+        read_op = copy.copy(self)
+        read_op._write_checkpoint = write_checkpoint
+        read_op._input_dependencies = []
+        read_op._output_dependencies = []
+        return read_op
+
     def aggregate_output_metadata(self) -> BlockMetadata:
         """A ``BlockMetadata`` that represents the aggregate metadata of the outputs.
 
@@ -11,8 +11,13 @@ from ray.data._internal.logical.rules.inherit_target_max_block_size import (
     InheritTargetMaxBlockSizeRule,
 )
 from ray.data._internal.logical.rules.operator_fusion import OperatorFusionRule
+from ray.data._internal.logical.rules.predicate_pushdown import PredicatePushdownRule
+from ray.data._internal.logical.rules.projection_pushdown import (
+    ProjectionPushdownRule,
+)
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
 from ray.data._internal.logical.rules.set_read_parallelism import SetReadParallelismRule
+from ray.data._internal.logical.rules.write_checkpoint import WriteCheckpointRule
 from ray.data._internal.logical.rules.zero_copy_map_fusion import (
     EliminateBuildOutputBlocks,
 )
@@ -22,6 +27,11 @@ from ray.util.annotations import DeveloperAPI
 _LOGICAL_RULES = [
     ReorderRandomizeBlocksRule,
     InheritBatchFormatRule,
+    # Predicates must be pushed down first, so that Filter operators between Read
+    # and Project operators don't block projection pushdown.
+    PredicatePushdownRule,
+    ProjectionPushdownRule,
+    WriteCheckpointRule,
 ]
 
 _PHYSICAL_RULES = [
@@ -0,0 +1,69 @@
+from typing import TYPE_CHECKING
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import Filter
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.logical.rules.util import copy_with_new_inputs
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class PredicatePushdownRule(Rule):
+    """Rule for pushing expression filters into Read operators.
+
+    If a Filter operator with a PyArrow expression (i.e., ``Dataset.filter(expr=...)``)
+    reads directly from a Read operator whose datasource supports predicate pushdown,
+    the expression is passed to the datasource and the Filter operator is removed.
+    This lets datasources like Parquet skip row groups and avoid materializing rows
+    that would be dropped anyway.
+
+    Consecutive filters are pushed down one after another, so
+    `Read -> Filter[a] -> Filter[b]` becomes `Read[a & b]`.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag, context=plan.context)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        input_ops = [self._apply(input_op) for input_op in op.input_dependencies]
+        if any(new is not old for new, old in zip(input_ops, op.input_dependencies)):
+            op = copy_with_new_inputs(op, input_ops)
+
+        if (
+            isinstance(op, Filter)
+            and op._filter_expr is not None
+            and isinstance(op.input_dependency, Read)
+        ):
+            read_op = op.input_dependency
+            datasource = read_op._datasource
+            if (
+                not datasource.should_create_reader
+                and datasource.supports_predicate_pushdown
+                and _can_evaluate(op._filter_expr, read_op)
+            ):
+                return read_op.with_datasource(
+                    datasource.apply_predicate(op._filter_expr)
+                )
+
+        return op
+
+
+def _can_evaluate(predicate: "pyarrow.dataset.Expression", read_op: Read) -> bool:
+    """Whether ``predicate`` is valid for the output schema of ``read_op``.
+
+    Invalid predicates (e.g., ones that reference unknown columns) aren't pushed
+    down, so that the Filter operator reports the error as usual.
+    """
+    import pyarrow as pa
+
+    schema = read_op.aggregate_output_metadata().schema
+    if not isinstance(schema, pa.Schema):
+        return False
+
+    try:
+        schema.empty_table().filter(predicate)
+    except (pa.ArrowException, TypeError):
+        return False
+    return True
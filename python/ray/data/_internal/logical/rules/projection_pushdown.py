@@ -0,0 +1,55 @@
+from typing import List
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import Project
+from ray.data._internal.logical.operators.one_to_one_operator import Limit
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.logical.rules.util import copy_with_new_inputs
+
+
+class ProjectionPushdownRule(Rule):
+    """Rule for pushing column selections into Read operators.
+
+    If a Project operator (i.e., ``Dataset.select_columns``) reads from a Read
+    operator whose datasource supports projection pushdown, the selected columns are
+    passed to the datasource so that it doesn't read the other columns at all.
+    Limit operators between the Read and the Project don't depend on columns, so the
+    rule looks through them.
+
+    The Project operator itself is kept, because it's cheap and it guarantees the
+    order of the output columns.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag, context=plan.context)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        input_ops = [self._apply(input_op) for input_op in op.input_dependencies]
+        if any(new is not old for new, old in zip(input_ops, op.input_dependencies)):
+            op = copy_with_new_inputs(op, input_ops)
+
+        if not isinstance(op, Project):
+            return op
+
+        # Find the Read operator, looking through operators that don't depend on
+        # the columns of their inputs.
+        ops_between: List[LogicalOperator] = []
+        upstream_op = op.input_dependency
+        while isinstance(upstream_op, Limit):
+            ops_between.append(upstream_op)
+            upstream_op = upstream_op.input_dependency
+
+        if not isinstance(upstream_op, Read):
+            return op
+        datasource = upstream_op._datasource
+        if (
+            datasource.should_create_reader
+            or not datasource.supports_projection_pushdown
+        ):
+            return op
+
+        new_op = upstream_op.with_datasource(datasource.apply_projection(op.cols))
+        for between_op in reversed(ops_between):
+            new_op = copy_with_new_inputs(between_op, [new_op])
+        return copy_with_new_inputs(op, [new_op])
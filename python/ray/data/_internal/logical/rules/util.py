@@ -0,0 +1,20 @@
+import copy
+from typing import List
+
+from ray.data._internal.logical.interfaces import LogicalOperator
+
+
+def copy_with_new_inputs(
+    op: LogicalOperator, input_ops: List[LogicalOperator]
+) -> LogicalOperator:
+    """Return a shallow copy of ``op`` that reads from ``input_ops``.
+
+    Rules use this instead of rewiring operators in place, because the same operator
+    instance may be shared by multiple Datasets.
+    """
+    new_op = copy.copy(op)
+    new_op._input_dependencies = list(input_ops)
+    new_op._output_dependencies = []
+    for input_op in input_ops:
+        input_op._output_dependencies.append(new_op)
+    return new_op
@@ -0,0 +1,39 @@
+from ray.data._internal.compute import ActorPoolStrategy
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import AbstractMap
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.logical.operators.write_operator import Write
+from ray.data._internal.logical.rules.util import copy_with_new_inputs
+
+
+class WriteCheckpointRule(Rule):
+    """Rule for passing the checkpoint of a Write operator to its Read operator.
+
+    The Read operator skips the read tasks whose outputs have been written according
+    to the checkpoint, and the Write operator records the read tasks that it has
+    written. This requires the Write operator to be fused with the Read operator, so
+    that each write task knows which read tasks it has run. So only a Read followed
+    by task-based map operators can be checkpointed.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        op = plan.dag
+        if not isinstance(op, Write) or op._checkpoint is None:
+            return plan
+
+        optimized_dag = copy_with_new_inputs(op, [self._apply(op.input_dependency, op)])
+        return LogicalPlan(dag=optimized_dag, context=plan.context)
+
+    def _apply(self, op: LogicalOperator, write_op: Write) -> LogicalOperator:
+        if isinstance(op, Read):
+            return op.with_write_checkpoint(write_op._checkpoint)
+
+        if not isinstance(op, AbstractMap) or isinstance(
+            getattr(op, "_compute", None), ActorPoolStrategy
+        ):
+            raise ValueError(
+                "Writes can only be checkpointed if the dataset is a read followed "
+                f"by task-based map operations, but found {op.name}. Unset "
+                "`DataContext.write_checkpoint_path` to write this dataset."
+            )
+        return copy_with_new_inputs(op, [self._apply(op.input_dependency, write_op)])
@@ -66,6 +66,7 @@ _op_name_white_list = [
     # N-ary
     "Zip",
     "Union",
+    "Join",
 ]
 
 
@@ -0,0 +1,90 @@
+from typing import List, Tuple, Union
+
+from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    SortAggregateTaskSpec,
+)
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import hash_partition
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.exchange.sort_task_spec import SortKey
+from ray.data.aggregate import AggregateFn
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+
+class HashAggregateTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-based aggregate tasks.
+
+    Aggregate is done in 2 steps: partial aggregate of individual blocks, and
+    final aggregate of the partial aggregates with the same keys.
+
+    Partial aggregate (`map`): each block is combined into one row of partial
+    aggregation states (accumulators) per key, which are then partitioned by the
+    hash of the key. So only the partial states are shuffled, instead of all rows.
+
+    Final aggregate (`reduce`): each task receives the partial states of a
+    partition from every map task, merges the states with the same key and
+    finalizes them.
+
+    Unlike `SortAggregateTaskSpec`, this doesn't need to sample boundaries, so the
+    map tasks can start before all input blocks are available. The output blocks
+    are sorted by key individually, but not globally.
+    """
+
+    def __init__(
+        self,
+        key: SortKey,
+        aggs: List[AggregateFn],
+        batch_format: str,
+    ):
+        super().__init__(
+            map_args=[key, aggs],
+            reduce_args=[key, aggs, batch_format],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        sort_key: SortKey,
+        aggs: List[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+
+        if BlockAccessor.for_block(block).num_rows() > 0:
+            # The blocks are aggregated before all of them are available, so
+            # validate against the schema of each block.
+            schema = BlockAccessor.for_block(block).schema()
+            for agg in aggs:
+                agg._validate(schema)
+
+        block = SortAggregateTaskSpec._prune_unused_columns(block, sort_key, aggs)
+        if sort_key.get_columns():
+            # `combine` expects the rows with the same key to be adjacent. This sort
+            # is local to the block, so no boundaries need to be sampled.
+            [block] = BlockAccessor.for_block(block).sort_and_partition([], sort_key)
+        combined = BlockAccessor.for_block(
+            BlockAccessor.for_block(block).combine(sort_key, aggs)
+        ).to_arrow()
+        if combined.num_rows == 0:
+            partitions = [combined] * output_num_blocks
+        else:
+            # Partitioning preserves the order of the rows, so each partition is
+            # still sorted by key, as `aggregate_combined_blocks` expects.
+            partitions = hash_partition(
+                combined, sort_key.get_columns(), output_num_blocks
+            )
+        meta = BlockAccessor.for_block(block).get_metadata(exec_stats=stats.build())
+        return partitions + [meta]
+
+    @staticmethod
+    def reduce(
+        key: SortKey,
+        aggs: List[AggregateFn],
+        batch_format: str,
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        return SortAggregateTaskSpec.reduce(
+            key, aggs, batch_format, *mapper_outputs, partial_reduce=partial_reduce
+        )
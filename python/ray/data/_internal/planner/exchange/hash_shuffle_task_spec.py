@@ -0,0 +1,123 @@
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+import numpy as np
+
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# Constants to combine the hashes of multiple key columns, and the hash of null keys.
+_HASH_MULTIPLIER = np.uint64(0x100000001B3)
+_NULL_KEY_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+
+class HashShuffleTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-partitioning shuffle tasks.
+
+    Each map task hash-partitions its block by the key columns, so that rows with
+    equal keys end up in the same reduce task. Each reduce task concatenates the
+    partitions it receives into one block.
+
+    This is used by repartition() with keys.
+    """
+
+    def __init__(self, keys: List[str]):
+        super().__init__(map_args=[keys], reduce_args=[])
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        keys: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        accessor = BlockAccessor.for_block(block)
+        partitions = hash_partition(accessor.to_arrow(), keys, output_num_blocks)
+        metadata = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+        return partitions + [metadata]
+
+    @staticmethod
+    def reduce(
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        from ray.data._internal.arrow_ops import transform_pyarrow
+
+        stats = BlockExecStats.builder()
+        new_block = transform_pyarrow.concat(
+            [BlockAccessor.for_block(b).to_arrow() for b in mapper_outputs]
+        )
+        accessor = BlockAccessor.for_block(new_block)
+        new_metadata = BlockMetadata(
+            num_rows=accessor.num_rows(),
+            size_bytes=accessor.size_bytes(),
+            schema=accessor.schema(),
+            input_files=None,
+            exec_stats=stats.build(),
+        )
+        return new_block, new_metadata
+
+
+def hash_partition(
+    table: "pyarrow.Table", keys: List[str], num_partitions: int
+) -> List["pyarrow.Table"]:
+    """Split ``table`` into ``num_partitions`` tables by the hash of ``keys``.
+
+    The hash is deterministic across processes, so rows with equal keys are assigned
+    to the same partition regardless of which block they come from.
+    """
+    from ray.data._internal.arrow_ops import transform_pyarrow
+
+    if num_partitions == 1:
+        return [table]
+
+    partition_ids = hash_partition_ids(table, keys, num_partitions)
+    counts = np.bincount(partition_ids, minlength=num_partitions)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    # Group the rows of each partition together, so that every partition is a
+    # zero-copy slice of the reordered table.
+    table = transform_pyarrow.take_table(
+        table, np.argsort(partition_ids, kind="stable")
+    )
+    return [table.slice(offsets[i], counts[i]) for i in range(num_partitions)]
+
+
+def hash_partition_ids(
+    table: "pyarrow.Table", keys: List[str], num_partitions: int
+) -> np.ndarray:
+    """Return the partition that ``hash_partition`` assigns to each row of ``table``."""
+    import pandas as pd
+    import pyarrow.compute as pc
+
+    if num_partitions == 1:
+        return np.zeros(table.num_rows, dtype=np.int64)
+
+    hashes = np.zeros(table.num_rows, dtype=np.uint64)
+    for key in keys:
+        column = table.column(key)
+        null_mask = None
+        if column.null_count > 0:
+            # Converting nulls to NumPy changes the dtype (e.g., int to float) and
+            # hence the hash, so fill in a valid value and hash the nulls to a
+            # constant instead. Then rows with null keys are assigned to the same
+            # partition regardless of which block they come from.
+            null_mask = column.is_null().to_numpy(zero_copy_only=False)
+            valid = pc.drop_null(column)
+            if len(valid) == 0:
+                column = None
+            else:
+                column = pc.fill_null(column, valid[0])
+        if column is None:
+            key_hashes = np.zeros(table.num_rows, dtype=np.uint64)
+        else:
+            key_hashes = pd.util.hash_array(column.to_numpy())
+        if null_mask is not None:
+            key_hashes[null_mask] = _NULL_KEY_HASH
+        hashes = hashes * _HASH_MULTIPLIER + key_hashes
+
+    return (hashes % np.uint64(num_partitions)).astype(np.int64)
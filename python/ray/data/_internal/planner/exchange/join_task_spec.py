@@ -0,0 +1,105 @@
+from typing import List, Optional, Tuple, Union
+
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import hash_partition
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+# Mapping from the join types of `Dataset.join` to the join types of PyArrow.
+JOIN_TYPES = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+}
+
+
+class JoinTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for distributed hash join tasks.
+
+    The input blocks of both sides are passed to the map tasks as a single list,
+    with the blocks of the left side first. Each map task hash-partitions its block
+    by the join keys, so that rows with equal keys end up in the same reduce task.
+    Each reduce task then joins the left and right partitions locally with PyArrow.
+    """
+
+    def __init__(
+        self,
+        num_left_blocks: int,
+        keys: List[str],
+        join_type: str,
+        left_suffix: Optional[str] = None,
+        right_suffix: Optional[str] = None,
+    ):
+        super().__init__(
+            map_args=[keys],
+            reduce_args=[num_left_blocks, keys, join_type, left_suffix, right_suffix],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        keys: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        accessor = BlockAccessor.for_block(block)
+        partitions = hash_partition(accessor.to_arrow(), keys, output_num_blocks)
+        metadata = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+        return partitions + [metadata]
+
+    @staticmethod
+    def reduce(
+        num_left_blocks: int,
+        keys: List[str],
+        join_type: str,
+        left_suffix: Optional[str],
+        right_suffix: Optional[str],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        stats = BlockExecStats.builder()
+        new_block = join_blocks(
+            mapper_outputs[:num_left_blocks],
+            mapper_outputs[num_left_blocks:],
+            keys,
+            join_type,
+            left_suffix,
+            right_suffix,
+        )
+        accessor = BlockAccessor.for_block(new_block)
+        new_metadata = BlockMetadata(
+            num_rows=accessor.num_rows(),
+            size_bytes=accessor.size_bytes(),
+            schema=accessor.schema(),
+            input_files=None,
+            exec_stats=stats.build(),
+        )
+        return new_block, new_metadata
+
+
+def join_blocks(
+    left_blocks: List[Block],
+    right_blocks: List[Block],
+    keys: List[str],
+    join_type: str,
+    left_suffix: Optional[str] = None,
+    right_suffix: Optional[str] = None,
+) -> Block:
+    """Join the concatenation of ``left_blocks`` with that of ``right_blocks``."""
+    from ray.data._internal.arrow_ops import transform_pyarrow
+
+    left = transform_pyarrow.concat(
+        [BlockAccessor.for_block(b).to_arrow() for b in left_blocks]
+    )
+    right = transform_pyarrow.concat(
+        [BlockAccessor.for_block(b).to_arrow() for b in right_blocks]
+    )
+    return left.join(
+        right,
+        keys=keys,
+        join_type=JOIN_TYPES[join_type],
+        left_suffix=left_suffix,
+        right_suffix=right_suffix,
+    )
@@ -4,6 +4,9 @@ from ray.data._internal.execution.interfaces import PhysicalOperator
 from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
+from ray.data._internal.execution.operators.hash_shuffle_operator import (
+    HashShuffleOperator,
+)
 from ray.data._internal.logical.operators.all_to_all_operator import (
     AbstractAllToAll,
     Aggregate,
@@ -13,16 +16,27 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
     Sort,
 )
 from ray.data._internal.planner.aggregate import generate_aggregate_fn
+from ray.data._internal.planner.exchange.hash_aggregate_task_spec import (
+    HashAggregateTaskSpec,
+)
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import (
+    HashShuffleTaskSpec,
+)
+from ray.data._internal.planner.exchange.sort_task_spec import SortKey
 from ray.data._internal.planner.random_shuffle import generate_random_shuffle_fn
 from ray.data._internal.planner.randomize_blocks import generate_randomize_blocks_fn
 from ray.data._internal.planner.repartition import generate_repartition_fn
 from ray.data._internal.planner.sort import generate_sort_fn
 from ray.data.context import DataContext
 
+# The number of partitions of hash aggregation, if the number of input blocks isn't
+# known in advance.
+DEFAULT_NUM_HASH_AGGREGATE_PARTITIONS = 200
+
 
 def plan_all_to_all_op(
     op: AbstractAllToAll, physical_children: List[PhysicalOperator]
-) -> AllToAllOperator:
+) -> PhysicalOperator:
     """Get the corresponding physical operators DAG for AbstractAllToAll operators.
 
     Note this method only converts the given `op`, but not its input dependencies.
@@ -31,6 +45,36 @@ def plan_all_to_all_op(
     assert len(physical_children) == 1
     input_physical_dag = physical_children[0]
 
+    if isinstance(op, Repartition) and op._keys:
+        # Hash repartition doesn't need to see all of its inputs before starting
+        # the shuffle, so plan it as a streaming operator.
+        return HashShuffleOperator(
+            input_physical_dag,
+            HashShuffleTaskSpec(op._keys),
+            op._num_outputs,
+            name=op.name,
+        )
+
+    if isinstance(op, Aggregate) and DataContext.get_current().use_hash_aggregate:
+        # Hash aggregation doesn't need to sample the key boundaries from all of
+        # its inputs, so plan it as a streaming operator.
+        if op._key is None:
+            num_partitions = 1
+        else:
+            # Use the same number of output partitions as the sort-based
+            # aggregation, if it's known in advance.
+            num_partitions = (
+                op.input_dependencies[0].estimated_num_outputs()
+                or input_physical_dag.num_outputs_total()
+                or DEFAULT_NUM_HASH_AGGREGATE_PARTITIONS
+            )
+        return HashShuffleOperator(
+            input_physical_dag,
+            HashAggregateTaskSpec(SortKey(op._key), op._aggs, op._batch_format),
+            num_partitions,
+            name=op.name,
+        )
+
     target_max_block_size = None
     if isinstance(op, RandomizeBlocks):
         fn = generate_randomize_blocks_fn(op)
@@ -72,7 +116,10 @@ def plan_all_to_all_op(
             )
         )
         fn = generate_sort_fn(
-            op._sort_key, op._batch_format, debug_limit_shuffle_execution_to_num_blocks
+            op._sort_key,
+            op._batch_format,
+            debug_limit_shuffle_execution_to_num_blocks,
+            boundaries_cache=op._boundaries_cache,
         )
         target_max_block_size = DataContext.get_current().target_shuffle_max_block_size
     elif isinstance(op, Aggregate):
@@ -230,3 +230,18 @@ class _ConvertToArrowExpressionVisitor(ast.NodeVisitor):
             return function_map[func_name](*args)
         else:
             raise ValueError(f"Unsupported function: {func_name}")
+
+
+def eval_expr(expression: pc.Expression, table: pa.Table) -> pa.ChunkedArray:
+    """Evaluate the expression on all rows of the table at once.
+
+    Args:
+        expression: The PyArrow compute expression to evaluate.
+        table: The table whose columns the expression references.
+
+    Returns:
+        The values of the expression for each row of the table.
+    """
+    import pyarrow.dataset as ds
+
+    return ds.dataset(table).to_table(columns={"result": expression}).column(0)
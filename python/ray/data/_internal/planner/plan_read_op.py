@@ -1,8 +1,9 @@
 import logging
 import warnings
-from typing import Iterable, List
+from typing import Iterable, List, Union
 
 import ray
+from ray.data._internal.block_cache import BlockCache, CachedReadTask
 from ray.data._internal.compute import TaskPoolStrategy
 from ray.data._internal.execution.interfaces import PhysicalOperator, RefBundle
 from ray.data._internal.execution.interfaces.task_context import TaskContext
@@ -17,8 +18,10 @@ from ray.data._internal.execution.operators.map_transformer import (
 from ray.data._internal.execution.util import memory_string
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.util import _warn_on_high_parallelism
+from ray.data._internal.write_checkpoint import CheckpointedReadTask
 from ray.data.block import Block, BlockMetadata
-from ray.data.datasource.datasource import ReadTask
+from ray.data.context import DataContext
+from ray.data.datasource.datasource import Datasource, Reader, ReadTask
 from ray.experimental.locations import get_local_object_locations
 from ray.util.debug import log_once
 
@@ -55,6 +58,26 @@ def cleaned_metadata(read_task: ReadTask, read_task_ref) -> BlockMetadata:
     return block_meta
 
 
+def _with_block_cache(
+    datasource_or_legacy_reader: Union[Datasource, Reader],
+    read_tasks: List[ReadTask],
+) -> List[ReadTask]:
+    """Wrap the read tasks that have cache keys with ``CachedReadTask``, if the block
+    cache is enabled."""
+    ctx = DataContext.get_current()
+    if ctx.block_cache_dir is None or not isinstance(
+        datasource_or_legacy_reader, Datasource
+    ):
+        return read_tasks
+
+    cache = BlockCache(ctx.block_cache_dir, ctx.block_cache_max_bytes)
+    cache_keys = datasource_or_legacy_reader.get_cache_keys(read_tasks)
+    return [
+        read_task if key is None else CachedReadTask(read_task, cache, key)
+        for read_task, key in zip(read_tasks, cache_keys)
+    ]
+
+
 def plan_read_op(
     op: Read, physical_children: List[PhysicalOperator]
 ) -> PhysicalOperator:
@@ -72,6 +95,11 @@ def plan_read_op(
         ), "Read parallelism must be set by the optimizer before execution"
         read_tasks = op._datasource_or_legacy_reader.get_read_tasks(parallelism)
         _warn_on_high_parallelism(parallelism, len(read_tasks))
+        read_tasks = _with_block_cache(op._datasource_or_legacy_reader, read_tasks)
+        if op._write_checkpoint is not None:
+            read_tasks = op._write_checkpoint.filter_read_tasks(
+                op._datasource_or_legacy_reader, read_tasks
+            )
 
         ret = []
         for read_task in read_tasks:
@@ -97,9 +125,15 @@ def plan_read_op(
         input_data_factory=get_input_data,
     )
 
-    def do_read(blocks: Iterable[ReadTask], _: TaskContext) -> Iterable[Block]:
+    def do_read(blocks: Iterable[ReadTask], ctx: TaskContext) -> Iterable[Block]:
         for read_task in blocks:
-            yield from read_task()
+            if isinstance(read_task, CheckpointedReadTask):
+                ctx.read_task_keys.append(read_task.key)
+                read_task = read_task.read_task
+            if isinstance(read_task, CachedReadTask):
+                yield from read_task.read_with_cache(ctx)
+            else:
+                yield from read_task()
 
     # Create a MapTransformer for a read operator
     transform_fns: List[MapTransformFn] = [
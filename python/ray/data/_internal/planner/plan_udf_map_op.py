@@ -2,9 +2,11 @@ import asyncio
 import collections
 import inspect
 import queue
+from collections import deque
+from concurrent.futures import Future
 from threading import Thread
 from types import GeneratorType
-from typing import Any, Callable, Iterable, Iterator, List, Optional
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -12,6 +14,7 @@ import pyarrow as pa
 
 import ray
 from ray._private.utils import get_or_create_event_loop
+from ray.data._internal.arrow_ops import transform_polars
 from ray.data._internal.compute import get_compute
 from ray.data._internal.execution.interfaces import PhysicalOperator
 from ray.data._internal.execution.interfaces.task_context import TaskContext
@@ -48,6 +51,10 @@ from ray.data.context import DataContext
 from ray.data.exceptions import UserCodeException
 from ray.util.rpdb import _is_ray_debugger_post_mortem_enabled
 
+# The default max number of batches that an actor processes concurrently with an
+# async UDF, if `max_concurrency` isn't specified in the Ray remote args.
+DEFAULT_ASYNC_UDF_MAX_CONCURRENCY = 16
+
 
 class _MapActorContext:
     def __init__(
@@ -55,18 +62,31 @@ class _MapActorContext:
         udf_map_cls: UserDefinedFunction,
         udf_map_fn: Callable[[Any], Any],
         is_async: bool,
+        max_concurrency: int = DEFAULT_ASYNC_UDF_MAX_CONCURRENCY,
     ):
         self.udf_map_cls = udf_map_cls
         self.udf_map_fn = udf_map_fn
         self.is_async = is_async
+        self.max_concurrency = max_concurrency
         self.udf_map_asyncio_loop = None
         self.udf_map_asyncio_thread = None
+        self._udf_map_asyncio_semaphore = None
 
         if is_async:
             self._init_async()
 
+    def get_asyncio_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore that bounds the number of batches that this actor
+        processes concurrently.
+
+        This must be called from the event loop thread.
+        """
+        if self._udf_map_asyncio_semaphore is None:
+            self._udf_map_asyncio_semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._udf_map_asyncio_semaphore
+
     def _init_async(self):
-        # Only used for callable class with async generator `__call__` method.
+        # Only used for callable class with async `__call__` method.
         loop = get_or_create_event_loop()
 
         def run_loop():
@@ -211,11 +231,19 @@ def _parse_op_fn(op: AbstractUDFMap):
         fn_constructor_args = op._fn_constructor_args or ()
         fn_constructor_kwargs = op._fn_constructor_kwargs or {}
 
-        is_async_gen = inspect.isasyncgenfunction(op._fn.__call__)
+        is_async = inspect.iscoroutinefunction(
+            op._fn.__call__
+        ) or inspect.isasyncgenfunction(op._fn.__call__)
+        if is_async and not isinstance(op, MapBatches):
+            raise ValueError(
+                f"Async UDFs are only supported by `map_batches`, but {op.name} got "
+                f"{op._fn.__name__} with an async `__call__` method."
+            )
+        max_concurrency = op._ray_remote_args.get(
+            "max_concurrency", DEFAULT_ASYNC_UDF_MAX_CONCURRENCY
+        )
 
-        # TODO(scottjlee): (1) support non-generator async functions
-        # (2) make the map actor async
-        if not is_async_gen:
+        if not is_async:
             op_fn = make_callable_class_concurrent(op_fn)
 
         def init_fn():
@@ -226,21 +254,27 @@ def _parse_op_fn(op: AbstractUDFMap):
                         *fn_constructor_args,
                         **fn_constructor_kwargs,
                     ),
-                    is_async=is_async_gen,
+                    is_async=is_async,
+                    max_concurrency=max_concurrency,
                 )
 
-        if is_async_gen:
+        if is_async:
 
             async def fn(item: Any) -> Any:
                 assert ray.data._map_actor_context is not None
                 assert ray.data._map_actor_context.is_async
 
                 try:
-                    return ray.data._map_actor_context.udf_map_fn(
+                    result = ray.data._map_actor_context.udf_map_fn(
                         item,
                         *fn_args,
                         **fn_kwargs,
                     )
+                    # Async generators are returned as is, and consumed by the
+                    # caller. Coroutines are awaited here.
+                    if inspect.isawaitable(result):
+                        result = await result
+                    return result
                 except Exception as e:
                     _handle_debugger_exception(e)
 
@@ -297,12 +331,13 @@ def _validate_batch_output(batch: Block) -> None:
             pd.core.frame.DataFrame,
             dict,
         ),
-    ):
+    ) and not transform_polars.is_polars_dataframe(batch):
         raise ValueError(
             "The `fn` you passed to `map_batches` returned a value of type "
             f"{type(batch)}. This isn't allowed -- `map_batches` expects "
             "`fn` to return a `pandas.DataFrame`, `pyarrow.Table`, "
-            "`numpy.ndarray`, `list`, or `dict[str, numpy.ndarray]`."
+            "`polars.DataFrame`, `numpy.ndarray`, `list`, or "
+            "`dict[str, numpy.ndarray]`."
         )
 
     if isinstance(batch, list):
@@ -332,7 +367,7 @@ def _generate_transform_fn_for_map_batches(
     fn: UserDefinedFunction,
 ) -> MapTransformCallable[DataBatch, DataBatch]:
     if inspect.iscoroutinefunction(fn):
-        # UDF is a callable class with async generator `__call__` method.
+        # UDF is a callable class with async `__call__` method.
         transform_fn = _generate_transform_fn_for_async_map_batches(fn)
 
     else:
@@ -383,61 +418,90 @@ def _generate_transform_fn_for_map_batches(
 def _generate_transform_fn_for_async_map_batches(
     fn: UserDefinedFunction,
 ) -> MapTransformCallable[DataBatch, DataBatch]:
+    """Generate a transform function for a callable class with an async `__call__`
+    method, which is either a coroutine function or an async generator function.
+
+    The batches are processed concurrently on the event loop of the actor, up to
+    `max_concurrency` batches per actor. The outputs are yielded in the order of
+    the input batches.
+    """
+    # Sentinel object to signal that a batch has been processed.
+    sentinel = object()
+
+    async def process_batch(batch: DataBatch, output_queue: queue.Queue):
+        actor_context = ray.data._map_actor_context
+        try:
+            async with actor_context.get_asyncio_semaphore():
+                result = await fn(batch)
+                if inspect.isasyncgen(result):
+                    # As soon as results become available from the async generator,
+                    # put them into the output queue so they can be yielded.
+                    async for output_batch in result:
+                        output_queue.put(output_batch)
+                else:
+                    output_queue.put(result)
+        except Exception as e:
+            # Put the exception into the queue to signal an error.
+            output_queue.put(e)
+        finally:
+            output_queue.put(sentinel)
+
     def transform_fn(
         input_iterable: Iterable[DataBatch], _: TaskContext
     ) -> Iterable[DataBatch]:
-        # Use a queue to store outputs from async generator calls.
-        # We will put output batches into this queue from async
-        # generators, and in the main event loop, yield them from
-        # the queue as they become available.
-        output_batch_queue = queue.Queue()
-        # Sentinel object to signal the end of the async generator.
-        sentinel = object()
-
-        async def process_batch(batch: DataBatch):
-            try:
-                output_batch_iterator = await fn(batch)
-                # As soon as results become available from the async generator,
-                # put them into the result queue so they can be yielded.
-                async for output_batch in output_batch_iterator:
-                    output_batch_queue.put(output_batch)
-            except Exception as e:
-                output_batch_queue.put(
-                    e
-                )  # Put the exception into the queue to signal an error
-
-        async def process_all_batches():
-            try:
-                loop = ray.data._map_actor_context.udf_map_asyncio_loop
-                tasks = [loop.create_task(process_batch(x)) for x in input_iterable]
+        actor_context = ray.data._map_actor_context
+        loop = actor_context.udf_map_asyncio_loop
+        # The output queues of the batches in flight, in the order of the input
+        # batches. Each batch has its own queue, so that the outputs can be yielded
+        # in order while the following batches are processed.
+        in_flight: Deque[Tuple[queue.Queue, Optional[Future]]] = deque()
+
+        def yield_outputs_of_first_batch() -> Iterator[DataBatch]:
+            # Keep the batch in `in_flight` until all of its outputs are yielded, so
+            # that it's cancelled below if the consumer stops early.
+            output_queue, _ = in_flight[0]
+            while True:
+                out_batch = output_queue.get()
+                if out_batch is sentinel:
+                    break
+                if isinstance(out_batch, Exception):
+                    raise out_batch
+                _validate_batch_output(out_batch)
+                yield out_batch
+            in_flight.popleft()
 
-                ctx = ray.data.DataContext.get_current()
-                if ctx.execution_options.preserve_order:
-                    for task in tasks:
-                        await task()
+        try:
+            for batch in input_iterable:
+                # Bound the number of batches in flight, so that the input isn't
+                # consumed faster than the UDF can process it.
+                while len(in_flight) >= actor_context.max_concurrency:
+                    yield from yield_outputs_of_first_batch()
+
+                output_queue = queue.Queue()
+                if (
+                    not isinstance(batch, collections.abc.Mapping)
+                    and BlockAccessor.for_block(batch).num_rows() == 0
+                ):
+                    # For empty input blocks, we directly ouptut them without
+                    # calling the UDF. See `_generate_transform_fn_for_map_batches`.
+                    output_queue.put(batch)
+                    output_queue.put(sentinel)
+                    in_flight.append((output_queue, None))
                 else:
-                    for task in asyncio.as_completed(tasks):
-                        await task
-            finally:
-                output_batch_queue.put(sentinel)
-
-        # Use the existing event loop to create and run Tasks to process each batch
-        loop = ray.data._map_actor_context.udf_map_asyncio_loop
-        asyncio.run_coroutine_threadsafe(process_all_batches(), loop)
-
-        # Yield results as they become available.
-        while True:
-            # Here, `out_batch` is a one-row output batch
-            # from the async generator, corresponding to a
-            # single row from the input batch.
-            out_batch = output_batch_queue.get()
-            if out_batch is sentinel:
-                # Break out of the loop when the sentinel is received.
-                break
-            if isinstance(out_batch, Exception):
-                raise out_batch
-            _validate_batch_output(out_batch)
-            yield out_batch
+                    future = asyncio.run_coroutine_threadsafe(
+                        process_batch(batch, output_queue), loop
+                    )
+                    in_flight.append((output_queue, future))
+
+            while in_flight:
+                yield from yield_outputs_of_first_batch()
+        finally:
+            # Cancel the remaining batches if the outputs are no longer consumed,
+            # e.g., due to an error, or because the generator is closed early. This
+            # releases their slots of the actor-wide semaphore.
+            for _, future in in_flight:
+                if future is not None:
+                    future.cancel()
 
     return transform_fn
 
@@ -1,5 +1,5 @@
 import itertools
-from typing import Callable, Iterator, List, Union
+from typing import Callable, Iterator, List, Optional, Union
 
 from ray.data._internal.compute import TaskPoolStrategy
 from ray.data._internal.execution.interfaces import PhysicalOperator
@@ -10,6 +10,7 @@ from ray.data._internal.execution.operators.map_transformer import (
     MapTransformer,
 )
 from ray.data._internal.logical.operators.write_operator import Write
+from ray.data._internal.write_checkpoint import WriteCheckpoint
 from ray.data.block import Block, BlockAccessor
 from ray.data.datasource.datasink import Datasink, WriteResult
 from ray.data.datasource.datasource import Datasource
@@ -33,9 +34,9 @@ def generate_write_fn(
     return fn
 
 
-def generate_collect_write_stats_fn() -> Callable[
-    [Iterator[Block], TaskContext], Iterator[Block]
-]:
+def generate_collect_write_stats_fn(
+    checkpoint: Optional[WriteCheckpoint] = None,
+) -> Callable[[Iterator[Block], TaskContext], Iterator[Block]]:
     # If the write op succeeds, the resulting Dataset is a list of
     # one Block which contain stats/metrics about the write.
     # Otherwise, an error will be raised. The Datasource can handle
@@ -51,6 +52,17 @@ def generate_collect_write_stats_fn() -> Callable[
         import pandas as pd
 
         write_result = WriteResult(num_rows=total_num_rows, size_bytes=total_size_bytes)
+        if checkpoint is not None:
+            # The blocks have been written at this point, so record the read tasks
+            # that produced them.
+            if not ctx.read_task_keys:
+                raise ValueError(
+                    "Can't checkpoint the write, because the write task didn't run "
+                    "the read tasks. This happens if the write can't be fused with "
+                    "the read, e.g., due to different Ray remote args. Unset "
+                    "`DataContext.write_checkpoint_path` to write this dataset."
+                )
+            checkpoint.record_task(ctx.read_task_keys, write_result)
         block = pd.DataFrame({"write_result": [write_result]})
         return iter([block])
 
@@ -64,7 +76,7 @@ def plan_write_op(
     input_physical_dag = physical_children[0]
 
     write_fn = generate_write_fn(op._datasink_or_legacy_datasource, **op._write_args)
-    collect_stats_fn = generate_collect_write_stats_fn()
+    collect_stats_fn = generate_collect_write_stats_fn(op._checkpoint)
     # Create a MapTransformer for a write operator
     transform_fns = [
         BlockMapTransformFn(write_fn),
@@ -32,6 +32,7 @@ def _register_default_plan_logical_op_fns():
         AggregateNumRows,
     )
     from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+    from ray.data._internal.execution.operators.join_operator import JoinOperator
     from ray.data._internal.execution.operators.limit_operator import LimitOperator
     from ray.data._internal.execution.operators.union_operator import UnionOperator
     from ray.data._internal.execution.operators.zip_operator import ZipOperator
@@ -46,7 +47,7 @@ def _register_default_plan_logical_op_fns():
         Filter,
         Project,
     )
-    from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
+    from ray.data._internal.logical.operators.n_ary_operator import Join, Union, Zip
     from ray.data._internal.logical.operators.one_to_one_operator import Limit
     from ray.data._internal.logical.operators.read_operator import Read
     from ray.data._internal.logical.operators.write_operator import Write
@@ -101,6 +102,20 @@ def _register_default_plan_logical_op_fns():
 
     register_plan_logical_op_fn(Union, plan_union_op)
 
+    def plan_join_op(logical_op, physical_children):
+        assert len(physical_children) == 2
+        return JoinOperator(
+            physical_children[0],
+            physical_children[1],
+            keys=logical_op._keys,
+            join_type=logical_op._join_type,
+            num_partitions=logical_op._num_partitions,
+            left_suffix=logical_op._left_suffix,
+            right_suffix=logical_op._right_suffix,
+        )
+
+    register_plan_logical_op_fn(Join, plan_join_op)
+
     def plan_limit_op(logical_op, physical_children):
         assert len(physical_children) == 1
         return LimitOperator(logical_op._limit, physical_children[0])
@@ -1,5 +1,5 @@
 from functools import partial
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
@@ -22,8 +22,15 @@ def generate_sort_fn(
     sort_key: SortKey,
     batch_format: str,
     _debug_limit_shuffle_execution_to_num_blocks: Optional[int] = None,
+    boundaries_cache: Optional[Dict[Tuple[Tuple[str, ...], int], List]] = None,
 ) -> AllToAllTransformFn:
-    """Generate function to sort blocks by the specified key column or key function."""
+    """Generate function to sort blocks by the specified key column or key function.
+
+    If ``boundaries_cache`` is set, the sampled boundaries are cached in it and
+    reused when the same number of blocks is sorted by the same columns again.
+    Stale boundaries only make the output blocks less balanced, since every row
+    still goes to the block of its range.
+    """
 
     def fn(
         sort_key: SortKey,
@@ -44,13 +51,21 @@ def generate_sort_fn(
         num_outputs = num_mappers
 
         # Sample boundaries for sort key.
-        if not sort_key.boundaries:
+        cache_key = (tuple(sort_key.get_columns()), num_outputs)
+        if not sort_key.boundaries and (
+            boundaries_cache is not None and cache_key in boundaries_cache
+        ):
+            boundaries = list(boundaries_cache[cache_key])
+        elif not sort_key.boundaries:
             sample_bar = ctx.sub_progress_bar_dict[
                 SortTaskSpec.SORT_SAMPLE_SUB_PROGRESS_BAR_NAME
             ]
             boundaries = SortTaskSpec.sample_boundaries(
                 blocks, sort_key, num_outputs, sample_bar
             )
+            if boundaries_cache is not None:
+                # Cache the ascending boundaries before they're reversed below.
+                boundaries_cache[cache_key] = list(boundaries)
         else:
             boundaries = [(b,) for b in sort_key.boundaries]
             num_outputs = len(boundaries) + 1
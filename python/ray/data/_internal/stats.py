@@ -1,5 +1,6 @@
 import collections
 import logging
+import math
 import threading
 import time
 from contextlib import contextmanager
@@ -28,6 +29,10 @@ logger = logging.getLogger(__name__)
 STATS_ACTOR_NAME = "datasets_stats_actor"
 STATS_ACTOR_NAMESPACE = "_dataset_stats_actor"
 
+# The max number of transform trace events kept per operator, to bound the size of
+# the stats in the driver.
+MAX_TRANSFORM_TRACE_EVENTS = 100000
+
 
 StatsDict = Dict[str, List[BlockMetadata]]
 
@@ -906,6 +911,45 @@ class DatasetStatsSummary:
 
         return out
 
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the profiles of the transform functions of this Dataset and its
+        parents in the Chrome trace event format, which can be loaded in Perfetto,
+        ``chrome://tracing`` and speedscope.
+
+        Each operator is shown as a process, and each of its tasks as a thread.
+        Transform profiling must be enabled with
+        ``DataContext.enable_transform_profiling``.
+        """
+        trace_events = []
+        visited = set()
+        pid = 0
+
+        def add_events(summ: "DatasetStatsSummary"):
+            nonlocal pid
+            if id(summ) in visited:
+                return
+            visited.add(id(summ))
+            for parent in summ.parents:
+                add_events(parent)
+            for operator_stats in summ.operators_stats:
+                if not operator_stats.transform_trace_events:
+                    continue
+                name = f"Operator {summ.number} {operator_stats.operator_name}"
+                trace_events.append(
+                    {
+                        "name": "process_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "args": {"name": name},
+                    }
+                )
+                for event in operator_stats.transform_trace_events:
+                    trace_events.append({**event, "pid": pid, "cat": name})
+                pid += 1
+
+        add_events(self)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
     @staticmethod
     def _collect_dataset_stats_summaries(
         curr: "DatasetStatsSummary",
@@ -1050,6 +1094,16 @@ class OperatorStatsSummary:
     # node_count: "count" stat instead of "sum"
     node_count: Optional[Dict[str, float]] = None
     task_rows: Optional[Dict[str, float]] = None
+    # The number of read tasks that hit or missed the block cache:
+    # {"hits": ..., "misses": ...}
+    block_cache: Optional[Dict[str, int]] = None
+    # The time and peak RSS of each transform function, if transform profiling is
+    # enabled: {stage_name: {"time": ..., "outputs": ..., "peak_rss": ...}}
+    transform_stages: Optional[Dict[str, Dict[str, float]]] = None
+    # The Chrome trace events of the transform functions, if transform profiling is
+    # enabled. At most `MAX_TRANSFORM_TRACE_EVENTS` of them are kept, sampled from
+    # all tasks.
+    transform_trace_events: Optional[List[Dict[str, Any]]] = None
 
     @classmethod
     def from_block_metadata(
@@ -1179,6 +1233,50 @@ class OperatorStatsSummary:
                 "count": len(node_counts),
             }
 
+        block_cache_stats = None
+        if exec_stats:
+            block_cache_hits = sum(e.block_cache_hits for e in exec_stats)
+            block_cache_misses = sum(e.block_cache_misses for e in exec_stats)
+            if block_cache_hits or block_cache_misses:
+                block_cache_stats = {
+                    "hits": block_cache_hits,
+                    "misses": block_cache_misses,
+                }
+
+        transform_stages, transform_trace_events = None, None
+        transform_profiles = [
+            e.transform_profile for e in exec_stats if e.transform_profile is not None
+        ]
+        if transform_profiles:
+            transform_stages = {}
+            transform_trace_events = []
+            num_trace_events = sum(len(p.trace_events) for p in transform_profiles)
+            # Sample every `trace_event_stride`-th event of each task, so that the
+            # events are bounded regardless of the number of tasks.
+            trace_event_stride = max(
+                1, math.ceil(num_trace_events / MAX_TRANSFORM_TRACE_EVENTS)
+            )
+            for profile in transform_profiles:
+                for name, time_s, num_outputs, peak_rss_bytes in zip(
+                    profile.stage_names,
+                    profile.stage_time_s,
+                    profile.stage_num_outputs,
+                    profile.stage_peak_rss_bytes,
+                ):
+                    stage = transform_stages.setdefault(
+                        name, {"time": 0, "outputs": 0, "peak_rss": 0}
+                    )
+                    stage["time"] += time_s
+                    stage["outputs"] += num_outputs
+                    stage["peak_rss"] = max(
+                        stage["peak_rss"],
+                        round(peak_rss_bytes / (1024 * 1024), 2),
+                    )
+                transform_trace_events.extend(
+                    profile.trace_events[::trace_event_stride]
+                )
+            transform_trace_events = transform_trace_events[:MAX_TRANSFORM_TRACE_EVENTS]
+
         return OperatorStatsSummary(
             operator_name=operator_name,
             is_sub_operator=is_sub_operator,
@@ -1194,6 +1292,9 @@ class OperatorStatsSummary:
             output_size_bytes=output_size_bytes_stats,
             node_count=node_counts_stats,
             task_rows=task_rows_stats,
+            block_cache=block_cache_stats,
+            transform_stages=transform_stages,
+            transform_trace_events=transform_trace_events,
         )
 
     def __str__(self) -> str:
@@ -1291,6 +1392,30 @@ class OperatorStatsSummary:
                 node_count_stats["mean"],
                 node_count_stats["count"],
             )
+        block_cache_stats = self.block_cache
+        if block_cache_stats:
+            out += indent
+            out += "* Block cache: {} hits, {} misses\n".format(
+                block_cache_stats["hits"],
+                block_cache_stats["misses"],
+            )
+        transform_stages = self.transform_stages
+        if transform_stages:
+            total_time = sum(stage["time"] for stage in transform_stages.values())
+            out += indent
+            out += "* Transform time breakdown:\n"
+            for name, stage in transform_stages.items():
+                percent = stage["time"] / total_time * 100 if total_time else 0
+                out += indent
+                out += (
+                    "\t* {}: {} ({:.1f}%), {} outputs, {} MiB peak RSS\n"
+                ).format(
+                    name,
+                    fmt(stage["time"]),
+                    percent,
+                    stage["outputs"],
+                    stage["peak_rss"],
+                )
         if output_num_rows_stats and self.time_total_s and wall_time_stats:
             # For throughput, we compute both an observed Ray Data operator throughput
             # and an estimated single node operator throughput.
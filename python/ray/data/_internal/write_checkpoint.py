@@ -0,0 +1,364 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import posixpath
+import uuid
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Set, Union
+
+import ray
+from ray import cloudpickle
+from ray.data.block import Block
+from ray.data.datasource.datasink import WriteResult
+from ray.data.datasource.datasource import Datasource, Reader, ReadTask
+from ray.data.datasource.path_util import _resolve_paths_and_filesystem
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data._internal.logical.interfaces import LogicalOperator
+    from ray.data.datasource.datasink import Datasink
+
+logger = logging.getLogger(__name__)
+
+# The file that marks a write as complete.
+_COMMITTED_FILE_NAME = "_COMMITTED"
+
+# The directory of the records of the completed write tasks.
+_TASKS_DIR_NAME = "tasks"
+
+# The prefix of the keys of read tasks that don't have cache keys. These keys are
+# the indices of the read tasks, so they're only valid for the same number of read
+# tasks.
+_INDEX_KEY_PREFIX = "read-task-"
+
+# Bump this when the format of the records changes.
+_CHECKPOINT_FORMAT_VERSION = 2
+
+# Attributes that differ between runs of the same write, so they're excluded from
+# the fingerprint of the write.
+_NON_IDENTIFYING_ATTRS = {"dataset_uuid"}
+
+# Attributes of the operators that don't identify what they compute, e.g., their
+# links to other operators, and the estimates and decisions of the optimizer.
+_NON_IDENTIFYING_OP_ATTRS = {
+    "_input_dependencies",
+    "_output_dependencies",
+    "_datasource",
+    "_datasource_or_legacy_reader",
+    "_detected_parallelism",
+    "_mem_size",
+    "_write_checkpoint",
+}
+
+
+def _describe_value(value: Any, name: str) -> str:
+    """Return a description of ``value`` that's stable across processes.
+
+    Primitives and containers are described by their contents, and other objects
+    by their attributes. Callables, and objects without attributes (e.g., ones
+    implemented in C), are described by the hash of their pickle, which covers the
+    code, constants and closures of functions that are pickled by value.
+
+    Raises:
+        ValueError: If ``value`` can't be described, e.g., it can't be pickled.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return repr(value)
+    if isinstance(value, bytes):
+        return f"bytes:{hashlib.sha256(value).hexdigest()}"
+    if isinstance(value, (list, tuple)):
+        items = [_describe_value(item, name) for item in value]
+        return f"[{', '.join(items)}]"
+    if isinstance(value, (set, frozenset)):
+        items = sorted(_describe_value(item, name) for item in value)
+        return f"{{{', '.join(items)}}}"
+    if isinstance(value, dict):
+        items = sorted(
+            f"{_describe_value(key, name)}: {_describe_value(item, name)}"
+            for key, item in value.items()
+        )
+        return f"{{{', '.join(items)}}}"
+    if isinstance(value, ray.ObjectRef):
+        raise ValueError(
+            f"The write can't be checkpointed, because `{name}` holds an object "
+            "reference, whose contents can't be fingerprinted."
+        )
+    if hasattr(value, "__dict__") and not callable(value):
+        return _describe_object(value, name)
+    try:
+        pickled = cloudpickle.dumps(value)
+    except Exception as e:
+        raise ValueError(
+            f"The write can't be checkpointed, because `{name}` can't be pickled "
+            f"to fingerprint it: {e}"
+        ) from e
+    return f"pickle:{hashlib.sha256(pickled).hexdigest()}"
+
+
+def _describe_object(obj: Any, name: str, excluded_attrs: Iterable[str] = ()) -> str:
+    """Return the type of ``obj`` and the descriptions of its attributes."""
+    attrs = []
+    for attr, value in sorted(vars(obj).items()):
+        if attr in _NON_IDENTIFYING_ATTRS or attr in excluded_attrs:
+            continue
+        attrs.append(f"{attr}={_describe_value(value, f'{name}.{attr}')}")
+    return f"{type(obj).__module__}.{type(obj).__qualname__}({', '.join(attrs)})"
+
+
+def _describe_read_inputs(datasource: Union[Datasource, Reader], name: str) -> str:
+    """Return a description of ``datasource`` that covers its input files.
+
+    The input files are described by their block cache keys (see
+    :meth:`~ray.data.Datasource.get_cache_keys`), which cover their sizes and
+    modification times, so rewriting an input file changes the description.
+    Datasources without input files are described by their attributes.
+
+    Raises:
+        ValueError: If the datasource has input files without cache keys.
+    """
+    read_tasks = datasource.get_read_tasks(1)
+    paths = sorted(
+        {path for task in read_tasks for path in task.metadata.input_files or []}
+    )
+    if not paths:
+        return _describe_object(datasource, name)
+
+    # Compute the key of each file separately, so the description doesn't depend
+    # on how the files are split into read tasks.
+    template = read_tasks[0]
+    file_read_tasks = [
+        ReadTask(
+            template.read_fn,
+            dataclasses.replace(template.metadata, input_files=[path]),
+        )
+        for path in paths
+    ]
+    keys = [None] * len(file_read_tasks)
+    if isinstance(datasource, Datasource):
+        keys = datasource.get_cache_keys(file_read_tasks)
+    if any(key is None for key in keys):
+        raise ValueError(
+            "The write can't be checkpointed, because the input files of "
+            f"{type(datasource).__name__} can't be fingerprinted. Implement "
+            "`Datasource.get_cache_keys` to checkpoint writes of its outputs."
+        )
+    return f"{type(datasource).__module__}.{type(datasource).__qualname__}({keys})"
+
+
+def compute_write_fingerprint(dag: "LogicalOperator", datasink: "Datasink") -> str:
+    """Return a fingerprint of writing the outputs of ``dag`` to ``datasink``.
+
+    The fingerprint covers the operators of the plan with their UDFs and
+    arguments, the input files of the reads with their sizes and modification
+    times, and the datasink with its arguments. So the reruns of a write have the
+    same fingerprint, and different writes, or writes of modified inputs, have
+    different ones.
+
+    Raises:
+        ValueError: If any part of the write can't be fingerprinted. Skipping the
+            write of a different plan with a colliding fingerprint would lose data,
+            so such writes aren't checkpointed.
+    """
+    from ray.data._internal.logical.operators.map_operator import AbstractMap
+    from ray.data._internal.logical.operators.read_operator import Read
+
+    parts = []
+    for op in dag.post_order_iter():
+        if isinstance(op, Read):
+            parts.append(
+                _describe_read_inputs(op._datasource_or_legacy_reader, op.name)
+            )
+        if isinstance(op, (Read, AbstractMap)):
+            description = _describe_object(op, op.name, _NON_IDENTIFYING_OP_ATTRS)
+            parts.append(f"{op.name}: {description}")
+        else:
+            # The writes of plans with other operators are rejected by
+            # `WriteCheckpointRule`, so their operators aren't described.
+            parts.append(op.name)
+    parts.append(_describe_object(datasink, "datasink"))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+class WriteCheckpoint:
+    """A checkpoint of a write, under a local or remote path.
+
+    Each write task that completes writes a record with the keys of the read tasks
+    whose outputs it has written, and its write result. A rerun of the write skips
+    the recorded read tasks, and passes the recorded write results to
+    :meth:`~ray.data.Datasink.on_write_complete` along with the new ones. After
+    ``on_write_complete`` succeeds, the write is marked as committed, and a rerun
+    does nothing.
+
+    The checkpoint of a write is stored under a subdirectory of ``path`` named
+    after the fingerprint of the write (see :func:`compute_write_fingerprint`), so
+    different writes with the same ``path`` don't share their checkpoints.
+
+    The key of a read task is its block cache key (see
+    :meth:`~ray.data.Datasource.get_cache_keys`) if it has one, so reruns with a
+    different read parallelism (e.g., on a smaller cluster) still skip the files
+    that have been written. Otherwise, it's the index of the read task, which is
+    only valid if the rerun has the same number of read tasks.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fingerprint: str,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    ):
+        paths, self._filesystem = _resolve_paths_and_filesystem(path, filesystem)
+        assert len(paths) == 1, len(paths)
+        self._path = posixpath.join(paths[0], fingerprint)
+        self._fingerprint = fingerprint
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def is_committed(self) -> bool:
+        """Whether the write has completed."""
+        from pyarrow.fs import FileType
+
+        info = self._filesystem.get_file_info(self._committed_file_path())
+        return info.type != FileType.NotFound
+
+    def commit(self):
+        """Mark the write as completed."""
+        self._write_file(
+            self._committed_file_path(),
+            {
+                "version": _CHECKPOINT_FORMAT_VERSION,
+                "fingerprint": self._fingerprint,
+            },
+        )
+
+    def record_task(self, read_task_keys: List[str], write_result: WriteResult):
+        """Record that the outputs of the given read tasks have been written."""
+        record = {
+            "version": _CHECKPOINT_FORMAT_VERSION,
+            "fingerprint": self._fingerprint,
+            "read_task_keys": read_task_keys,
+            "num_rows": write_result.num_rows,
+            "size_bytes": write_result.size_bytes,
+        }
+        self._write_file(
+            posixpath.join(self._path, _TASKS_DIR_NAME, f"{uuid.uuid4().hex}.json"),
+            record,
+        )
+
+    def load_records(self) -> List[dict]:
+        """Return the records of the completed write tasks."""
+        from pyarrow.fs import FileSelector, FileType
+
+        selector = FileSelector(
+            posixpath.join(self._path, _TASKS_DIR_NAME), allow_not_found=True
+        )
+        records = []
+        for info in self._filesystem.get_file_info(selector):
+            if info.type != FileType.File or not info.path.endswith(".json"):
+                continue
+            with self._filesystem.open_input_stream(info.path) as f:
+                record = json.loads(f.read().decode("utf-8"))
+            if record.get("version") != _CHECKPOINT_FORMAT_VERSION:
+                raise ValueError(
+                    f"The write checkpoint at {self._path} was written by an "
+                    "incompatible version of Ray Data. Delete it to rerun the write "
+                    "from scratch."
+                )
+            if record["fingerprint"] != self._fingerprint:
+                raise ValueError(
+                    f"The write checkpoint at {self._path} belongs to a different "
+                    "write. Delete it to rerun the write from scratch."
+                )
+            records.append(record)
+        return records
+
+    @staticmethod
+    def get_write_result_blocks(records: List[dict]) -> List[Block]:
+        """Return the write results of ``records`` in the format of the blocks that
+        write tasks output."""
+        import pandas as pd
+
+        return [
+            pd.DataFrame(
+                {
+                    "write_result": [
+                        WriteResult(
+                            num_rows=record["num_rows"],
+                            size_bytes=record["size_bytes"],
+                        )
+                    ]
+                }
+            )
+            for record in records
+        ]
+
+    def filter_read_tasks(
+        self,
+        datasource_or_legacy_reader: Union[Datasource, Reader],
+        read_tasks: List[ReadTask],
+    ) -> List["CheckpointedReadTask"]:
+        """Drop the read tasks whose outputs have been written, and attach the keys
+        to the remaining ones."""
+        if isinstance(datasource_or_legacy_reader, Datasource):
+            keys = datasource_or_legacy_reader.get_cache_keys(read_tasks)
+        else:
+            keys = [None] * len(read_tasks)
+        num_read_tasks = len(read_tasks)
+        keys = [
+            key if key is not None else f"{_INDEX_KEY_PREFIX}{i}-of-{num_read_tasks}"
+            for i, key in enumerate(keys)
+        ]
+
+        written_keys: Set[str] = set()
+        for record in self.load_records():
+            written_keys.update(record["read_task_keys"])
+        for key in written_keys:
+            if key.startswith(_INDEX_KEY_PREFIX) and not key.endswith(
+                f"-of-{num_read_tasks}"
+            ):
+                raise ValueError(
+                    f"The write checkpoint at {self._path} was written with a "
+                    f"different number of read tasks than the current "
+                    f"{num_read_tasks}. Set `override_num_blocks` of the read to "
+                    "the same value as the original write to resume it."
+                )
+
+        remaining = [
+            CheckpointedReadTask(read_task, key)
+            for read_task, key in zip(read_tasks, keys)
+            if key not in written_keys
+        ]
+        if len(remaining) < num_read_tasks:
+            logger.info(
+                f"Skipping {num_read_tasks - len(remaining)} of {num_read_tasks} "
+                f"read tasks whose outputs were written according to the write "
+                f"checkpoint at {self._path}."
+            )
+        return remaining
+
+    def _committed_file_path(self) -> str:
+        return posixpath.join(self._path, _COMMITTED_FILE_NAME)
+
+    def _write_file(self, path: str, content: dict):
+        # Write to a temporary file first, so that readers never see a partial
+        # file. On object stores, the move is a copy and a delete, but the records
+        # are small.
+        self._filesystem.create_dir(posixpath.dirname(path), recursive=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with self._filesystem.open_output_stream(tmp_path) as f:
+            f.write(json.dumps(content).encode("utf-8"))
+        self._filesystem.move(tmp_path, path)
+
+
+class CheckpointedReadTask(ReadTask):
+    """A ``ReadTask`` with the key that identifies it in a ``WriteCheckpoint``."""
+
+    def __init__(self, read_task: ReadTask, key: str):
+        super().__init__(read_task.read_fn, read_task.metadata)
+        self.read_task = read_task
+        self.key = key
+
+    def __call__(self) -> Iterable[Block]:
+        return self.read_task()
@@ -38,9 +38,13 @@ except ImportError:
 
 if TYPE_CHECKING:
     import pandas
+    import polars
     import pyarrow
 
     from ray.data._internal.block_builder import BlockBuilder
+    from ray.data._internal.execution.operators.map_transformer import (
+        TransformProfile,
+    )
     from ray.data._internal.planner.exchange.sort_task_spec import SortKey
     from ray.data.aggregate import AggregateFn
 
@@ -70,7 +74,9 @@ class BlockType(Enum):
 
 # User-facing data batch type. This is the data type for data that is supplied to and
 # returned from batch UDFs.
-DataBatch = Union["pyarrow.Table", "pandas.DataFrame", Dict[str, np.ndarray]]
+DataBatch = Union[
+    "pyarrow.Table", "pandas.DataFrame", "polars.DataFrame", Dict[str, np.ndarray]
+]
 
 # User-facing data column type. This is the data type for data that is supplied to and
 # returned from column UDFs.
@@ -108,7 +114,7 @@ BlockPartitionMetadata = List["BlockMetadata"]
 # is on by default. When block splitting is off, the type is a plain block.
 MaybeBlockPartition = Union[Block, DynamicObjectRefGenerator]
 
-VALID_BATCH_FORMATS = ["pandas", "pyarrow", "numpy", None]
+VALID_BATCH_FORMATS = ["pandas", "pyarrow", "polars", "numpy", None]
 DEFAULT_BATCH_FORMAT = "numpy"
 
 
@@ -153,6 +159,11 @@ class BlockExecStats:
         # differentiate from previous tasks on the same worker.
         self.max_rss_bytes: int = 0
         self.task_idx: Optional[int] = None
+        # The number of read tasks that hit or missed the block cache.
+        self.block_cache_hits: int = 0
+        self.block_cache_misses: int = 0
+        # The profile of the transform functions, if profiling is enabled.
+        self.transform_profile: Optional["TransformProfile"] = None
 
     @staticmethod
     def builder() -> "_BlockExecStatsBuilder":
@@ -300,6 +311,16 @@ class BlockAccessor:
         """Convert this block into an Arrow table."""
         raise NotImplementedError
 
+    def to_polars(self) -> "polars.DataFrame":
+        """Convert this block into a polars DataFrame.
+
+        This is zero-copy for Arrow blocks, for the types that polars and Arrow
+        represent the same way.
+        """
+        from ray.data._internal.arrow_ops import transform_polars
+
+        return transform_polars.from_arrow(self.to_arrow())
+
     def to_block(self) -> Block:
         """Return the base block that this accessor wraps."""
         raise NotImplementedError
@@ -325,6 +346,8 @@ class BlockAccessor:
             return self.to_pandas()
         elif batch_format == "pyarrow":
             return self.to_arrow()
+        elif batch_format == "polars":
+            return self.to_polars()
         elif batch_format == "numpy":
             return self.to_numpy()
         else:
@@ -371,6 +394,7 @@ class BlockAccessor:
         block_type: Optional[BlockType] = None,
     ) -> Block:
         """Create a block from user-facing data formats."""
+        from ray.data._internal.arrow_ops import transform_polars
 
         if isinstance(batch, np.ndarray):
             raise ValueError(
@@ -380,6 +404,11 @@ class BlockAccessor:
                 "e.g., `{'data': array}` instead of `array`."
             )
 
+        elif transform_polars.is_polars_dataframe(batch):
+            # There's no polars block type, so polars DataFrames are converted to
+            # Arrow tables, which is zero-copy for most types.
+            return batch.to_arrow()
+
         elif isinstance(batch, collections.abc.Mapping):
             if block_type is None or block_type == BlockType.ARROW:
                 try:
@@ -56,6 +56,10 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATA_PUSH_BASED_SHUFFLE", None)
 )
 
+DEFAULT_USE_HASH_AGGREGATE = bool(
+    int(os.environ.get("RAY_DATA_USE_HASH_AGGREGATE", "0"))
+)
+
 DEFAULT_SCHEDULING_STRATEGY = "SPREAD"
 
 # This default enables locality-based scheduling in Ray for tasks where arg data
@@ -141,6 +145,38 @@ DEFAULT_OP_RESOURCE_RESERVATION_RATIO = float(
 
 DEFAULT_MAX_ERRORED_BLOCKS = 0
 
+# Joins broadcast inputs that are smaller than this size in bytes, instead of
+# shuffling both inputs.
+DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Whether the streaming executor tunes the target max block size of operators at
+# runtime, based on the object store usage and the task durations.
+DEFAULT_ENABLE_ADAPTIVE_BLOCK_SIZING = env_bool(
+    "RAY_DATA_ENABLE_ADAPTIVE_BLOCK_SIZING", False
+)
+
+# The bounds of the target max block size when adaptive block sizing is enabled.
+DEFAULT_ADAPTIVE_BLOCK_SIZING_MIN_BYTES = 16 * 1024 * 1024
+DEFAULT_ADAPTIVE_BLOCK_SIZING_MAX_BYTES = 512 * 1024 * 1024
+
+# The directory on the local disk of each node to cache the blocks of read tasks in.
+# Caching is disabled if this is None.
+DEFAULT_BLOCK_CACHE_DIR = os.environ.get("RAY_DATA_BLOCK_CACHE_DIR", None)
+
+# The max total size of the cached blocks on each node.
+DEFAULT_BLOCK_CACHE_MAX_BYTES = env_integer(
+    "RAY_DATA_BLOCK_CACHE_MAX_BYTES", 10 * 1024 * 1024 * 1024
+)
+
+# The directory to checkpoint writes to, so that a failed write can be resumed.
+# Checkpointing is disabled if this is None.
+DEFAULT_WRITE_CHECKPOINT_PATH = os.environ.get("RAY_DATA_WRITE_CHECKPOINT_PATH", None)
+
+# Whether to time the transform functions of map tasks and sample their memory usage.
+DEFAULT_ENABLE_TRANSFORM_PROFILING = env_bool(
+    "RAY_DATA_ENABLE_TRANSFORM_PROFILING", False
+)
+
 # Use this to prefix important warning messages for the user.
 WARN_PREFIX = "⚠️ "
 
@@ -208,6 +244,10 @@ class DataContext:
         actor_prefetcher_enabled: Whether to use actor based block prefetcher.
         use_push_based_shuffle: Whether to use push-based shuffle.
         pipeline_push_based_shuffle_reduce_tasks:
+        use_hash_aggregate: Whether to aggregate by the hash of the groupby key,
+            instead of sorting. Map tasks combine their blocks into partial
+            aggregates, which are shuffled as the blocks are produced. The output
+            isn't sorted by key.
         scheduling_strategy: The global scheduling strategy. For tasks with large args,
             ``scheduling_strategy_large_args`` takes precedence.
         scheduling_strategy_large_args: Scheduling strategy for tasks with large args.
@@ -279,6 +319,42 @@ class DataContext:
         retried_io_errors: A list of substrings of error messages that should
             trigger a retry when reading or writing files. This is useful for handling
             transient errors when reading from remote storage systems.
+        broadcast_join_threshold_bytes: :meth:`Dataset.join` broadcasts an input
+            that's smaller than this size in bytes to every block of the other input,
+            instead of hash-partitioning both inputs.
+        enable_adaptive_block_sizing: Whether to tune the target max block size of
+            map operators at runtime. Blocks are shrunk when the object store is
+            under memory pressure, and grown when the per-task overhead of
+            downstream operators dominates.
+        adaptive_block_sizing_min_bytes: The min target max block size in bytes when
+            adaptive block sizing is enabled.
+        adaptive_block_sizing_max_bytes: The max target max block size in bytes when
+            adaptive block sizing is enabled.
+        block_cache_dir: If set, the blocks produced by read tasks are cached as
+            Arrow IPC files under this directory on the local disk of each node, and
+            later reads of the same unmodified files with the same arguments, even
+            by other jobs, load the cached blocks instead. Only datasources that
+            implement :meth:`~ray.data.Datasource.get_cache_keys` are cached.
+        block_cache_max_bytes: The max total size in bytes of the cached blocks on
+            each node. The least recently used blocks are evicted beyond it.
+        write_checkpoint_path: If set, writes record the read tasks whose outputs
+            have been written under this local or remote path, and a rerun of a
+            failed write with the same path skips them. A rerun of a completed write
+            does nothing. The checkpoint of each write is stored under a
+            subdirectory named after a fingerprint of the dataset's plan (including
+            the UDFs with their arguments, and the sizes and modification times of
+            the input files) and the datasink, so different writes can share the
+            path. Only writes whose write tasks also run the read tasks (i.e., a
+            read followed by task-based map operations), and whose plan can be
+            fingerprinted, can be checkpointed.
+        enable_transform_profiling: Whether to profile the transform functions
+            (e.g., read, batching, UDFs and building output blocks) of map tasks.
+            The time and peak memory usage of each transform function are shown
+            in :meth:`Dataset.stats() <ray.data.Dataset.stats>`, and a trace can be
+            exported with
+            :meth:`Dataset.export_transform_profile()
+            <ray.data.Dataset.export_transform_profile>`. This adds overhead to
+            each batch and row, so only enable it for tuning.
     """
 
     target_max_block_size: int = DEFAULT_TARGET_MAX_BLOCK_SIZE
@@ -289,6 +365,7 @@ class DataContext:
     actor_prefetcher_enabled: bool = DEFAULT_ACTOR_PREFETCHER_ENABLED
     use_push_based_shuffle: bool = DEFAULT_USE_PUSH_BASED_SHUFFLE
     pipeline_push_based_shuffle_reduce_tasks: bool = True
+    use_hash_aggregate: bool = DEFAULT_USE_HASH_AGGREGATE
     scheduling_strategy: SchedulingStrategyT = DEFAULT_SCHEDULING_STRATEGY
     scheduling_strategy_large_args: SchedulingStrategyT = (
         DEFAULT_SCHEDULING_STRATEGY_LARGE_ARGS
@@ -340,6 +417,14 @@ class DataContext:
     retried_io_errors: List[str] = field(
         default_factory=lambda: list(DEFAULT_RETRIED_IO_ERRORS)
     )
+    broadcast_join_threshold_bytes: int = DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES
+    enable_adaptive_block_sizing: bool = DEFAULT_ENABLE_ADAPTIVE_BLOCK_SIZING
+    adaptive_block_sizing_min_bytes: int = DEFAULT_ADAPTIVE_BLOCK_SIZING_MIN_BYTES
+    adaptive_block_sizing_max_bytes: int = DEFAULT_ADAPTIVE_BLOCK_SIZING_MAX_BYTES
+    block_cache_dir: Optional[str] = DEFAULT_BLOCK_CACHE_DIR
+    block_cache_max_bytes: int = DEFAULT_BLOCK_CACHE_MAX_BYTES
+    write_checkpoint_path: Optional[str] = DEFAULT_WRITE_CHECKPOINT_PATH
+    enable_transform_profiling: bool = DEFAULT_ENABLE_TRANSFORM_PROFILING
 
     def __post_init__(self):
         # The additonal ray remote args that should be added to
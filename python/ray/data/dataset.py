@@ -2,6 +2,7 @@ import collections
 import copy
 import html
 import itertools
+import json
 import logging
 import time
 import warnings
@@ -36,6 +37,7 @@ from ray.air.util.tensor_extensions.arrow import (
 from ray.air.util.tensor_extensions.utils import _create_possibly_ragged_ndarray
 from ray.data._internal.aggregate import Max, Mean, Min, Std, Sum
 from ray.data._internal.compute import ComputeStrategy
+from ray.data._internal.datasource.arrow_ipc_datasink import ArrowIPCDatasink
 from ray.data._internal.datasource.bigquery_datasink import BigQueryDatasink
 from ray.data._internal.datasource.csv_datasink import CSVDatasink
 from ray.data._internal.datasource.image_datasink import ImageDatasink
@@ -68,6 +70,7 @@ from ray.data._internal.logical.operators.map_operator import (
     MapRows,
     Project,
 )
+from ray.data._internal.logical.operators.n_ary_operator import Join
 from ray.data._internal.logical.operators.n_ary_operator import (
     Union as UnionLogicalOperator,
 )
@@ -82,6 +85,10 @@ from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.split import _get_num_rows, _split_at_indices
 from ray.data._internal.stats import DatasetStats, DatasetStatsSummary, StatsManager
 from ray.data._internal.util import AllToAllAPI, ConsumptionAPI, get_compute_strategy
+from ray.data._internal.write_checkpoint import (
+    WriteCheckpoint,
+    compute_write_fingerprint,
+)
 from ray.data.aggregate import AggregateFn
 from ray.data.block import (
     VALID_BATCH_FORMATS,
@@ -97,6 +104,7 @@ from ray.data.block import (
 )
 from ray.data.context import DataContext
 from ray.data.datasource import Connection, Datasink, FilenameProvider
+from ray.data.expressions import Expr
 from ray.data.iterator import DataIterator
 from ray.data.random_access_dataset import RandomAccessDataset
 from ray.types import ObjectRef
@@ -233,6 +241,9 @@ class Dataset:
         # Handle to currently running executor for this dataset.
         self._current_executor: Optional["Executor"] = None
         self._write_ds = None
+        # The range boundaries sampled by sorts of this dataset, to reuse them in
+        # later sorts.
+        self._sort_boundaries_cache: Dict[Tuple[Tuple[str, ...], int], List] = {}
 
         self._set_uuid(StatsManager.get_dataset_id_from_stats_actor())
 
@@ -522,7 +533,11 @@ class Dataset:
         Args:
             fn: The function or generator to apply to a record batch, or a class type
                 that can be instantiated to create such a callable. Note ``fn`` must be
-                pickle-able.
+                pickle-able. If ``fn`` is a class with an ``async def __call__``
+                method (either a coroutine or an async generator), each actor
+                processes up to ``max_concurrency`` batches concurrently on an event
+                loop (16 if ``max_concurrency`` isn't specified in
+                ``ray_remote_args``), and the outputs keep the order of the batches.
             batch_size: The desired number of rows in each batch, or ``None`` to use
                 entire blocks as batches (blocks may contain different numbers of rows).
                 The actual size of the batch provided to ``fn`` may be smaller than
@@ -532,7 +547,8 @@ class Dataset:
             batch_format: If ``"default"`` or ``"numpy"``, batches are
                 ``Dict[str, numpy.ndarray]``. If ``"pandas"``, batches are
                 ``pandas.DataFrame``. If ``"pyarrow"``, batches are
-                ``pyarrow.Table``.
+                ``pyarrow.Table``. If ``"polars"``, batches are
+                ``polars.DataFrame``, converted from Arrow blocks without copies.
             zero_copy_batch: Whether ``fn`` should be provided zero-copy, read-only
                 batches. If this is ``True`` and no copy is required for the
                 ``batch_format`` conversion, the batch is a zero-copy, read-only
@@ -702,11 +718,16 @@ class Dataset:
     @PublicAPI(api_group=BT_API_GROUP)
     def add_column(
         self,
-        col: str,
-        fn: Callable[
-            [DataBatch],
-            DataBatchColumn,
-        ],
+        col: Union[str, Expr],
+        fn: Optional[
+            Union[
+                Callable[
+                    [DataBatch],
+                    DataBatchColumn,
+                ],
+                Expr,
+            ]
+        ] = None,
         *,
         batch_format: Optional[str] = "pandas",
         compute: Optional[str] = None,
@@ -737,13 +758,28 @@ class Dataset:
             id      int64
             new_id  int64
 
+            Add the same column with a vectorized :class:`~ray.data.expressions.Expr`,
+            which is evaluated with ``pyarrow.compute`` kernels on whole blocks.
+
+            >>> from ray.data.expressions import col
+            >>> ds.add_column((col("id") * 2).alias("new_id")).schema()
+            Column  Type
+            ------  ----
+            id      int64
+            new_id  int64
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
             col: Name of the column to add. If the name already exists, the
-                column is overwritten.
+                column is overwritten. Alternatively, an
+                :class:`~ray.data.expressions.Expr` named with
+                :meth:`~ray.data.expressions.Expr.alias` that computes the column, in
+                which case ``fn`` must not be given.
             fn: Map function generating the column values given a batch of
-                records in pandas format.
+                records in pandas format, or an :class:`~ray.data.expressions.Expr`
+                that computes the column values. ``batch_format`` doesn't apply to
+                expressions.
             batch_format: If ``"default"`` or ``"numpy"``, batches are
                 ``Dict[str, numpy.ndarray]``. If ``"pandas"``, batches are
                 ``pandas.DataFrame``. If ``"pyarrow"``, batches are
@@ -757,6 +793,40 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        if isinstance(col, Expr):
+            if fn is not None:
+                raise ValueError("`fn` must be None when `col` is an expression.")
+            if col.name is None:
+                raise ValueError(
+                    f"The expression must be named with `Expr.alias()`, got: {col!r}"
+                )
+            col, fn = col.name, col
+
+        def _raise_duplicate_column_error(col: str):
+            raise ValueError(f"Trying to add an existing column with name {col!r}")
+
+        if isinstance(fn, Expr):
+            from ray.data._internal.planner.plan_expression.expression_evaluator import (  # noqa: E501
+                eval_expr,
+            )
+
+            expression = fn.to_pyarrow()
+
+            def add_column_from_expr(batch: "pyarrow.Table") -> "pyarrow.Table":
+                if batch.schema.get_field_index(col) != -1:
+                    _raise_duplicate_column_error(col)
+                return batch.append_column(col, eval_expr(expression, batch))
+
+            return self.map_batches(
+                add_column_from_expr,
+                batch_format="pyarrow",
+                batch_size=None,
+                compute=compute,
+                concurrency=concurrency,
+                zero_copy_batch=True,
+                **ray_remote_args,
+            )
+
         # Check that batch_format
         accepted_batch_formats = ["pandas", "pyarrow", "numpy"]
         if batch_format not in accepted_batch_formats:
@@ -765,9 +835,6 @@ class Dataset:
                 f"got: {batch_format}"
             )
 
-        def _raise_duplicate_column_error(col: str):
-            raise ValueError(f"Trying to add an existing column with name {col!r}")
-
         def add_column(batch: DataBatch) -> DataBatch:
             column = fn(batch)
             if batch_format == "pandas":
@@ -1180,7 +1247,7 @@ class Dataset:
     def filter(
         self,
         fn: Optional[UserDefinedFunction[Dict[str, Any], bool]] = None,
-        expr: Optional[str] = None,
+        expr: Optional[Union[str, Expr]] = None,
         *,
         compute: Union[str, ComputeStrategy] = None,
         concurrency: Optional[Union[int, Tuple[int, int]]] = None,
@@ -1213,13 +1280,21 @@ class Dataset:
             >>> ds.filter(lambda row: row["id"] % 2 == 0).take_all()
             [{'id': 0}, {'id': 2}, {'id': 4}, ...]
 
+            Filter with a vectorized :class:`~ray.data.expressions.Expr`, which is
+            evaluated with ``pyarrow.compute`` kernels on whole blocks instead of
+            calling a Python function per row.
+
+            >>> from ray.data.expressions import col
+            >>> ds.filter(expr=(col("id") >= 10) & (col("id") < 13)).take_all()
+            [{'id': 10}, {'id': 11}, {'id': 12}]
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
             fn: The predicate to apply to each row, or a class type
                 that can be instantiated to create such a callable.
-            expr: An expression string that will be
-                converted to pyarrow.dataset.Expression type.
+            expr: An :class:`~ray.data.expressions.Expr`, or an expression string
+                that will be converted to pyarrow.dataset.Expression type.
             compute: This argument is deprecated. Use ``concurrency`` argument.
             concurrency: The number of Ray workers to use concurrently. For a
                 fixed-sized worker pool of size ``n``, specify ``concurrency=n``.
@@ -1244,11 +1319,14 @@ class Dataset:
                 ExpressionEvaluator,
             )
 
-            # TODO: (srinathk) bind the expression to the actual schema.
-            # If fn is a string, convert it to a pyarrow.dataset.Expression
-            # Initialize ExpressionEvaluator with valid columns, if available
-            evaluator = ExpressionEvaluator()
-            resolved_expr = evaluator.get_filters(expression=expr)
+            if isinstance(expr, Expr):
+                resolved_expr = expr.to_pyarrow()
+            else:
+                # TODO: (srinathk) bind the expression to the actual schema.
+                # If fn is a string, convert it to a pyarrow.dataset.Expression
+                # Initialize ExpressionEvaluator with valid columns, if available
+                evaluator = ExpressionEvaluator()
+                resolved_expr = evaluator.get_filters(expression=expr)
 
             compute = TaskPoolStrategy(size=concurrency)
         else:
@@ -1283,6 +1361,7 @@ class Dataset:
         num_blocks: int,
         *,
         shuffle: bool = False,
+        keys: Optional[Union[str, List[str]]] = None,
     ) -> "Dataset":
         """Repartition the :class:`Dataset` into exactly this number of :ref:`blocks <dataset_concept>`.
 
@@ -1299,6 +1378,12 @@ class Dataset:
             minimal data movement needed to equalize block sizes. Otherwise, Ray Data
             performs a full distributed shuffle.
 
+            If ``keys`` are specified, Ray Data performs a distributed shuffle that
+            partitions the rows by the hash of the key columns, so that all rows with
+            the same keys end up in the same block. Unlike the other modes, the hash
+            shuffle starts partitioning blocks as soon as they're produced, rather than
+            waiting for the whole upstream to finish.
+
             .. image:: /data/images/dataset-shuffle.svg
                 :align: center
 
@@ -1310,6 +1395,9 @@ class Dataset:
             >>> ds = ray.data.range(100).repartition(10).materialize()
             >>> ds.num_blocks()
             10
+            >>> ds = ray.data.range(100).repartition(10, keys="id").materialize()
+            >>> ds.num_blocks()
+            10
 
         Time complexity: O(dataset size / parallelism)
 
@@ -1321,15 +1409,23 @@ class Dataset:
                 requires all-to-all data movement. When shuffle is disabled,
                 output blocks are created from adjacent input blocks,
                 minimizing data movement.
+            keys: A column name or a list of column names to hash-partition the
+                rows by. If specified, ``shuffle`` is ignored.
 
         Returns:
             The repartitioned :class:`Dataset`.
         """  # noqa: E501
+        if isinstance(keys, str):
+            keys = [keys]
+        if keys is not None and len(keys) == 0:
+            raise ValueError("`keys` must contain at least one column name.")
+
         plan = self._plan.copy()
         op = Repartition(
             self._logical_plan.dag,
             num_outputs=num_blocks,
             shuffle=shuffle,
+            keys=keys,
         )
         logical_plan = LogicalPlan(op, self.context)
         return Dataset(plan, logical_plan)
@@ -1485,6 +1581,7 @@ class Dataset:
         *,
         equal: bool = False,
         locality_hints: Optional[List["NodeIdStr"]] = None,
+        work_stealing: bool = False,
     ) -> List[DataIterator]:
         """Returns ``n`` :class:`DataIterators <ray.data.DataIterator>` that can
         be used to read disjoint subsets of the dataset in parallel.
@@ -1558,6 +1655,11 @@ class Dataset:
                 iterator output locations. This list must have length ``n``. You can
                 get the current node id of a task or actor by calling
                 ``ray.get_runtime_context().get_node_id()``.
+            work_stealing: If ``True``, blocks are queued for the iterators as they're
+                produced, and an iterator that runs out of blocks steals the queued
+                blocks of the other iterators. This avoids stalling fast iterators
+                on slow ones, but the iterators may see very different numbers of
+                rows. Can't be combined with ``equal=True``.
 
         Returns:
             The output iterator splits. These iterators are Ray-serializable and can
@@ -1569,7 +1671,9 @@ class Dataset:
                 Unlike :meth:`~Dataset.streaming_split`, :meth:`~Dataset.split`
                 materializes the dataset in memory.
         """
-        return StreamSplitDataIterator.create(self, n, equal, locality_hints)
+        return StreamSplitDataIterator.create(
+            self, n, equal, locality_hints, work_stealing=work_stealing
+        )
 
     @ConsumptionAPI
     @PublicAPI(api_group=SMD_API_GROUP)
@@ -2438,6 +2542,7 @@ class Dataset:
         key: Union[str, List[str]],
         descending: Union[bool, List[bool]] = False,
         boundaries: List[Union[int, float]] = None,
+        within_partitions_only: bool = False,
     ) -> "Dataset":
         """Sort the dataset by the specified key column or key function.
         The `key` parameter must be specified (i.e., it cannot be `None`).
@@ -2472,6 +2577,10 @@ class Dataset:
             3  13
             4  14
 
+        Sorting samples the dataset to find the range boundaries of the output
+        blocks, unless ``boundaries`` is given. The sampled boundaries are reused by
+        later sorts of the same dataset by the same columns.
+
         Time complexity: O(dataset size * log(dataset size / parallelism))
 
         Args:
@@ -2486,6 +2595,10 @@ class Dataset:
                 will be divided into the third block. If not provided, the
                 boundaries will be sampled from the input blocks. This feature
                 only supports numeric columns right now.
+            within_partitions_only: If ``True``, sort the rows of each block
+                independently, without moving rows between blocks. This avoids the
+                sampling and the shuffle of a global sort, e.g. when the rows with
+                the same key are known to be in the same block.
 
         Returns:
             A new, sorted :class:`Dataset`.
@@ -2496,10 +2609,27 @@ class Dataset:
         if key is None:
             raise ValueError("The 'key' parameter cannot be None for sorting.")
         sort_key = SortKey(key, descending, boundaries)
+        if within_partitions_only:
+            if boundaries:
+                raise ValueError(
+                    "`boundaries` can't be used with `within_partitions_only=True`."
+                )
+
+            def sort_block(block: Block) -> Block:
+                [block] = BlockAccessor.for_block(block).sort_and_partition(
+                    [], sort_key
+                )
+                return block
+
+            return self.map_batches(
+                sort_block, batch_size=None, batch_format=None, zero_copy_batch=True
+            )
+
         plan = self._plan.copy()
         op = Sort(
             self._logical_plan.dag,
             sort_key=sort_key,
+            boundaries_cache=self._sort_boundaries_cache,
         )
         logical_plan = LogicalPlan(op, self.context)
         return Dataset(plan, logical_plan)
@@ -2540,6 +2670,86 @@ class Dataset:
         logical_plan = LogicalPlan(op, self.context)
         return Dataset(plan, logical_plan)
 
+    @AllToAllAPI
+    @PublicAPI(stability="alpha", api_group=SMD_API_GROUP)
+    def join(
+        self,
+        other: "Dataset",
+        on: Union[str, List[str]],
+        how: Literal["inner", "left", "right", "outer"] = "inner",
+        *,
+        num_partitions: Optional[int] = None,
+        left_suffix: Optional[str] = None,
+        right_suffix: Optional[str] = None,
+    ) -> "Dataset":
+        """Join this dataset with another dataset on one or more key columns.
+
+        If one of the datasets is smaller than
+        ``DataContext.broadcast_join_threshold_bytes``, Ray Data sends it to every
+        block of the other dataset, and joins each block independently. Otherwise,
+        Ray Data hash-partitions both datasets by the join keys with a distributed
+        shuffle, and joins each partition independently.
+
+        .. note::
+            The order of the output rows isn't deterministic.
+
+        Examples:
+            >>> import ray
+            >>> users = ray.data.from_items(
+            ...     [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+            ... )
+            >>> orders = ray.data.from_items(
+            ...     [{"id": 1, "amount": 10}, {"id": 1, "amount": 20}]
+            ... )
+            >>> sorted(
+            ...     users.join(orders, on="id").take_all(), key=lambda r: r["amount"]
+            ... )
+            [{'id': 1, 'name': 'Alice', 'amount': 10}, {'id': 1, 'name': 'Alice', 'amount': 20}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            other: The dataset to join with on the right hand side.
+            on: The name of the column or the list of columns to join on. Both
+                datasets must contain these columns, with the same types.
+            how: The type of join. ``"inner"`` keeps rows with keys present in both
+                datasets, ``"left"`` and ``"right"`` also keep unmatched rows of the
+                respective dataset, and ``"outer"`` keeps unmatched rows of both.
+            num_partitions: The number of output blocks of the shuffle. Defaults to
+                the number of blocks of the larger dataset.
+            left_suffix: The suffix to add to the names of non-key columns of this
+                dataset that also exist in ``other``.
+            right_suffix: The suffix to add to the names of non-key columns of
+                ``other`` that also exist in this dataset.
+
+        Returns:
+            A :class:`Dataset` containing the joined rows. Columns of both datasets are
+            included, with the key columns only included once.
+        """  # noqa: E501
+        if how not in ("inner", "left", "right", "outer"):
+            raise ValueError(
+                f"Invalid join type '{how}'. Supported join types are 'inner', "
+                "'left', 'right' and 'outer'."
+            )
+        keys = [on] if isinstance(on, str) else list(on)
+        if not keys:
+            raise ValueError("At least one join key must be provided.")
+        if num_partitions is not None and num_partitions <= 0:
+            raise ValueError("`num_partitions` must be positive.")
+
+        plan = self._plan.copy()
+        op = Join(
+            self._logical_plan.dag,
+            other._logical_plan.dag,
+            keys=keys,
+            join_type=how,
+            num_partitions=num_partitions,
+            left_suffix=left_suffix,
+            right_suffix=right_suffix,
+        )
+        logical_plan = LogicalPlan(op, self.context)
+        return Dataset(plan, logical_plan)
+
     @PublicAPI(api_group=BT_API_GROUP)
     def limit(self, limit: int) -> "Dataset":
         """Truncate the dataset to the first ``limit`` rows.
@@ -2598,7 +2808,9 @@ class Dataset:
             batch_size: The maximum number of rows to return.
             batch_format: If ``"default"`` or ``"numpy"``, batches are
                 ``Dict[str, numpy.ndarray]``. If ``"pandas"``, batches are
-                ``pandas.DataFrame``.
+                ``pandas.DataFrame``. If ``"pyarrow"``, batches are
+                ``pyarrow.Table``. If ``"polars"``, batches are
+                ``polars.DataFrame``.
 
         Returns:
             A batch of up to ``batch_size`` rows from the dataset.
@@ -2761,6 +2973,10 @@ class Dataset:
         For Datasets which only read Parquet files (created with
         :meth:`~ray.data.read_parquet`), this method reads the file metadata to
         efficiently count the number of rows without reading in the entire data.
+        The count is also derived from the metadata without execution through
+        operations that preserve the number of rows, like
+        :meth:`~ray.data.Dataset.map`, :meth:`~ray.data.Dataset.select_columns`,
+        sorts, shuffles, and unions.
 
         Examples:
             >>> import ray
@@ -2907,6 +3123,10 @@ class Dataset:
             >>> ds.size_bytes()
             80
 
+        If the size isn't known from the metadata of the inputs (e.g., after
+        operations that transform the rows), this executes the dataset without
+        materializing it.
+
         Returns:
             The in-memory size of the dataset in bytes, or None if the
             in-memory size is not known.
@@ -2915,7 +3135,16 @@ class Dataset:
         if self._logical_plan.dag.aggregate_output_metadata().size_bytes is not None:
             return self._logical_plan.dag.aggregate_output_metadata().size_bytes
 
-        metadata = self._plan.execute().metadata
+        if self._plan.has_computed_output():
+            metadata = self._plan.execute().metadata
+        else:
+            # Stream the execution instead of materializing the dataset, so that
+            # only the metadata of the blocks is kept.
+            metadata = [
+                meta
+                for bundle in self.iter_internal_ref_bundles()
+                for meta in bundle.metadata
+            ]
         if not metadata or metadata[0].size_bytes is None:
             return None
         return sum(m.size_bytes for m in metadata)
@@ -3614,6 +3843,98 @@ class Dataset:
             concurrency=concurrency,
         )
 
+    @ConsumptionAPI
+    @PublicAPI(stability="alpha", api_group=IOC_API_GROUP)
+    def write_arrow_ipc(
+        self,
+        path: str,
+        *,
+        compression: Optional[str] = None,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+        try_create_dir: bool = True,
+        arrow_open_stream_args: Optional[Dict[str, Any]] = None,
+        filename_provider: Optional[FilenameProvider] = None,
+        num_rows_per_file: Optional[int] = None,
+        ray_remote_args: Dict[str, Any] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        """Writes the :class:`~ray.data.Dataset` to Arrow IPC files, also known as
+        Feather V2 files.
+
+        Uncompressed Arrow IPC files are read back with
+        :meth:`~ray.data.read_arrow_ipc` by memory-mapping them, without decoding.
+        This makes them a cheap format to persist intermediate datasets.
+
+        The number of files is determined by the number of blocks in the dataset.
+        To control the number of number of blocks, call
+        :meth:`~ray.data.Dataset.repartition`.
+
+        By default, the format of the output files is ``{uuid}_{block_idx}.arrow``,
+        where ``uuid`` is a unique id for the dataset. To modify this behavior,
+        implement a custom :class:`~ray.data.datasource.FilenameProvider`
+        and pass it in as the ``filename_provider`` argument.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100)
+            >>> ds.write_arrow_ipc("local:///tmp/data/")
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            path: The path to the destination root directory, where
+                the Arrow IPC files are written to.
+            compression: The compression codec of the record batches, either
+                ``"lz4"`` or ``"zstd"``. Compressed files need to be decompressed
+                when read, so they can't be read zero-copy. Defaults to ``None``,
+                which means no compression.
+            filesystem: The pyarrow filesystem implementation to write to.
+                These filesystems are specified in the
+                `pyarrow docs <https://arrow.apache.org/docs\
+                /python/api/filesystems.html#filesystem-implementations>`_.
+                Specify this if you need to provide specific configurations to the
+                filesystem. By default, the filesystem is automatically selected based
+                on the scheme of the paths. For example, if the path begins with
+                ``s3://``, the ``S3FileSystem`` is used.
+            try_create_dir: If ``True``, attempts to create all directories in
+                destination path. Does nothing if all directories already
+                exist. Defaults to ``True``.
+            arrow_open_stream_args: kwargs passed to
+                `pyarrow.fs.FileSystem.open_output_stream <https://arrow.apache.org\
+                /docs/python/generated/pyarrow.fs.FileSystem.html\
+                #pyarrow.fs.FileSystem.open_output_stream>`_, which is used when
+                opening the file to write to.
+            filename_provider: A :class:`~ray.data.datasource.FilenameProvider`
+                implementation. Use this parameter to customize what your filenames
+                look like.
+            num_rows_per_file: [Experimental] The target number of rows to write to each
+                file. If ``None``, Ray Data writes a system-chosen number of rows to
+                each file. The specified value is a hint, not a strict limit. Ray Data
+                might write more or fewer rows to each file. In specific, if the number
+                of rows per block is larger than the specified value, Ray Data writes
+                the number of rows per block to each file.
+            ray_remote_args: kwargs passed to :meth:`~ray.remote` in the write tasks.
+            concurrency: The maximum number of Ray tasks to run concurrently. Set this
+                to control number of tasks to run concurrently. This doesn't change the
+                total number of tasks run. By default, concurrency is dynamically
+                decided based on the available resources.
+        """
+        datasink = ArrowIPCDatasink(
+            path,
+            compression=compression,
+            num_rows_per_file=num_rows_per_file,
+            filesystem=filesystem,
+            try_create_dir=try_create_dir,
+            open_stream_args=arrow_open_stream_args,
+            filename_provider=filename_provider,
+            dataset_uuid=self._uuid,
+        )
+        self.write_datasink(
+            datasink,
+            ray_remote_args=ray_remote_args,
+            concurrency=concurrency,
+        )
+
     @ConsumptionAPI
     def write_sql(
         self,
@@ -3865,12 +4186,26 @@ class Dataset:
                 soft=False,
             )
 
+        checkpoint = None
+        if self.context.write_checkpoint_path is not None:
+            checkpoint = WriteCheckpoint(
+                self.context.write_checkpoint_path,
+                compute_write_fingerprint(self._logical_plan.dag, datasink),
+            )
+            if checkpoint.is_committed():
+                logger.info(
+                    "Skipping the write, because it has completed according to the "
+                    f"write checkpoint at {checkpoint.path}."
+                )
+                return
+
         plan = self._plan.copy()
         write_op = Write(
             self._logical_plan.dag,
             datasink,
             ray_remote_args=ray_remote_args,
             concurrency=concurrency,
+            checkpoint=checkpoint,
         )
         logical_plan = LogicalPlan(write_op, self.context)
 
@@ -3879,6 +4214,13 @@ class Dataset:
 
             datasink.on_write_start()
 
+            checkpointed_write_results = []
+            if checkpoint is not None:
+                # The results of the write tasks that completed in previous runs.
+                checkpointed_write_results = checkpoint.get_write_result_blocks(
+                    checkpoint.load_records()
+                )
+
             self._write_ds = Dataset(plan, logical_plan).materialize()
             # TODO: Get and handle the blocks with an iterator instead of getting
             # everything in a blocking way, so some blocks can be freed earlier.
@@ -3887,7 +4229,9 @@ class Dataset:
                 isinstance(block, pd.DataFrame) and len(block) == 1
                 for block in raw_write_results
             )
-            datasink.on_write_complete(raw_write_results)
+            datasink.on_write_complete(checkpointed_write_results + raw_write_results)
+            if checkpoint is not None:
+                checkpoint.commit()
 
         except Exception as e:
             datasink.on_write_failed(e)
@@ -3978,7 +4322,9 @@ class Dataset:
                 ``drop_last`` is ``False``. Defaults to 256.
             batch_format: If ``"default"`` or ``"numpy"``, batches are
                 ``Dict[str, numpy.ndarray]``. If ``"pandas"``, batches are
-                ``pandas.DataFrame``.
+                ``pandas.DataFrame``. If ``"pyarrow"``, batches are
+                ``pyarrow.Table``. If ``"polars"``, batches are
+                ``polars.DataFrame``.
             drop_last: Whether to drop the last batch if it's incomplete.
             local_shuffle_buffer_size: If not ``None``, the data is randomly shuffled
                 using a local in-memory shuffle buffer, and this value serves as the
@@ -4014,6 +4360,7 @@ class Dataset:
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        pin_memory: bool = False,
     ) -> Iterable[TorchBatchType]:
         """Return an iterable over batches of data represented as Torch tensors.
 
@@ -4089,6 +4436,10 @@ class Dataset:
                 the buffer, the remaining rows in the buffer are drained.
                 ``batch_size`` must also be specified when using local shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            pin_memory: Whether to copy the batches to page-locked host buffers
+                before copying them to a CUDA ``device``, which makes the copies
+                faster and asynchronous. The buffers are reused across batches.
+                This has no effect on other devices, or with ``collate_fn``.
 
         Returns:
             An iterable over Torch Tensor batches.
@@ -4106,6 +4457,7 @@ class Dataset:
             drop_last=drop_last,
             local_shuffle_buffer_size=local_shuffle_buffer_size,
             local_shuffle_seed=local_shuffle_seed,
+            pin_memory=pin_memory,
         )
 
     @ConsumptionAPI
@@ -4867,6 +5219,7 @@ class Dataset:
         self,
         key: str,
         num_workers: Optional[int] = None,
+        index: Literal["sorted", "hash"] = "sorted",
     ) -> RandomAccessDataset:
         """Convert this dataset into a distributed RandomAccessDataset (EXPERIMENTAL).
 
@@ -4887,10 +5240,16 @@ class Dataset:
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            index: How to index the records. ``"sorted"`` sorts the dataset by the
+                key and finds records by binary search. ``"hash"`` partitions the
+                dataset by the hash of the key instead, and each worker builds a
+                hash index of its blocks. This avoids sorting the dataset, and is
+                faster for lookups of unordered keys, at the cost of the memory of the
+                hash indexes.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(self, key, num_workers=num_workers, index=index)
 
     @ConsumptionAPI(pattern="store memory.", insert_after=True)
     @PublicAPI(api_group=E_API_GROUP)
@@ -4979,6 +5338,39 @@ class Dataset:
             return self._write_ds.stats()
         return self._get_stats_summary().to_string()
 
+    @DeveloperAPI
+    def export_transform_profile(self, path: str) -> None:
+        """Write the profiles of the transform functions of this dataset's map
+        operators to a local file, in the Chrome trace event format.
+
+        The trace shows when each transform function (e.g., reading, batching, the
+        UDF and building output blocks) of each task ran, and can be opened in
+        `Perfetto <https://ui.perfetto.dev>`_, ``chrome://tracing`` or
+        `speedscope <https://www.speedscope.app>`_. Like :meth:`stats`, this
+        doesn't trigger execution.
+
+        Transform profiling must be enabled before the dataset is executed:
+
+        .. testcode::
+
+            import ray
+
+            ray.data.DataContext.get_current().enable_transform_profiling = True
+            ds = ray.data.range(10).map_batches(lambda batch: batch).materialize()
+            ds.export_transform_profile("/tmp/trace.json")
+
+        Args:
+            path: The path of the local file to write the trace to.
+        """
+        if self._current_executor:
+            summary = self._current_executor.get_stats().to_summary()
+        elif self._write_ds is not None and self._write_ds._plan.has_computed_output():
+            summary = self._write_ds._get_stats_summary()
+        else:
+            summary = self._get_stats_summary()
+        with open(path, "w") as f:
+            json.dump(summary.to_chrome_trace(), f)
+
     def _get_stats_summary(self) -> DatasetStatsSummary:
         return self._plan.stats().to_summary()
 
@@ -5389,6 +5781,7 @@ class Dataset:
         self._uuid = state["uuid"]
         self._logical_plan = state["logical_plan"]
         self._current_executor = None
+        self._sort_boundaries_cache = {}
 
     def __del__(self):
         if not self._current_executor:
@@ -83,6 +83,11 @@ class Datasink:
         succeed prior to ``write_datasink()`` returning to the user. If this
         method fails, then ``on_write_failed()`` is called.
 
+        If ``DataContext.write_checkpoint_path`` is set, a rerun of a failed write
+        only runs the remaining write tasks, and this method receives the results of
+        the write tasks of all runs. Once this method succeeds, reruns of the write
+        skip it, so it's called at most once per checkpointed write.
+
         Args:
             write_result_blocks: The blocks resulting from executing
             the Write operator, containing write results and stats.
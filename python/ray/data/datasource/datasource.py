@@ -1,4 +1,4 @@
-from typing import Callable, Iterable, List, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
 
 import numpy as np
 
@@ -6,6 +6,9 @@ from ray.data._internal.util import _check_pyarrow_version
 from ray.data.block import Block, BlockMetadata
 from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
 
+if TYPE_CHECKING:
+    import pyarrow
+
 
 @PublicAPI
 class Datasource:
@@ -79,6 +82,71 @@ class Datasource:
         """If ``False``, only launch read tasks on the driver's node."""
         return True
 
+    @property
+    def supports_projection_pushdown(self) -> bool:
+        """Whether this datasource can read a subset of its columns.
+
+        If ``True``, the optimizer can call
+        :meth:`~ray.data.Datasource.apply_projection` to push column selections
+        (e.g., :meth:`Dataset.select_columns() <ray.data.Dataset.select_columns>`)
+        into the read.
+        """
+        return False
+
+    def apply_projection(self, columns: List[str]) -> "Datasource":
+        """Return a copy of this datasource that only reads the given columns.
+
+        The returned datasource must produce blocks that contain at least
+        ``columns``. The datasource itself shouldn't be modified, because it might
+        be shared by multiple datasets.
+
+        Args:
+            columns: The names of the columns to read.
+        """
+        raise NotImplementedError
+
+    @property
+    def supports_predicate_pushdown(self) -> bool:
+        """Whether this datasource can filter rows while reading.
+
+        If ``True``, the optimizer can call
+        :meth:`~ray.data.Datasource.apply_predicate` to push expression filters
+        (e.g., ``Dataset.filter(expr=...)``) into the read.
+        """
+        return False
+
+    def apply_predicate(self, predicate: "pyarrow.dataset.Expression") -> "Datasource":
+        """Return a copy of this datasource that only reads rows matching
+        ``predicate``.
+
+        The returned datasource must drop every row for which ``predicate`` isn't
+        true, because the optimizer removes the filter from the plan. The
+        datasource itself shouldn't be modified, because it might be shared by
+        multiple datasets.
+
+        Args:
+            predicate: The PyArrow expression that rows must satisfy.
+        """
+        raise NotImplementedError
+
+    def get_cache_keys(self, read_tasks: List["ReadTask"]) -> List[Optional[str]]:
+        """Return the block cache keys of the given read tasks of this datasource.
+
+        If ``DataContext.block_cache_dir`` is set, the blocks of each read task with
+        a key are cached, and later read tasks with the same key load the cached
+        blocks instead of reading. So a key must identify everything the blocks
+        depend on, e.g., the input files and their modification times, and the
+        read arguments.
+
+        The default implementation returns ``None`` for every read task, which means
+        that the read tasks aren't cached.
+
+        Args:
+            read_tasks: The read tasks returned by
+                :meth:`~ray.data.Datasource.get_read_tasks`.
+        """
+        return [None] * len(read_tasks)
+
 
 @Deprecated
 class Reader:
@@ -76,6 +76,19 @@ class FileBasedDatasource(Datasource):
     # Number of threads for concurrent reading within each read task.
     # If zero or negative, reading will be performed in the main thread.
     _NUM_THREADS_PER_TASK = 0
+    # The attributes that don't affect the blocks read from the files, which are
+    # excluded from the block cache keys.
+    _CACHE_KEY_EXCLUDED_ATTRS = {
+        "_supports_distributed_reads",
+        "_meta_provider",
+        "_partition_filter",
+        "_ignore_missing_paths",
+        "_filesystem",
+        "_file_metadata_shuffler",
+        "_paths_ref",
+        "_file_sizes_ref",
+        "_encoding_ratio",
+    }
 
     def __init__(
         self,
@@ -371,6 +384,19 @@ class FileBasedDatasource(Datasource):
     def supports_distributed_reads(self) -> bool:
         return self._supports_distributed_reads
 
+    def get_cache_keys(self, read_tasks: List[ReadTask]) -> List[Optional[str]]:
+        from ray.data._internal.block_cache import get_file_cache_keys
+
+        # Subclasses store their read arguments as attributes. Keys aren't
+        # computed if any of them has no stable representation.
+        read_args = {
+            name: value
+            for name, value in vars(self).items()
+            if name not in self._CACHE_KEY_EXCLUDED_ATTRS
+        }
+        read_args["datasource"] = f"{type(self).__module__}.{type(self).__qualname__}"
+        return get_file_cache_keys(read_args, self._filesystem, read_tasks)
+
 
 def _add_partitions(
     data: Union["pyarrow.Table", "pd.DataFrame"], partitions: Dict[str, Any]
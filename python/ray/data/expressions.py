@@ -0,0 +1,184 @@
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow.compute as pc
+
+
+@PublicAPI(stability="alpha")
+class Expr:
+    """A vectorized expression over the columns of a :class:`~ray.data.Dataset`.
+
+    Expressions are built from :func:`col` and :func:`lit` with Python operators,
+    and are evaluated with ``pyarrow.compute`` kernels on whole blocks, instead of
+    calling a Python function per row. Pass them to
+    :meth:`Dataset.filter() <ray.data.Dataset.filter>` and
+    :meth:`Dataset.add_column() <ray.data.Dataset.add_column>`.
+
+    Expressions follow the semantics of the ``pyarrow.compute`` kernels. For
+    example, dividing two integer columns performs an integer division, and
+    arithmetic on nulls results in nulls.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.expressions import col
+        >>> ds = ray.data.range(10)
+        >>> ds.filter(expr=(col("id") > 5) & (col("id") != 8)).take_all()
+        [{'id': 6}, {'id': 7}, {'id': 9}]
+        >>> ds.add_column((col("id") * 2).alias("id_2")).take(2)
+        [{'id': 0, 'id_2': 0}, {'id': 1, 'id_2': 2}]
+    """
+
+    def __init__(self, expr: "pc.Expression", name: Optional[str] = None):
+        """Create an Expr. Use :func:`col` and :func:`lit` instead.
+
+        Args:
+            expr: The equivalent PyArrow expression.
+            name: The name of the output column of this expression, if any.
+        """
+        self._expr = expr
+        self._name = name
+
+    @property
+    def name(self) -> Optional[str]:
+        """The name of the output column, set by :meth:`alias` or :func:`col`."""
+        return self._name
+
+    def alias(self, name: str) -> "Expr":
+        """Return this expression with the given output column name."""
+        return Expr(self._expr, name)
+
+    def to_pyarrow(self) -> "pc.Expression":
+        """Return the equivalent ``pyarrow.compute.Expression``."""
+        return self._expr
+
+    def isin(self, values: Iterable[Any]) -> "Expr":
+        """Whether the values are in ``values``."""
+        return Expr(self._expr.isin(list(values)))
+
+    def is_null(self) -> "Expr":
+        """Whether the values are null."""
+        return Expr(self._expr.is_null())
+
+    def is_valid(self) -> "Expr":
+        """Whether the values aren't null."""
+        return Expr(self._expr.is_valid())
+
+    def _binary_op(self, other: Any, name: str, reflected: bool = False) -> "Expr":
+        other = _to_pyarrow(other)
+        if reflected:
+            return Expr(getattr(_to_pyarrow_operand(other), name)(self._expr))
+        return Expr(getattr(self._expr, name)(other))
+
+    def __eq__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__eq__")
+
+    def __ne__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__ne__")
+
+    def __lt__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__lt__")
+
+    def __le__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__le__")
+
+    def __gt__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__gt__")
+
+    def __ge__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__ge__")
+
+    def __add__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__add__")
+
+    def __radd__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__add__", reflected=True)
+
+    def __sub__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__sub__")
+
+    def __rsub__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__sub__", reflected=True)
+
+    def __mul__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__mul__")
+
+    def __rmul__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__mul__", reflected=True)
+
+    def __truediv__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__truediv__")
+
+    def __rtruediv__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__truediv__", reflected=True)
+
+    def __and__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__and__")
+
+    def __or__(self, other: Any) -> "Expr":
+        return self._binary_op(other, "__or__")
+
+    def __invert__(self) -> "Expr":
+        return Expr(~self._expr)
+
+    def __neg__(self) -> "Expr":
+        import pyarrow.compute as pc
+
+        return Expr(pc.negate_checked(self._expr))
+
+    def __bool__(self):
+        raise TypeError(
+            "An Expr can't be converted to a bool. Use `&`, `|` and `~` instead of "
+            "`and`, `or` and `not`, and avoid chained comparisons like `a < b < c`."
+        )
+
+    # Expressions override `__eq__`, so they can't be hashed.
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        if self._name is not None:
+            return f"Expr({self._expr}, name={self._name!r})"
+        return f"Expr({self._expr})"
+
+
+@PublicAPI(stability="alpha")
+def col(name: str) -> Expr:
+    """Return an expression that references the column ``name``.
+
+    Examples:
+        >>> from ray.data.expressions import col
+        >>> col("x") > 5
+        Expr((x > 5))
+    """
+    import pyarrow.compute as pc
+
+    return Expr(pc.field(name), name)
+
+
+@PublicAPI(stability="alpha")
+def lit(value: Any) -> Expr:
+    """Return an expression for the constant ``value``.
+
+    Examples:
+        >>> from ray.data.expressions import col, lit
+        >>> (lit(1) + col("x")).alias("y")
+        Expr(add_checked(1, x), name='y')
+    """
+    import pyarrow.compute as pc
+
+    return Expr(pc.scalar(value))
+
+
+def _to_pyarrow(value: Any) -> Any:
+    if isinstance(value, Expr):
+        return value.to_pyarrow()
+    return value
+
+
+def _to_pyarrow_operand(value: Any) -> "pc.Expression":
+    import pyarrow.compute as pc
+
+    if isinstance(value, pc.Expression):
+        return value
+    return pc.scalar(value)
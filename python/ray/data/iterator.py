@@ -125,7 +125,8 @@ class DataIterator(abc.ABC):
                 ``drop_last`` is ``False``. Defaults to 256.
             batch_format: Specify ``"default"`` to use the default block format
                 (NumPy), ``"pandas"`` to select ``pandas.DataFrame``, "pyarrow" to
-                select ``pyarrow.Table``, or ``"numpy"`` to select
+                select ``pyarrow.Table``, ``"polars"`` to select
+                ``polars.DataFrame``, or ``"numpy"`` to select
                 ``Dict[str, numpy.ndarray]``, or None to return the underlying block
                 exactly as is with no additional formatting.
             drop_last: Whether to drop the last batch if it's incomplete.
@@ -240,6 +241,7 @@ class DataIterator(abc.ABC):
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        pin_memory: bool = False,
     ) -> Iterable["TorchBatchType"]:
         """Return a batched iterable of Torch Tensors over the dataset.
 
@@ -316,12 +318,19 @@ class DataIterator(abc.ABC):
                 therefore ``batch_size`` must also be specified when using local
                 shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            pin_memory: Whether to copy the batches to page-locked host buffers
+                before copying them to a CUDA ``device``, which makes the copies
+                faster and asynchronous. The buffers are reused across batches.
+                This has no effect on other devices, or with ``collate_fn``.
 
         Returns:
             An iterable over Torch Tensor batches.
         """
 
+        import torch
+
         from ray.air._internal.torch_utils import (
+            PinnedMemoryBufferPool,
             convert_ndarray_batch_to_torch_tensor_batch,
         )
         from ray.train.torch import get_device
@@ -338,7 +347,28 @@ class DataIterator(abc.ABC):
             # Ray Train is not being used.
             device = get_device()
 
-        if collate_fn is None:
+        use_pinned_buffers = (
+            collate_fn is None
+            and pin_memory
+            and device is not None
+            and torch.device(device).type == "cuda"
+        )
+        if use_pinned_buffers:
+            pinned_buffer_pool = PinnedMemoryBufferPool()
+
+            # The tensors are created without copies if possible, and then copied
+            # to reused page-locked buffers, for asynchronous copies to the device.
+            def collate_fn(batch: Union[np.ndarray, Dict[str, np.ndarray]]):
+                return pinned_buffer_pool.copy_batch_to_buffers(
+                    convert_ndarray_batch_to_torch_tensor_batch(batch, dtypes=dtypes)
+                )
+
+            def finalize_fn(batch: Union["torch.Tensor", Dict[str, "torch.Tensor"]]):
+                return pinned_buffer_pool.move_batch_to_device(
+                    batch, torch.device(device)
+                )
+
+        elif collate_fn is None:
             # The default collate_fn handles formatting and Tensor creation.
             # Here, we set device=None to defer host to device data transfer
             # to the subsequent finalize_fn.
@@ -3,14 +3,18 @@ import logging
 import random
 import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple
 
 import numpy as np
 
 import ray
+from ray.data._internal.arrow_ops import transform_pyarrow
 from ray.data._internal.execution.interfaces.ref_bundle import (
     _ref_bundles_iterator_to_block_refs_list,
 )
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import (
+    hash_partition_ids,
+)
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data.block import BlockAccessor
 from ray.data.context import DataContext
@@ -23,6 +27,8 @@ except ImportError:
     pa = None
 
 if TYPE_CHECKING:
+    import pyarrow
+
     from ray.data import Dataset
 
 logger = logging.getLogger(__name__)
@@ -40,41 +46,82 @@ class RandomAccessDataset:
         ds: "Dataset",
         key: str,
         num_workers: int,
+        index: str = "sorted",
     ):
         """Construct a RandomAccessDataset (internal API).
 
         The constructor is a private API. Use ``ds.to_random_access_dataset()``
         to construct a RandomAccessDataset.
         """
+        if index not in ("sorted", "hash"):
+            raise ValueError(
+                f"`index` must be either 'sorted' or 'hash', but got: {index!r}."
+            )
         schema = ds.schema(fetch_if_missing=True)
         if schema is None or isinstance(schema, type):
             raise ValueError("RandomAccessDataset only supports Arrow-format blocks.")
 
         start = time.perf_counter()
-        logger.info("[setup] Indexing dataset by sort key.")
-        sorted_ds = ds.sort(key)
-        get_bounds = cached_remote_fn(_get_bounds)
-        bundles = sorted_ds.iter_internal_ref_bundles()
-        blocks = _ref_bundles_iterator_to_block_refs_list(bundles)
-
-        logger.info("[setup] Computing block range bounds.")
-        bounds = ray.get([get_bounds.remote(b, key) for b in blocks])
+        self._key = key
+        self._index = index
         self._non_empty_blocks = []
-        self._lower_bound = None
-        self._upper_bounds = []
-        for i, b in enumerate(bounds):
-            if b:
-                self._non_empty_blocks.append(blocks[i])
-                if self._lower_bound is None:
-                    self._lower_bound = b[0]
-                self._upper_bounds.append(b[1])
+        if index == "sorted":
+            logger.info("[setup] Indexing dataset by sort key.")
+            sorted_ds = ds.sort(key)
+            get_bounds = cached_remote_fn(_get_bounds)
+            bundles = sorted_ds.iter_internal_ref_bundles()
+            blocks = _ref_bundles_iterator_to_block_refs_list(bundles)
+
+            logger.info("[setup] Computing block range bounds.")
+            bounds = ray.get([get_bounds.remote(b, key) for b in blocks])
+            self._lower_bound = None
+            self._upper_bounds = []
+            for i, b in enumerate(bounds):
+                if b:
+                    self._non_empty_blocks.append(blocks[i])
+                    if self._lower_bound is None:
+                        self._lower_bound = b[0]
+                    self._upper_bounds.append(b[1])
+        else:
+            if key not in schema.names:
+                raise ValueError(
+                    f"The key '{key}' must be a column of the dataset, but the "
+                    f"columns are: {schema.names}."
+                )
+            logger.info("[setup] Partitioning dataset by the hash of the key.")
+            materialized = ds.materialize()
+            self._num_partitions = materialized.num_blocks()
+            partitioned_ds = materialized.repartition(self._num_partitions, keys=[key])
+            get_partition = cached_remote_fn(_get_hash_partition)
+            bundles = partitioned_ds.iter_internal_ref_bundles()
+            blocks = _ref_bundles_iterator_to_block_refs_list(bundles)
+
+            logger.info("[setup] Computing block partitions.")
+            partitions = ray.get(
+                [get_partition.remote(b, key, self._num_partitions) for b in blocks]
+            )
+            # The hash partition of each non-empty block, or -1 if there's no block
+            # for a partition.
+            self._partition_to_block = np.full(self._num_partitions, -1)
+            for i, partition in enumerate(partitions):
+                if partition is not None:
+                    self._partition_to_block[partition] = len(self._non_empty_blocks)
+                    self._non_empty_blocks.append(blocks[i])
+
+        # An empty table with the schema of the blocks, for `multiget_table()`.
+        self._empty_table = None
+        if self._non_empty_blocks:
+            get_empty_table = cached_remote_fn(_get_empty_table)
+            self._empty_table = ray.get(
+                get_empty_table.remote(self._non_empty_blocks[0])
+            )
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DataContext.get_current()
         scheduling_strategy = ctx.scheduling_strategy
         self._workers = [
             _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
-                key
+                key, index
             )
             for _ in range(num_workers)
         ]
@@ -141,8 +188,8 @@ class RandomAccessDataset:
         Returns:
             ObjectRef containing the record (in pydict form), or None if not found.
         """
-        block_index = self._find_le(key)
-        if block_index is None:
+        block_index = self._find_blocks([key])[0]
+        if block_index < 0:
             return ray.put(None)
         return self._worker_for(block_index).get.remote(block_index, key)
 
@@ -155,24 +202,93 @@ class RandomAccessDataset:
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
-        batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
-            if index is None:
+        results = [None] * len(keys)
+        for positions, values in self._multiget(keys, "multiget"):
+            for i, value in zip(positions, values):
+                results[i] = value
+        return results
+
+    def multiget_table(self, keys: List[Any]) -> "pyarrow.Table":
+        """Synchronously find the records for a list of keys, as an Arrow table.
+
+        This is faster than ``multiget()`` for large numbers of keys, since the
+        records aren't converted to Python objects.
+
+        Args:
+            keys: List of keys to find the records for.
+
+        Returns:
+            A table with one row for each key, in the same order as ``keys``. All
+            columns of the rows of missing records are null.
+        """
+        tables = []
+        indices = np.zeros(len(keys), dtype=np.int64)
+        found = np.zeros(len(keys), dtype=bool)
+        num_rows = 0
+        for positions, table in self._multiget(keys, "multiget_table"):
+            tables.append(table)
+            indices[positions] = np.arange(num_rows, num_rows + len(positions))
+            found[positions] = True
+            num_rows += len(positions)
+        if tables:
+            table = transform_pyarrow.concat(tables)
+        elif self._empty_table is not None:
+            table = self._empty_table
+        else:
+            # The dataset is empty.
+            return pa.table({})
+        return transform_pyarrow.take_table(table, pa.array(indices, mask=~found))
+
+    def _multiget(
+        self, keys: List[Any], method: str
+    ) -> Iterator[Tuple[np.ndarray, Any]]:
+        """Look up the keys with one call per worker.
+
+        Returns:
+            An iterator over the positions of the looked up keys in ``keys``, and
+            the result of the ``method`` of the worker for them.
+        """
+        block_indices = self._find_blocks(keys)
+        # Group the keys by block, and the blocks by worker.
+        order = np.argsort(block_indices, kind="stable")
+        unique_block_indices, starts = np.unique(
+            block_indices[order], return_index=True
+        )
+        ends = np.append(starts[1:], len(order))
+        worker_positions = defaultdict(list)
+        for block_index, start, end in zip(unique_block_indices, starts, ends):
+            if block_index < 0:
                 continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
+            worker = self._worker_for(block_index)
+            worker_positions[worker].append(order[start:end])
+
+        futures = []
+        for worker, positions in worker_positions.items():
+            positions = np.concatenate(positions)
+            fut = getattr(worker, method).remote(
+                block_indices[positions].tolist(), [keys[i] for i in positions]
             )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+            futures.append((positions, fut))
+        for positions, fut in futures:
+            yield positions, ray.get(fut)
+
+    def _find_blocks(self, keys: List[Any]) -> np.ndarray:
+        """Return the index of the block of each key, or -1 if there's none."""
+        if not self._non_empty_blocks:
+            return np.full(len(keys), -1)
+        if self._index == "hash":
+            key_type = self._empty_table.schema.field(self._key).type
+            key_table = pa.table({self._key: pa.array(keys, type=key_type)})
+            partitions = hash_partition_ids(
+                key_table, [self._key], self._num_partitions
+            )
+            return self._partition_to_block[partitions]
+        keys = np.asarray(keys)
+        block_indices = np.searchsorted(self._upper_bounds, keys)
+        block_indices[
+            (block_indices >= len(self._upper_bounds)) | (keys < self._lower_bound)
+        ] = -1
+        return block_indices
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -197,23 +313,30 @@ class RandomAccessDataset:
     def _worker_for(self, block_index: int):
         return random.choice(self._block_to_workers_map[block_index])
 
-    def _find_le(self, x: Any) -> int:
-        i = bisect.bisect_left(self._upper_bounds, x)
-        if i >= len(self._upper_bounds) or x < self._lower_bound:
-            return None
-        return i
-
 
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
-    def __init__(self, key_field):
+    def __init__(self, key_field, index="sorted"):
         self.blocks = None
         self.key_field = key_field
+        self.index = index
+        # The key column of each block, and the hash index of each block, if the
+        # keys aren't sorted.
+        self.key_columns = None
+        self.hash_indexes = None
         self.num_accesses = 0
         self.total_time = 0
 
     def assign_blocks(self, block_ref_dict):
         self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        self.key_columns = {
+            k: BlockAccessor.for_block(block).to_numpy(self.key_field)
+            for k, block in self.blocks.items()
+        }
+        if self.index == "hash":
+            self.hash_indexes = {
+                k: _HashIndex(column) for k, column in self.key_columns.items()
+            }
 
     def get(self, block_index, key):
         start = time.perf_counter()
@@ -224,20 +347,37 @@ class _RandomAccessWorker:
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
-            self.blocks[block_indices[0]], pa.Table
-        ):
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [acc._get_row(i) for i in indices]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+        result = [None] * len(keys)
+        for block_index, positions, rows in self._multiget(block_indices, keys):
+            acc = BlockAccessor.for_block(self.blocks[block_index])
+            for i, row in zip(positions, rows):
+                if row >= 0:
+                    result[i] = acc._get_row(int(row))
+        self.total_time += time.perf_counter() - start
+        self.num_accesses += 1
+        return result
+
+    def multiget_table(self, block_indices, keys):
+        start = time.perf_counter()
+        tables = []
+        indices = np.zeros(len(keys), dtype=np.int64)
+        found = np.zeros(len(keys), dtype=bool)
+        num_found = 0
+        for block_index, positions, rows in self._multiget(block_indices, keys):
+            block_found = rows >= 0
+            acc = BlockAccessor.for_block(self.blocks[block_index])
+            if not tables or block_found.any():
+                # Convert at least one row, so that the types of the columns of
+                # pandas blocks can be inferred.
+                block_rows = rows[block_found] if block_found.any() else [0]
+                table = BlockAccessor.for_block(acc.take(block_rows)).to_arrow()
+                tables.append(table.slice(0, block_found.sum()))
+            positions = positions[block_found]
+            indices[positions] = np.arange(num_found, num_found + len(positions))
+            found[positions] = True
+            num_found += len(positions)
+        table = transform_pyarrow.concat(tables)
+        result = transform_pyarrow.take_table(table, pa.array(indices, mask=~found))
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
@@ -252,9 +392,42 @@ class _RandomAccessWorker:
             "total_time": self.total_time,
         }
 
+    def _multiget(
+        self, block_indices: List[int], keys: List[Any]
+    ) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """Look up the keys with one vectorized search per block.
+
+        Returns:
+            An iterator over the index of each block, the positions of its keys in
+            ``keys``, and the rows of these keys in the block, or -1 if not found.
+        """
+        block_indices = np.asarray(block_indices)
+        order = np.argsort(block_indices, kind="stable")
+        unique_block_indices, starts = np.unique(
+            block_indices[order], return_index=True
+        )
+        ends = np.append(starts[1:], len(order))
+        for block_index, start, end in zip(unique_block_indices, starts, ends):
+            positions = order[start:end]
+            block_keys = np.asarray([keys[i] for i in positions])
+            column = self.key_columns[block_index]
+            if self.index == "hash":
+                rows = self.hash_indexes[block_index].get_indexer(block_keys)
+            else:
+                rows = np.searchsorted(column, block_keys)
+                found = rows < len(column)
+                found[found] = column[rows[found]] == block_keys[found]
+                rows = np.where(found, rows, -1)
+            yield block_index, positions, rows
+
     def _get(self, block_index, key):
         if block_index is None:
             return None
+        if self.index == "hash":
+            [row] = self.hash_indexes[block_index].get_indexer([key])
+            if row < 0:
+                return None
+            return BlockAccessor.for_block(self.blocks[block_index])._get_row(int(row))
         block = self.blocks[block_index]
         column = block[self.key_field]
         if isinstance(block, pa.Table):
@@ -266,6 +439,28 @@ class _RandomAccessWorker:
         return acc._get_row(i)
 
 
+class _HashIndex:
+    """A hash index of the rows of a block by their keys."""
+
+    def __init__(self, column: np.ndarray):
+        import pandas as pd
+
+        self._index = pd.Index(column)
+        # The row of each key in the index, if the keys aren't unique.
+        self._rows = None
+        if not self._index.is_unique:
+            is_first = ~self._index.duplicated()
+            self._index = self._index[is_first]
+            self._rows = np.flatnonzero(is_first)
+
+    def get_indexer(self, keys: Any) -> np.ndarray:
+        """Return the row of each key, or -1 if not found."""
+        rows = self._index.get_indexer(keys)
+        if self._rows is not None:
+            rows = np.where(rows >= 0, self._rows[rows], -1)
+        return rows
+
+
 def _binary_search_find(column, x):
     i = bisect.bisect_left(column, x)
     if i != len(column) and column[i] == x:
@@ -284,6 +479,19 @@ class _ArrowListWrapper:
         return len(self.arrow_col)
 
 
+def _get_hash_partition(block, key, num_partitions):
+    if len(block) == 0:
+        return None
+    table = BlockAccessor.for_block(block).slice(0, 1).to_arrow()
+    return hash_partition_ids(table, [key], num_partitions)[0]
+
+
+def _get_empty_table(block):
+    # Convert a row instead of an empty block, so that the types of the columns of
+    # pandas blocks can be inferred.
+    return BlockAccessor.for_block(block).slice(0, 1).to_arrow().slice(0, 0)
+
+
 def _get_bounds(block, key):
     if len(block) == 0:
         return None
@@ -105,6 +105,35 @@ def test_repartition_shuffle_arrow(ray_start_regular_shared):
     assert large._block_num_rows() == [500] * 20
 
 
+def test_repartition_by_keys(ray_start_regular_shared):
+    ds = ray.data.from_items(
+        [{"a": i % 7, "b": i % 3, "c": i} for i in range(100)],
+        override_num_blocks=10,
+    )
+    ds2 = ds.repartition(4, keys="a")
+    assert ds2.count() == 100
+    assert len(ds2._block_num_rows()) == 4
+    assert sorted(ds2.to_pandas()["c"]) == list(range(100))
+
+    # Rows with equal keys must end up in the same block.
+    seen = {}
+    for i, bundle in enumerate(ds2.iter_internal_ref_bundles()):
+        for block in ray.get(bundle.block_refs):
+            for key in block["a"].to_pylist():
+                assert seen.setdefault(key, i) == i
+
+    ds3 = ds.repartition(5, keys=["a", "b"])
+    seen = {}
+    for i, bundle in enumerate(ds3.iter_internal_ref_bundles()):
+        for block in ray.get(bundle.block_refs):
+            for key in zip(block["a"].to_pylist(), block["b"].to_pylist()):
+                assert seen.setdefault(key, i) == i
+    assert len(seen) == 21
+
+    with pytest.raises(ValueError):
+        ds.repartition(4, keys=[])
+
+
 def test_unique(ray_start_regular_shared):
     ds = ray.data.from_items([3, 2, 3, 1, 2, 3])
     assert set(ds.unique("item")) == {1, 2, 3}
@@ -199,6 +228,67 @@ def test_groupby_none(ray_start_regular_shared):
     assert ds.groupby(None).max().take_all() == [{"max(id)": 9}]
 
 
+def test_groupby_hash_aggregate(ray_start_regular_shared, restore_data_context):
+    DataContext.get_current().use_hash_aggregate = True
+    xs = list(range(100))
+    random.shuffle(xs)
+    items = [
+        {"A": (x % 3) if x % 10 else None, "B": x % 2, "C": x, "D": x * 0.5} for x in xs
+    ]
+    ds = ray.data.from_items(items, override_num_blocks=10)
+
+    expected = pd.DataFrame(items).groupby(["A", "B"], dropna=False)
+    expected = expected.agg(count=("C", "count"), sum=("C", "sum"), mean=("D", "mean"))
+    result = (
+        ds.groupby(["A", "B"])
+        .aggregate(Count(), Sum("C"), Mean("D"))
+        .to_pandas()
+        .sort_values(["A", "B"], na_position="last")
+        .reset_index(drop=True)
+    )
+    expected = expected.reset_index().sort_values(["A", "B"], na_position="last")
+    np.testing.assert_array_equal(result["count()"], expected["count"])
+    np.testing.assert_array_equal(result["sum(C)"], expected["sum"])
+    np.testing.assert_array_almost_equal(result["mean(D)"], expected["mean"])
+    # Every key appears exactly once, including the null keys.
+    assert len(result) == 7
+
+    assert ds.groupby(None).count().take_all() == [{"count()": 100}]
+    assert ds.filter(lambda r: r["C"] > 100).groupby("A").count().count() == 0
+
+    with pytest.raises(ValueError):
+        ds.groupby("A").sum("E").materialize()
+
+
+@pytest.mark.parametrize("use_hash_aggregate", [False, True])
+def test_groupby_polars(
+    ray_start_regular_shared, restore_data_context, use_hash_aggregate
+):
+    ctx = DataContext.get_current()
+    ctx.use_hash_aggregate = use_hash_aggregate
+    xs = list(range(100))
+    random.shuffle(xs)
+    items = [{"A": x % 3, "B": x % 2, "C": x, "D": x * 0.5} for x in xs]
+    ds = ray.data.from_items(items, override_num_blocks=10)
+
+    def aggregate():
+        return (
+            ds.groupby(["A", "B"])
+            .aggregate(Count(), Sum("C"), Mean("D"))
+            .to_pandas()
+            .sort_values(["A", "B"], na_position="last")
+            .reset_index(drop=True)
+        )
+
+    ctx.use_polars = False
+    expected = aggregate()
+    # The groups of the blocks are found with polars.
+    ctx.use_polars = True
+    result = aggregate()
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(result) == 6
+
+
 def test_groupby_errors(ray_start_regular_shared):
     ds = ray.data.range(100)
     ds.groupby(None).count().show()  # OK
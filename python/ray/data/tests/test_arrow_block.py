@@ -261,6 +261,27 @@ def test_combine_chunked_array_large():
     assert result.chunks[1].nbytes == sum([c.nbytes for c in input_.chunks[14:]])
 
 
+def test_to_numpy_zero_copy():
+    table = pa.table(
+        {
+            "id": np.arange(10),
+            "image": ArrowTensorArray.from_numpy(np.ones((10, 4, 4), dtype=np.uint8)),
+        }
+    )
+    # Slices of single-chunk columns are converted without copies.
+    batch = ArrowBlockAccessor.for_block(table.slice(2, 4)).to_numpy()
+    assert batch["id"].tolist() == [2, 3, 4, 5]
+    assert np.shares_memory(batch["id"], table["id"].chunk(0).to_numpy())
+    assert batch["image"].shape == (4, 4, 4)
+    assert np.shares_memory(batch["image"], table["image"].chunk(0).to_numpy())
+
+    # Multi-chunk columns are combined.
+    table = pa.concat_tables([table.slice(0, 5), table.slice(5, 5)])
+    batch = ArrowBlockAccessor.for_block(table).to_numpy()
+    assert batch["id"].tolist() == list(range(10))
+    assert batch["image"].shape == (10, 4, 4)
+
+
 def test_append_column(ray_start_regular_shared):
     animals = ["Flamingo", "Centipede"]
     num_legs = [2, 100]
@@ -0,0 +1,77 @@
+import os
+
+import pyarrow as pa
+import pytest
+from pytest_lazyfixture import lazy_fixture
+
+import ray
+from ray.data.tests.conftest import *  # noqa
+from ray.data.tests.mock_http_server import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+@pytest.mark.parametrize(
+    "fs,data_path",
+    [
+        (None, lazy_fixture("local_path")),
+        (lazy_fixture("local_fs"), lazy_fixture("local_path")),
+        (lazy_fixture("s3_fs"), lazy_fixture("s3_path")),
+    ],
+)
+def test_arrow_ipc_roundtrip(ray_start_regular_shared, fs, data_path):
+    ds = ray.data.range(100, override_num_blocks=4).map(
+        lambda row: {"id": row["id"], "str": str(row["id"])}
+    )
+    ds.write_arrow_ipc(data_path, filesystem=fs)
+
+    ds = ray.data.read_arrow_ipc(data_path, filesystem=fs)
+    assert ds.count() == 100
+    assert ds.schema().names == ["id", "str"]
+    assert sorted(ds.take_all(), key=lambda row: row["id"]) == [
+        {"id": i, "str": str(i)} for i in range(100)
+    ]
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_arrow_ipc_write(ray_start_regular_shared, tmp_path, compression):
+    ds = ray.data.range(10, override_num_blocks=2)
+    ds._set_uuid("data")
+    ds.write_arrow_ipc(tmp_path, compression=compression)
+
+    file_path1 = os.path.join(tmp_path, "data_000000_000000.arrow")
+    file_path2 = os.path.join(tmp_path, "data_000001_000000.arrow")
+    table1 = pa.ipc.open_file(file_path1).read_all()
+    table2 = pa.ipc.open_file(file_path2).read_all()
+    assert table1.column("id").to_pylist() == list(range(5))
+    assert table2.column("id").to_pylist() == list(range(5, 10))
+
+    ds = ray.data.read_arrow_ipc(tmp_path)
+    assert sorted(row["id"] for row in ds.take_all()) == list(range(10))
+
+
+def test_arrow_ipc_read_columns(ray_start_regular_shared, tmp_path):
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.0, 2.0, 3.0]})
+    with pa.OSFile(os.path.join(tmp_path, "test.feather"), "wb") as f:
+        with pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+
+    ds = ray.data.read_arrow_ipc(tmp_path, columns=["c", "a"])
+    assert ds.take_all() == [
+        {"c": 1.0, "a": 1},
+        {"c": 2.0, "a": 2},
+        {"c": 3.0, "a": 3},
+    ]
+
+
+def test_arrow_ipc_read_include_paths(ray_start_regular_shared, tmp_path):
+    ray.data.range(10, override_num_blocks=1).write_arrow_ipc(tmp_path)
+    (path,) = os.listdir(tmp_path)
+
+    ds = ray.data.read_arrow_ipc(tmp_path, include_paths=True)
+    assert {row["path"] for row in ds.take_all()} == {os.path.join(tmp_path, path)}
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -7,10 +7,6 @@ import ray
 from ray.data._internal.batcher import Batcher, ShufflingBatcher
 
 
-def gen_block(num_rows):
-    return pa.table({"foo": [1] * num_rows})
-
-
 def test_shuffling_batcher():
     batch_size = 5
     buffer_size = 20
@@ -27,145 +23,115 @@ def test_shuffling_batcher():
         batch_size=batch_size,
         shuffle_buffer_min_size=buffer_size,
     )
-
-    def add_and_check(
-        num_rows,
-        materialized_buffer_size,
-        pending_buffer_size,
-        expect_has_batch=False,
-        no_nexting_yet=True,
-    ):
-        block = gen_block(num_rows)
+    num_rows_added = 0
+    yielded_rows = []
+
+    def add_and_check(num_rows, expected_buffer_size, expect_has_batch=False):
+        nonlocal num_rows_added
+        block = pa.table(
+            {"foo": list(range(num_rows_added, num_rows_added + num_rows))}
+        )
+        num_rows_added += num_rows
         batcher.add(block)
         if expect_has_batch:
             assert batcher.has_batch()
         else:
             assert not batcher.has_batch()
-
-        if no_nexting_yet:
-            # Check that no shuffle buffer has been materialized yet.
-            assert batcher._shuffle_buffer is None
-            assert batcher._batch_head == 0
-
-        assert batcher._builder.num_rows() == pending_buffer_size
-        assert batcher._materialized_buffer_size() == materialized_buffer_size
+        assert batcher._buffer_size == expected_buffer_size
 
     def next_and_check(
-        current_cursor,
-        materialized_buffer_size,
-        pending_buffer_size,
+        expected_buffer_size,
         should_batch_be_full=True,
         should_have_batch_after=True,
-        new_data_added=False,
     ):
         if should_batch_be_full:
             assert batcher.has_batch()
         else:
-            batcher.has_any()
-        if new_data_added:
-            # If new data was added, the builder should be non-empty.
-            assert batcher._builder.num_rows() > 0
+            assert batcher.has_any()
         batch = batcher.next_batch()
+        yielded_rows.extend(batch["foo"].to_pylist())
 
         if should_batch_be_full:
             assert len(batch) == batch_size
 
-        assert batcher._builder.num_rows() == pending_buffer_size
-        assert batcher._materialized_buffer_size() == materialized_buffer_size
-
+        assert batcher._buffer_size == expected_buffer_size
         if should_have_batch_after:
             assert batcher.has_batch()
         else:
             assert not batcher.has_batch()
 
     # Add less than a batch.
-    # Buffer not full and no batch slack.
-    add_and_check(3, materialized_buffer_size=0, pending_buffer_size=3)
+    add_and_check(3, expected_buffer_size=3)
+    # Add to more than a batch (total=10), but the buffer isn't full.
+    add_and_check(7, expected_buffer_size=10)
+    # Fill up to buffer (total=20). A batch is now available.
+    add_and_check(10, expected_buffer_size=20, expect_has_batch=True)
+
+    # Consume the only available batch, which drops the buffer below the min size.
+    next_and_check(expected_buffer_size=15, should_have_batch_after=False)
+
+    # Add 4 batches-worth to the buffer, and consume them.
+    add_and_check(20, expected_buffer_size=35, expect_has_batch=True)
+    next_and_check(expected_buffer_size=30)
+    next_and_check(expected_buffer_size=25)
+    next_and_check(expected_buffer_size=20)
+    next_and_check(expected_buffer_size=15, should_have_batch_after=False)
 
-    # Add to more than a batch (total=10).
-    # Buffer not full and no batch slack.
-    add_and_check(7, materialized_buffer_size=0, pending_buffer_size=10)
-
-    # Fill up to buffer (total=20).
-    # Buffer is full but no batch slack.
-    add_and_check(10, materialized_buffer_size=0, pending_buffer_size=20)
+    # Add a full batch + a partial batch to the buffer.
+    add_and_check(8, expected_buffer_size=23, expect_has_batch=True)
+    next_and_check(expected_buffer_size=18, should_have_batch_after=False)
 
-    # Fill past buffer and over 1.5 * min buffer size. A batch is now available, but
-    # compaction still doesn't happen until a next().
-    add_and_check(
-        15, materialized_buffer_size=0, pending_buffer_size=35, expect_has_batch=True
-    )
+    # Indicate to the batcher that we're done adding blocks.
+    batcher.done_adding()
+    assert batcher.has_batch()
 
-    # Consume only available batch.
+    # Consume 3 full batches and one partial batch, fully draining the buffer.
+    next_and_check(expected_buffer_size=13)
+    next_and_check(expected_buffer_size=8)
+    next_and_check(expected_buffer_size=3, should_have_batch_after=False)
     next_and_check(
-        0,
-        materialized_buffer_size=30,
-        pending_buffer_size=0,
-        should_have_batch_after=True,
-        new_data_added=True,
+        expected_buffer_size=0,
+        should_batch_be_full=False,
+        should_have_batch_after=False,
     )
+    assert not batcher.has_any()
 
-    # Add 4 batches-worth to the already-full buffer.
-    add_and_check(
-        20,
-        materialized_buffer_size=30,
-        pending_buffer_size=20,
-        expect_has_batch=True,
-        no_nexting_yet=False,
-    )
+    # Every row is yielded exactly once, and the source blocks are released.
+    assert sorted(yielded_rows) == list(range(num_rows_added))
+    assert yielded_rows != list(range(num_rows_added))
+    assert not batcher._blocks
 
-    # Consume 4 batches from the buffer.
-    next_and_check(
-        0, materialized_buffer_size=25, pending_buffer_size=20, new_data_added=True
-    )
-    next_and_check(batch_size, materialized_buffer_size=20, pending_buffer_size=20)
-    # Triggers materialization of pending batches to avoid falling below min buf size.
-    next_and_check(2 * batch_size, materialized_buffer_size=35, pending_buffer_size=0)
-    next_and_check(
-        3 * batch_size,
-        materialized_buffer_size=30,
-        pending_buffer_size=0,
-        should_have_batch_after=True,
-    )
 
-    # Add a full batch + a partial batch to the buffer.
-    add_and_check(
-        8,
-        materialized_buffer_size=30,
-        pending_buffer_size=8,
-        expect_has_batch=True,
-        no_nexting_yet=False,
-    )
-    next_and_check(
-        0,
-        materialized_buffer_size=25,
-        pending_buffer_size=8,
-        should_have_batch_after=True,
-        new_data_added=True,
+def test_shuffling_batcher_retained_rows():
+    batch_size = 10
+    buffer_size = 1000
+    batcher = ShufflingBatcher(
+        batch_size=batch_size, shuffle_buffer_min_size=buffer_size, shuffle_seed=0
     )
 
-    # Indicate to the batcher that we're done adding blocks.
+    def check_retained_rows():
+        # The drawn rows of partially consumed blocks are released by compacting
+        # the blocks, so the retained rows are bounded by the buffered rows.
+        num_rows_retained = sum(len(block) for block in batcher._blocks.values())
+        assert num_rows_retained <= 2 * batcher._buffer_size
+
+    num_rows_added = 0
+    yielded_rows = []
+    for _ in range(100):
+        rows = list(range(num_rows_added, num_rows_added + 100))
+        batcher.add(pa.table({"foo": rows}))
+        num_rows_added += 100
+        check_retained_rows()
+        while batcher.has_batch():
+            yielded_rows.extend(batcher.next_batch()["foo"].to_pylist())
+            check_retained_rows()
     batcher.done_adding()
+    while batcher.has_any():
+        yielded_rows.extend(batcher.next_batch()["foo"].to_pylist())
+        check_retained_rows()
 
-    # Consume 6 full batches and one partial batch, fully draining the buffer.
-    next_and_check(batch_size, materialized_buffer_size=28, pending_buffer_size=0)
-    next_and_check(2 * batch_size, materialized_buffer_size=23, pending_buffer_size=0)
-    next_and_check(3 * batch_size, materialized_buffer_size=18, pending_buffer_size=0)
-    next_and_check(4 * batch_size, materialized_buffer_size=13, pending_buffer_size=0)
-    next_and_check(5 * batch_size, materialized_buffer_size=8, pending_buffer_size=0)
-    next_and_check(
-        6 * batch_size,
-        materialized_buffer_size=3,
-        pending_buffer_size=0,
-        should_have_batch_after=False,
-    )
-    next_and_check(
-        7 * batch_size,
-        materialized_buffer_size=0,
-        pending_buffer_size=0,
-        should_batch_be_full=False,
-        should_have_batch_after=False,
-    )
+    assert sorted(yielded_rows) == list(range(num_rows_added))
+    assert not batcher._blocks
 
 
 def test_batching_pyarrow_table_with_many_chunks():
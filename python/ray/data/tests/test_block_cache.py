@@ -0,0 +1,104 @@
+import os
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import ray
+from ray.data._internal.block_cache import BlockCache
+from ray.data.context import DataContext
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def _write_parquet_files(path, num_files):
+    for i in range(num_files):
+        table = pa.table({"id": list(range(i * 10, (i + 1) * 10))})
+        pq.write_table(table, os.path.join(path, f"{i}.parquet"))
+
+
+def test_block_cache_get_put(tmp_path):
+    cache = BlockCache(str(tmp_path), max_bytes=1024 * 1024)
+    table = pa.table({"id": list(range(10))})
+
+    assert cache.get("key") is None
+    assert list(cache.put("key", [table, table])) == [table, table]
+    blocks = cache.get("key")
+    assert len(blocks) == 2
+    assert all(block.equals(table) for block in blocks)
+
+    # Entries are only committed after all blocks are consumed.
+    blocks = cache.put("partial", [table, table])
+    next(blocks)
+    blocks.close()
+    assert cache.get("partial") is None
+
+    # Non-Arrow blocks aren't cached.
+    assert list(cache.put("pandas", [table.to_pandas()]))[0].equals(table.to_pandas())
+    assert cache.get("pandas") is None
+
+
+def test_block_cache_eviction(tmp_path):
+    table = pa.table({"id": list(range(1000))})
+    cache = BlockCache(str(tmp_path), max_bytes=1)
+    list(cache.put("key1", [table]))
+    entry_size = sum(
+        entry.stat().st_size for entry in os.scandir(os.path.join(tmp_path, "key1"))
+    )
+
+    cache = BlockCache(str(tmp_path), max_bytes=int(entry_size * 2.5))
+    list(cache.put("key2", [table]))
+    # Make "key1" the most recently used entry.
+    time.sleep(0.01)
+    assert cache.get("key1") is not None
+    list(cache.put("key3", [table]))
+
+    assert cache.get("key1") is not None
+    assert cache.get("key2") is None
+    assert cache.get("key3") is not None
+
+
+def test_read_parquet_with_block_cache(
+    ray_start_regular_shared, restore_data_context, tmp_path
+):
+    data_path = tmp_path / "data"
+    data_path.mkdir()
+    _write_parquet_files(data_path, 2)
+    ctx = DataContext.get_current()
+    ctx.block_cache_dir = str(tmp_path / "cache")
+
+    ds = ray.data.read_parquet(str(data_path), override_num_blocks=2).materialize()
+    assert sorted(row["id"] for row in ds.take_all()) == list(range(20))
+    assert "Block cache: 0 hits, 2 misses" in ds.stats()
+
+    ds = ray.data.read_parquet(str(data_path), override_num_blocks=2).materialize()
+    assert sorted(row["id"] for row in ds.take_all()) == list(range(20))
+    assert "Block cache: 2 hits, 0 misses" in ds.stats()
+
+    # Different read arguments don't share cache entries.
+    ds = ray.data.read_parquet(
+        str(data_path), columns=["id"], override_num_blocks=2
+    ).materialize()
+    assert "Block cache: 0 hits, 2 misses" in ds.stats()
+
+    # Modified files aren't read from the cache.
+    time.sleep(0.01)
+    pq.write_table(pa.table({"id": [-1]}), str(data_path / "0.parquet"))
+    ds = ray.data.read_parquet(str(data_path), override_num_blocks=2).materialize()
+    assert sorted(row["id"] for row in ds.take_all()) == [-1] + list(range(10, 20))
+    assert "Block cache: 1 hits, 1 misses" in ds.stats()
+
+
+def test_read_without_block_cache(ray_start_regular_shared, tmp_path):
+    _write_parquet_files(tmp_path, 2)
+    assert DataContext.get_current().block_cache_dir is None
+
+    ds = ray.data.read_parquet(str(tmp_path)).materialize()
+    assert "Block cache" not in ds.stats()
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
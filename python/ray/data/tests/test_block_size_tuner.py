@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from ray.data._internal.execution.block_size_tuner import BlockSizeTuner
+from ray.data._internal.execution.interfaces.execution_options import (
+    ExecutionOptions,
+    ExecutionResources,
+)
+from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.map_operator import MapOperator
+from ray.data._internal.execution.streaming_executor_state import (
+    build_streaming_topology,
+)
+from ray.data.context import DataContext
+from ray.data.tests.conftest import *  # noqa
+
+MiB = 1024 * 1024
+
+
+def mock_map_op(input_op, target_max_block_size=None):
+    op = MapOperator.create(
+        MagicMock(),
+        input_op,
+        target_max_block_size=target_max_block_size,
+    )
+    op.start = MagicMock(side_effect=lambda _: None)
+    return op
+
+
+def mock_resource_manager(usage: int, limit: int):
+    resource_manager = MagicMock()
+    resource_manager.get_global_usage = MagicMock(
+        return_value=ExecutionResources(object_store_memory=usage)
+    )
+    resource_manager.get_global_limits = MagicMock(
+        return_value=ExecutionResources(object_store_memory=limit)
+    )
+    return resource_manager
+
+
+def finish_tasks(op: MapOperator, num_tasks: int, duration_s: float):
+    op.metrics.num_tasks_finished += num_tasks
+    op.metrics.block_generation_time += num_tasks * duration_s
+
+
+@pytest.fixture
+def block_size_bounds(restore_data_context):
+    ctx = DataContext.get_current()
+    ctx.target_max_block_size = 128 * MiB
+    ctx.adaptive_block_sizing_min_bytes = 32 * MiB
+    ctx.adaptive_block_sizing_max_bytes = 512 * MiB
+
+
+def test_shrink_on_memory_pressure(block_size_bounds):
+    o1 = InputDataBuffer([])
+    o2 = mock_map_op(o1)
+    o3 = mock_map_op(o2)
+    topo, _ = build_streaming_topology(o3, ExecutionOptions())
+
+    tuner = BlockSizeTuner(topo, mock_resource_manager(usage=90, limit=100))
+    tuner.update()
+    assert o2.actual_target_max_block_size == 64 * MiB
+    assert o3.actual_target_max_block_size == 64 * MiB
+
+    tuner.update()
+    assert o2.actual_target_max_block_size == 32 * MiB
+    # Block sizes are bounded by `adaptive_block_sizing_min_bytes`.
+    tuner.update()
+    assert o2.actual_target_max_block_size == 32 * MiB
+
+
+def test_shrink_on_spill(block_size_bounds):
+    o1 = InputDataBuffer([])
+    o2 = mock_map_op(o1)
+    topo, _ = build_streaming_topology(o2, ExecutionOptions())
+
+    tuner = BlockSizeTuner(topo, mock_resource_manager(usage=60, limit=100))
+    tuner.update()
+    assert o2.actual_target_max_block_size == 128 * MiB
+
+    o2.metrics.obj_store_mem_spilled += 10 * MiB
+    tuner.update()
+    assert o2.actual_target_max_block_size == 64 * MiB
+
+    # No new spilled objects since the last update.
+    tuner.update()
+    assert o2.actual_target_max_block_size == 64 * MiB
+
+
+def test_grow_on_short_downstream_tasks(block_size_bounds):
+    o1 = InputDataBuffer([])
+    o2 = mock_map_op(o1)
+    o3 = mock_map_op(o2)
+    topo, _ = build_streaming_topology(o3, ExecutionOptions())
+
+    tuner = BlockSizeTuner(topo, mock_resource_manager(usage=10, limit=100))
+    # No downstream tasks have finished yet.
+    tuner.update()
+    assert o2.actual_target_max_block_size == 128 * MiB
+
+    finish_tasks(o3, num_tasks=10, duration_s=0.1)
+    tuner.update()
+    assert o2.actual_target_max_block_size == 256 * MiB
+    # The last operator has no downstream tasks.
+    assert o3.actual_target_max_block_size == 128 * MiB
+
+    # Only the tasks finished since the last update are considered.
+    finish_tasks(o3, num_tasks=10, duration_s=5)
+    tuner.update()
+    assert o2.actual_target_max_block_size == 256 * MiB
+
+    finish_tasks(o3, num_tasks=10, duration_s=0.1)
+    tuner.update()
+    finish_tasks(o3, num_tasks=10, duration_s=0.1)
+    tuner.update()
+    # Block sizes are bounded by `adaptive_block_sizing_max_bytes`.
+    assert o2.actual_target_max_block_size == 512 * MiB
+
+
+def test_skip_ops_with_overridden_block_size(block_size_bounds):
+    o1 = InputDataBuffer([])
+    o2 = mock_map_op(o1, target_max_block_size=1024 * MiB)
+    topo, _ = build_streaming_topology(o2, ExecutionOptions())
+
+    tuner = BlockSizeTuner(topo, mock_resource_manager(usage=90, limit=100))
+    tuner.update()
+    assert o2.actual_target_max_block_size == 1024 * MiB
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
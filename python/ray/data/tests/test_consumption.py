@@ -149,6 +149,32 @@ def test_count(ray_start_regular):
     assert_core_execution_metrics_equals(CoreExecutionMetrics(task_count={}))
 
 
+def test_count_through_row_preserving_ops(ray_start_regular):
+    ds = ray.data.range(100, override_num_blocks=10)
+
+    # The number of rows is known from the metadata of the read, and these operators
+    # don't change it, so counting doesn't trigger execution.
+    mapped = ds.map(lambda row: row)
+    assert mapped.count() == 100
+    assert not mapped._plan.has_started_execution
+
+    projected = ds.select_columns(["id"])
+    assert projected.count() == 100
+    assert projected.schema().names == ["id"]
+    assert not projected._plan.has_started_execution
+
+    unioned = ds.union(ray.data.range(50))
+    assert unioned.count() == 150
+    assert not unioned._plan.has_started_execution
+
+    zipped = ds.zip(ray.data.range(100).map(lambda row: {"id2": row["id"]}))
+    assert zipped.count() == 100
+    assert not zipped._plan.has_started_execution
+
+    # Filters can drop rows, so they're executed.
+    assert ds.filter(lambda row: row["id"] < 10).count() == 10
+
+
 def test_count_edge_case(ray_start_regular):
     # Test this edge case: https://github.com/ray-project/ray/issues/44509.
     ds = ray.data.range(10)
@@ -5,6 +5,7 @@ from typing import List, Optional
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pytest
 
 import ray
@@ -14,6 +15,9 @@ from ray.data._internal.execution.interfaces import ExecutionOptions
 from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
+from ray.data._internal.execution.operators.hash_shuffle_operator import (
+    HashShuffleOperator,
+)
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.map_transformer import (
@@ -48,6 +52,8 @@ from ray.data._internal.logical.operators.map_operator import (
     Project,
 )
 from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
+from ray.data._internal.logical.operators.one_to_one_operator import Limit
+from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import (
     PhysicalOptimizer,
@@ -487,6 +493,36 @@ def test_repartition_operator(ray_start_regular_shared, shuffle):
     assert physical_op._logical_operators == [op]
 
 
+def test_repartition_by_keys_operator(ray_start_regular_shared):
+    planner = Planner()
+    read_op = get_parquet_read_logical_op()
+    op = Repartition(read_op, num_outputs=5, shuffle=False, keys=["a"])
+    plan = LogicalPlan(op, DataContext.get_current())
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Repartition"
+    assert isinstance(physical_op, HashShuffleOperator)
+    assert physical_op.num_outputs_total() == 5
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+    assert physical_op._logical_operators == [op]
+
+
+def test_hash_aggregate_operator(ray_start_regular_shared, restore_data_context):
+    DataContext.get_current().use_hash_aggregate = True
+    planner = Planner()
+    read_op = get_parquet_read_logical_op()
+    op = Aggregate(read_op, key="a", aggs=[Count()])
+    plan = LogicalPlan(op, DataContext.get_current())
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Aggregate"
+    assert isinstance(physical_op, HashShuffleOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+    assert physical_op._logical_operators == [op]
+
+
 @pytest.mark.parametrize(
     "shuffle",
     [True, False],
@@ -1185,6 +1221,74 @@ def test_inherit_batch_format_rule():
     assert optimized_plan.dag._batch_format == "pandas"
 
 
+def test_projection_pushdown_rule(ray_start_regular_shared):
+    from ray.data._internal.logical.rules.projection_pushdown import (
+        ProjectionPushdownRule,
+    )
+
+    ctx = DataContext.get_current()
+
+    read_op = get_parquet_read_logical_op()
+    cols = ["sepal.length", "variety"]
+    op = Project(Limit(read_op, 10), cols)
+    original_plan = LogicalPlan(dag=op, context=ctx)
+
+    optimized_plan = ProjectionPushdownRule().apply(original_plan)
+    project_op = optimized_plan.dag
+    assert isinstance(project_op, Project)
+    assert isinstance(project_op.input_dependency, Limit)
+    new_read_op = project_op.input_dependency.input_dependency
+    assert isinstance(new_read_op, Read)
+    assert new_read_op._datasource._columns == cols
+    assert new_read_op.aggregate_output_metadata().schema.names == cols
+    # The original operators shouldn't be modified.
+    assert op.input_dependency.input_dependency is read_op
+    assert read_op._datasource._columns is None
+
+
+def test_predicate_pushdown_rule(ray_start_regular_shared):
+    from ray.data._internal.logical.rules.predicate_pushdown import (
+        PredicatePushdownRule,
+    )
+
+    ctx = DataContext.get_current()
+
+    read_op = get_parquet_read_logical_op()
+    op = Filter(read_op, filter_expr=pc.field("sepal.length") > 5.0)
+    op = Filter(op, filter_expr=pc.field("sepal.width") < 3.0)
+    original_plan = LogicalPlan(dag=op, context=ctx)
+
+    optimized_plan = PredicatePushdownRule().apply(original_plan)
+    new_read_op = optimized_plan.dag
+    assert isinstance(new_read_op, Read)
+    assert new_read_op._datasource._to_batches_kwargs["filter"].equals(
+        (pc.field("sepal.length") > 5.0) & (pc.field("sepal.width") < 3.0)
+    )
+    assert "filter" not in read_op._datasource._to_batches_kwargs
+
+    # Predicates that reference unknown columns aren't pushed down.
+    op = Filter(read_op, filter_expr=pc.field("unknown") > 5.0)
+    optimized_plan = PredicatePushdownRule().apply(LogicalPlan(dag=op, context=ctx))
+    assert optimized_plan.dag is op
+
+
+def test_pushdown_e2e(ray_start_regular_shared):
+    path = "example://iris.parquet"
+    expected = [
+        {"petal.width": row["petal.width"]}
+        for row in ray.data.read_parquet(path).take_all()
+        if row["sepal.length"] > 5.0
+    ]
+
+    ds = (
+        ray.data.read_parquet(path)
+        .filter(expr="sepal.length > 5.0")
+        .select_columns(["petal.width"])
+    )
+    assert ds.take_all() == expected
+    assert str(ds._plan._logical_plan.dag) == "Read[ReadParquet] -> Project[Project]"
+
+
 def test_batch_format_on_sort(ray_start_regular_shared):
     """Checks that the Sort op can inherit batch_format from upstream ops correctly."""
     ds = ray.data.from_items(
@@ -0,0 +1,83 @@
+import pickle
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from ray.data._internal.planner.plan_expression.expression_evaluator import eval_expr
+from ray.data.expressions import Expr, col, lit
+
+
+@pytest.fixture
+def table():
+    return pa.table({"a": [1, 2, 3, 4], "b": [10.0, 20.0, None, 40.0]})
+
+
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        (col("a") + col("b"), [11.0, 22.0, None, 44.0]),
+        (col("a") - 1, [0, 1, 2, 3]),
+        (10 - col("a"), [9, 8, 7, 6]),
+        (col("a") * 2, [2, 4, 6, 8]),
+        (2 * col("a"), [2, 4, 6, 8]),
+        (col("b") / 10, [1.0, 2.0, None, 4.0]),
+        (-col("a"), [-1, -2, -3, -4]),
+        (col("a") > 2, [False, False, True, True]),
+        (col("a") <= 2, [True, True, False, False]),
+        (col("a") == lit(3), [False, False, True, False]),
+        (col("a") != 3, [True, True, False, True]),
+        ((col("a") > 1) & (col("a") < 4), [False, True, True, False]),
+        ((col("a") < 2) | (col("a") > 3), [True, False, False, True]),
+        (~(col("a") > 2), [True, True, False, False]),
+        (col("a").isin([1, 4]), [True, False, False, True]),
+        (col("b").is_null(), [False, False, True, False]),
+        (col("b").is_valid(), [True, True, False, True]),
+    ],
+)
+def test_eval_expr(table, expr, expected):
+    assert eval_expr(expr.to_pyarrow(), table).to_pylist() == expected
+
+
+def test_expr_names():
+    assert col("a").name == "a"
+    assert (col("a") + 1).name is None
+    assert (col("a") + 1).alias("b").name == "b"
+    assert lit(1).name is None
+
+
+def test_expr_to_pyarrow():
+    expr = (col("a") > 5) & (col("b") == "x")
+    assert expr.to_pyarrow().equals((pc.field("a") > 5) & (pc.field("b") == "x"))
+
+
+def test_expr_serialization(table):
+    expr = (col("a") * 2 + col("b")).alias("c")
+    restored = pickle.loads(pickle.dumps(expr))
+    assert restored.name == "c"
+    assert restored.to_pyarrow().equals(expr.to_pyarrow())
+    assert eval_expr(restored.to_pyarrow(), table).to_pylist() == [
+        12.0,
+        24.0,
+        None,
+        48.0,
+    ]
+
+
+def test_expr_bool():
+    with pytest.raises(TypeError, match="can't be converted to a bool"):
+        bool(col("a") > 1)
+    with pytest.raises(TypeError):
+        1 < col("a") < 3
+
+
+def test_expr_is_unhashable():
+    assert isinstance(col("a"), Expr)
+    with pytest.raises(TypeError):
+        hash(col("a"))
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,103 @@
+import pandas as pd
+import pytest
+
+import ray
+from ray.data.context import DataContext
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def _to_sorted_df(ds, columns):
+    df = ds.to_pandas()
+    return df[columns].sort_values(columns, na_position="first").reset_index(drop=True)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("broadcast", [True, False])
+def test_join(ray_start_regular_shared, restore_data_context, how, broadcast):
+    DataContext.get_current().broadcast_join_threshold_bytes = (
+        1024 * 1024 * 1024 if broadcast else 0
+    )
+    left_df = pd.DataFrame({"id": [1, 2, 3, 4, 5, 6], "a": list("abcdef")})
+    right_df = pd.DataFrame({"id": [2, 4, 4, 6, 8], "b": [2.0, 4.0, 4.5, 6.0, 8.0]})
+    left = ray.data.from_pandas(left_df).repartition(3)
+    right = ray.data.from_pandas(right_df).repartition(2)
+
+    ds = left.join(right, on="id", how=how)
+
+    columns = ["id", "a", "b"]
+    expected = left_df.merge(right_df, on="id", how=how)
+    expected = expected.sort_values(columns, na_position="first").reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        _to_sorted_df(ds, columns), expected, check_dtype=False
+    )
+
+
+def test_join_multiple_keys_and_suffixes(ray_start_regular_shared):
+    left = ray.data.from_items(
+        [{"k1": i % 2, "k2": i % 3, "v": i} for i in range(12)]
+    ).repartition(4)
+    right = ray.data.from_items(
+        [{"k1": i % 2, "k2": i % 3, "v": -i} for i in range(6)]
+    ).repartition(3)
+
+    ds = left.join(
+        right, on=["k1", "k2"], num_partitions=5, right_suffix="_right"
+    ).materialize()
+
+    assert ds.num_blocks() == 5
+    assert set(ds.schema().names) == {"k1", "k2", "v", "v_right"}
+    rows = ds.take_all()
+    assert len(rows) == 12
+    for row in rows:
+        assert row["v"] % 2 == row["k1"] and row["v"] % 3 == row["k2"]
+        assert -row["v_right"] % 2 == row["k1"] and -row["v_right"] % 3 == row["k2"]
+
+
+def test_join_null_keys(ray_start_regular_shared, restore_data_context):
+    DataContext.get_current().broadcast_join_threshold_bytes = 0
+    left = ray.data.from_items(
+        [{"id": 1, "a": 1}, {"id": None, "a": 2}, {"id": 3, "a": 3}]
+    ).repartition(2)
+    right = ray.data.from_items([{"id": 1, "b": 1}, {"id": 3, "b": 3}])
+
+    ds = left.join(right, on="id", how="left")
+
+    rows = sorted(ds.take_all(), key=lambda row: row["a"])
+    assert [row["b"] for row in rows] == [1, None, 3]
+
+
+@pytest.mark.parametrize(
+    "how,num_rows_if_left_empty,num_rows_if_right_empty",
+    [("inner", 0, 0), ("left", 0, 3), ("right", 2, 0), ("outer", 2, 3)],
+)
+def test_join_empty_input(
+    ray_start_regular_shared, how, num_rows_if_left_empty, num_rows_if_right_empty
+):
+    left = ray.data.from_items([{"id": i, "a": i} for i in range(3)])
+    right = ray.data.from_items([{"id": i, "b": i} for i in range(2)])
+
+    # `limit(0)` outputs no blocks, so the schema of the input is unknown.
+    ds = left.limit(0).join(right, on="id", how=how)
+    assert sorted(row["id"] for row in ds.take_all()) == list(
+        range(num_rows_if_left_empty)
+    )
+
+    ds = left.join(right.limit(0), on="id", how=how)
+    assert sorted(row["id"] for row in ds.take_all()) == list(
+        range(num_rows_if_right_empty)
+    )
+
+
+def test_join_invalid_args(ray_start_regular_shared):
+    ds = ray.data.range(3)
+    with pytest.raises(ValueError, match="Invalid join type"):
+        ds.join(ds, on="id", how="cross")
+    with pytest.raises(ValueError, match="join key"):
+        ds.join(ds, on=[])
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -21,6 +21,7 @@ from ray.data._internal.execution.interfaces.ref_bundle import (
 from ray.data._internal.execution.operators.actor_pool_map_operator import _MapWorker
 from ray.data.context import DataContext
 from ray.data.exceptions import UserCodeException
+from ray.data.expressions import col, lit
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.test_util import ConcurrencyCounter  # noqa
 from ray.data.tests.util import column_udf, column_udf_class, extract_values
@@ -427,6 +428,35 @@ def test_add_column(ray_start_regular_shared):
         ray.data.range(5).add_column("foo", lambda x: x["id"] + 1, batch_format="foo")
 
 
+def test_add_column_with_expr(ray_start_regular_shared):
+    ds = ray.data.from_items([{"a": i, "b": 10 * i} for i in range(5)])
+
+    assert ds.add_column((col("a") + col("b")).alias("c")).take(2) == [
+        {"a": 0, "b": 0, "c": 0},
+        {"a": 1, "b": 10, "c": 11},
+    ]
+    assert ds.add_column("c", lit(100) - col("a") * 2).take(2) == [
+        {"a": 0, "b": 0, "c": 100},
+        {"a": 1, "b": 10, "c": 98},
+    ]
+    assert ds.add_column("c", col("b") > 20).take_all()[2:] == [
+        {"a": 2, "b": 20, "c": False},
+        {"a": 3, "b": 30, "c": True},
+        {"a": 4, "b": 40, "c": True},
+    ]
+
+    with pytest.raises(
+        UserCodeException, match="Trying to add an existing column with name 'a'"
+    ):
+        ds.add_column((col("a") + 1).alias("a")).materialize()
+
+    with pytest.raises(ValueError, match="must be named"):
+        ds.add_column(col("a") + 1)
+
+    with pytest.raises(ValueError, match="`fn` must be None"):
+        ds.add_column((col("a") + 1).alias("c"), lambda df: df["a"])
+
+
 @pytest.mark.parametrize("names", (["foo", "bar"], {"spam": "foo", "ham": "bar"}))
 def test_rename_columns(ray_start_regular_shared, names):
     ds = ray.data.from_items([{"spam": 0, "ham": 0}])
@@ -543,6 +573,31 @@ def test_filter_with_invalid_expression(ray_start_regular_shared, tmp_path):
         fake_column_ds.to_pandas()
 
 
+def test_filter_with_expr(ray_start_regular_shared):
+    ds = ray.data.from_items(
+        [{"a": i, "b": str(i) if i % 2 else None} for i in range(10)]
+    )
+
+    assert ds.filter(expr=col("a") >= 7).take_all() == [
+        {"a": 7, "b": "7"},
+        {"a": 8, "b": None},
+        {"a": 9, "b": "9"},
+    ]
+    assert ds.filter(expr=(col("a") < 4) & col("b").is_valid()).take_all() == [
+        {"a": 1, "b": "1"},
+        {"a": 3, "b": "3"},
+    ]
+    assert ds.filter(expr=col("b").isin(["3", "5"]) | (col("a") == 0)).take_all() == [
+        {"a": 0, "b": None},
+        {"a": 3, "b": "3"},
+        {"a": 5, "b": "5"},
+    ]
+    assert ds.filter(expr=~(col("a") * 2 > lit(2))).count() == 2
+
+    with pytest.raises(UserCodeException):
+        ds.filter(expr=col("unknown") > 1).materialize()
+
+
 def test_drop_columns(ray_start_regular_shared, tmp_path):
     df = pd.DataFrame({"col1": [1, 2, 3], "col2": [2, 3, 4], "col3": [3, 4, 5]})
     ds1 = ray.data.from_pandas(df)
@@ -669,6 +724,24 @@ def test_map_batches_basic(ray_start_regular_shared, tmp_path, restore_data_cont
         ).take()
 
 
+def test_map_batches_polars(ray_start_regular_shared, restore_data_context):
+    import polars as pl
+
+    DataContext.get_current().execution_options.preserve_order = True
+    ds = ray.data.range(10, override_num_blocks=2)
+
+    def fn(df):
+        assert isinstance(df, pl.DataFrame)
+        return df.with_columns([(pl.col("id") * 2).alias("id2")])
+
+    ds = ds.map_batches(fn, batch_format="polars")
+    assert ds.take_all() == [{"id": i, "id2": 2 * i} for i in range(10)]
+
+    batches = list(ds.iter_batches(batch_size=5, batch_format="polars"))
+    assert all(isinstance(batch, pl.DataFrame) for batch in batches)
+    assert pl.concat(batches)["id2"].to_list() == [2 * i for i in range(10)]
+
+
 def test_map_batches_extra_args(shutdown_only, tmp_path):
     ray.shutdown()
     ray.init(num_cpus=3)
@@ -1358,6 +1431,84 @@ def test_map_batches_async_exception_propagation(shutdown_only):
     assert "assert False" in str(exc_info.value)
 
 
+def test_map_batches_async_coroutine(shutdown_only):
+    ray.shutdown()
+    ray.init(num_cpus=4)
+
+    class AsyncActor:
+        def __init__(self):
+            self.num_running = 0
+            self.max_num_running = 0
+
+        async def __call__(self, batch):
+            self.num_running += 1
+            self.max_num_running = max(self.max_num_running, self.num_running)
+            # Later batches finish first, to check that the order is preserved.
+            await asyncio.sleep(0.1 * (4 - batch["id"][0] % 4))
+            self.num_running -= 1
+            return {"id": batch["id"], "max_num_running": [self.max_num_running]}
+
+    n = 16
+    ds = ray.data.range(n, override_num_blocks=1)
+    ds = ds.map_batches(AsyncActor, batch_size=1, concurrency=1, max_concurrency=4)
+
+    output = ds.take_all()
+    assert [row["id"] for row in output] == list(range(n))
+    max_num_running = max(row["max_num_running"] for row in output)
+    assert 1 < max_num_running <= 4, max_num_running
+
+
+def test_map_batches_async_cancel_on_close():
+    from ray.data._internal.planner.plan_udf_map_op import (
+        _generate_transform_fn_for_async_map_batches,
+        _MapActorContext,
+    )
+
+    never_done = threading.Event()
+
+    class AsyncActor:
+        async def __call__(self, batch):
+            yield batch
+            # The remaining outputs of the batch are never consumed.
+            while not never_done.is_set():
+                await asyncio.sleep(0.01)
+            yield batch
+
+    async def fn(batch):
+        return ray.data._map_actor_context.udf_map_fn(batch)
+
+    actor_context = _MapActorContext(
+        AsyncActor, AsyncActor(), is_async=True, max_concurrency=2
+    )
+    ray.data._map_actor_context = actor_context
+    try:
+        transform_fn = _generate_transform_fn_for_async_map_batches(fn)
+        batches = [{"id": np.array([i])} for i in range(2)]
+        outputs = transform_fn(iter(batches), None)
+        assert next(outputs)["id"] == [0]
+
+        # Closing the generator cancels the batches in flight, including the one
+        # whose outputs were being yielded, so they release the semaphore.
+        outputs.close()
+        semaphore = actor_context._udf_map_asyncio_semaphore
+        wait_for_condition(lambda: semaphore._value == 2, timeout=5)
+    finally:
+        never_done.set()
+        ray.data._map_actor_context = None
+        actor_context.udf_map_asyncio_loop.call_soon_threadsafe(
+            actor_context.udf_map_asyncio_loop.stop
+        )
+
+
+def test_map_async_udf_unsupported(shutdown_only):
+    class AsyncActor:
+        async def __call__(self, row):
+            return row
+
+    with pytest.raises(ValueError, match="only supported by `map_batches`"):
+        ray.data.range(10).map(AsyncActor, concurrency=1).materialize()
+
+
 def test_map_batches_async_generator_fast_yield(shutdown_only):
     # Tests the case where the async generator yields immediately,
     # with a high number of tasks in flight, which results in
@@ -12,6 +12,7 @@ import pytest
 import ray
 from ray._private.test_utils import wait_for_condition
 from ray.data._internal.compute import ActorPoolStrategy, TaskPoolStrategy
+from ray.data._internal.datasource.range_datasource import RangeDatasource
 from ray.data._internal.execution.interfaces import (
     ExecutionOptions,
     PhysicalOperator,
@@ -23,6 +24,9 @@ from ray.data._internal.execution.operators.actor_pool_map_operator import (
 from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
+from ray.data._internal.execution.operators.hash_shuffle_operator import (
+    HashShuffleOperator,
+)
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
 from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.operators.map_operator import (
@@ -38,7 +42,11 @@ from ray.data._internal.execution.operators.task_pool_map_operator import (
 )
 from ray.data._internal.execution.operators.union_operator import UnionOperator
 from ray.data._internal.execution.util import make_ref_bundles
-from ray.data.block import Block, BlockAccessor
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.planner.exchange.hash_shuffle_task_spec import (
+    HashShuffleTaskSpec,
+)
+from ray.data.block import Block, BlockAccessor, BlockExecStats
 from ray.data.context import DataContext
 from ray.data.tests.util import run_one_op_task, run_op_tasks_sync
 from ray.tests.client_test_utils import create_remote_signal_actor
@@ -350,6 +358,119 @@ def test_map_operator_actor_locality_stats(ray_start_regular_shared):
     assert not op.completed()
 
 
+def _make_produced_ref_bundles(simple_data: List[List[Any]]) -> List[RefBundle]:
+    """Create ref bundles whose blocks are recorded as produced on this node."""
+    bundles = make_ref_bundles(simple_data)
+    for bundle in bundles:
+        for metadata in bundle.metadata:
+            metadata.exec_stats = BlockExecStats()
+    return bundles
+
+
+@pytest.mark.parametrize("fallback", ["spill", "wait"])
+def test_map_operator_task_locality_stats(ray_start_regular_shared, fallback):
+    input_op = InputDataBuffer(_make_produced_ref_bundles([[i] for i in range(10)]))
+    op = MapOperator.create(
+        _mul2_map_data_prcessor,
+        input_op=input_op,
+        name="TestMapper",
+        compute_strategy=TaskPoolStrategy(),
+    )
+    assert isinstance(op, TaskPoolMapOperator)
+
+    op.start(
+        ExecutionOptions(task_locality_enabled=True, task_locality_fallback=fallback)
+    )
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+    op.all_inputs_done()
+    run_op_tasks_sync(op)
+
+    output = []
+    while op.has_next():
+        _get_blocks(op.get_next(), output)
+    assert sorted(output) == [[i * 2] for i in range(10)]
+
+    # All blocks are on the local node, so all tasks should run there.
+    metrics = op.metrics.as_dict()
+    assert metrics["task_locality_hits"] == 10, metrics
+    assert metrics["task_locality_misses"] == 0, metrics
+    assert "all objects local" in op.progress_str()
+
+
+def test_map_operator_task_locality_disabled(ray_start_regular_shared):
+    input_op = InputDataBuffer(_make_produced_ref_bundles([[i] for i in range(10)]))
+    op = MapOperator.create(
+        _mul2_map_data_prcessor,
+        input_op=input_op,
+        name="TestMapper",
+        compute_strategy=TaskPoolStrategy(),
+        ray_remote_args={"scheduling_strategy": "SPREAD"},
+    )
+
+    # A user-specified scheduling strategy takes precedence over locality hints.
+    op.start(ExecutionOptions(task_locality_enabled=True))
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+    op.all_inputs_done()
+    run_op_tasks_sync(op)
+
+    metrics = op.metrics.as_dict()
+    assert metrics["task_locality_hits"] == 0, metrics
+    assert metrics["task_locality_misses"] == 0, metrics
+    assert op.progress_str() == ""
+
+    with pytest.raises(ValueError):
+        ExecutionOptions(task_locality_fallback="invalid")
+
+
+def test_map_operator_task_locality_dynamic_strategy(ray_start_regular_shared):
+    input_op = InputDataBuffer(_make_produced_ref_bundles([[i] for i in range(10)]))
+    op = MapOperator.create(
+        _mul2_map_data_prcessor,
+        input_op=input_op,
+        name="TestMapper",
+        compute_strategy=TaskPoolStrategy(),
+        ray_remote_args_fn=lambda: {"scheduling_strategy": "SPREAD"},
+    )
+
+    # A scheduling strategy from `ray_remote_args_fn` also takes precedence over
+    # locality hints.
+    op.start(ExecutionOptions(task_locality_enabled=True))
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+    op.all_inputs_done()
+    run_op_tasks_sync(op)
+
+    metrics = op.metrics.as_dict()
+    assert metrics["task_locality_hits"] == 0, metrics
+    assert metrics["task_locality_misses"] == 0, metrics
+
+
+def test_map_operator_task_locality_read(ray_start_regular_shared):
+    input_op = InputDataBuffer(_make_produced_ref_bundles([[i] for i in range(10)]))
+    op = MapOperator.create(
+        _mul2_map_data_prcessor,
+        input_op=input_op,
+        name="TestRead",
+        compute_strategy=TaskPoolStrategy(),
+    )
+    datasource = RangeDatasource(10)
+    op.set_logical_operators(Read(datasource, datasource, -1, None))
+
+    # The inputs of reads are read tasks put by the driver, so reads don't get
+    # locality hints.
+    op.start(ExecutionOptions(task_locality_enabled=True))
+    while input_op.has_next():
+        op.add_input(input_op.get_next(), 0)
+    op.all_inputs_done()
+    run_op_tasks_sync(op)
+
+    metrics = op.metrics.as_dict()
+    assert metrics["task_locality_hits"] == 0, metrics
+    assert metrics["task_locality_misses"] == 0, metrics
+
+
 @pytest.mark.parametrize("use_actors", [False, True])
 def test_map_operator_min_rows_per_bundle(ray_start_regular_shared, use_actors):
     # Simple sanity check of batching behavior.
@@ -668,6 +789,43 @@ def test_limit_operator(ray_start_regular_shared):
         assert limit_op.completed(), limit
 
 
+def test_hash_shuffle_operator(ray_start_regular_shared):
+    """Test the memory accounting and the reduce throttling of HashShuffleOperator."""
+    num_partitions = 4
+    input_op = InputDataBuffer(make_ref_bundles([[i, i + 10] for i in range(10)]))
+    op = HashShuffleOperator(input_op, HashShuffleTaskSpec(["id"]), num_partitions)
+    op.start(ExecutionOptions())
+    input_size = 0
+    while input_op.has_next():
+        bundle = input_op.get_next()
+        input_size += bundle.size_bytes()
+        op.add_input(bundle, 0)
+    assert op.metrics.obj_store_mem_shuffle_map_outputs == 0
+
+    # The map outputs are held until the reduce tasks consume them.
+    run_op_tasks_sync(op)
+    held = op.metrics.obj_store_mem_shuffle_map_outputs
+    assert 0 < held <= input_size
+
+    # The reduce phase starts with one reduce task, and submits more only when the
+    # operator isn't in backpressure.
+    op.all_inputs_done()
+    assert len(op.get_active_tasks()) == 1
+    op.notify_in_task_submission_backpressure(True)
+    assert len(op.get_active_tasks()) == 1
+    op.notify_in_task_submission_backpressure(False)
+    assert len(op.get_active_tasks()) == 2
+
+    # One reduce task keeps running until all partitions are reduced.
+    run_op_tasks_sync(op)
+    assert op.metrics.obj_store_mem_shuffle_map_outputs == 0
+    outputs = []
+    while op.has_next():
+        outputs.extend(_get_bundles(op.get_next()))
+    assert sorted(outputs) == list(range(20))
+    assert op.completed()
+
+
 def _get_bundles(bundle: RefBundle):
     output = []
     for block_ref in bundle.block_refs:
@@ -1,3 +1,5 @@
+import random
+
 import pyarrow
 import pytest
 
@@ -6,7 +8,8 @@ from ray.tests.conftest import *  # noqa
 
 
 @pytest.mark.parametrize("pandas", [False, True])
-def test_basic(ray_start_regular_shared, pandas):
+@pytest.mark.parametrize("index", ["sorted", "hash"])
+def test_basic(ray_start_regular_shared, pandas, index):
     ds = ray.data.range(100, override_num_blocks=10)
     ds = ds.add_column("embedding", lambda b: b["id"] ** 2)
     if not pandas:
@@ -14,7 +17,7 @@ def test_basic(ray_start_regular_shared, pandas):
             lambda df: pyarrow.Table.from_pandas(df), batch_format="pandas"
         )
 
-    rad = ds.to_random_access_dataset("id", num_workers=1)
+    rad = ds.to_random_access_dataset("id", num_workers=1, index=index)
 
     # Test get.
     assert ray.get(rad.get_async(-1)) is None
@@ -30,6 +33,29 @@ def test_basic(ray_start_regular_shared, pandas):
     assert results == [None] + [expected(i) for i in range(10)] + [None]
 
 
+@pytest.mark.parametrize("index", ["sorted", "hash"])
+def test_multiget_multiple_blocks(ray_start_regular_shared, index):
+    ds = ray.data.range(100, override_num_blocks=10).filter(lambda r: r["id"] % 2)
+    ds = ds.add_column("str", lambda b: b["id"].astype(str))
+    rad = ds.to_random_access_dataset("id", num_workers=2, index=index)
+
+    # Look up keys of all blocks, in random order, including missing keys.
+    keys = list(range(-5, 105))
+    random.shuffle(keys)
+    expected = [
+        {"id": k, "str": str(k)} if 0 <= k < 100 and k % 2 else None for k in keys
+    ]
+    assert rad.multiget(keys) == expected
+
+    table = rad.multiget_table(keys)
+    assert table.column_names == ["id", "str"]
+    assert table.to_pylist() == [
+        row if row is not None else {"id": None, "str": None} for row in expected
+    ]
+    assert rad.multiget_table([-1]).to_pylist() == [{"id": None, "str": None}]
+    assert rad.multiget_table([]).num_rows == 0
+
+
 def test_empty_blocks(ray_start_regular_shared):
     ds = ray.data.range(10).repartition(20)
     assert ds._plan.initial_num_blocks() == 20
@@ -42,6 +68,10 @@ def test_errors(ray_start_regular_shared):
     ds = ray.data.range(10)
     with pytest.raises(ValueError):
         ds.to_random_access_dataset("invalid")
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("invalid", index="hash")
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("id", index="invalid")
 
 
 def test_stats(ray_start_regular_shared):
@@ -1,6 +1,7 @@
 import logging
 import random
 from collections import defaultdict
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -322,6 +323,65 @@ def test_sort_with_one_block(shutdown_only, use_push_based_shuffle):
     ).sum("token_counts")
 
 
+@pytest.mark.parametrize("descending", [False, True])
+def test_merge_sorted_blocks(descending):
+    rng = np.random.default_rng(0)
+    for values in [
+        rng.integers(0, 50, size=100),
+        rng.random(100),
+        np.array([1.0, np.nan, 3.0, np.nan]),
+        np.array(["b", "a", "c", "a"]),
+    ]:
+        blocks = [
+            BlockAccessor.for_block(
+                pa.table({"key": chunk, "idx": np.arange(len(chunk))})
+            ).sort_and_partition([], SortKey("key", descending))[0]
+            for chunk in np.array_split(values, 4)
+        ]
+        merged, _ = BlockAccessor.for_block(blocks[0]).merge_sorted_blocks(
+            blocks, SortKey("key", descending)
+        )
+        expected = pa.concat_tables(blocks).sort_by(
+            [("key", "descending" if descending else "ascending")]
+        )
+        assert merged.equals(expected)
+
+
+def test_sort_reuses_boundaries(ray_start_regular_shared):
+    ds = (
+        ray.data.range(100, override_num_blocks=4)
+        .map(lambda row: {"id": row["id"], "id2": 99 - row["id"]})
+        .random_shuffle()
+        .materialize()
+    )
+    with patch.object(
+        SortTaskSpec, "sample_boundaries", wraps=SortTaskSpec.sample_boundaries
+    ) as sample_boundaries:
+        assert extract_values("id", ds.sort("id").take_all()) == list(range(100))
+        assert extract_values("id", ds.sort("id", descending=True).take_all()) == list(
+            reversed(range(100))
+        )
+        assert sample_boundaries.call_count == 1
+
+        # Sorting the same dataset by a different column samples again.
+        assert extract_values("id2", ds.sort("id2").take_all()) == list(range(100))
+        assert sample_boundaries.call_count == 2
+
+
+def test_sort_within_partitions_only(ray_start_regular_shared):
+    ds = ray.data.range(100, override_num_blocks=4).map_batches(
+        lambda batch: {"id": batch["id"][::-1]}
+    )
+    ds = ds.sort("id", within_partitions_only=True)
+    blocks = [ray.get(ref) for ref in ds.get_internal_block_refs()]
+    assert [BlockAccessor.for_block(b).to_pandas()["id"].tolist() for b in blocks] == [
+        list(range(i, i + 25)) for i in range(0, 100, 25)
+    ]
+
+    with pytest.raises(ValueError):
+        ds.sort("id", boundaries=[10], within_partitions_only=True)
+
+
 def test_push_based_shuffle_schedule():
     def _test(num_input_blocks, merge_factor, num_cpus_per_node_map):
         num_cpus = sum(v for v in num_cpus_per_node_map.values())
@@ -1,4 +1,6 @@
+import json
 import logging
+import os
 import re
 import threading
 import time
@@ -52,6 +54,7 @@ def gen_expected_metrics(
             "'bytes_inputs_received': N",
             "'num_task_inputs_processed': N",
             "'bytes_task_inputs_processed': N",
+            "'rows_task_inputs_processed': N",
             "'bytes_inputs_of_submitted_tasks': N",
             "'num_task_outputs_generated': N",
             "'bytes_task_outputs_generated': N",
@@ -72,9 +75,12 @@ def gen_expected_metrics(
             ),
             "'obj_store_mem_internal_inqueue_blocks': Z",
             "'obj_store_mem_internal_outqueue_blocks': Z",
+            "'obj_store_mem_shuffle_map_outputs': Z",
             "'obj_store_mem_freed': N",
             f"""'obj_store_mem_spilled': {"N" if spilled else "Z"}""",
             "'obj_store_mem_used': A",
+            "'num_times_scheduled': A",
+            "'num_times_starved': A",
             "'cpu_usage': Z",
             "'gpu_usage': Z",
         ]
@@ -92,7 +98,10 @@ def gen_expected_metrics(
             ),
             "'obj_store_mem_internal_inqueue_blocks': Z",
             "'obj_store_mem_internal_outqueue_blocks': Z",
+            "'obj_store_mem_shuffle_map_outputs': Z",
             "'obj_store_mem_used': A",
+            "'num_times_scheduled': A",
+            "'num_times_starved': A",
             "'cpu_usage': Z",
             "'gpu_usage': Z",
         ]
@@ -187,10 +196,11 @@ def canonicalize(stats: str, filter_global_stats: bool = True) -> str:
     canonicalized_stats = re.sub("[0-9\.]+(ms|us|s)", "T", canonicalized_stats)
     # Memory expressions.
     canonicalized_stats = re.sub("[0-9\.]+(B|MB|GB)", "M", canonicalized_stats)
-    # For obj_store_mem_used, the value can be zero or positive, depending on the run.
-    # Replace with A to avoid test flakiness.
+    # For obj_store_mem_used and the scheduling decision counts, the value can be
+    # zero or positive, depending on the run. Replace with A to avoid test flakiness.
     canonicalized_stats = re.sub(
-        r"(obj_store_mem_used: |'obj_store_mem_used': )\d+(\.\d+)?",
+        r"((?:obj_store_mem_used|num_times_scheduled|num_times_starved)(?:: |': ))"
+        r"\d+(\.\d+)?",
         # Replaces the number with 'A' while keeping the key prefix intact.
         r"\g<1>A",
         canonicalized_stats,
@@ -546,6 +556,7 @@ def test_dataset__repr__(ray_start_regular_shared, restore_data_context):
         "      bytes_inputs_received: N,\n"
         "      num_task_inputs_processed: N,\n"
         "      bytes_task_inputs_processed: N,\n"
+        "      rows_task_inputs_processed: N,\n"
         "      bytes_inputs_of_submitted_tasks: N,\n"
         "      num_task_outputs_generated: N,\n"
         "      bytes_task_outputs_generated: N,\n"
@@ -563,9 +574,12 @@ def test_dataset__repr__(ray_start_regular_shared, restore_data_context):
         "      task_submission_backpressure_time: N,\n"
         "      obj_store_mem_internal_inqueue_blocks: Z,\n"
         "      obj_store_mem_internal_outqueue_blocks: Z,\n"
+        "      obj_store_mem_shuffle_map_outputs: Z,\n"
         "      obj_store_mem_freed: N,\n"
         "      obj_store_mem_spilled: Z,\n"
         "      obj_store_mem_used: A,\n"
+        "      num_times_scheduled: A,\n"
+        "      num_times_starved: A,\n"
         "      cpu_usage: Z,\n"
         "      gpu_usage: Z,\n"
         "      ray_remote_args: {'num_cpus': N, 'scheduling_strategy': 'SPREAD'},\n"
@@ -660,6 +674,7 @@ def test_dataset__repr__(ray_start_regular_shared, restore_data_context):
         "      bytes_inputs_received: N,\n"
         "      num_task_inputs_processed: N,\n"
         "      bytes_task_inputs_processed: N,\n"
+        "      rows_task_inputs_processed: N,\n"
         "      bytes_inputs_of_submitted_tasks: N,\n"
         "      num_task_outputs_generated: N,\n"
         "      bytes_task_outputs_generated: N,\n"
@@ -677,9 +692,12 @@ def test_dataset__repr__(ray_start_regular_shared, restore_data_context):
         "      task_submission_backpressure_time: N,\n"
         "      obj_store_mem_internal_inqueue_blocks: Z,\n"
         "      obj_store_mem_internal_outqueue_blocks: Z,\n"
+        "      obj_store_mem_shuffle_map_outputs: Z,\n"
         "      obj_store_mem_freed: N,\n"
         "      obj_store_mem_spilled: Z,\n"
         "      obj_store_mem_used: A,\n"
+        "      num_times_scheduled: A,\n"
+        "      num_times_starved: A,\n"
         "      cpu_usage: Z,\n"
         "      gpu_usage: Z,\n"
         "      ray_remote_args: {'num_cpus': N, 'scheduling_strategy': 'SPREAD'},\n"
@@ -729,6 +747,7 @@ def test_dataset__repr__(ray_start_regular_shared, restore_data_context):
         "            bytes_inputs_received: N,\n"
         "            num_task_inputs_processed: N,\n"
         "            bytes_task_inputs_processed: N,\n"
+        "            rows_task_inputs_processed: N,\n"
         "            bytes_inputs_of_submitted_tasks: N,\n"
         "            num_task_outputs_generated: N,\n"
         "            bytes_task_outputs_generated: N,\n"
@@ -746,9 +765,12 @@ def test_dataset__repr__(ray_start_regular_shared, restore_data_context):
         "            task_submission_backpressure_time: N,\n"
         "            obj_store_mem_internal_inqueue_blocks: Z,\n"
         "            obj_store_mem_internal_outqueue_blocks: Z,\n"
+        "            obj_store_mem_shuffle_map_outputs: Z,\n"
         "            obj_store_mem_freed: N,\n"
         "            obj_store_mem_spilled: Z,\n"
         "            obj_store_mem_used: A,\n"
+        "            num_times_scheduled: A,\n"
+        "            num_times_starved: A,\n"
         "            cpu_usage: Z,\n"
         "            gpu_usage: Z,\n"
         "            ray_remote_args: {'num_cpus': N, 'scheduling_strategy': 'SPREAD'},\n"  # noqa: E501
@@ -1317,6 +1339,62 @@ def test_time_backpressure(ray_start_regular_shared, restore_data_context):
     assert ds._plan.stats().extra_metrics["task_submission_backpressure_time"] > 0
 
 
+def test_transform_profiling(ray_start_regular_shared, tmp_path, restore_data_context):
+    DataContext.get_current().enable_transform_profiling = True
+
+    def f(batch):
+        time.sleep(0.1)
+        return batch
+
+    ds = ray.data.range(10, override_num_blocks=2).map_batches(f).materialize()
+    [operator_stats] = ds._get_stats_summary().operators_stats
+    stages = operator_stats.transform_stages
+    assert list(stages) == [
+        "0: BlockMapTransformFn(do_read)",
+        "1: BuildOutputBlocksMapTransformFn",
+        "2: BlocksToBatchesMapTransformFn",
+        "3: BatchMapTransformFn[UDF]",
+        "4: BuildOutputBlocksMapTransformFn",
+        "Output",
+    ]
+    # The time spent in the upstream stages isn't attributed to the UDF.
+    udf_time = stages["3: BatchMapTransformFn[UDF]"]["time"]
+    assert udf_time >= 0.2
+    assert udf_time > stages["4: BuildOutputBlocksMapTransformFn"]["time"]
+    assert stages["Output"]["outputs"] == 2
+    assert "* Transform time breakdown:" in ds.stats()
+
+    trace_path = os.path.join(tmp_path, "trace.json")
+    ds.export_transform_profile(trace_path)
+    with open(trace_path) as f:
+        trace = json.load(f)
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert {event["name"] for event in events} == set(stages)
+    assert {event["tid"] for event in events} == {0, 1}
+
+    # Profiling is disabled by default.
+    DataContext.get_current().enable_transform_profiling = False
+    ds = ray.data.range(10).map_batches(f).materialize()
+    assert ds._get_stats_summary().operators_stats[0].transform_stages is None
+
+
+def test_transform_profiler_max_trace_events(monkeypatch):
+    from ray.data._internal.execution.operators.map_transformer import (
+        TransformProfiler,
+        create_map_transformer_from_block_fn,
+    )
+
+    monkeypatch.setattr(TransformProfiler, "MAX_TRACE_EVENTS", 5)
+    transformer = create_map_transformer_from_block_fn(lambda blocks, ctx: blocks)
+    profiler = TransformProfiler(transformer, task_idx=0)
+
+    # The cap applies to the task, not to each profile that's popped.
+    num_trace_events = 0
+    for _ in profiler.profile_stage(0, range(10)):
+        num_trace_events += len(profiler.pop_profile().trace_events)
+    assert num_trace_events == 5
+
+
 def test_runtime_metrics(ray_start_regular_shared):
     from math import isclose
 
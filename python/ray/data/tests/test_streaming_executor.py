@@ -19,6 +19,9 @@ from ray.data._internal.execution.operators.map_transformer import (
     create_map_transformer_from_block_fn,
 )
 from ray.data._internal.execution.resource_manager import ResourceManager
+from ray.data._internal.execution.scheduling_policy import (
+    BottleneckSchedulingPolicy,
+)
 from ray.data._internal.execution.streaming_executor import (
     _debug_dump_topology,
     _validate_dag,
@@ -231,6 +234,64 @@ def test_select_operator_to_run():
     assert _select_op_to_run() == o2
 
 
+def test_select_operator_to_run_with_bottleneck_policy():
+    opt = ExecutionOptions()
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = MapOperator.create(
+        make_map_transformer(lambda block: [b * -1 for b in block]), o1
+    )
+    o3 = MapOperator.create(
+        make_map_transformer(lambda block: [b * 2 for b in block]), o2
+    )
+    topo, _ = build_streaming_topology(o3, opt)
+    resource_manager = mock_resource_manager(
+        global_limits=ExecutionResources.for_limits(1, 1, 1),
+    )
+    resource_manager.get_op_usage = MagicMock(return_value=ExecutionResources(0, 0, 0))
+    policy = BottleneckSchedulingPolicy(topo, resource_manager)
+
+    def _select_op_to_run():
+        return select_operator_to_run(
+            topo,
+            resource_manager,
+            [],
+            mock_autoscaler(),
+            True,
+            scheduling_policy=policy,
+        )
+
+    topo[o1].outqueue.append(make_ref_bundle("dummy1"))
+    topo[o2].outqueue.append(make_ref_bundle("dummy2"))
+
+    # Operators without a throughput estimate run first.
+    o2.metrics.rows_task_outputs_generated = 100
+    o2.metrics.block_generation_time = 1
+    o2.metrics.num_tasks_running = 1
+    assert _select_op_to_run() == o3
+    assert topo[o3]._scheduling_status.reason == "no throughput estimate yet"
+    assert topo[o2]._scheduling_status.reason.startswith("estimated throughput=")
+
+    # o3 is the bottleneck.
+    o3.metrics.rows_task_outputs_generated = 10
+    o3.metrics.block_generation_time = 1
+    o3.metrics.num_tasks_running = 1
+    assert _select_op_to_run() == o3
+
+    # o3 filters out most rows, so o2 is the bottleneck in terms of the rows it
+    # results in at the end of the pipeline.
+    o3.metrics.rows_task_inputs_processed = 20
+    o3.metrics.num_tasks_running = 100
+    assert _select_op_to_run() == o2
+    assert topo[o2]._scheduling_status.selected
+    assert not topo[o3]._scheduling_status.selected
+
+    assert o2.metrics.num_times_scheduled == 1
+    assert o2.metrics.num_times_starved == 2
+    assert o3.metrics.num_times_scheduled == 2
+    assert o3.metrics.num_times_starved == 1
+
+
 def test_dispatch_next_task():
     inputs = make_ref_bundles([[x] for x in range(20)])
     o1 = InputDataBuffer(inputs)
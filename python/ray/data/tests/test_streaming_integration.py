@@ -342,6 +342,29 @@ def test_streaming_split_independent_finish(ray_start_10_cpus_shared):
     assert len(ready) == 2
 
 
+def test_streaming_split_work_stealing(ray_start_10_cpus_shared):
+    ds = ray.data.range(100, override_num_blocks=50)
+    i1, i2 = ds.streaming_split(2, work_stealing=True)
+
+    @ray.remote
+    def consume(x, delay):
+        ids = []
+        for batch in x.iter_batches(batch_size=None, prefetch_batches=0):
+            time.sleep(delay)
+            ids.extend(batch["id"])
+        return ids
+
+    # Run multiple epochs to test that the queues are reset between epochs.
+    for _ in range(2):
+        fast, slow = ray.get([consume.remote(i1, 0), consume.remote(i2, 0.2)])
+        assert sorted(fast + slow) == list(range(100))
+        # The fast consumer steals the blocks of the slow consumer.
+        assert len(fast) > len(slow)
+
+    with pytest.raises(ValueError):
+        ds.streaming_split(2, equal=True, work_stealing=True)
+
+
 def test_streaming_split_error_propagation(
     ray_start_10_cpus_shared, restore_data_context
 ):
@@ -0,0 +1,201 @@
+import os
+import threading
+import uuid
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import ray
+from ray.data._internal.write_checkpoint import (
+    WriteCheckpoint,
+    compute_write_fingerprint,
+)
+from ray.data.block import BlockAccessor
+from ray.data.context import DataContext
+from ray.data.datasource import Datasink, WriteResult
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+class ParquetFilesDatasink(Datasink):
+    def __init__(self, path):
+        self.path = path
+        self.write_result = None
+
+    def on_write_start(self):
+        os.makedirs(self.path, exist_ok=True)
+
+    def write(self, blocks, ctx):
+        for block in blocks:
+            table = BlockAccessor.for_block(block).to_arrow()
+            pq.write_table(table, os.path.join(self.path, f"{uuid.uuid4()}.parquet"))
+
+    def on_write_complete(self, write_result_blocks):
+        self.write_result = super().on_write_complete(write_result_blocks)
+        return self.write_result
+
+
+def _read_ids(path):
+    return sorted(pq.read_table(path)["id"].to_pylist())
+
+
+def test_write_checkpoint_records(tmp_path):
+    checkpoint = WriteCheckpoint(str(tmp_path), "fingerprint")
+    assert not checkpoint.is_committed()
+    assert checkpoint.load_records() == []
+
+    checkpoint.record_task(["a", "b"], WriteResult(num_rows=10, size_bytes=100))
+    records = checkpoint.load_records()
+    assert [record["read_task_keys"] for record in records] == [["a", "b"]]
+    [block] = checkpoint.get_write_result_blocks(records)
+    assert block["write_result"].iloc[0] == WriteResult(num_rows=10, size_bytes=100)
+
+    checkpoint.commit()
+    assert checkpoint.is_committed()
+
+    # Checkpoints of other writes under the same path are separate.
+    other_checkpoint = WriteCheckpoint(str(tmp_path), "other-fingerprint")
+    assert not other_checkpoint.is_committed()
+    assert other_checkpoint.load_records() == []
+
+
+def _fingerprint(ds, path):
+    return compute_write_fingerprint(
+        ds._logical_plan.dag, ParquetFilesDatasink(str(path))
+    )
+
+
+def test_write_fingerprint(ray_start_regular_shared, tmp_path):
+    ds = ray.data.range(10).map_batches(lambda batch: batch)
+    assert _fingerprint(ds, tmp_path) == _fingerprint(ds, tmp_path)
+    # The fingerprint depends on the datasink, the datasource, and the UDFs.
+    assert _fingerprint(ds, tmp_path) != _fingerprint(ds, tmp_path / "other")
+    assert _fingerprint(ds, tmp_path) != _fingerprint(
+        ray.data.range(20).map_batches(lambda batch: batch), tmp_path
+    )
+    assert _fingerprint(ds, tmp_path) != _fingerprint(
+        ray.data.range(10).map_batches(lambda batch: batch.copy()), tmp_path
+    )
+
+
+def test_write_fingerprint_udf_constants(ray_start_regular_shared, tmp_path):
+    # UDFs with the same bytecode, but different constants or closures.
+    def double(batch):
+        return {"id": batch["id"] * 2}
+
+    def triple(batch):
+        return {"id": batch["id"] * 3}
+
+    assert _fingerprint(ray.data.range(10).map_batches(double), tmp_path) != (
+        _fingerprint(ray.data.range(10).map_batches(triple), tmp_path)
+    )
+
+    def multiply(factor):
+        return lambda batch: {"id": batch["id"] * factor}
+
+    assert _fingerprint(ray.data.range(10).map_batches(multiply(2)), tmp_path) == (
+        _fingerprint(ray.data.range(10).map_batches(multiply(2)), tmp_path)
+    )
+    assert _fingerprint(ray.data.range(10).map_batches(multiply(2)), tmp_path) != (
+        _fingerprint(ray.data.range(10).map_batches(multiply(3)), tmp_path)
+    )
+
+
+def test_write_fingerprint_udf_args(ray_start_regular_shared, tmp_path):
+    def multiply(batch, factor):
+        return {"id": batch["id"] * factor}
+
+    def fingerprint(factor):
+        ds = ray.data.range(10).map_batches(multiply, fn_kwargs={"factor": factor})
+        return _fingerprint(ds, tmp_path)
+
+    assert fingerprint(2) == fingerprint(2)
+    assert fingerprint(2) != fingerprint(3)
+
+    # Writes with arguments that can't be fingerprinted aren't checkpointed.
+    lock = threading.Lock()
+    ds = ray.data.range(10).map_batches(multiply, fn_kwargs={"factor": lock})
+    with pytest.raises(ValueError, match="can't be checkpointed"):
+        _fingerprint(ds, tmp_path)
+
+
+def test_write_fingerprint_modified_inputs(ray_start_regular_shared, tmp_path):
+    input_path = os.path.join(tmp_path, "input")
+    os.makedirs(input_path)
+    for i in range(2):
+        pq.write_table(pa.table({"id": [i]}), os.path.join(input_path, f"{i}.parquet"))
+
+    fingerprint = _fingerprint(ray.data.read_parquet(input_path), tmp_path)
+    assert fingerprint == _fingerprint(ray.data.read_parquet(input_path), tmp_path)
+    assert fingerprint != _fingerprint(
+        ray.data.read_parquet(input_path, columns=["id"]), tmp_path
+    )
+
+    # Rewriting an input file changes the fingerprint.
+    pq.write_table(pa.table({"id": [0, 1, 2]}), os.path.join(input_path, "0.parquet"))
+    assert fingerprint != _fingerprint(ray.data.read_parquet(input_path), tmp_path)
+
+
+def test_write_checkpoint_resume(
+    ray_start_regular_shared, tmp_path, restore_data_context
+):
+    output_path = os.path.join(tmp_path, "output")
+    marker_path = os.path.join(tmp_path, "fail")
+    DataContext.get_current().write_checkpoint_path = os.path.join(
+        tmp_path, "checkpoint"
+    )
+
+    def fail_once(batch):
+        if 7 in batch["id"] and os.path.exists(marker_path):
+            raise RuntimeError("Failing the write")
+        return batch
+
+    ds = ray.data.range(10, override_num_blocks=10).map_batches(fail_once)
+
+    # The first run fails, but the completed write tasks are checkpointed.
+    open(marker_path, "w").close()
+    with pytest.raises(Exception):
+        ds.write_datasink(ParquetFilesDatasink(output_path))
+    assert 7 not in _read_ids(output_path)
+
+    # The rerun only writes the remaining rows, but completes with the results of
+    # both runs.
+    os.remove(marker_path)
+    datasink = ParquetFilesDatasink(output_path)
+    ds.write_datasink(datasink)
+    assert datasink.write_result.num_rows == 10
+    assert _read_ids(output_path) == list(range(10))
+
+    # Reruns of a completed write are skipped.
+    datasink = ParquetFilesDatasink(output_path)
+    ds.write_datasink(datasink)
+    assert datasink.write_result is None
+    assert _read_ids(output_path) == list(range(10))
+
+    # Other writes with the same checkpoint path aren't skipped.
+    other_output_path = os.path.join(tmp_path, "other_output")
+    datasink = ParquetFilesDatasink(other_output_path)
+    ray.data.range(10, override_num_blocks=10).write_datasink(datasink)
+    assert datasink.write_result.num_rows == 10
+    assert _read_ids(other_output_path) == list(range(10))
+
+
+def test_write_checkpoint_unsupported(
+    ray_start_regular_shared, tmp_path, restore_data_context
+):
+    DataContext.get_current().write_checkpoint_path = str(tmp_path)
+
+    ds = ray.data.from_arrow(pa.table({"id": list(range(10))}))
+    with pytest.raises(ValueError, match="can only be checkpointed"):
+        ds.write_parquet(os.path.join(tmp_path, "output"))
+
+    ds = ray.data.range(10).random_shuffle()
+    with pytest.raises(ValueError, match="can only be checkpointed"):
+        ds.write_parquet(os.path.join(tmp_path, "output"))
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
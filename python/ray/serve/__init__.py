@@ -14,6 +14,7 @@ try:
         get_replica_context,
         ingress,
         multiplexed,
+        prefetch_multiplexed_models,
         run,
         shutdown,
         start,
@@ -51,6 +52,7 @@ __all__ = [
     "Deployment",
     "multiplexed",
     "get_multiplexed_model_id",
+    "prefetch_multiplexed_models",
     "status",
     "get_app_handle",
     "get_deployment_handle",
@@ -1,7 +1,9 @@
+import inspect
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from typing import Callable, Deque, Dict, List, Optional, Set
 
 from ray.serve._private.common import (
     DeploymentHandleSource,
@@ -19,6 +21,19 @@ from ray.serve._private.utils import get_capacity_adjusted_num_replicas
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
+# The number of recent replica startups whose average latency is passed to
+# autoscaling policies.
+NUM_REPLICA_STARTUP_LATENCIES_TO_AVERAGE = 10
+
+
+def policy_accepts_replica_startup_latency(policy: Callable) -> bool:
+    """Whether an autoscaling policy takes the replica startup latency.
+
+    It's only passed to the policies that declare it, so that policies written
+    before it was added keep working.
+    """
+    return "replica_startup_latency_s" in inspect.signature(policy).parameters
+
 
 @dataclass
 class HandleMetricReport:
@@ -99,6 +114,11 @@ class AutoscalingState:
         self._running_replicas: List[ReplicaID] = []
         self._target_capacity: Optional[float] = None
         self._target_capacity_direction: Optional[TargetCapacityDirection] = None
+        # The latencies of the most recent replica startups, from when they were
+        # requested until they were running.
+        self._replica_startup_latencies_s: Deque[float] = deque(
+            maxlen=NUM_REPLICA_STARTUP_LATENCIES_TO_AVERAGE
+        )
 
     def register(self, info: DeploymentInfo, curr_target_num_replicas: int) -> int:
         """Registers an autoscaling deployment's info.
@@ -117,6 +137,9 @@ class AutoscalingState:
         self._deployment_info = info
         self._config = config
         self._policy = self._config.get_policy()
+        self._policy_accepts_replica_startup_latency = (
+            policy_accepts_replica_startup_latency(self._policy)
+        )
         self._target_capacity = info.target_capacity
         self._target_capacity_direction = info.target_capacity_direction
         self._policy_state = {}
@@ -127,6 +150,18 @@ class AutoscalingState:
         if replica_id in self._replica_requests:
             del self._replica_requests[replica_id]
 
+    def record_replica_startup_latency(self, latency_s: float):
+        self._replica_startup_latencies_s.append(latency_s)
+
+    def get_replica_startup_latency_s(self) -> Optional[float]:
+        """The average latency of the recent replica startups, if any."""
+        if len(self._replica_startup_latencies_s) == 0:
+            return None
+
+        return sum(self._replica_startup_latencies_s) / len(
+            self._replica_startup_latencies_s
+        )
+
     def get_num_replicas_lower_bound(self) -> int:
         if self._config.initial_replicas is not None and (
             self._target_capacity_direction == TargetCapacityDirection.UP
@@ -271,6 +306,12 @@ class AutoscalingState:
         `_skip_bound_check` is True, then the bounds are not applied.
         """
 
+        policy_kwargs = {}
+        if self._policy_accepts_replica_startup_latency:
+            policy_kwargs[
+                "replica_startup_latency_s"
+            ] = self.get_replica_startup_latency_s()
+
         decision_num_replicas = self._policy(
             curr_target_num_replicas=curr_target_num_replicas,
             total_num_requests=self.get_total_num_requests(),
@@ -279,6 +320,7 @@ class AutoscalingState:
             capacity_adjusted_min_replicas=self.get_num_replicas_lower_bound(),
             capacity_adjusted_max_replicas=self.get_num_replicas_upper_bound(),
             policy_state=self._policy_state,
+            **policy_kwargs,
         )
 
         if _skip_bound_check:
@@ -358,6 +400,13 @@ class AutoscalingStateManager:
         if deployment_id in self._autoscaling_states:
             self._autoscaling_states[deployment_id].on_replica_stopped(replica_id)
 
+    def record_replica_startup_latency(self, replica_id: ReplicaID, latency_s: float):
+        deployment_id = replica_id.deployment_id
+        if deployment_id in self._autoscaling_states:
+            self._autoscaling_states[deployment_id].record_replica_startup_latency(
+                latency_s
+            )
+
     def get_metrics(self) -> Dict[DeploymentID, float]:
         return {
             deployment_id: self.get_total_num_requests(deployment_id)
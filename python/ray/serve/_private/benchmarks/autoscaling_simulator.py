@@ -0,0 +1,251 @@
+"""Replays recorded traffic against autoscaling policies to evaluate them offline.
+
+The trace is a CSV file with a `timestamp_s` and a `num_requests` column: the
+number of ongoing (queued and running) requests to the deployment over time,
+e.g., exported from the `serve_deployment_queued_queries` and
+`serve_num_ongoing_requests_at_replicas` metrics.
+
+The simulation steps through the trace every `CONTROL_LOOP_INTERVAL_S`, like the
+controller. Like the handles, it reports the average number of requests over the
+last `look_back_period_s` every `metrics_interval_s`. Replicas start running
+`replica_startup_latency_s` after they're added, and are removed immediately.
+The number of requests in the trace doesn't depend on the number of replicas,
+i.e., the simulation doesn't model the feedback of overload on the traffic.
+"""
+
+import csv
+import inspect
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, List, Tuple
+
+import click
+
+from ray._private.utils import import_attr
+from ray.serve._private.autoscaling_state import policy_accepts_replica_startup_latency
+from ray.serve._private.constants import CONTROL_LOOP_INTERVAL_S
+from ray.serve.config import AutoscalingConfig
+
+
+@dataclass
+class SimulationResult:
+    target_ongoing_requests: float
+    step_s: float
+    num_requests: List[float] = field(default_factory=list)
+    num_running_replicas: List[int] = field(default_factory=list)
+    target_num_replicas: List[int] = field(default_factory=list)
+
+    @property
+    def replica_hours(self) -> float:
+        """The total time the replicas were running for."""
+        return sum(self.num_running_replicas) * self.step_s / 3600
+
+    @property
+    def overloaded_fraction(self) -> float:
+        """The fraction of the time the running replicas had more requests than
+        their target."""
+        if len(self.num_requests) == 0:
+            return 0.0
+
+        num_overloaded_steps = sum(
+            num_requests > num_replicas * self.target_ongoing_requests
+            for num_requests, num_replicas in zip(
+                self.num_requests, self.num_running_replicas
+            )
+        )
+        return num_overloaded_steps / len(self.num_requests)
+
+    @property
+    def mean_excess_requests(self) -> float:
+        """The average number of requests beyond the target of the running
+        replicas."""
+        if len(self.num_requests) == 0:
+            return 0.0
+
+        return sum(
+            max(0, num_requests - num_replicas * self.target_ongoing_requests)
+            for num_requests, num_replicas in zip(
+                self.num_requests, self.num_running_replicas
+            )
+        ) / len(self.num_requests)
+
+
+def load_traffic_trace(path: str) -> List[Tuple[float, float]]:
+    """Loads a trace of (timestamp_s, num_requests) from a CSV file."""
+    with open(path, newline="") as f:
+        trace = [
+            (float(row["timestamp_s"]), float(row["num_requests"]))
+            for row in csv.DictReader(f)
+        ]
+
+    return sorted(trace)
+
+
+def simulate_autoscaling_policy(
+    policy: Callable,
+    config: AutoscalingConfig,
+    trace: List[Tuple[float, float]],
+    *,
+    replica_startup_latency_s: float,
+    step_s: float = CONTROL_LOOP_INTERVAL_S,
+) -> SimulationResult:
+    """Replays a traffic trace against an autoscaling policy.
+
+    Args:
+        policy: The autoscaling policy, with the same signature as
+            `replica_queue_length_autoscaling_policy`.
+        config: The autoscaling config of the deployment.
+        trace: The number of ongoing requests over time, as (timestamp_s,
+            num_requests) tuples in time order.
+        replica_startup_latency_s: How long replicas take to start.
+        step_s: How often the policy is called.
+    """
+    assert len(trace) > 0, "The trace is empty."
+
+    policy_params = inspect.signature(policy).parameters
+    policy_kwargs = {}
+    if policy_accepts_replica_startup_latency(policy):
+        policy_kwargs["replica_startup_latency_s"] = replica_startup_latency_s
+
+    result = SimulationResult(
+        target_ongoing_requests=config.get_target_ongoing_requests(),
+        step_s=step_s,
+    )
+    policy_state = {}
+    target_num_replicas = (
+        config.initial_replicas
+        if config.initial_replicas is not None
+        else config.min_replicas
+    )
+    num_running_replicas = target_num_replicas
+    # The times at which the starting replicas will be running, in order.
+    starting_replica_ready_times_s: Deque[float] = deque()
+
+    # The samples of the number of requests in the look-back period.
+    look_back_samples: Deque[Tuple[float, float]] = deque()
+    reported_num_requests = 0.0
+    next_report_time_s = trace[0][0]
+
+    trace_index = 0
+    num_steps = math.floor((trace[-1][0] - trace[0][0]) / step_s) + 1
+    for step in range(num_steps):
+        curr_time_s = trace[0][0] + step * step_s
+        while trace_index + 1 < len(trace) and trace[trace_index + 1][0] <= curr_time_s:
+            trace_index += 1
+        num_requests = trace[trace_index][1]
+
+        look_back_samples.append((curr_time_s, num_requests))
+        while curr_time_s - look_back_samples[0][0] > config.look_back_period_s:
+            look_back_samples.popleft()
+        if curr_time_s >= next_report_time_s:
+            reported_num_requests = sum(n for _, n in look_back_samples) / len(
+                look_back_samples
+            )
+            next_report_time_s += config.metrics_interval_s
+
+        while (
+            len(starting_replica_ready_times_s) > 0
+            and starting_replica_ready_times_s[0] <= curr_time_s
+        ):
+            starting_replica_ready_times_s.popleft()
+            num_running_replicas += 1
+
+        if "curr_time_s" in policy_params:
+            policy_kwargs["curr_time_s"] = curr_time_s
+        target_num_replicas = policy(
+            curr_target_num_replicas=target_num_replicas,
+            total_num_requests=reported_num_requests,
+            num_running_replicas=num_running_replicas,
+            config=config,
+            capacity_adjusted_min_replicas=config.min_replicas,
+            capacity_adjusted_max_replicas=config.max_replicas,
+            policy_state=policy_state,
+            **policy_kwargs,
+        )
+        target_num_replicas = max(
+            config.min_replicas, min(config.max_replicas, target_num_replicas)
+        )
+
+        num_replicas = num_running_replicas + len(starting_replica_ready_times_s)
+        for _ in range(target_num_replicas - num_replicas):
+            starting_replica_ready_times_s.append(
+                curr_time_s + replica_startup_latency_s
+            )
+        for _ in range(num_replicas - target_num_replicas):
+            # Stop the replicas that are still starting first.
+            if len(starting_replica_ready_times_s) > 0:
+                starting_replica_ready_times_s.pop()
+            else:
+                num_running_replicas -= 1
+
+        result.num_requests.append(num_requests)
+        result.num_running_replicas.append(num_running_replicas)
+        result.target_num_replicas.append(target_num_replicas)
+
+    return result
+
+
+@click.command(help="Replay a traffic trace against Serve autoscaling policies.")
+@click.option(
+    "--trace",
+    "trace_path",
+    required=True,
+    help="CSV file with `timestamp_s` and `num_requests` columns.",
+)
+@click.option(
+    "--policy",
+    "policies",
+    multiple=True,
+    default=[
+        "ray.serve.autoscaling_policy:replica_queue_length_autoscaling_policy",
+        "ray.serve.autoscaling_policy:predictive_autoscaling_policy",
+    ],
+    help="Import path of a policy to evaluate. Can be passed multiple times.",
+)
+@click.option(
+    "--replica-startup-latency-s",
+    type=float,
+    default=30.0,
+    help="How long replicas take to start.",
+)
+@click.option("--min-replicas", type=int, default=1)
+@click.option("--max-replicas", type=int, default=100)
+@click.option("--target-ongoing-requests", type=float, default=2.0)
+@click.option("--upscale-delay-s", type=float, default=30.0)
+@click.option("--downscale-delay-s", type=float, default=600.0)
+def main(
+    trace_path: str,
+    policies: Tuple[str],
+    replica_startup_latency_s: float,
+    min_replicas: int,
+    max_replicas: int,
+    target_ongoing_requests: float,
+    upscale_delay_s: float,
+    downscale_delay_s: float,
+):
+    trace = load_traffic_trace(trace_path)
+    config = AutoscalingConfig(
+        min_replicas=min_replicas,
+        max_replicas=max_replicas,
+        target_ongoing_requests=target_ongoing_requests,
+        upscale_delay_s=upscale_delay_s,
+        downscale_delay_s=downscale_delay_s,
+    )
+
+    for policy_path in policies:
+        result = simulate_autoscaling_policy(
+            import_attr(policy_path),
+            config,
+            trace,
+            replica_startup_latency_s=replica_startup_latency_s,
+        )
+        print(
+            f"{policy_path}: {result.replica_hours:.2f} replica hours, overloaded "
+            f"{100 * result.overloaded_fraction:.1f}% of the time, "
+            f"{result.mean_excess_requests:.2f} excess requests on average."
+        )
+
+
+if __name__ == "__main__":
+    main()
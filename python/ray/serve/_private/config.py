@@ -27,13 +27,20 @@ from ray.serve._private.constants import (
     MAX_REPLICAS_PER_NODE_MAX_VALUE,
 )
 from ray.serve._private.utils import DEFAULT, DeploymentOptionUpdateType
-from ray.serve.config import AutoscalingConfig
+from ray.serve.config import (
+    AutoscalingConfig,
+    ReplicaSelectionPolicy,
+    ResponseCacheConfig,
+)
 from ray.serve.generated.serve_pb2 import AutoscalingConfig as AutoscalingConfigProto
 from ray.serve.generated.serve_pb2 import DeploymentConfig as DeploymentConfigProto
 from ray.serve.generated.serve_pb2 import DeploymentLanguage
 from ray.serve.generated.serve_pb2 import EncodingType as EncodingTypeProto
 from ray.serve.generated.serve_pb2 import LoggingConfig as LoggingConfigProto
 from ray.serve.generated.serve_pb2 import ReplicaConfig as ReplicaConfigProto
+from ray.serve.generated.serve_pb2 import (
+    ResponseCacheConfig as ResponseCacheConfigProto,
+)
 from ray.util.placement_group import validate_placement_group
 
 
@@ -107,6 +114,10 @@ class DeploymentConfig(BaseModel):
             unhealthy.
         autoscaling_config: Autoscaling configuration.
         logging_config: Configuration for deployment logs.
+        replica_selection_policy: How callers choose between the candidate
+            replicas of the deployment.
+        response_cache_config: Config of the response cache in the callers of the
+            deployment. If None, responses aren't cached.
         user_configured_option_names: The names of options manually
             configured by the user.
     """
@@ -166,6 +177,16 @@ class DeploymentConfig(BaseModel):
         update_type=DeploymentOptionUpdateType.NeedsActorReconfigure,
     )
 
+    replica_selection_policy: ReplicaSelectionPolicy = Field(
+        default=ReplicaSelectionPolicy.QUEUE_LEN,
+        update_type=DeploymentOptionUpdateType.LightWeight,
+    )
+
+    response_cache_config: Optional[ResponseCacheConfig] = Field(
+        default=None,
+        update_type=DeploymentOptionUpdateType.LightWeight,
+    )
+
     # Contains the names of deployment options manually set by the user
     user_configured_option_names: Set[str] = set()
 
@@ -232,9 +253,14 @@ class DeploymentConfig(BaseModel):
                 )
 
             data["logging_config"] = LoggingConfigProto(**data["logging_config"])
+        if data.get("response_cache_config"):
+            data["response_cache_config"] = ResponseCacheConfigProto(
+                **data["response_cache_config"]
+            )
         data["user_configured_option_names"] = list(
             data["user_configured_option_names"]
         )
+        data["replica_selection_policy"] = data["replica_selection_policy"].value
         return DeploymentConfigProto(**data)
 
     def to_proto_bytes(self):
@@ -284,6 +310,13 @@ class DeploymentConfig(BaseModel):
                 data["logging_config"]["encoding"] = EncodingTypeProto.Name(
                     data["logging_config"]["encoding"]
                 )
+        if "response_cache_config" in data:
+            data["response_cache_config"] = ResponseCacheConfig(
+                **data["response_cache_config"]
+            )
+        if not data.get("replica_selection_policy"):
+            # Unset by older versions and by Java.
+            data["replica_selection_policy"] = ReplicaSelectionPolicy.QUEUE_LEN
 
         return cls(**data)
 
@@ -248,6 +248,14 @@ RAY_SERVE_MULTIPLEXED_MODEL_ID_MATCHING_TIMEOUT_S = float(
     os.environ.get("RAY_SERVE_MULTIPLEXED_MODEL_ID_MATCHING_TIMEOUT_S", "1")
 )
 
+# How long a router keeps sending the requests for a multiplexed model ID to the
+# replica that it sent the first request for it to, before the replica reports the
+# model ID as loading or loaded. This avoids loading the model on several replicas
+# at once. The unit is second.
+RAY_SERVE_MULTIPLEXED_MODEL_LOAD_ROUTING_TIMEOUT_S = float(
+    os.environ.get("RAY_SERVE_MULTIPLEXED_MODEL_LOAD_ROUTING_TIMEOUT_S", "10")
+)
+
 # Enable memray in all Serve actors.
 RAY_SERVE_ENABLE_MEMORY_PROFILING = (
     os.environ.get("RAY_SERVE_ENABLE_MEMORY_PROFILING", "0") == "1"
@@ -301,6 +309,13 @@ RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S = float(
     os.environ.get("RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S", 10.0)
 )
 
+# Time constant of the decay of the peak-EWMA of the request latencies of each
+# replica, used by the "peak_ewma" replica selection policy. A latency spike is taken
+# into account immediately, and its weight decays by a factor of e over this period.
+RAY_SERVE_REPLICA_LATENCY_EWMA_DECAY_S = float(
+    os.environ.get("RAY_SERVE_REPLICA_LATENCY_EWMA_DECAY_S", 5.0)
+)
+
 # The default autoscaling policy to use if none is specified.
 DEFAULT_AUTOSCALING_POLICY = "ray.serve.autoscaling_policy:default_autoscaling_policy"
 
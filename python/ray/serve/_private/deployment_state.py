@@ -2011,6 +2011,12 @@ class DeploymentState:
                         f"{replica.initialization_latency_s:.1f}s."
                     )
                 logger.info(replica_startup_message, extra={"log_to_stderr": False})
+                if original_state == ReplicaState.STARTING:
+                    # Updated and recovered replicas don't show how long it takes
+                    # to add new ones.
+                    self._autoscaling_state_manager.record_replica_startup_latency(
+                        replica.replica_id, e2e_replica_start_latency
+                    )
 
             elif start_status == ReplicaStartupStatus.FAILED:
                 # Replica reconfigure (deploy / upgrade) failed
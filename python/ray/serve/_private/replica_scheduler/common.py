@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import math
+import threading
 import time
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Set
@@ -7,6 +9,7 @@ from typing import Any, Callable, Dict, List, Optional, Set
 from ray.serve._private.common import ReplicaID, RequestMetadata
 from ray.serve._private.constants import (
     RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S,
+    RAY_SERVE_REPLICA_LATENCY_EWMA_DECAY_S,
     SERVE_LOGGER_NAME,
 )
 
@@ -74,3 +77,74 @@ class ReplicaQueueLengthCache:
         for replica_id in list(self._cache.keys()):
             if replica_id not in active_replica_ids:
                 self._cache.pop(replica_id)
+
+
+@dataclass(frozen=True)
+class ReplicaLatencyEntry:
+    ewma_latency_s: float
+    timestamp: float
+
+
+class ReplicaLatencyTracker:
+    """Tracks a peak-EWMA of the latency of the requests to each replica.
+
+    A latency above the current average replaces it immediately, so a replica that
+    slows down is penalized right away. Lower latencies are averaged in with a
+    weight that grows with the time since the last one, so the average decays
+    towards them with a time constant of `decay_s`.
+
+    Latencies are recorded from the threads that complete requests, so the entries
+    are guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        *,
+        decay_s: float = RAY_SERVE_REPLICA_LATENCY_EWMA_DECAY_S,
+        get_curr_time_s: Optional[Callable[[], float]] = None,
+    ):
+        self._entries: Dict[ReplicaID, ReplicaLatencyEntry] = {}
+        self._decay_s = decay_s
+        self._get_curr_time_s = (
+            get_curr_time_s if get_curr_time_s is not None else time.time
+        )
+        self._lock = threading.Lock()
+
+    def record(self, replica_id: ReplicaID, latency_s: float):
+        """Record the latency of a request to a replica."""
+        now = self._get_curr_time_s()
+        with self._lock:
+            entry = self._entries.get(replica_id)
+            if entry is None or latency_s > entry.ewma_latency_s:
+                ewma_latency_s = latency_s
+            else:
+                elapsed_s = max(now - entry.timestamp, 0)
+                weight = math.exp(-elapsed_s / self._decay_s)
+                ewma_latency_s = entry.ewma_latency_s * weight + latency_s * (
+                    1 - weight
+                )
+            self._entries[replica_id] = ReplicaLatencyEntry(ewma_latency_s, now)
+
+    def get(self, replica_id: ReplicaID) -> Optional[float]:
+        """Get the average latency of the requests to a replica.
+
+        Replicas without any recorded latency get the mean of those of the other
+        replicas, so they're neither favored nor avoided until they're measured.
+        Returns `None` if no latency has been recorded for any replica.
+        """
+        with self._lock:
+            entry = self._entries.get(replica_id)
+            if entry is not None:
+                return entry.ewma_latency_s
+            if len(self._entries) == 0:
+                return None
+            return sum(e.ewma_latency_s for e in self._entries.values()) / len(
+                self._entries
+            )
+
+    def remove_inactive_replicas(self, *, active_replica_ids: Set[ReplicaID]):
+        """Removes entries for all replica IDs not in the provided active set."""
+        with self._lock:
+            for replica_id in list(self._entries.keys()):
+                if replica_id not in active_replica_ids:
+                    self._entries.pop(replica_id)
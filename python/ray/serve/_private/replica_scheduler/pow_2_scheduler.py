@@ -30,15 +30,18 @@ from ray.serve._private.common import (
 from ray.serve._private.constants import (
     RAY_SERVE_MAX_QUEUE_LENGTH_RESPONSE_DEADLINE_S,
     RAY_SERVE_MULTIPLEXED_MODEL_ID_MATCHING_TIMEOUT_S,
+    RAY_SERVE_MULTIPLEXED_MODEL_LOAD_ROUTING_TIMEOUT_S,
     RAY_SERVE_QUEUE_LENGTH_RESPONSE_DEADLINE_S,
     SERVE_LOGGER_NAME,
 )
 from ray.serve._private.replica_scheduler.common import (
     PendingRequest,
+    ReplicaLatencyTracker,
     ReplicaQueueLengthCache,
 )
 from ray.serve._private.replica_scheduler.replica_scheduler import ReplicaScheduler
 from ray.serve._private.replica_scheduler.replica_wrapper import ReplicaWrapper
+from ray.serve.config import ReplicaSelectionPolicy
 from ray.util import metrics
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
@@ -59,7 +62,9 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
 
     The replica responds with two items: (queue_len, accepted). Only replicas that
     accept the request are considered; between those, the one with the lower queue
-    length is chosen.
+    length is chosen. With the `PEAK_EWMA` replica selection policy, the queue
+    length is weighted by the recent request latency of each replica instead (see
+    `ReplicaLatencyTracker`).
 
     In the case when neither replica accepts the request (e.g., their queues are full),
     the procedure is repeated with backoff. This backoff repeats indefinitely until a
@@ -113,6 +118,9 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._self_availability_zone = self_availability_zone
         self._use_replica_queue_len_cache = use_replica_queue_len_cache
         self._create_replica_wrapper_func = create_replica_wrapper_func
+        self._get_curr_time_s = (
+            get_curr_time_s if get_curr_time_s is not None else time.time
+        )
 
         # Current replicas available to be scheduled.
         # Updated via `update_replicas`.
@@ -121,6 +129,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._replica_queue_len_cache = ReplicaQueueLengthCache(
             get_curr_time_s=get_curr_time_s,
         )
+        self._replica_selection_policy = ReplicaSelectionPolicy.QUEUE_LEN
+        self._replica_latency_tracker = ReplicaLatencyTracker(
+            get_curr_time_s=get_curr_time_s,
+        )
 
         # NOTE(edoakes): Python 3.10 removed the `loop` parameter to `asyncio.Event`.
         # Now, the `asyncio.Event` will call `get_running_loop` in its constructor to
@@ -144,6 +156,15 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         # Whenever there is a match, we will remove the the model id from this set.
         self._multiplexed_model_id_fallback_match: Set[str] = set()
 
+        # The replica that this router sent the first request for a multiplexed
+        # model ID to, when no replica had the model, and the time it was sent. The
+        # replica will load the model, so the following requests for it are sent
+        # there too until the replica reports the model ID, instead of starting
+        # loads of the same model on other replicas.
+        self._multiplexed_model_id_to_loading_replica_id: Dict[
+            str, Tuple[ReplicaID, float]
+        ] = {}
+
         # Tasks running the scheduling loop. The size of this set may vary over time
         # as new tasks will be scheduled when a request comes in or new replicas are
         # added, but it will not exceed self.max_num_scheduling_tasks.
@@ -272,6 +293,26 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                 replica_id, queue_len_info.num_ongoing_requests
             )
 
+    def update_replica_selection_policy(self, policy: ReplicaSelectionPolicy):
+        self._replica_selection_policy = policy
+
+    def on_request_completed(self, replica_id: ReplicaID, latency_s: float):
+        """Update the latency of the replica with a completed request."""
+        if self._replica_selection_policy == ReplicaSelectionPolicy.PEAK_EWMA:
+            self._replica_latency_tracker.record(replica_id, latency_s)
+
+    def _get_replica_score(self, replica_id: ReplicaID, queue_len: int) -> float:
+        """Get the score of a candidate replica; the lowest score is chosen.
+
+        With the `PEAK_EWMA` policy, this is the expected time for the replica to
+        drain its queue and serve one more request. Otherwise, it's the queue length.
+        """
+        if self._replica_selection_policy == ReplicaSelectionPolicy.PEAK_EWMA:
+            latency_s = self._replica_latency_tracker.get(replica_id)
+            if latency_s is not None:
+                return (queue_len + 1) * latency_s
+        return queue_len
+
     def update_replicas(self, replicas: List[ReplicaWrapper]):
         """Update the set of available replicas to be considered for scheduling.
 
@@ -325,14 +366,66 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._multiplexed_model_id_to_replica_ids = (
             new_multiplexed_model_id_to_replica_ids
         )
+        # Stop tracking the model loads that the replicas have reported, or whose
+        # replicas are gone.
+        for model_id, (replica_id, _) in list(
+            self._multiplexed_model_id_to_loading_replica_id.items()
+        ):
+            if (
+                replica_id not in new_replica_id_set
+                or replica_id
+                in new_multiplexed_model_id_to_replica_ids.get(model_id, set())
+            ):
+                del self._multiplexed_model_id_to_loading_replica_id[model_id]
         self._replica_queue_len_cache.remove_inactive_replicas(
             active_replica_ids=new_replica_id_set
         )
+        self._replica_latency_tracker.remove_inactive_replicas(
+            active_replica_ids=new_replica_id_set
+        )
         # Populate cache for new replicas
         self._event_loop.create_task(self._probe_queue_lens(replicas_to_ping, 0))
         self._replicas_updated_event.set()
         self.maybe_start_scheduling_tasks()
 
+    def _get_replica_ids_loading_multiplexed_model(
+        self, model_id: str
+    ) -> Set[ReplicaID]:
+        """Get the replica that this router sent a request for the model ID to that
+        will load the model, if any (see `_record_multiplexed_model_load`)."""
+        entry = self._multiplexed_model_id_to_loading_replica_id.get(model_id)
+        if entry is None:
+            return set()
+
+        replica_id, assigned_time_s = entry
+        if (
+            replica_id not in self._replica_id_set
+            or self._get_curr_time_s() - assigned_time_s
+            > RAY_SERVE_MULTIPLEXED_MODEL_LOAD_ROUTING_TIMEOUT_S
+        ):
+            del self._multiplexed_model_id_to_loading_replica_id[model_id]
+            return set()
+        return {replica_id}
+
+    def _record_multiplexed_model_load(
+        self, request_metadata: Optional[RequestMetadata], replica: ReplicaWrapper
+    ):
+        """Record that a request for a multiplexed model ID was sent to a replica
+        that isn't known to have the model, so the replica will load it."""
+        if request_metadata is None or not request_metadata.multiplexed_model_id:
+            return
+
+        model_id = request_metadata.multiplexed_model_id
+        if (
+            replica.replica_id
+            not in self._multiplexed_model_id_to_replica_ids.get(model_id, set())
+            and model_id not in self._multiplexed_model_id_to_loading_replica_id
+        ):
+            self._multiplexed_model_id_to_loading_replica_id[model_id] = (
+                replica.replica_id,
+                self._get_curr_time_s(),
+            )
+
     def _get_replica_ids_with_fewest_multiplexed_models(self) -> Set[str]:
         """Get the set of replicas that have the fewest multiplexed models loaded."""
         candidates = set()
@@ -417,6 +510,14 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                                 request_metadata.multiplexed_model_id, None
                             )
                         )
+                        if not candidate_replica_ids:
+                            # The model may be loading on a replica that hasn't
+                            # reported it yet.
+                            candidate_replica_ids = (
+                                self._get_replica_ids_loading_multiplexed_model(
+                                    request_metadata.multiplexed_model_id
+                                )
+                            )
                         if (
                             not candidate_replica_ids
                             and request_metadata.multiplexed_model_id
@@ -629,9 +730,9 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         present in the cache, the replica will be actively probed and the cache updated.
 
         Among replicas that respond within the deadline and don't have full queues, the
-        one with the lowest queue length is chosen.
+        one with the lowest score is chosen (see `_get_replica_score`).
         """
-        lowest_queue_len = math.inf
+        lowest_score = math.inf
         chosen_replica_id: Optional[str] = None
         not_in_cache: List[ReplicaWrapper] = []
         if self._use_replica_queue_len_cache:
@@ -643,8 +744,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                 # cache entries expire.
                 if queue_len is None or queue_len >= r.max_ongoing_requests:
                     not_in_cache.append(r)
-                elif queue_len < lowest_queue_len:
-                    lowest_queue_len = queue_len
+                    continue
+                score = self._get_replica_score(r.replica_id, queue_len)
+                if score < lowest_score:
+                    lowest_score = score
                     chosen_replica_id = r.replica_id
         else:
             not_in_cache = candidates
@@ -660,8 +763,11 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                     # None is returned if we failed to get the queue len.
                     continue
 
-                if queue_len < r.max_ongoing_requests and queue_len < lowest_queue_len:
-                    lowest_queue_len = queue_len
+                if queue_len >= r.max_ongoing_requests:
+                    continue
+                score = self._get_replica_score(r.replica_id, queue_len)
+                if score < lowest_score:
+                    lowest_score = score
                     chosen_replica_id = r.replica_id
         elif len(not_in_cache) > 0:
             # If there are replicas without a valid cache entry, probe them in the
@@ -709,6 +815,9 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         if matched_pending_request is not None:
             matched_pending_request.future.set_result(replica)
             self._pending_requests_to_fulfill.remove(matched_pending_request)
+            self._record_multiplexed_model_load(
+                matched_pending_request.metadata, replica
+            )
             return
 
         # If no pending request matches the request metadata, fulfill the next in the
@@ -717,6 +826,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
             pr = self._pending_requests_to_fulfill.popleft()
             if not pr.future.done():
                 pr.future.set_result(replica)
+                self._record_multiplexed_model_load(pr.metadata, replica)
                 break
 
     def _get_next_pending_request_metadata_to_schedule(
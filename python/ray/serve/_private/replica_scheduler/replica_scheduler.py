@@ -7,6 +7,7 @@ from ray.serve._private.replica_scheduler.common import (
     ReplicaQueueLengthCache,
 )
 from ray.serve._private.replica_scheduler.replica_wrapper import ReplicaWrapper
+from ray.serve.config import ReplicaSelectionPolicy
 
 
 class ReplicaScheduler(ABC):
@@ -42,6 +43,17 @@ class ReplicaScheduler(ABC):
     def on_replica_actor_unavailable(self, replica_id: ReplicaID):
         pass
 
+    def update_replica_selection_policy(self, policy: ReplicaSelectionPolicy):
+        """Set how to choose between candidate replicas, if supported."""
+        pass
+
+    def on_request_completed(self, replica_id: ReplicaID, latency_s: float):
+        """Called with the latency of each request that a replica completed.
+
+        This may be called from a thread other than the scheduler's event loop.
+        """
+        pass
+
     @property
     @abstractmethod
     def replica_queue_len_cache(self) -> ReplicaQueueLengthCache:
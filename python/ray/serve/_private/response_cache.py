@@ -0,0 +1,347 @@
+import asyncio
+import concurrent.futures
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple, Union
+
+import ray
+from ray.exceptions import RayError
+from ray.experimental import get_local_object_locations
+from ray.serve._private.common import DeploymentID, RequestMetadata
+from ray.serve._private.replica_result import ReplicaResult
+from ray.serve._private.utils import calculate_remaining_timeout
+from ray.serve.config import ResponseCacheConfig
+from ray.util import metrics
+
+
+def _get_object_size_bytes(object_ref: ray.ObjectRef) -> Optional[int]:
+    """Return the size of a completed object, as known by its owner (this worker)."""
+    locations = get_local_object_locations([object_ref])
+    return locations.get(object_ref, {}).get("object_size")
+
+
+class CachedReplicaResult(ReplicaResult):
+    """The result of a unary request, shared by all requests with its cache key.
+
+    The underlying result is resolved to its object ref once, by the cache, and the
+    callers only ever get the object ref, so that they don't contend for the
+    underlying result. A shared request isn't cancelled when one of its callers is.
+    """
+
+    def __init__(self, replica_result: ReplicaResult):
+        self._replica_result = replica_result
+        self._object_ref_future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def _set_object_ref(self, object_ref: ray.ObjectRef):
+        self._object_ref_future.set_result(object_ref)
+
+    def _set_exception(self, e: BaseException):
+        self._object_ref_future.set_exception(e)
+
+    def get(self, timeout_s: Optional[float]):
+        start_time_s = time.time()
+        object_ref = self.to_object_ref(timeout_s=timeout_s)
+        remaining_timeout_s = calculate_remaining_timeout(
+            timeout_s=timeout_s,
+            start_time_s=start_time_s,
+            curr_time_s=time.time(),
+        )
+        return ray.get(object_ref, timeout=remaining_timeout_s)
+
+    async def get_async(self):
+        return await (await self.to_object_ref_async())
+
+    def __next__(self):
+        raise NotImplementedError("Streaming responses are never cached.")
+
+    async def __anext__(self):
+        raise NotImplementedError("Streaming responses are never cached.")
+
+    def add_done_callback(self, callback: Callable):
+        self._replica_result.add_done_callback(callback)
+
+    def cancel(self):
+        # Other callers may be waiting for the response.
+        pass
+
+    def to_object_ref(self, *, timeout_s: Optional[float] = None) -> ray.ObjectRef:
+        try:
+            return self._object_ref_future.result(timeout=timeout_s)
+        except concurrent.futures.TimeoutError:
+            raise TimeoutError("Timed out resolving to ObjectRef.") from None
+
+    async def to_object_ref_async(self) -> ray.ObjectRef:
+        return await asyncio.wrap_future(self._object_ref_future)
+
+    def to_object_ref_gen(self) -> ray.ObjectRefGenerator:
+        raise NotImplementedError("Streaming responses are never cached.")
+
+
+@dataclass
+class _ResponseCacheEntry:
+    result: CachedReplicaResult
+    expiration_time_s: float
+    # Only known once the response has completed, until then it's 0.
+    size_bytes: int = 0
+
+
+class ResponseCache:
+    """Caches the responses of a deployment in a router.
+
+    Responses are keyed by the method, the multiplexed model ID and the user-defined
+    cache key of their requests. They're reused until `ttl_s` after they were
+    requested, and the least recently used ones are evicted when the total size of
+    the completed responses exceeds `max_size_bytes`. Failed responses are dropped
+    as soon as they complete.
+
+    If `coalesce_requests` is set, a response is cached as soon as its request is
+    sent, so concurrent requests share it, and the requests that arrive while it's
+    being scheduled wait for it. Otherwise, responses are only cached once they
+    complete.
+
+    All methods must be called from the router's event loop.
+    """
+
+    def __init__(
+        self,
+        config: ResponseCacheConfig,
+        deployment_id: DeploymentID,
+        handle_id: str,
+        self_actor_id: str,
+        event_loop: asyncio.AbstractEventLoop,
+        get_curr_time_s: Optional[Callable[[], float]] = None,
+        get_object_size_bytes: Optional[
+            Callable[[ray.ObjectRef], Optional[int]]
+        ] = None,
+    ):
+        self._config = config
+        self._key_function = config.get_key_function()
+        self._event_loop = event_loop
+        self._get_curr_time_s = (
+            get_curr_time_s if get_curr_time_s is not None else time.time
+        )
+        self._get_object_size_bytes = (
+            get_object_size_bytes
+            if get_object_size_bytes is not None
+            else _get_object_size_bytes
+        )
+
+        # In least to most recently used order.
+        self._entries: "OrderedDict[Hashable, _ResponseCacheEntry]" = OrderedDict()
+        # In insertion order, which is expiration order if requests are coalesced,
+        # because the TTL is the same for all entries. Evicted entries are skipped
+        # when they're popped.
+        self._expiration_queue: Deque[Tuple[Hashable, _ResponseCacheEntry]] = deque()
+        self._total_size_bytes: int = 0
+
+        # The requests whose responses are about to be cached. The futures are set
+        # to the response once it is, or to None if the request wasn't sent.
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+        tags = {
+            "deployment": deployment_id.name,
+            "application": deployment_id.app_name,
+            "handle": handle_id,
+            "actor_id": self_actor_id,
+        }
+        tag_keys = tuple(tags.keys())
+        self._num_hits_counter = metrics.Counter(
+            "serve_response_cache_hits",
+            description=(
+                "The number of requests that got a cached response, including the "
+                "ones that shared the response of a concurrent request."
+            ),
+            tag_keys=tag_keys,
+        )
+        self._num_hits_counter.set_default_tags(tags)
+        self._num_misses_counter = metrics.Counter(
+            "serve_response_cache_misses",
+            description=(
+                "The number of cacheable requests that were sent to a replica."
+            ),
+            tag_keys=tag_keys,
+        )
+        self._num_misses_counter.set_default_tags(tags)
+        self._size_bytes_gauge = metrics.Gauge(
+            "serve_response_cache_size_bytes",
+            description="The total size of the completed cached responses.",
+            tag_keys=tag_keys,
+        )
+        self._size_bytes_gauge.set_default_tags(tags)
+
+    @property
+    def config(self) -> ResponseCacheConfig:
+        return self._config
+
+    @property
+    def total_size_bytes(self) -> int:
+        return self._total_size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_key(
+        self,
+        request_meta: RequestMetadata,
+        request_args: Union[Tuple[Any], List[Any]],
+        request_kwargs: Dict[str, Any],
+    ) -> Optional[Hashable]:
+        """Return the cache key of a request, or None if it mustn't be cached."""
+        if request_meta.is_streaming:
+            return None
+
+        key = self._key_function(*request_args, **request_kwargs)
+        if key is None:
+            return None
+
+        return (request_meta.call_method, request_meta.multiplexed_model_id, key)
+
+    async def get_or_claim(self, key: Hashable) -> Optional[ReplicaResult]:
+        """Return the cached response for the key.
+
+        If there's none, return None. If requests are coalesced, the caller must
+        then send the request and pass its result to `put`, or call `release` if it
+        isn't sent.
+        """
+        while True:
+            self._remove_expired_entries()
+            entry = self._entries.get(key)
+            if entry is not None and entry.expiration_time_s <= self._get_curr_time_s():
+                # Responses that are only cached once they complete may expire
+                # out of order.
+                self._remove_entry(key, entry)
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._num_hits_counter.inc()
+                return entry.result
+
+            in_flight_future = self._in_flight.get(key)
+            if in_flight_future is None:
+                break
+
+            # Shielded so that cancelling this request doesn't affect the others
+            # waiting for the same response.
+            result = await asyncio.shield(in_flight_future)
+            if result is not None:
+                self._num_hits_counter.inc()
+                return result
+
+            # The request we waited for wasn't sent, so look the key up again.
+
+        if self._config.coalesce_requests:
+            self._in_flight[key] = self._event_loop.create_future()
+
+        self._num_misses_counter.inc()
+        return None
+
+    def release(self, key: Hashable):
+        """Give up a key claimed by `get_or_claim` without caching a response."""
+        in_flight_future = self._in_flight.pop(key, None)
+        if in_flight_future is not None and not in_flight_future.done():
+            in_flight_future.set_result(None)
+
+    def put(self, key: Hashable, replica_result: ReplicaResult) -> ReplicaResult:
+        """Cache the result of a request that was just sent.
+
+        Returns the result to return to the caller instead of `replica_result`.
+        """
+        cached_result = CachedReplicaResult(replica_result)
+        entry = _ResponseCacheEntry(
+            result=cached_result,
+            expiration_time_s=self._get_curr_time_s() + self._config.ttl_s,
+        )
+        if self._config.coalesce_requests:
+            self._add_entry(key, entry)
+
+        in_flight_future = self._in_flight.pop(key, None)
+        if in_flight_future is not None and not in_flight_future.done():
+            in_flight_future.set_result(cached_result)
+
+        self._event_loop.create_task(
+            self._resolve_object_ref(key, entry, replica_result)
+        )
+        # The callback is called from a Ray core thread.
+        replica_result.add_done_callback(
+            lambda result: self._event_loop.call_soon_threadsafe(
+                self._on_response_completed, key, entry, result
+            )
+        )
+
+        return cached_result
+
+    async def _resolve_object_ref(
+        self,
+        key: Hashable,
+        entry: _ResponseCacheEntry,
+        replica_result: ReplicaResult,
+    ):
+        try:
+            object_ref = await replica_result.to_object_ref_async()
+        except Exception as e:
+            self._remove_entry(key, entry)
+            entry.result._set_exception(e)
+        else:
+            entry.result._set_object_ref(object_ref)
+
+    def _on_response_completed(
+        self, key: Hashable, entry: _ResponseCacheEntry, result: Union[Any, RayError]
+    ):
+        if isinstance(result, RayError):
+            self._remove_entry(key, entry)
+        else:
+            self._event_loop.create_task(self._add_completed_entry(key, entry))
+
+    async def _add_completed_entry(self, key: Hashable, entry: _ResponseCacheEntry):
+        try:
+            object_ref = await entry.result.to_object_ref_async()
+        except Exception:
+            # Already removed by `_resolve_object_ref`.
+            return
+
+        size_bytes = self._get_object_size_bytes(object_ref)
+        if size_bytes is None or size_bytes > self._config.max_size_bytes:
+            self._remove_entry(key, entry)
+            return
+
+        if self._config.coalesce_requests:
+            if self._entries.get(key) is not entry:
+                # Evicted or expired before it completed.
+                return
+        else:
+            self._add_entry(key, entry)
+
+        entry.size_bytes = size_bytes
+        self._total_size_bytes += size_bytes
+        self._remove_expired_entries()
+        while self._total_size_bytes > self._config.max_size_bytes:
+            lru_key, lru_entry = next(iter(self._entries.items()))
+            self._remove_entry(lru_key, lru_entry)
+
+        self._size_bytes_gauge.set(self._total_size_bytes)
+
+    def _add_entry(self, key: Hashable, entry: _ResponseCacheEntry):
+        existing_entry = self._entries.get(key)
+        if existing_entry is not None:
+            self._remove_entry(key, existing_entry)
+
+        self._entries[key] = entry
+        self._expiration_queue.append((key, entry))
+
+    def _remove_entry(self, key: Hashable, entry: _ResponseCacheEntry):
+        # The key may have been cached again since the entry was removed.
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+            self._total_size_bytes -= entry.size_bytes
+            self._size_bytes_gauge.set(self._total_size_bytes)
+
+    def _remove_expired_entries(self):
+        curr_time_s = self._get_curr_time_s()
+        while (
+            len(self._expiration_queue) > 0
+            and self._expiration_queue[0][1].expiration_time_s <= curr_time_s
+        ):
+            key, entry = self._expiration_queue.popleft()
+            self._remove_entry(key, entry)
@@ -31,8 +31,13 @@ from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.metrics_utils import InMemoryMetricsStore, MetricsPusher
 from ray.serve._private.replica_result import ReplicaResult
 from ray.serve._private.replica_scheduler import PendingRequest, ReplicaScheduler
+from ray.serve._private.response_cache import ResponseCache
 from ray.serve._private.utils import resolve_deployment_response
-from ray.serve.config import AutoscalingConfig
+from ray.serve.config import (
+    AutoscalingConfig,
+    ReplicaSelectionPolicy,
+    ResponseCacheConfig,
+)
 from ray.serve.exceptions import BackPressureError
 from ray.util import metrics
 
@@ -352,6 +357,8 @@ class AsyncioRouter:
 
         self._event_loop = event_loop
         self.deployment_id = deployment_id
+        self._handle_id = handle_id
+        self._self_actor_id = self_actor_id
         self._enable_strict_max_ongoing_requests = enable_strict_max_ongoing_requests
 
         self._replica_scheduler: ReplicaScheduler = replica_scheduler
@@ -366,6 +373,9 @@ class AsyncioRouter:
         # update. This includes an optional autoscaling config.
         self.deployment_config: Optional[DeploymentConfig] = None
 
+        # Set if the deployment config has a response cache config.
+        self._response_cache: Optional[ResponseCache] = None
+
         # Initializing `self._metrics_manager` before `self.long_poll_client` is
         # necessary to avoid race condition where `self.update_deployment_config()`
         # might be called before `self._metrics_manager` instance is created.
@@ -424,10 +434,54 @@ class AsyncioRouter:
             self._running_replicas_populated = True
 
     def update_deployment_config(self, deployment_config: DeploymentConfig):
+        self.deployment_config = deployment_config
         self._metrics_manager.update_deployment_config(
             deployment_config,
             curr_num_replicas=len(self._replica_scheduler.curr_replicas),
         )
+        self._replica_scheduler.update_replica_selection_policy(
+            deployment_config.replica_selection_policy
+        )
+        self._update_response_cache(deployment_config.response_cache_config)
+
+    def _update_response_cache(self, config: Optional[ResponseCacheConfig]):
+        if config is None:
+            self._response_cache = None
+        elif self._response_cache is None or self._response_cache.config != config:
+            # Responses cached with the old config may not be valid anymore, e.g.,
+            # if the key function changed.
+            self._response_cache = ResponseCache(
+                config,
+                self.deployment_id,
+                self._handle_id,
+                self._self_actor_id,
+                self._event_loop,
+            )
+
+    def _should_record_request_latency(self, request_meta: RequestMetadata) -> bool:
+        # The latency of a streaming request depends on the length of the stream
+        # more than on the replica, so it's not used to compare replicas.
+        return (
+            self.deployment_config is not None
+            and self.deployment_config.replica_selection_policy
+            == ReplicaSelectionPolicy.PEAK_EWMA
+            and not request_meta.is_streaming
+        )
+
+    def _record_request_latency(
+        self,
+        replica_id: ReplicaID,
+        send_time_s: float,
+        result: Union[Any, RayError],
+    ):
+        # Failed requests don't measure how fast the replica serves requests. Worse,
+        # a replica that fails fast would look fast and attract more requests.
+        if isinstance(result, RayError):
+            return
+
+        self._replica_scheduler.on_request_completed(
+            replica_id, time.time() - send_time_s
+        )
 
     async def _resolve_request_arguments(
         self, request_args: Tuple[Any], request_kwargs: Dict[str, Any]
@@ -588,13 +642,36 @@ class AsyncioRouter:
                 request_args, request_kwargs = await self._resolve_request_arguments(
                     request_args, request_kwargs
                 )
-                replica_result, replica_id = await self.schedule_and_send_request(
-                    PendingRequest(
-                        args=list(request_args),
-                        kwargs=request_kwargs,
-                        metadata=request_meta,
-                    ),
-                )
+
+                response_cache = self._response_cache
+                cache_key = None
+                if response_cache is not None:
+                    cache_key = response_cache.get_key(
+                        request_meta, request_args, request_kwargs
+                    )
+                if cache_key is not None:
+                    cached_result = await response_cache.get_or_claim(cache_key)
+                    if cached_result is not None:
+                        return cached_result
+
+                try:
+                    replica_result, replica_id = await self.schedule_and_send_request(
+                        PendingRequest(
+                            args=list(request_args),
+                            kwargs=request_kwargs,
+                            metadata=request_meta,
+                        ),
+                    )
+                except BaseException:
+                    if cache_key is not None:
+                        # Let the requests waiting for this one be sent instead.
+                        response_cache.release(cache_key)
+                    raise
+
+                if self._should_record_request_latency(request_meta):
+                    replica_result.add_done_callback(
+                        partial(self._record_request_latency, replica_id, time.time())
+                    )
 
                 # Keep track of requests that have been sent out to replicas
                 if RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE:
@@ -611,6 +688,9 @@ class AsyncioRouter:
                     )
                     replica_result.add_done_callback(callback)
 
+                if cache_key is not None:
+                    replica_result = response_cache.put(cache_key, replica_result)
+
                 return replica_result
             except asyncio.CancelledError:
                 # NOTE(edoakes): this is not strictly necessary because
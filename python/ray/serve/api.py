@@ -40,6 +40,8 @@ from ray.serve.config import (
     DeploymentMode,
     HTTPOptions,
     ProxyLocation,
+    ReplicaSelectionPolicy,
+    ResponseCacheConfig,
     gRPCOptions,
 )
 from ray.serve.context import (
@@ -262,6 +264,12 @@ def deployment(
     health_check_period_s: Default[float] = DEFAULT.VALUE,
     health_check_timeout_s: Default[float] = DEFAULT.VALUE,
     logging_config: Default[Union[Dict, LoggingConfig, None]] = DEFAULT.VALUE,
+    replica_selection_policy: Default[
+        Union[str, ReplicaSelectionPolicy]
+    ] = DEFAULT.VALUE,
+    response_cache_config: Default[
+        Union[Dict, ResponseCacheConfig, None]
+    ] = DEFAULT.VALUE,
 ) -> Callable[[Callable], Deployment]:
     """Decorator that converts a Python class to a `Deployment`.
 
@@ -321,6 +329,16 @@ def deployment(
             run on a single node. Valid values are None (default, no limit)
             or an integer in the range of [1, 100].
             This cannot be set together with placement_group_bundles.
+        replica_selection_policy: [EXPERIMENTAL] How callers choose between the
+            candidate replicas for each request. Defaults to "queue_len", which
+            chooses the replica with the fewest ongoing requests. "peak_ewma" also
+            takes the recent request latencies of the replicas into account, to
+            route traffic away from slow replicas. See `ReplicaSelectionPolicy`.
+        response_cache_config: [EXPERIMENTAL] Config to cache the responses to
+            unary requests in each caller (proxy or DeploymentHandle), and to share
+            one response between concurrent requests with the same cache key. Only
+            set this for deployments whose responses depend on nothing but the
+            request. Defaults to None (no caching). See `ResponseCacheConfig`.
 
     Returns:
         `Deployment`
@@ -386,6 +404,8 @@ def deployment(
         health_check_period_s=health_check_period_s,
         health_check_timeout_s=health_check_timeout_s,
         logging_config=logging_config,
+        replica_selection_policy=replica_selection_policy,
+        response_cache_config=response_cache_config,
     )
     deployment_config.user_configured_option_names = set(user_configured_option_names)
 
@@ -557,7 +577,10 @@ def delete(name: str, _blocking: bool = True):
 
 @PublicAPI(stability="beta")
 def multiplexed(
-    func: Optional[Callable[..., Any]] = None, max_num_models_per_replica: int = 3
+    func: Optional[Callable[..., Any]] = None,
+    max_num_models_per_replica: int = 3,
+    max_model_bytes_per_replica: Optional[int] = None,
+    model_size_bytes_func: Optional[Callable[[Any], int]] = None,
 ):
     """Wrap a callable or method used to load multiplexed models in a replica.
 
@@ -575,6 +598,15 @@ def multiplexed(
     When the number of models in one replica is larger than max_num_models_per_replica,
     the models will be unloaded using an LRU policy.
 
+    If max_model_bytes_per_replica is set, the total size of the models in one
+    replica, as returned by model_size_bytes_func, is also kept within it. The
+    models are then unloaded based on their size, their measured load time and
+    how recently they were used, so that large models that are cheap to reload
+    are unloaded before small models that are slow to load.
+
+    Models can be loaded ahead of requests with
+    :func:`~ray.serve.prefetch_multiplexed_models`.
+
     If you want to release resources after the model is loaded, you can define
     a `__del__` method in your model class. The `__del__` method will be called when
     the model is unloaded.
@@ -617,6 +649,11 @@ def multiplexed(
             set it to a larger number if you have enough memory on
             the node resource, in opposite, you can set it to a smaller
             number if you want to save memory on the node resource.
+        max_model_bytes_per_replica: the maximum total size in bytes of the
+            models to be loaded on each replica. By default, there's no limit.
+        model_size_bytes_func: a function that returns the size in bytes of a
+            loaded model, e.g., the memory its weights take up. Required if
+            max_model_bytes_per_replica is set.
     """
 
     if func is not None:
@@ -645,7 +682,39 @@ def multiplexed(
     if max_num_models_per_replica != -1 and max_num_models_per_replica <= 0:
         raise ValueError("max_num_models_per_replica must be positive.")
 
+    if max_model_bytes_per_replica is not None:
+        if not isinstance(max_model_bytes_per_replica, int):
+            raise TypeError("max_model_bytes_per_replica must be an integer.")
+        if max_model_bytes_per_replica <= 0:
+            raise ValueError("max_model_bytes_per_replica must be positive.")
+        if model_size_bytes_func is None:
+            raise ValueError(
+                "model_size_bytes_func must be provided if "
+                "max_model_bytes_per_replica is set."
+            )
+
     def _multiplex_decorator(func: Callable):
+        def _get_or_create_multiplex_wrapper(self: Any) -> _ModelMultiplexWrapper:
+            # User defined multiplexed function can be a standalone function or a
+            # method of a class. The model multiplex wrapper is cached in the
+            # function or the instance of the class respectively.
+            multiplex_object = func if self is None else self
+            multiplex_attr = "__serve_multiplex_wrapper"
+            # If the multiplexed function is called for the first time,
+            # create a model multiplex wrapper and cache it in the multiplex object.
+            if not hasattr(multiplex_object, multiplex_attr):
+                model_multiplex_wrapper = _ModelMultiplexWrapper(
+                    func,
+                    self,
+                    max_num_models_per_replica,
+                    max_model_bytes_per_replica,
+                    model_size_bytes_func,
+                )
+                setattr(multiplex_object, multiplex_attr, model_multiplex_wrapper)
+            else:
+                model_multiplex_wrapper = getattr(multiplex_object, multiplex_attr)
+            return model_multiplex_wrapper
+
         @wraps(func)
         async def _multiplex_wrapper(*args):
             args_check_error_msg = (
@@ -666,7 +735,6 @@ def multiplexed(
                     raise TypeError(
                         args_check_error_msg.format("more than one arguments.")
                     )
-                multiplex_object = func
                 model_id = args[0]
             else:
                 # count self as an argument
@@ -674,25 +742,70 @@ def multiplexed(
                     raise TypeError(
                         args_check_error_msg.format("more than one arguments.")
                     )
-                multiplex_object = self
                 model_id = args[1]
-            multiplex_attr = "__serve_multiplex_wrapper"
-            # If the multiplexed function is called for the first time,
-            # create a model multiplex wrapper and cache it in the multiplex object.
-            if not hasattr(multiplex_object, multiplex_attr):
-                model_multiplex_wrapper = _ModelMultiplexWrapper(
-                    func, self, max_num_models_per_replica
-                )
-                setattr(multiplex_object, multiplex_attr, model_multiplex_wrapper)
-            else:
-                model_multiplex_wrapper = getattr(multiplex_object, multiplex_attr)
+            model_multiplex_wrapper = _get_or_create_multiplex_wrapper(self)
             return await model_multiplex_wrapper.load_model(model_id)
 
+        _multiplex_wrapper._get_or_create_multiplex_wrapper = (
+            _get_or_create_multiplex_wrapper
+        )
         return _multiplex_wrapper
 
     return _multiplex_decorator(func) if callable(func) else _multiplex_decorator
 
 
+@PublicAPI(stability="alpha")
+def prefetch_multiplexed_models(
+    load_model: Callable[..., Any], model_ids: Optional[List[str]] = None
+) -> None:
+    """Load multiplexed models in the background, ahead of requests for them.
+
+    This must be called from the replica's event loop, e.g., from an async method
+    of the deployment. The models are loaded one at a time in the background, and
+    only into the free capacity of the replica (see
+    :func:`~ray.serve.multiplexed`), so no loaded model is unloaded to make room
+    for them. Prefetched models that haven't been requested are the first to be
+    unloaded when a requested model needs room.
+
+    While a model is being prefetched, the replica reports it to the routers, so
+    requests for the model are sent to this replica instead of starting another
+    load elsewhere.
+
+    .. code-block:: python
+
+            from ray import serve
+
+            @serve.deployment
+            class MultiplexedDeployment:
+                @serve.multiplexed(max_num_models_per_replica=5)
+                async def load_model(self, model_id: str) -> Any:
+                    return load_from_s3(model_id)
+
+                async def __call__(self, request):
+                    model = await self.load_model(serve.get_multiplexed_model_id())
+                    # Keep the most requested models warm.
+                    serve.prefetch_multiplexed_models(self.load_model)
+                    return model(request)
+
+    Args:
+        load_model: the function or bound method decorated with
+            :func:`~ray.serve.multiplexed`.
+        model_ids: the model IDs to prefetch, in order of priority. By default, the
+            model IDs most requested from this replica that aren't loaded are
+            prefetched.
+    """
+    get_or_create_multiplex_wrapper = getattr(
+        load_model, "_get_or_create_multiplex_wrapper", None
+    )
+    if get_or_create_multiplex_wrapper is None:
+        raise TypeError(
+            "prefetch_multiplexed_models must be called with a function or method "
+            "decorated with `@serve.multiplexed`."
+        )
+    self = getattr(load_model, "__self__", None)
+    get_or_create_multiplex_wrapper(self).prefetch(model_ids)
+
+
 @PublicAPI(stability="beta")
 def get_multiplexed_model_id() -> str:
     """Get the multiplexed model ID for the current request.
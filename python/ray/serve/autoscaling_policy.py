@@ -1,5 +1,6 @@
 import logging
 import math
+import time
 from typing import Any, Dict, Optional
 
 from ray.serve._private.constants import CONTROL_LOOP_INTERVAL_S, SERVE_LOGGER_NAME
@@ -156,4 +157,127 @@ def replica_queue_length_autoscaling_policy(
     return decision_num_replicas
 
 
+def _update_request_forecast(
+    config: AutoscalingConfig,
+    total_num_requests: float,
+    curr_time_s: float,
+    policy_state: Dict[str, Any],
+):
+    """Updates the Holt (level and trend) model of the number of requests.
+
+    The model is updated online on every call, with smoothing weights derived
+    from the time since the last call, so it doesn't depend on how often it's
+    called. The level follows the metric on the time scale of
+    `metrics_interval_s`, and the trend (in requests per second) on the time
+    scale of `look_back_period_s`.
+    """
+    last_update_time_s = policy_state.get("forecast_last_update_time_s")
+    if last_update_time_s is None:
+        policy_state["forecast_level"] = total_num_requests
+        policy_state["forecast_trend"] = 0.0
+        policy_state["forecast_last_update_time_s"] = curr_time_s
+        return
+
+    dt = curr_time_s - last_update_time_s
+    if dt <= 0:
+        return
+
+    level = policy_state["forecast_level"]
+    trend = policy_state["forecast_trend"]
+    alpha = 1 - math.exp(-dt / config.metrics_interval_s)
+    beta = 1 - math.exp(-dt / config.look_back_period_s)
+
+    new_level = alpha * total_num_requests + (1 - alpha) * (level + trend * dt)
+    policy_state["forecast_trend"] = (
+        beta * (new_level - level) / dt + (1 - beta) * trend
+    )
+    policy_state["forecast_level"] = new_level
+    policy_state["forecast_last_update_time_s"] = curr_time_s
+
+
+@PublicAPI(stability="alpha")
+def predictive_autoscaling_policy(
+    curr_target_num_replicas: int,
+    total_num_requests: int,
+    num_running_replicas: int,
+    config: Optional[AutoscalingConfig],
+    capacity_adjusted_min_replicas: int,
+    capacity_adjusted_max_replicas: int,
+    policy_state: Dict[str, Any],
+    replica_startup_latency_s: Optional[float] = None,
+    curr_time_s: Optional[float] = None,
+) -> int:
+    """An autoscaling policy that provisions replicas ahead of forecasted load.
+
+    It keeps a Holt (level and trend) model of the number of requests, and
+    forecasts it for when replicas started now would be running: after the
+    measured replica startup latency, plus half the look-back period because
+    the metric is averaged over it. Replicas are added as soon as either the
+    forecast or the current number of requests needs them, so ramps are
+    provisioned ahead of time instead of after `upscale_delay_s`. They're only
+    removed once neither has needed them for `downscale_delay_s`, like in the
+    default policy.
+
+    To use it, set `_policy` of the autoscaling config to
+    "ray.serve.autoscaling_policy:predictive_autoscaling_policy".
+
+    Args:
+        replica_startup_latency_s: The recent average time it took replicas of
+            the deployment to start, or None if none has started yet.
+        curr_time_s: The current time, defaults to `time.time()`.
+    """
+    if curr_time_s is None:
+        curr_time_s = time.time()
+
+    _update_request_forecast(config, total_num_requests, curr_time_s, policy_state)
+    horizon_s = (replica_startup_latency_s or 0) + config.look_back_period_s / 2
+    forecast_num_requests = max(
+        0,
+        policy_state["forecast_level"] + policy_state["forecast_trend"] * horizon_s,
+    )
+    desired_num_replicas = math.ceil(
+        forecast_num_requests / config.get_target_ongoing_requests()
+    )
+
+    if num_running_replicas > 0:
+        desired_num_replicas = max(
+            desired_num_replicas,
+            _calculate_desired_num_replicas(
+                config,
+                total_num_requests,
+                num_running_replicas=num_running_replicas,
+                override_min_replicas=capacity_adjusted_min_replicas,
+                override_max_replicas=capacity_adjusted_max_replicas,
+            ),
+        )
+    elif total_num_requests > 0:
+        # Requests are queued, so at least one replica is needed now.
+        desired_num_replicas = max(desired_num_replicas, 1)
+
+    desired_num_replicas = max(
+        capacity_adjusted_min_replicas,
+        min(capacity_adjusted_max_replicas, desired_num_replicas),
+    )
+
+    decision_counter = policy_state.get("decision_counter", 0)
+    decision_num_replicas = curr_target_num_replicas
+    if desired_num_replicas > curr_target_num_replicas:
+        # The forecast is already smoothed, so don't wait to scale up.
+        decision_counter = 0
+        decision_num_replicas = desired_num_replicas
+    elif desired_num_replicas < curr_target_num_replicas:
+        if decision_counter > 0:
+            decision_counter = 0
+        decision_counter -= 1
+
+        if decision_counter < -int(config.downscale_delay_s / CONTROL_LOOP_INTERVAL_S):
+            decision_counter = 0
+            decision_num_replicas = desired_num_replicas
+    else:
+        decision_counter = 0
+
+    policy_state["decision_counter"] = decision_counter
+    return decision_num_replicas
+
+
 default_autoscaling_policy = replica_queue_length_autoscaling_policy
@@ -26,6 +26,7 @@ from typing import (
 from ray import serve
 from ray._private.signature import extract_signature, flatten_args, recover_args
 from ray._private.utils import get_or_create_event_loop
+from ray.serve import metrics
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 from ray.serve._private.utils import extract_self_if_method_call
 from ray.serve.exceptions import RayServeException
@@ -77,12 +78,174 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _BatchLatencyModel:
+    """Estimates the latency of a batch handler as a function of the batch size.
+
+    Keeps an exponentially weighted moving average of the latency of each batch
+    size that has been observed, and fits a line through them.
+    """
+
+    # The weight of a new latency measurement in the moving average.
+    SMOOTHING_FACTOR = 0.2
+
+    def __init__(self):
+        self._latency_s_by_batch_size: Dict[int, float] = {}
+        # The (intercept, slope) of the fitted line, cached until the next record.
+        self._line: Optional[Tuple[float, float]] = None
+
+    def record(self, batch_size: int, latency_s: float) -> None:
+        self._line = None
+        prev_latency_s = self._latency_s_by_batch_size.get(batch_size)
+        if prev_latency_s is None:
+            self._latency_s_by_batch_size[batch_size] = latency_s
+        else:
+            self._latency_s_by_batch_size[
+                batch_size
+            ] = prev_latency_s + self.SMOOTHING_FACTOR * (latency_s - prev_latency_s)
+
+    def estimate(self, batch_size: int) -> Optional[float]:
+        """Returns the estimated latency, or None if nothing has been recorded."""
+        points = self._latency_s_by_batch_size
+        if len(points) == 0:
+            return None
+        if len(points) == 1:
+            ((observed_batch_size, latency_s),) = points.items()
+            # With a single batch size observed, conservatively assume that the
+            # latency grows linearly above it, and doesn't shrink below it.
+            return latency_s * max(batch_size / observed_batch_size, 1)
+
+        if self._line is None:
+            self._line = self._fit_line()
+        intercept, slope = self._line
+        return max(intercept + slope * batch_size, 0)
+
+    def _fit_line(self) -> Tuple[float, float]:
+        """Least-squares fit of `latency_s = intercept + slope * batch_size`."""
+        points = self._latency_s_by_batch_size
+        mean_size = sum(points.keys()) / len(points)
+        mean_latency_s = sum(points.values()) / len(points)
+        covariance = sum(
+            (size - mean_size) * (latency_s - mean_latency_s)
+            for size, latency_s in points.items()
+        )
+        variance = sum((size - mean_size) ** 2 for size in points.keys())
+        # Larger batches are never assumed to be faster.
+        slope = max(covariance / variance, 0)
+        return mean_latency_s - slope * mean_size, slope
+
+
+class _AdaptiveBatchController:
+    """Chooses the batch size and wait timeout of a _BatchQueue online.
+
+    The batch handler latency and the request arrival rate are measured, and the
+    largest batch size whose expected latency meets the latency SLO is chosen.
+    Waiting for a full batch of that size takes `(batch_size - 1) / arrival_rate`
+    seconds in expectation, so at low load small batches are chosen, and requests
+    don't wait for batches that won't fill up. If even that batch size can't keep
+    up with the arrival rate, the smallest batch size that can is chosen instead,
+    since otherwise requests would queue up indefinitely.
+
+    The wait timeout is capped by the `batch_wait_timeout_s` of the queue, or by
+    `DEFAULT_MAX_WAIT_SLO_FRACTION` of the latency SLO if that's 0 (the default).
+    """
+
+    # The weight of a new inter-arrival time in the moving average.
+    SMOOTHING_FACTOR = 0.1
+
+    # The fraction of the latency SLO that caps the wait timeout if the queue's
+    # `batch_wait_timeout_s` is 0.
+    DEFAULT_MAX_WAIT_SLO_FRACTION = 0.5
+
+    def __init__(self, latency_slo_s: float):
+        self.latency_slo_s = latency_slo_s
+        self.latency_model = _BatchLatencyModel()
+        self._last_arrival_time: Optional[float] = None
+        self._interarrival_time_s: Optional[float] = None
+
+    def record_arrival(self, arrival_time: float) -> None:
+        if self._last_arrival_time is not None:
+            interarrival_time_s = max(arrival_time - self._last_arrival_time, 0)
+            if self._interarrival_time_s is None:
+                self._interarrival_time_s = interarrival_time_s
+            else:
+                self._interarrival_time_s += self.SMOOTHING_FACTOR * (
+                    interarrival_time_s - self._interarrival_time_s
+                )
+        self._last_arrival_time = arrival_time
+
+    def get_arrival_rate(self, now: float) -> Optional[float]:
+        """Returns the estimated number of arrivals per second, or None if unknown."""
+        if self._interarrival_time_s is None:
+            return None
+        # If no request has arrived for longer than the average inter-arrival time,
+        # the arrival rate has dropped.
+        interarrival_time_s = max(
+            self._interarrival_time_s, now - self._last_arrival_time
+        )
+        if interarrival_time_s == 0:
+            return float("inf")
+        return 1 / interarrival_time_s
+
+    def get_batch_params(
+        self, max_batch_size: int, max_batch_wait_timeout_s: float, now: float
+    ) -> Tuple[int, float]:
+        """Returns the batch size and wait timeout to use for the next batch.
+
+        The returned values don't exceed the given maximums. A maximum wait timeout
+        of 0 means that it's unset, and a fraction of the latency SLO is used.
+        """
+        if max_batch_wait_timeout_s == 0:
+            max_batch_wait_timeout_s = (
+                self.DEFAULT_MAX_WAIT_SLO_FRACTION * self.latency_slo_s
+            )
+        arrival_rate = self.get_arrival_rate(now)
+        if arrival_rate is None or self.latency_model.estimate(1) is None:
+            # Nothing has been measured yet.
+            return max_batch_size, max_batch_wait_timeout_s
+
+        def fill_time_s(batch_size: int) -> float:
+            if batch_size == 1:
+                return 0.0
+            return (batch_size - 1) / arrival_rate
+
+        def can_keep_up(batch_size: int) -> bool:
+            return batch_size >= arrival_rate * self.latency_model.estimate(batch_size)
+
+        # The expected latency grows with the batch size, so stop at the first
+        # batch size that exceeds the SLO.
+        batch_size = 1
+        while batch_size < max_batch_size:
+            next_batch_size = batch_size + 1
+            if (
+                fill_time_s(next_batch_size)
+                + self.latency_model.estimate(next_batch_size)
+                > self.latency_slo_s
+            ):
+                break
+            batch_size = next_batch_size
+
+        if not can_keep_up(batch_size):
+            while batch_size < max_batch_size and not can_keep_up(batch_size):
+                batch_size += 1
+
+        # Wait as long as it takes to fill the batch in expectation, but no longer
+        # than the SLO allows after accounting for the handler latency.
+        remaining_slo_s = max(
+            self.latency_slo_s - self.latency_model.estimate(batch_size), 0
+        )
+        batch_wait_timeout_s = min(
+            fill_time_s(batch_size), remaining_slo_s, max_batch_wait_timeout_s
+        )
+        return batch_size, batch_wait_timeout_s
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         batch_wait_timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        latency_slo_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -101,6 +264,9 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            latency_slo_s: if provided, the batch size and timeout are chosen
+                adaptively to meet this latency, up to max_batch_size and
+                timeout_s.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.max_batch_size = max_batch_size
@@ -110,6 +276,27 @@ class _BatchQueue:
         # Used for observability.
         self.curr_iteration_start_time = time.time()
 
+        self._adaptive_controller: Optional[_AdaptiveBatchController] = None
+        if latency_slo_s is not None:
+            self._adaptive_controller = _AdaptiveBatchController(latency_slo_s)
+            handler_name = getattr(handle_batch_func, "__qualname__", "")
+            self._adaptive_batch_size_gauge = metrics.Gauge(
+                "serve_batch_adaptive_batch_size",
+                description="The batch size chosen by adaptive batching.",
+                tag_keys=("batch_handler",),
+            )
+            self._adaptive_batch_size_gauge.set_default_tags(
+                {"batch_handler": handler_name}
+            )
+            self._adaptive_batch_wait_timeout_gauge = metrics.Gauge(
+                "serve_batch_adaptive_wait_timeout_s",
+                description="The batch wait timeout chosen by adaptive batching.",
+                tag_keys=("batch_handler",),
+            )
+            self._adaptive_batch_wait_timeout_gauge.set_default_tags(
+                {"batch_handler": handler_name}
+            )
+
         self._handle_batch_task = None
         self._loop = get_or_create_event_loop()
         if handle_batch_func is not None:
@@ -140,9 +327,26 @@ class _BatchQueue:
         self._warn_if_max_batch_size_exceeds_max_ongoing_requests()
 
     def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
+        if self._adaptive_controller is not None:
+            self._adaptive_controller.record_arrival(time.time())
         self.queue.put_nowait(request)
         self.requests_available_event.set()
 
+    def _get_batch_params(self) -> Tuple[int, float]:
+        """Returns the max batch size and wait timeout for the next batch."""
+        if self._adaptive_controller is None:
+            return self.max_batch_size, self.batch_wait_timeout_s
+
+        (
+            max_batch_size,
+            batch_wait_timeout_s,
+        ) = self._adaptive_controller.get_batch_params(
+            self.max_batch_size, self.batch_wait_timeout_s, time.time()
+        )
+        self._adaptive_batch_size_gauge.set(max_batch_size)
+        self._adaptive_batch_wait_timeout_gauge.set(batch_wait_timeout_s)
+        return max_batch_size, batch_wait_timeout_s
+
     async def wait_for_batch(self) -> List[Any]:
         """Wait for batch respecting self.max_batch_size and self.timeout_s.
 
@@ -158,8 +362,7 @@ class _BatchQueue:
         batch.append(await self.queue.get())
 
         # Cache current max_batch_size and batch_wait_timeout_s for this batch.
-        max_batch_size = self.max_batch_size
-        batch_wait_timeout_s = self.batch_wait_timeout_s
+        max_batch_size, batch_wait_timeout_s = self._get_batch_params()
 
         # Wait self.timeout_s seconds for new queue arrivals.
         batch_start_time = time.time()
@@ -312,7 +515,12 @@ class _BatchQueue:
                 await self._consume_func_generator(func_generator, futures, len(batch))
             else:
                 func_future = func_future_or_generator
+                func_start_time = time.time()
                 await self._assign_func_results(func_future, futures, len(batch))
+                if self._adaptive_controller is not None:
+                    self._adaptive_controller.latency_model.record(
+                        len(batch), time.time() - func_start_time
+                    )
 
         except Exception as e:
             logger.exception("_process_batch ran into an unexpected exception.")
@@ -346,11 +554,13 @@ class _LazyBatchQueueWrapper:
         max_batch_size: int = 10,
         batch_wait_timeout_s: float = 0.0,
         handle_batch_func: Optional[Callable] = None,
+        latency_slo_s: Optional[float] = None,
     ):
         self._queue: Optional[_BatchQueue] = None
         self.max_batch_size = max_batch_size
         self.batch_wait_timeout_s = batch_wait_timeout_s
         self.handle_batch_func = handle_batch_func
+        self.latency_slo_s = latency_slo_s
 
     @property
     def queue(self) -> _BatchQueue:
@@ -363,6 +573,7 @@ class _LazyBatchQueueWrapper:
                 self.max_batch_size,
                 self.batch_wait_timeout_s,
                 self.handle_batch_func,
+                self.latency_slo_s,
             )
         return self._queue
 
@@ -386,6 +597,15 @@ class _LazyBatchQueueWrapper:
     def get_batch_wait_timeout_s(self) -> float:
         return self.batch_wait_timeout_s
 
+    def _get_adaptive_batch_params(self) -> Optional[Tuple[int, float]]:
+        """Gets the batch size and wait timeout chosen by adaptive batching.
+
+        Returns None if adaptive batching isn't enabled.
+        """
+        if self.latency_slo_s is None:
+            return None
+        return self.queue._get_batch_params()
+
     def _get_curr_iteration_start_time(self) -> Optional[float]:
         """Gets current iteration's start time on default _BatchQueue implementation.
 
@@ -437,6 +657,17 @@ def _validate_max_batch_size(max_batch_size):
         )
 
 
+def _validate_latency_slo_s(latency_slo_s):
+    if latency_slo_s is None:
+        return
+
+    if not isinstance(latency_slo_s, (float, int)):
+        raise TypeError(f"latency_slo_s must be a float > 0, got {latency_slo_s}")
+
+    if latency_slo_s <= 0:
+        raise ValueError(f"latency_slo_s must be a float > 0, got {latency_slo_s}")
+
+
 def _validate_batch_wait_timeout_s(batch_wait_timeout_s):
     if not isinstance(batch_wait_timeout_s, (float, int)):
         raise TypeError(
@@ -496,6 +727,7 @@ def batch(
     /,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    latency_slo_s: Optional[float] = None,
 ) -> "_BatchDecorator":
     ...
 
@@ -532,6 +764,7 @@ def batch(
     /,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    latency_slo_s: Optional[float] = None,
 ) -> Callable:
     """Converts a function to asynchronously handle batches.
 
@@ -547,6 +780,16 @@ def batch(
     methods from the batch_handler (`set_max_batch_size` and
     `set_batch_wait_timeout_s`).
 
+    If `latency_slo_s` is set, the batch size and wait timeout are instead
+    tuned online, based on the measured latency of the function at different
+    batch sizes and the arrival rate of requests: at low load requests don't
+    wait for batches that won't fill up, and at high load batches are as large
+    as the latency SLO allows. `max_batch_size` and `batch_wait_timeout_s` are
+    the upper bounds of the chosen values; if `batch_wait_timeout_s` is 0 (the
+    default), the wait timeout is bounded by half of `latency_slo_s` instead.
+    The chosen values are exported as the `serve_batch_adaptive_batch_size` and
+    `serve_batch_adaptive_wait_timeout_s` metrics.
+
     Example:
 
     .. code-block:: python
@@ -579,6 +822,11 @@ def batch(
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the current batch.
+        latency_slo_s: if set, the target latency in seconds of a request,
+            including the time it waits for its batch. Enables adaptive
+            batching, which chooses a wait timeout of at most
+            `batch_wait_timeout_s`, or of at most half of `latency_slo_s` if
+            `batch_wait_timeout_s` is 0. Not supported for generator functions.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -593,12 +841,20 @@ def batch(
 
     _validate_max_batch_size(max_batch_size)
     _validate_batch_wait_timeout_s(batch_wait_timeout_s)
+    _validate_latency_slo_s(latency_slo_s)
 
     def _batch_decorator(_func):
+        if latency_slo_s is not None and isasyncgenfunction(_func):
+            raise ValueError(
+                "`latency_slo_s` isn't supported for generator functions decorated "
+                "with @serve.batch."
+            )
+
         lazy_batch_queue_wrapper = _LazyBatchQueueWrapper(
             max_batch_size,
             batch_wait_timeout_s,
             _func,
+            latency_slo_s,
         )
 
         async def batch_handler_generator(
@@ -665,6 +921,9 @@ def batch(
         wrapper._get_handling_task_stack = (
             lazy_batch_queue_wrapper._get_handling_task_stack
         )
+        wrapper._get_adaptive_batch_params = (
+            lazy_batch_queue_wrapper._get_adaptive_batch_params
+        )
 
         return wrapper
 
@@ -220,6 +220,74 @@ class ProxyLocation(str, Enum):
             return ProxyLocation(deployment_mode.value)
 
 
+@PublicAPI(stability="alpha")
+class ReplicaSelectionPolicy(str, Enum):
+    """Config for how callers choose between the candidate replicas of a deployment.
+
+    Options:
+
+        - queue_len: choose the replica with the fewest ongoing requests. This is
+          the default.
+        - peak_ewma: choose the replica with the lowest product of its number of
+          ongoing requests and the exponentially weighted moving average of its
+          recent request latencies, as measured by the caller. Latency spikes are
+          taken into account immediately, and decay over time. This routes traffic
+          away from slow replicas, e.g., ones on slower nodes or with noisy
+          neighbours, to reduce tail latencies.
+    """
+
+    QUEUE_LEN = "queue_len"
+    PEAK_EWMA = "peak_ewma"
+
+
+@PublicAPI(stability="alpha")
+class ResponseCacheConfig(BaseModel):
+    """Config for caching the responses of a deployment in its callers.
+
+    Each caller (proxy or DeploymentHandle) keeps its own cache of the responses to
+    unary requests. Requests with the same cache key, method and multiplexed model
+    ID within `ttl_s` of each other get the same response, and only the first one is
+    sent to a replica. Only use this for deployments whose responses depend on
+    nothing but the request.
+
+    Streaming requests are never cached, and neither are failed requests.
+
+    Args:
+        key_function: A function, or its import path, that's called with the
+            arguments of each request and returns a hashable cache key for it, or
+            None if the response to the request must not be cached.
+        ttl_s: How long a response is reused for, from when it was requested.
+        max_size_bytes: The maximum total size of the cached responses in each
+            caller. The least recently used responses are evicted beyond it.
+        coalesce_requests: Whether concurrent requests with the same cache key share
+            the response of the first one, instead of being sent to replicas until
+            its response has been cached.
+    """
+
+    # Cloudpickled after validation, so that the config can be sent to callers that
+    # can't import the function until they use it.
+    key_function: Any
+    ttl_s: PositiveFloat = 60.0
+    max_size_bytes: PositiveInt = 100 * 1024 * 1024
+    coalesce_requests: bool = True
+
+    @validator("key_function", always=True)
+    def serialize_key_function(cls, v):
+        if isinstance(v, bytes):
+            return v
+        if isinstance(v, str):
+            v = import_attr(v)
+        if not callable(v):
+            raise TypeError(
+                f"key_function must be a callable or an import path, got: {type(v)}."
+            )
+        return cloudpickle.dumps(v)
+
+    def get_key_function(self) -> Callable:
+        """Deserialize the key function from cloudpickled bytes."""
+        return cloudpickle.loads(self.key_function)
+
+
 @PublicAPI(stability="stable")
 class HTTPOptions(BaseModel):
     """HTTP options for the proxies. Supported fields:
@@ -11,7 +11,11 @@ from ray.serve._private.config import (
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 from ray.serve._private.usage import ServeUsageTag
 from ray.serve._private.utils import DEFAULT, Default
-from ray.serve.config import AutoscalingConfig
+from ray.serve.config import (
+    AutoscalingConfig,
+    ReplicaSelectionPolicy,
+    ResponseCacheConfig,
+)
 from ray.serve.schema import DeploymentSchema, LoggingConfig, RayActorOptionsSchema
 from ray.util.annotations import PublicAPI
 
@@ -225,6 +229,12 @@ class Deployment:
         health_check_period_s: Default[float] = DEFAULT.VALUE,
         health_check_timeout_s: Default[float] = DEFAULT.VALUE,
         logging_config: Default[Union[Dict, LoggingConfig, None]] = DEFAULT.VALUE,
+        replica_selection_policy: Default[
+            Union[str, ReplicaSelectionPolicy]
+        ] = DEFAULT.VALUE,
+        response_cache_config: Default[
+            Union[Dict, ResponseCacheConfig, None]
+        ] = DEFAULT.VALUE,
         _init_args: Default[Tuple[Any]] = DEFAULT.VALUE,
         _init_kwargs: Default[Dict[Any, Any]] = DEFAULT.VALUE,
         _internal: bool = False,
@@ -357,6 +367,12 @@ class Deployment:
                 logging_config = logging_config.dict()
             new_deployment_config.logging_config = logging_config
 
+        if replica_selection_policy is not DEFAULT.VALUE:
+            new_deployment_config.replica_selection_policy = replica_selection_policy
+
+        if response_cache_config is not DEFAULT.VALUE:
+            new_deployment_config.response_cache_config = response_cache_config
+
         new_replica_config = ReplicaConfig.create(
             func_or_class,
             init_args=_init_args,
@@ -425,6 +441,7 @@ def deployment_to_schema(d: Deployment) -> DeploymentSchema:
         "placement_group_bundles": d._replica_config.placement_group_bundles,
         "max_replicas_per_node": d._replica_config.max_replicas_per_node,
         "logging_config": d._deployment_config.logging_config,
+        "replica_selection_policy": d._deployment_config.replica_selection_policy,
     }
 
     # Let non-user-configured options be set to defaults. If the schema
@@ -485,6 +502,7 @@ def schema_to_deployment(s: DeploymentSchema) -> Deployment:
         health_check_period_s=s.health_check_period_s,
         health_check_timeout_s=s.health_check_timeout_s,
         logging_config=s.logging_config,
+        replica_selection_policy=s.replica_selection_policy,
     )
     deployment_config.user_configured_option_names = (
         s._get_user_configured_option_names()
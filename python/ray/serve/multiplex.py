@@ -2,8 +2,8 @@ import asyncio
 import inspect
 import logging
 import time
-from collections import OrderedDict
-from typing import Any, Callable, List, Set
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from ray.serve import metrics
 from ray.serve._private.common import MultiplexedReplicaInfo
@@ -32,15 +32,30 @@ class _ModelMultiplexWrapper:
     The model will be unloaded in the LRU order, the model multiplexer will call the
     model's __del__ attribute if it exists to clean up the model resources eagerly.
 
+    If a memory budget is given, the total size of the models on the replica is
+    kept within it too. In that case, the models are unloaded in GreedyDual-Size
+    order instead: the models that are cheap to reload relative to their size, and
+    that haven't been used recently, are unloaded first.
+
+    Models can be prefetched ahead of requests into the free capacity of the
+    replica. Prefetched models that haven't been requested yet are unloaded before
+    any other model.
     """
 
     _PUSH_MULTIPLEXED_MODEL_IDS_TASK_NAME = "push_multiplexed_model_ids"
 
+    # The maximum number of model IDs whose request counts, sizes and load
+    # latencies are kept. Beyond it, the least recently requested models that
+    # aren't loaded are forgotten.
+    _MAX_NUM_MODEL_STATS = 1000
+
     def __init__(
         self,
         model_load_func: Callable[[str], Any],
         self_arg: Any,
         max_num_models_per_replica: int,
+        max_model_bytes_per_replica: Optional[int] = None,
+        model_size_bytes_func: Optional[Callable[[Any], int]] = None,
     ):
         """Initialize the model multiplexer.
         Args:
@@ -49,6 +64,10 @@ class _ModelMultiplexWrapper:
             max_num_models_per_replica: the maximum number of models to be loaded on the
                 current replica. If it is -1, there is no limit for the number of models
                 per replica.
+            max_model_bytes_per_replica: the maximum total size in bytes of the models
+                loaded on the current replica. If it is None, there is no limit.
+            model_size_bytes_func: the function that returns the size in bytes of a
+                loaded model. Required if max_model_bytes_per_replica is set.
         """
 
         ServeUsageTag.MULTIPLEXED_API_USED.record("1")
@@ -57,6 +76,24 @@ class _ModelMultiplexWrapper:
         self._func: Callable = model_load_func
         self.self_arg: Any = self_arg
         self.max_num_models_per_replica: int = max_num_models_per_replica
+        self.max_model_bytes_per_replica: Optional[int] = max_model_bytes_per_replica
+        self._model_size_bytes_func = model_size_bytes_func
+
+        # The size in bytes and load latency in seconds of the models that have been
+        # loaded, kept after they're unloaded to estimate the cost of reloading them.
+        self._model_size_bytes: Dict[str, int] = {}
+        self._model_load_latency_s: Dict[str, float] = {}
+        # The GreedyDual-Size priorities of the loaded models, and the priority of
+        # the last unloaded model, which ages the priorities of the models that
+        # aren't used.
+        self._model_priorities: Dict[str, float] = {}
+        self._min_model_priority: float = 0.0
+        # The loaded models that were prefetched and haven't been requested yet.
+        self._prefetched_model_ids: Set[str] = set()
+        # The number of requests for each model ID, used to predict which models to
+        # prefetch, ordered from the least to the most recently requested.
+        self._model_request_counts: Counter = Counter()
+        self._prefetch_tasks: Set[asyncio.Task] = set()
 
         self.model_load_latency_ms = metrics.Histogram(
             "serve_multiplexed_model_load_latency_ms",
@@ -90,6 +127,14 @@ class _ModelMultiplexWrapper:
             "serve_multiplexed_models_load_counter",
             description="The counter for loaded models on the current replica.",
         )
+        self.models_prefetch_counter = metrics.Counter(
+            "serve_multiplexed_models_prefetch_counter",
+            description="The counter for prefetched models on the current replica.",
+        )
+        self.model_bytes_gauge = metrics.Gauge(
+            "serve_multiplexed_model_bytes",
+            description="The total size of the models loaded on the current replica.",
+        )
 
         context = _get_internal_replica_context()
         if context is None:
@@ -134,6 +179,8 @@ class _ModelMultiplexWrapper:
         """Push the multiplexed replica info to the controller."""
         try:
             self.num_models_gauge.set(len(self.models))
+            if self.max_model_bytes_per_replica is not None:
+                self.model_bytes_gauge.set(self._get_loaded_model_bytes())
 
             for model_id in self.models:
                 self.registered_model_gauge.set(1, tags={"model_id": model_id})
@@ -154,6 +201,8 @@ class _ModelMultiplexWrapper:
 
     async def shutdown(self):
         """Unload all the models when the model multiplexer is deleted."""
+        for task in self._prefetch_tasks:
+            task.cancel()
         while len(self.models) > 0:
             try:
                 await self.unload_model_lru()
@@ -180,11 +229,13 @@ class _ModelMultiplexWrapper:
             raise ValueError("The model ID cannot be empty.")
 
         self.get_model_requests_counter.inc()
+        self._model_request_counts[model_id] = (
+            self._model_request_counts.pop(model_id, 0) + 1
+        )
+        self._prune_model_stats()
 
         if model_id in self.models:
-            # Move the model to the end of the OrderedDict to ensure LRU caching.
-            model = self.models.pop(model_id)
-            self.models[model_id] = model
+            self._on_model_used(model_id)
             return self.models[model_id]
         else:
             # Set the flag to push the multiplexed replica info to the controller
@@ -194,39 +245,14 @@ class _ModelMultiplexWrapper:
             self._push_multiplexed_replica_info = True
             self._model_load_tasks.add(model_id)
             async with self._model_cache_lock:
-                # Check if the model has been loaded by another request.
+                # Check if the model has been loaded by another request, or
+                # prefetched.
                 if model_id in self.models:
-                    return self.models[model_id]
-                try:
-                    # If the number of models per replica is specified, check
-                    # if the number of models on the current replica has
-                    # reached the limit.
-                    if (
-                        self.max_num_models_per_replica > 0
-                        and len(self.models) >= self.max_num_models_per_replica
-                    ):
-                        # Unload the least recently used model.
-                        await self.unload_model_lru()
-                        self._push_multiplexed_replica_info = True
-
-                    # Load the model.
-                    logger.info(f"Loading model '{model_id}'.")
-                    self.models_load_counter.inc()
-                    load_start_time = time.time()
-                    if self.self_arg is None:
-                        self.models[model_id] = await self._func(model_id)
-                    else:
-                        self.models[model_id] = await self._func(
-                            self.self_arg, model_id
-                        )
-                    load_latency_ms = (time.time() - load_start_time) * 1000.0
-                    logger.info(
-                        f"Successfully loaded model '{model_id}' in "
-                        f"{load_latency_ms:.1f}ms."
-                    )
                     self._model_load_tasks.discard(model_id)
-                    self.model_load_latency_ms.observe(load_latency_ms)
+                    self._on_model_used(model_id)
                     return self.models[model_id]
+                try:
+                    return await self._load_model_locked(model_id)
                 except Exception as e:
                     logger.error(
                         f"Failed to load model '{model_id}'. Error: {e}",
@@ -234,12 +260,187 @@ class _ModelMultiplexWrapper:
                     self._model_load_tasks.discard(model_id)
                     raise e
 
+    def prefetch(self, model_ids: Optional[List[str]] = None) -> None:
+        """Load models in the background, ahead of requests for them.
+
+        Models are only prefetched into the free capacity of the replica, so no
+        model is unloaded to make room for them. Prefetched models that haven't been
+        requested are the first to be unloaded when a requested model needs room.
+
+        Args:
+            model_ids: the model IDs to prefetch, in order of priority. If None, the
+                most requested model IDs that aren't loaded are prefetched.
+        """
+        if model_ids is None:
+            model_ids = [
+                model_id
+                for model_id, _ in self._model_request_counts.most_common()
+                if model_id not in self.models
+            ]
+
+        task = asyncio.get_running_loop().create_task(self._prefetch(model_ids))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _prefetch(self, model_ids: List[str]) -> None:
+        for model_id in model_ids:
+            if model_id in self.models or model_id in self._model_load_tasks:
+                continue
+            if not self._has_capacity_for(model_id):
+                break
+
+            # Report the model as loading, so that routers send its requests here.
+            self._push_multiplexed_replica_info = True
+            self._model_load_tasks.add(model_id)
+            try:
+                async with self._model_cache_lock:
+                    if model_id in self.models or not self._has_capacity_for(model_id):
+                        continue
+                    logger.info(f"Prefetching model '{model_id}'.")
+                    self.models_prefetch_counter.inc()
+                    await self._load_model_locked(model_id, prefetch=True)
+            except Exception as e:
+                logger.warning(f"Failed to prefetch model '{model_id}'. Error: {e}")
+            finally:
+                self._model_load_tasks.discard(model_id)
+
+    async def _load_model_locked(self, model_id: str, prefetch: bool = False) -> Any:
+        """Load the model, unloading other models to make room for it if needed.
+
+        Must be called with the model cache lock held.
+        """
+        # Make room for the model before loading it, based on its size when it was
+        # last loaded, if known.
+        while self.models and not self._has_capacity_for(model_id):
+            await self._unload_model(self._choose_model_to_unload())
+            self._push_multiplexed_replica_info = True
+
+        # Load the model.
+        logger.info(f"Loading model '{model_id}'.")
+        self.models_load_counter.inc()
+        load_start_time = time.time()
+        if self.self_arg is None:
+            model = await self._func(model_id)
+        else:
+            model = await self._func(self.self_arg, model_id)
+        load_latency_ms = (time.time() - load_start_time) * 1000.0
+        logger.info(
+            f"Successfully loaded model '{model_id}' in {load_latency_ms:.1f}ms."
+        )
+        self.models[model_id] = model
+        self._model_load_tasks.discard(model_id)
+        self.model_load_latency_ms.observe(load_latency_ms)
+
+        self._model_load_latency_s[model_id] = load_latency_ms / 1000.0
+        if self.max_model_bytes_per_replica is not None:
+            self._model_size_bytes[model_id] = self._model_size_bytes_func(model)
+        if prefetch:
+            self._prefetched_model_ids.add(model_id)
+            self._set_model_priority(model_id)
+        else:
+            self._on_model_used(model_id)
+
+        # The model may be larger than the room that was made for it. Prefetching
+        # never unloads other models, so a prefetched model that doesn't fit is
+        # unloaded itself.
+        while (
+            self.max_model_bytes_per_replica is not None
+            and self._get_loaded_model_bytes() > self.max_model_bytes_per_replica
+            and len(self.models) > 1
+        ):
+            if prefetch:
+                await self._unload_model(model_id)
+            else:
+                await self._unload_model(self._choose_model_to_unload(exclude=model_id))
+            self._push_multiplexed_replica_info = True
+            if model_id not in self.models:
+                break
+        return model
+
+    def _on_model_used(self, model_id: str) -> None:
+        # Move the model to the end of the OrderedDict to ensure LRU caching.
+        self.models.move_to_end(model_id)
+        self._prefetched_model_ids.discard(model_id)
+        self._set_model_priority(model_id)
+
+    def _set_model_priority(self, model_id: str) -> None:
+        """Set the GreedyDual-Size priority of the model: its cost of reloading per
+        byte, on top of the priority of the last unloaded model."""
+        size_bytes = max(self._model_size_bytes.get(model_id, 1), 1)
+        load_latency_s = self._model_load_latency_s.get(model_id, 0.0)
+        self._model_priorities[model_id] = (
+            self._min_model_priority + load_latency_s / size_bytes
+        )
+
+    def _prune_model_stats(self) -> None:
+        """Forget the stats of the least recently requested models that aren't
+        loaded, beyond `_MAX_NUM_MODEL_STATS` models."""
+        num_to_prune = len(self._model_request_counts) - self._MAX_NUM_MODEL_STATS
+        if num_to_prune <= 0:
+            return
+        model_ids_to_prune = []
+        for model_id in self._model_request_counts:
+            if len(model_ids_to_prune) == num_to_prune:
+                break
+            if model_id not in self.models and model_id not in self._model_load_tasks:
+                model_ids_to_prune.append(model_id)
+        for model_id in model_ids_to_prune:
+            del self._model_request_counts[model_id]
+            self._model_size_bytes.pop(model_id, None)
+            self._model_load_latency_s.pop(model_id, None)
+
+    def _get_loaded_model_bytes(self) -> int:
+        return sum(self._model_size_bytes.get(model_id, 0) for model_id in self.models)
+
+    def _has_capacity_for(self, model_id: str) -> bool:
+        """Whether the model fits on the replica without unloading other models.
+
+        Models whose size is unknown are assumed to fit if any memory is free.
+        """
+        if (
+            self.max_num_models_per_replica > 0
+            and len(self.models) >= self.max_num_models_per_replica
+        ):
+            return False
+        if self.max_model_bytes_per_replica is not None:
+            free_bytes = (
+                self.max_model_bytes_per_replica - self._get_loaded_model_bytes()
+            )
+            size_bytes = self._model_size_bytes.get(model_id, 0)
+            return free_bytes > 0 and size_bytes <= free_bytes
+        return True
+
+    def _choose_model_to_unload(self, exclude: Optional[str] = None) -> str:
+        candidates = [model_id for model_id in self.models if model_id != exclude]
+        # Prefetched models that haven't been requested go first, oldest first.
+        for model_id in candidates:
+            if model_id in self._prefetched_model_ids:
+                return model_id
+        if self.max_model_bytes_per_replica is None:
+            # Least recently used.
+            return candidates[0]
+        return min(candidates, key=lambda model_id: self._model_priorities[model_id])
+
     async def unload_model_lru(self) -> None:
         """Unload the least recently used model."""
+        await self._unload_model(next(iter(self.models)))
+
+    async def _unload_model(self, model_id: str) -> None:
+        """Unload the given model."""
 
         self.models_unload_counter.inc()
         unload_start_time = time.time()
-        model_id, model = self.models.popitem(last=False)
+        model = self.models.pop(model_id)
+        self._prefetched_model_ids.discard(model_id)
+        if model_id not in self._model_request_counts:
+            # E.g., a prefetched model that was never requested. Its stats aren't
+            # pruned with the request counts, so forget them now.
+            self._model_size_bytes.pop(model_id, None)
+            self._model_load_latency_s.pop(model_id, None)
+        priority = self._model_priorities.pop(model_id, None)
+        if priority is not None:
+            # Age the priorities of the remaining models.
+            self._min_model_priority = max(self._min_model_priority, priority)
         logger.info(f"Unloading model '{model_id}'.")
 
         # If the model has __del__ attribute, call it.
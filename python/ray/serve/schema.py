@@ -31,7 +31,7 @@ from ray.serve._private.constants import (
 )
 from ray.serve._private.deployment_info import DeploymentInfo
 from ray.serve._private.utils import DEFAULT
-from ray.serve.config import ProxyLocation
+from ray.serve.config import ProxyLocation, ReplicaSelectionPolicy
 from ray.util.annotations import PublicAPI
 
 # Shared amongst multiple schemas.
@@ -384,6 +384,13 @@ class DeploymentSchema(BaseModel, allow_population_by_field_name=True):
         default=DEFAULT.VALUE,
         description="Logging config for configuring serve deployment logs.",
     )
+    replica_selection_policy: ReplicaSelectionPolicy = Field(
+        default=DEFAULT.VALUE,
+        description=(
+            "[EXPERIMENTAL] How callers choose between the candidate replicas for "
+            'each request: "queue_len" (default) or "peak_ewma".'
+        ),
+    )
 
     @root_validator
     def validate_num_replicas_and_autoscaling_config(cls, values):
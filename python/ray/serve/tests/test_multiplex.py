@@ -116,6 +116,98 @@ class TestMultiplexWrapper:
         assert multiplexer._push_multiplexed_replica_info
         assert multiplexer.models == {"2": "2", "4": "4"}
 
+    async def test_multiplex_wrapper_memory_budget(self, start_serve_with_context):
+        """Test multiplex wrapper with GreedyDual-Size caching under a budget."""
+
+        async def model_load_func(model_id: str):
+            if model_id == "slow":
+                await asyncio.sleep(0.5)
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=-1,
+            max_model_bytes_per_replica=100,
+            model_size_bytes_func=lambda model: 40,
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        await multiplexer.load_model("slow")
+        await multiplexer.load_model("fast")
+        assert list(multiplexer.models) == ["slow", "fast"]
+
+        # The third model doesn't fit. The slow model is the least recently used,
+        # but it's more expensive to reload, so the fast model is unloaded.
+        await multiplexer.load_model("new")
+        assert list(multiplexer.models) == ["slow", "new"]
+        assert multiplexer._get_loaded_model_bytes() == 80
+
+    async def test_prefetch(self, start_serve_with_context):
+        """Test that models are prefetched into free capacity only, and that
+        prefetched models that haven't been requested are unloaded first."""
+
+        async def model_load_func(model_id: str):
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func, None, max_num_models_per_replica=2
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        await multiplexer.load_model("1")
+        multiplexer.prefetch(["p1", "p2"])
+        await asyncio.gather(*multiplexer._prefetch_tasks)
+        assert list(multiplexer.models) == ["1", "p1"]
+        assert multiplexer._prefetched_model_ids == {"p1"}
+
+        # The prefetched model is unloaded before the least recently used one.
+        await multiplexer.load_model("2")
+        assert list(multiplexer.models) == ["1", "2"]
+        assert multiplexer._prefetched_model_ids == set()
+
+        # Without room, nothing is prefetched.
+        multiplexer.prefetch(["p1"])
+        await asyncio.gather(*multiplexer._prefetch_tasks)
+        assert list(multiplexer.models) == ["1", "2"]
+
+    async def test_model_stats_are_pruned(self, start_serve_with_context):
+        """Test that the stats of models that aren't loaded are bounded."""
+
+        async def model_load_func(model_id: str):
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=2,
+            max_model_bytes_per_replica=100,
+            model_size_bytes_func=lambda model: 10,
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+        multiplexer._MAX_NUM_MODEL_STATS = 10
+
+        for i in range(100):
+            await multiplexer.load_model(str(i))
+        assert list(multiplexer.models) == ["98", "99"]
+        assert len(multiplexer._model_request_counts) == 10
+        assert len(multiplexer._model_size_bytes) <= 10
+        assert len(multiplexer._model_load_latency_s) <= 10
+        # The most recently requested models are kept.
+        expected_model_ids = {str(i) for i in range(90, 100)}
+        assert set(multiplexer._model_request_counts) == expected_model_ids
+
+        # The stats of prefetched models that were never requested are forgotten
+        # when they're unloaded.
+        await multiplexer.unload_model_lru()
+        multiplexer.prefetch(["p1"])
+        await asyncio.gather(*multiplexer._prefetch_tasks)
+        assert "p1" in multiplexer._model_size_bytes
+        await multiplexer.load_model("100")
+        assert "p1" not in multiplexer.models
+        assert "p1" not in multiplexer._model_size_bytes
+        assert "p1" not in multiplexer._model_load_latency_s
+
     async def test_bad_call_multiplexed_func(self, start_serve_with_context):
         """Test bad call to multiplexed function"""
 
@@ -264,6 +356,28 @@ class TestBasicAPI:
             async def get_model4(model: str):
                 pass
 
+        # max_model_bytes_per_replica must be positive and needs a size function
+        with pytest.raises(ValueError):
+
+            @serve.multiplexed(
+                max_model_bytes_per_replica=0, model_size_bytes_func=lambda m: 1
+            )
+            async def get_model_bytes(model: str):
+                pass
+
+        with pytest.raises(ValueError):
+
+            @serve.multiplexed(max_model_bytes_per_replica=100)
+            async def get_model_bytes2(model: str):
+                pass
+
+        # prefetch_multiplexed_models needs a multiplexed function
+        async def not_multiplexed(model: str):
+            pass
+
+        with pytest.raises(TypeError):
+            serve.prefetch_multiplexed_models(not_multiplexed)
+
         # multiplexed function must be async def
         with pytest.raises(TypeError):
 
@@ -1,10 +1,18 @@
+import math
 import sys
 
 import pytest
 
+from ray.serve._private.autoscaling_state import (
+    policy_accepts_replica_startup_latency,
+)
+from ray.serve._private.benchmarks.autoscaling_simulator import (
+    simulate_autoscaling_policy,
+)
 from ray.serve._private.constants import CONTROL_LOOP_INTERVAL_S
 from ray.serve.autoscaling_policy import (
     _calculate_desired_num_replicas,
+    predictive_autoscaling_policy,
     replica_queue_length_autoscaling_policy,
 )
 from ray.serve.config import AutoscalingConfig
@@ -636,5 +644,113 @@ class TestReplicaQueueLengthPolicy:
         assert new_num_replicas == ongoing_requests / target_requests
 
 
+class TestPredictiveAutoscalingPolicy:
+    def test_accepts_replica_startup_latency(self):
+        assert policy_accepts_replica_startup_latency(predictive_autoscaling_policy)
+        assert not policy_accepts_replica_startup_latency(
+            replica_queue_length_autoscaling_policy
+        )
+
+    def test_steady_load(self):
+        """With constant load, the policy converges to the reactive target."""
+        config = AutoscalingConfig(
+            min_replicas=1, max_replicas=100, target_ongoing_requests=2
+        )
+        trace = [(t, 10.0) for t in range(0, 1200, 5)]
+        result = simulate_autoscaling_policy(
+            predictive_autoscaling_policy,
+            config,
+            trace,
+            replica_startup_latency_s=60,
+        )
+
+        assert max(result.target_num_replicas) == 5
+        assert result.num_running_replicas[-1] == 5
+
+    @pytest.mark.parametrize("replica_startup_latency_s", [0, 120])
+    def test_forecast_horizon(self, replica_startup_latency_s):
+        """The policy provisions for the load at the end of the startup latency."""
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=200,
+            target_ongoing_requests=1,
+            metrics_interval_s=10,
+            look_back_period_s=30,
+        )
+        policy_state = {}
+        # The load grows by 1 request per second.
+        for step in range(600):
+            curr_time_s = step * CONTROL_LOOP_INTERVAL_S
+            new_num_replicas = predictive_autoscaling_policy(
+                curr_target_num_replicas=1,
+                total_num_requests=curr_time_s,
+                num_running_replicas=1,
+                config=config,
+                capacity_adjusted_min_replicas=1,
+                capacity_adjusted_max_replicas=200,
+                policy_state=policy_state,
+                replica_startup_latency_s=replica_startup_latency_s,
+                curr_time_s=curr_time_s,
+            )
+
+        # The load averaged over the look-back period lags by half of it.
+        horizon_s = replica_startup_latency_s + 15
+        expected_num_replicas = curr_time_s + horizon_s
+        assert abs(new_num_replicas - expected_num_replicas) < 0.1 * (
+            expected_num_replicas
+        )
+
+    def test_downscale_delay(self):
+        """Replicas are removed only after `downscale_delay_s`."""
+        config = AutoscalingConfig(
+            min_replicas=1,
+            max_replicas=100,
+            target_ongoing_requests=2,
+            downscale_delay_s=300,
+        )
+        trace = [(t, 40.0 if t < 300 else 4.0) for t in range(0, 1200, 5)]
+        result = simulate_autoscaling_policy(
+            predictive_autoscaling_policy,
+            config,
+            trace,
+            replica_startup_latency_s=60,
+        )
+
+        steps_per_s = round(1 / CONTROL_LOOP_INTERVAL_S)
+        assert result.target_num_replicas[599 * steps_per_s] >= 20
+        assert result.target_num_replicas[-1] < 20
+
+    def test_provisions_ahead_of_ramp(self):
+        """Compared to the default policy, the predictive policy keeps up with a
+        ramp when replicas take long to start."""
+        config = AutoscalingConfig(
+            min_replicas=1, max_replicas=100, target_ongoing_requests=2
+        )
+        trace = [
+            (t, 2 + 198 * math.sin(math.pi * t / 3600) ** 2) for t in range(0, 3601, 5)
+        ]
+
+        default_result = simulate_autoscaling_policy(
+            replica_queue_length_autoscaling_policy,
+            config,
+            trace,
+            replica_startup_latency_s=60,
+        )
+        predictive_result = simulate_autoscaling_policy(
+            predictive_autoscaling_policy,
+            config,
+            trace,
+            replica_startup_latency_s=60,
+        )
+
+        assert (
+            predictive_result.mean_excess_requests
+            < 0.5 * default_result.mean_excess_requests
+        )
+        assert predictive_result.overloaded_fraction < (
+            default_result.overloaded_fraction
+        )
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -11,7 +11,7 @@ from ray._private.utils import get_or_create_event_loop
 from ray.serve._private.common import DeploymentID, ReplicaID
 from ray.serve._private.config import DeploymentConfig
 from ray.serve._private.constants import SERVE_LOGGER_NAME
-from ray.serve.batching import _BatchQueue
+from ray.serve.batching import _AdaptiveBatchController, _BatchQueue
 from ray.serve.exceptions import RayServeException
 
 # Setup the global replica context for the test.
@@ -801,6 +801,103 @@ async def test_batch_generator_setters():
             await coro.__anext__()
 
 
+def test_adaptive_batch_controller():
+    controller = _AdaptiveBatchController(latency_slo_s=0.1)
+
+    # Nothing has been measured yet, so the maximums are used.
+    assert controller.get_batch_params(64, 1.0, now=0) == (64, 1.0)
+
+    # The handler takes 10ms plus 1ms per request.
+    for batch_size in [1, 4, 16, 32]:
+        controller.latency_model.record(batch_size, 0.01 + 0.001 * batch_size)
+    assert controller.latency_model.estimate(10) == pytest.approx(0.02)
+
+    def arrive(num_requests: int, interval_s: float, start: float) -> float:
+        for i in range(num_requests):
+            controller.record_arrival(start + i * interval_s)
+        return start + (num_requests - 1) * interval_s
+
+    # At 10 requests per second, batches wouldn't fill up within the SLO, so
+    # requests don't wait.
+    now = arrive(100, 0.1, start=0)
+    assert controller.get_batch_params(64, 1.0, now) == (1, 0.0)
+
+    # At 200 requests per second, batches of 15 requests meet the SLO: it takes
+    # 70ms to fill them, and 25ms to handle them.
+    now = arrive(1000, 0.005, start=now + 0.005)
+    batch_size, batch_wait_timeout_s = controller.get_batch_params(64, 1.0, now)
+    assert batch_size == 15
+    assert batch_wait_timeout_s == pytest.approx(0.07)
+
+    # The maximums bound the chosen values.
+    assert controller.get_batch_params(8, 0.01, now) == (8, 0.01)
+
+    # At 1000 requests per second, the handler can't keep up with any batch size
+    # within the SLO, so the largest batches are used.
+    now = arrive(1000, 0.001, start=now + 0.001)
+    batch_size, _ = controller.get_batch_params(64, 1.0, now)
+    assert batch_size == 64
+
+    # When requests stop arriving, the arrival rate drops.
+    assert controller.get_batch_params(64, 1.0, now + 10) == (1, 0.0)
+
+
+def test_adaptive_batch_controller_default_wait_timeout():
+    controller = _AdaptiveBatchController(latency_slo_s=0.1)
+    for batch_size in [1, 4, 16, 32]:
+        controller.latency_model.record(batch_size, 0.01 + 0.001 * batch_size)
+
+    def arrive(num_requests: int, interval_s: float, start: float) -> float:
+        for i in range(num_requests):
+            controller.record_arrival(start + i * interval_s)
+        return start + (num_requests - 1) * interval_s
+
+    # With the default `batch_wait_timeout_s` of 0, requests still don't wait when
+    # batches wouldn't fill up.
+    now = arrive(100, 0.1, start=0)
+    assert controller.get_batch_params(64, 0.0, now) == (1, 0.0)
+
+    # When batches fill up, the wait grows, up to half of the SLO.
+    now = arrive(1000, 0.005, start=now + 0.005)
+    batch_size, batch_wait_timeout_s = controller.get_batch_params(64, 0.0, now)
+    assert batch_size == 15
+    assert batch_wait_timeout_s == pytest.approx(0.05)
+
+
+@pytest.mark.asyncio
+async def test_batch_latency_slo():
+    with pytest.raises(ValueError):
+
+        @serve.batch(latency_slo_s=0)
+        async def invalid_slo(requests):
+            return requests
+
+    with pytest.raises(ValueError, match="generator"):
+
+        @serve.batch(latency_slo_s=0.1)
+        async def generator(requests):
+            yield requests
+
+    @serve.batch(max_batch_size=4, batch_wait_timeout_s=0.05, latency_slo_s=0.1)
+    async def func(requests):
+        return requests
+
+    @serve.batch(max_batch_size=4, batch_wait_timeout_s=0.05)
+    async def non_adaptive_func(requests):
+        return requests
+
+    assert non_adaptive_func._get_adaptive_batch_params() is None
+    assert func._get_adaptive_batch_params() == (4, 0.05)
+
+    for i in range(10):
+        assert await func(i) == i
+
+    # Requests arrive one at a time, much slower than the handler, so they
+    # shouldn't wait for batches that won't fill up.
+    await asyncio.sleep(0.2)
+    assert func._get_adaptive_batch_params() == (1, 0.0)
+
+
 def test_warn_if_max_batch_size_exceeds_max_ongoing_requests():
     """Test warn_if_max_batch_size_exceeds_max_ongoing_requests() logged the warning
      message correctly.
@@ -12,6 +12,8 @@ from ray.serve.config import (
     DeploymentMode,
     HTTPOptions,
     ProxyLocation,
+    ReplicaSelectionPolicy,
+    ResponseCacheConfig,
     gRPCOptions,
 )
 from ray.serve.generated.serve_pb2 import AutoscalingConfig as AutoscalingConfigProto
@@ -551,6 +553,25 @@ def test_with_proto():
     config = DeploymentConfig(user_config={"python": ("native", ["objects"])})
     assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
 
+    # Test replica_selection_policy
+    config = DeploymentConfig(replica_selection_policy="peak_ewma")
+    assert config.replica_selection_policy == ReplicaSelectionPolicy.PEAK_EWMA
+    assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+
+    # Test response_cache_config
+    config = DeploymentConfig(
+        response_cache_config={
+            "key_function": lambda x: x,
+            "ttl_s": 1.5,
+            "max_size_bytes": 1000,
+            "coalesce_requests": False,
+        }
+    )
+    assert isinstance(config.response_cache_config, ResponseCacheConfig)
+    deserialized_config = DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+    assert config == deserialized_config
+    assert deserialized_config.response_cache_config.get_key_function()(1) == 1
+
 
 @pytest.mark.parametrize("use_deprecated_smoothing_factor", [True, False])
 def test_zero_default_proto(use_deprecated_smoothing_factor):
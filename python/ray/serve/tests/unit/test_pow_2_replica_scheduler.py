@@ -1,5 +1,6 @@
 import asyncio
 import importlib
+import math
 import os
 import random
 import sys
@@ -20,15 +21,20 @@ from ray.serve._private.common import (
     ReplicaID,
     RequestMetadata,
 )
-from ray.serve._private.constants import RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S
+from ray.serve._private.constants import (
+    RAY_SERVE_MULTIPLEXED_MODEL_LOAD_ROUTING_TIMEOUT_S,
+    RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S,
+)
 from ray.serve._private.replica_result import ReplicaResult
 from ray.serve._private.replica_scheduler import (
     PendingRequest,
     PowerOfTwoChoicesReplicaScheduler,
     ReplicaWrapper,
 )
+from ray.serve._private.replica_scheduler.common import ReplicaLatencyTracker
 from ray.serve._private.replica_scheduler.pow_2_scheduler import ReplicaQueueLengthCache
 from ray.serve._private.test_utils import MockTimer
+from ray.serve.config import ReplicaSelectionPolicy
 
 TIMER = MockTimer()
 
@@ -1361,6 +1367,47 @@ class TestModelMultiplexing:
             assert done.pop() == m2_tasks[0]
             m2_tasks = m2_tasks[1:]
 
+    async def test_requests_sent_to_replica_loading_model_id(self, pow_2_scheduler):
+        """
+        Verify that once a request for a model ID that no replica has is sent to a
+        replica, the following requests for it are sent to the same replica until
+        it reports the model ID, instead of loading the model on other replicas.
+        """
+        s = pow_2_scheduler
+        loop = get_or_create_event_loop()
+
+        r1 = FakeReplicaWrapper("r1", model_ids={"m1"})
+        r1.set_queue_len_response(0)
+        r2 = FakeReplicaWrapper("r2")
+        r2.set_queue_len_response(0)
+        r3 = FakeReplicaWrapper("r3")
+        r3.set_queue_len_response(0)
+        s.update_replicas([r1, r2, r3])
+
+        first = await loop.create_task(
+            s.choose_replica_for_request(fake_pending_request(model_id="m2"))
+        )
+        assert first in {r2, r3}
+        for _ in range(10):
+            request = fake_pending_request(model_id="m2")
+            task = loop.create_task(s.choose_replica_for_request(request))
+            assert (await task) == first
+
+        # Once the replica reports the model ID, it's no longer tracked as loading.
+        first._model_ids = {"m2"}
+        s.update_replicas([r1, r2, r3])
+        assert "m2" not in s._multiplexed_model_id_to_loading_replica_id
+
+        # The load is no longer tracked after the timeout.
+        first._model_ids = set()
+        s.update_replicas([r1, r2, r3])
+        await loop.create_task(
+            s.choose_replica_for_request(fake_pending_request(model_id="m3"))
+        )
+        assert "m3" in s._multiplexed_model_id_to_loading_replica_id
+        TIMER.advance(RAY_SERVE_MULTIPLEXED_MODEL_LOAD_ROUTING_TIMEOUT_S + 1)
+        assert s._get_replica_ids_loading_multiplexed_model("m3") == set()
+
 
 @pytest.mark.asyncio
 async def test_get_queue_len_cancelled_on_timeout(pow_2_scheduler):
@@ -1536,6 +1583,73 @@ async def test_queue_len_cache():
     )
 
 
+def test_replica_latency_tracker():
+    TIMER.reset()
+
+    decay_s = 10.0
+    t = ReplicaLatencyTracker(decay_s=decay_s, get_curr_time_s=TIMER.time)
+
+    d_id = DeploymentID(name="TEST_DEPLOYMENT")
+    replica_id_1 = ReplicaID("r1", deployment_id=d_id)
+    replica_id_2 = ReplicaID("r2", deployment_id=d_id)
+    replica_id_3 = ReplicaID("r3", deployment_id=d_id)
+
+    # Nothing recorded yet.
+    assert t.get(replica_id_1) is None
+
+    # The first latency is taken as is, and so are higher latencies.
+    t.record(replica_id_1, 1.0)
+    assert t.get(replica_id_1) == 1.0
+    TIMER.advance(decay_s)
+    t.record(replica_id_1, 2.0)
+    assert t.get(replica_id_1) == 2.0
+
+    # A lower latency right away barely moves the average.
+    t.record(replica_id_1, 1.0)
+    assert t.get(replica_id_1) == pytest.approx(2.0)
+
+    # After the decay period, it moves it by a factor of (1 - 1/e).
+    TIMER.advance(decay_s)
+    t.record(replica_id_1, 1.0)
+    assert t.get(replica_id_1) == pytest.approx(1.0 + 1.0 / math.e)
+
+    # Replicas without latencies get the mean.
+    t.record(replica_id_2, 3.0)
+    expected_mean = (t.get(replica_id_1) + 3.0) / 2
+    assert t.get(replica_id_3) == pytest.approx(expected_mean)
+
+    t.remove_inactive_replicas(active_replica_ids={replica_id_2})
+    assert t.get(replica_id_1) == 3.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy", [ReplicaSelectionPolicy.QUEUE_LEN, ReplicaSelectionPolicy.PEAK_EWMA]
+)
+async def test_replica_selection_policy(pow_2_scheduler, policy):
+    """
+    Verify that with the peak-EWMA policy, a replica with a short queue but high
+    latency loses to a replica with a longer queue but low latency.
+    """
+    s = pow_2_scheduler
+    s.update_replica_selection_policy(policy)
+    loop = get_or_create_event_loop()
+
+    r1 = FakeReplicaWrapper("r1")
+    r1.set_queue_len_response(0)
+    r2 = FakeReplicaWrapper("r2")
+    r2.set_queue_len_response(3)
+    s.update_replicas([r1, r2])
+
+    s.on_request_completed(r1.replica_id, 1.0)
+    s.on_request_completed(r2.replica_id, 0.1)
+
+    expected = r2 if policy == ReplicaSelectionPolicy.PEAK_EWMA else r1
+    for _ in range(10):
+        task = loop.create_task(s.choose_replica_for_request(fake_pending_request()))
+        assert (await task) == expected
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "pow_2_scheduler",
@@ -0,0 +1,257 @@
+import asyncio
+import sys
+from typing import Callable, Dict, List, Optional
+
+import pytest
+
+import ray
+from ray.exceptions import RayError
+from ray.serve._private.common import DeploymentID, RequestMetadata
+from ray.serve._private.replica_result import ReplicaResult
+from ray.serve._private.response_cache import ResponseCache
+from ray.serve._private.test_utils import MockTimer
+from ray.serve.config import ResponseCacheConfig
+
+
+class FakeReplicaResult(ReplicaResult):
+    def __init__(self, object_ref: str):
+        self._object_ref = object_ref
+        self._done_callbacks: List[Callable] = []
+
+    def complete(self, result):
+        for callback in self._done_callbacks:
+            callback(result)
+
+    def get(self, timeout_s: Optional[float]):
+        raise NotImplementedError
+
+    async def get_async(self):
+        raise NotImplementedError
+
+    def __next__(self):
+        raise NotImplementedError
+
+    async def __anext__(self):
+        raise NotImplementedError
+
+    def add_done_callback(self, callback: Callable):
+        self._done_callbacks.append(callback)
+
+    def cancel(self):
+        raise NotImplementedError
+
+    def to_object_ref(self, timeout_s: Optional[float]) -> ray.ObjectRef:
+        return self._object_ref
+
+    async def to_object_ref_async(self) -> ray.ObjectRef:
+        return self._object_ref
+
+    def to_object_ref_gen(self) -> ray.ObjectRefGenerator:
+        raise NotImplementedError
+
+
+def request_metadata(
+    *,
+    call_method: str = "__call__",
+    multiplexed_model_id: str = "",
+    is_streaming: bool = False,
+) -> RequestMetadata:
+    return RequestMetadata(
+        request_id="test-request",
+        internal_request_id="test-internal-request",
+        call_method=call_method,
+        multiplexed_model_id=multiplexed_model_id,
+        is_streaming=is_streaming,
+    )
+
+
+def create_cache(
+    timer: MockTimer,
+    object_sizes: Dict[str, int],
+    **config_kwargs,
+) -> ResponseCache:
+    config_kwargs.setdefault("key_function", lambda key: key)
+    return ResponseCache(
+        ResponseCacheConfig(**config_kwargs),
+        DeploymentID(name="test"),
+        "test-handle",
+        "test-actor",
+        asyncio.get_running_loop(),
+        get_curr_time_s=timer.time,
+        get_object_size_bytes=lambda object_ref: object_sizes.get(object_ref),
+    )
+
+
+async def flush_event_loop():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def send(cache: ResponseCache, key: str, object_ref: str) -> FakeReplicaResult:
+    assert await cache.get_or_claim(key) is None
+    replica_result = FakeReplicaResult(object_ref)
+    cache.put(key, replica_result)
+    await flush_event_loop()
+    return replica_result
+
+
+def test_config_key_function():
+    config = ResponseCacheConfig(key_function=lambda x: x + 1)
+    assert isinstance(config.key_function, bytes)
+    assert config.get_key_function()(1) == 2
+
+    # Already serialized key functions are kept as is.
+    assert ResponseCacheConfig(**config.dict()).get_key_function()(1) == 2
+
+    with pytest.raises(TypeError):
+        ResponseCacheConfig(key_function=1)
+
+
+@pytest.mark.asyncio
+async def test_get_key():
+    cache = create_cache(
+        MockTimer(), {}, key_function=lambda x, skip=False: None if skip else x
+    )
+
+    assert cache.get_key(request_metadata(), [1], {}) == ("__call__", "", 1)
+    assert cache.get_key(request_metadata(call_method="other"), [1], {}) == (
+        "other",
+        "",
+        1,
+    )
+    assert cache.get_key(request_metadata(multiplexed_model_id="m"), [1], {}) == (
+        "__call__",
+        "m",
+        1,
+    )
+    assert cache.get_key(request_metadata(), [1], {"skip": True}) is None
+    assert cache.get_key(request_metadata(is_streaming=True), [1], {}) is None
+
+
+@pytest.mark.asyncio
+async def test_coalesce_requests():
+    cache = create_cache(MockTimer(), {"ref": 10})
+
+    assert await cache.get_or_claim("a") is None
+    # Requests with the same key wait for the first one to be sent.
+    waiting_task = asyncio.ensure_future(cache.get_or_claim("a"))
+    await flush_event_loop()
+    assert not waiting_task.done()
+    # Requests with other keys don't.
+    assert await cache.get_or_claim("b") is None
+
+    replica_result = FakeReplicaResult("ref")
+    cached_result = cache.put("a", replica_result)
+    assert await waiting_task is cached_result
+    assert await cache.get_or_claim("a") is cached_result
+    assert await cached_result.to_object_ref_async() == "ref"
+    assert cached_result.to_object_ref(timeout_s=0) == "ref"
+
+    replica_result.complete("result")
+    await flush_event_loop()
+    assert await cache.get_or_claim("a") is cached_result
+    assert cache.total_size_bytes == 10
+
+
+@pytest.mark.asyncio
+async def test_release():
+    cache = create_cache(MockTimer(), {})
+
+    assert await cache.get_or_claim("a") is None
+    waiting_task = asyncio.ensure_future(cache.get_or_claim("a"))
+    await flush_event_loop()
+
+    # The first request wasn't sent, so the waiting one claims the key.
+    cache.release("a")
+    assert await waiting_task is None
+    waiting_task = asyncio.ensure_future(cache.get_or_claim("a"))
+    await flush_event_loop()
+    assert not waiting_task.done()
+    cache.release("a")
+    assert await waiting_task is None
+
+
+@pytest.mark.asyncio
+async def test_no_coalescing():
+    cache = create_cache(MockTimer(), {"ref": 10}, coalesce_requests=False)
+
+    assert await cache.get_or_claim("a") is None
+    replica_result = FakeReplicaResult("ref")
+    cached_result = cache.put("a", replica_result)
+    # Only completed responses are cached.
+    assert await cache.get_or_claim("a") is None
+
+    replica_result.complete("result")
+    await flush_event_loop()
+    assert await cache.get_or_claim("a") is cached_result
+
+
+@pytest.mark.parametrize("coalesce_requests", [False, True])
+@pytest.mark.asyncio
+async def test_ttl(coalesce_requests: bool):
+    timer = MockTimer()
+    cache = create_cache(
+        timer, {"ref": 10}, ttl_s=10, coalesce_requests=coalesce_requests
+    )
+
+    replica_result = await send(cache, "a", "ref")
+    replica_result.complete("result")
+    await flush_event_loop()
+
+    timer.advance(9)
+    assert await cache.get_or_claim("a") is not None
+    timer.advance(1)
+    assert await cache.get_or_claim("a") is None
+    assert len(cache) == 0
+    assert cache.total_size_bytes == 0
+
+
+@pytest.mark.parametrize("coalesce_requests", [False, True])
+@pytest.mark.asyncio
+async def test_failed_responses_are_dropped(coalesce_requests: bool):
+    cache = create_cache(MockTimer(), {"ref": 10}, coalesce_requests=coalesce_requests)
+
+    replica_result = await send(cache, "a", "ref")
+    replica_result.complete(RayError())
+    await flush_event_loop()
+    assert await cache.get_or_claim("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("coalesce_requests", [False, True])
+@pytest.mark.asyncio
+async def test_max_size_bytes(coalesce_requests: bool):
+    cache = create_cache(
+        MockTimer(),
+        {"ref-a": 40, "ref-b": 40, "ref-c": 40, "ref-big": 101},
+        max_size_bytes=100,
+        coalesce_requests=coalesce_requests,
+    )
+
+    for key in ["a", "b"]:
+        replica_result = await send(cache, key, f"ref-{key}")
+        replica_result.complete("result")
+        await flush_event_loop()
+    assert cache.total_size_bytes == 80
+
+    # Use "a" so that "b" is the least recently used response.
+    assert await cache.get_or_claim("a") is not None
+    replica_result = await send(cache, "c", "ref-c")
+    replica_result.complete("result")
+    await flush_event_loop()
+    assert cache.total_size_bytes == 80
+    assert await cache.get_or_claim("a") is not None
+    assert await cache.get_or_claim("c") is not None
+    assert await cache.get_or_claim("b") is None
+    cache.release("b")
+
+    # Responses larger than the budget are never cached.
+    replica_result = await send(cache, "big", "ref-big")
+    replica_result.complete("result")
+    await flush_event_loop()
+    assert await cache.get_or_claim("big") is None
+    assert cache.total_size_bytes == 80
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))